@@ -152,10 +152,11 @@ def parse_report(text: str) -> dict | None:
 
 
 def extract_all_tool_names() -> set[str]:
-    """Extract all pfsense_* tool names from generated/server.py."""
+    """Extract all pfsense_* tool names from generated/server.py and generated/tools/."""
     if not SERVER_PY.exists():
         return set()
-    text = SERVER_PY.read_text()
+    sources = [SERVER_PY, *sorted((SERVER_PY.parent / "tools").glob("*.py"))]
+    text = "\n".join(path.read_text() for path in sources)
     return set(re.findall(r"async def (pfsense_\w+)\(", text))
 
 
@@ -0,0 +1 @@
+"""Performance benchmarks for the generated pfSense MCP server."""
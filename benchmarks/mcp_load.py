@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+End-to-end MCP throughput and latency benchmark.
+
+Starts the offline mock pfSense (benchmarks/mock_pfsense.py) and one
+pfsense-mcp server process wired to it, then drives the server over MCP
+(stdio or streamable HTTP) with a fixed number of concurrent workers.
+Each worker repeatedly runs a scenario from the chosen mix:
+
+- read:   list rules/aliases/interfaces, search tools, overview, status
+- crud:   create alias -> update -> delete -> firewall apply
+- mixed:  read calls with a CRUD round every fifth iteration
+- replay: tools_invoked sequences from bank-tester result files, with
+          arguments synthesized from each tool's input schema
+
+Reports throughput, p50/p95/p99/max latency and a per-tool breakdown as
+JSON (stdout or --output) plus a table on stderr.
+
+Usage:
+    python -m benchmarks.mcp_load --transport stdio --concurrency 8 --duration 30
+    python -m benchmarks.mcp_load --transport http --mix crud --mock-latency 0.02
+    python -m benchmarks.mcp_load --mix replay --replay bank-tester/results/run-*/
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ANALYZE_RESULTS = REPO_ROOT / "bank-tester" / "analyze-results.py"
+
+MIXES = ("read", "crud", "mixed", "replay")
+TRANSPORTS = ("stdio", "http")
+
+_SEARCH_QUERIES = (
+    "firewall rule", "dhcp static mapping", "wireguard peer", "alias",
+    "gateway status", "haproxy backend", "dns resolver host override",
+)
+
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _latency_summary(values: list[float]) -> dict[str, float]:
+    values = sorted(values)
+    return {
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+        "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+    }
+
+
+@dataclass
+class Recorder:
+    """Collects per-call latencies once the warm-up period is over."""
+
+    recording: bool = False
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    skipped: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record(self, tool: str, seconds: float, ok: bool) -> None:
+        if not self.recording:
+            return
+        self.latencies[tool].append(seconds)
+        if not ok:
+            self.errors[tool] += 1
+
+    def skip(self, tool: str) -> None:
+        """Count a call that was never made (e.g. the tool isn't registered)."""
+        if self.recording:
+            self.skipped[tool] += 1
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        all_latencies = [v for values in self.latencies.values() for v in values]
+        calls = len(all_latencies)
+        tools = sorted(
+            set(self.latencies) | set(self.skipped), key=lambda t: -len(self.latencies.get(t, ()))
+        )
+        return {
+            "summary": {
+                "calls": calls,
+                "errors": sum(self.errors.values()),
+                "skipped": sum(self.skipped.values()),
+                "duration_s": round(elapsed, 3),
+                "throughput_per_s": round(calls / elapsed, 2) if elapsed else 0.0,
+                **_latency_summary(all_latencies),
+            },
+            "tools": {
+                tool: {
+                    "calls": len(self.latencies.get(tool, ())),
+                    "errors": self.errors.get(tool, 0),
+                    "skipped": self.skipped.get(tool, 0),
+                    **_latency_summary(self.latencies.get(tool, [])),
+                }
+                for tool in tools
+            },
+        }
+
+
+def _payload(result: Any) -> Any:
+    """The tool's return value from a CallToolResult."""
+    structured = result.structured_content
+    if isinstance(structured, dict):
+        return structured.get("result", structured)
+    for block in result.content:
+        text = getattr(block, "text", None)
+        if text is not None:
+            try:
+                return json.loads(text)
+            except ValueError:
+                return text
+    return None
+
+
+async def _call(client: Client, recorder: Recorder, tool: str, args: dict[str, Any]) -> Any:
+    start = time.perf_counter()
+    try:
+        result = await client.call_tool(tool, args, raise_on_error=False)
+    except Exception:
+        recorder.record(tool, time.perf_counter() - start, ok=False)
+        return None
+    payload = _payload(result)
+    ok = not result.is_error and not (isinstance(payload, dict) and "error" in payload)
+    recorder.record(tool, time.perf_counter() - start, ok=ok)
+    return payload
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+Scenario = Callable[[Client, Recorder, int], Awaitable[None]]
+
+
+async def read_scenario(client: Client, recorder: Recorder, n: int) -> None:
+    """One read-only call, rotating through what agents typically ask first."""
+    calls = (
+        ("pfsense_list_firewall_rules", {"limit": 50}),
+        ("pfsense_search_tools", {"query": _SEARCH_QUERIES[n % len(_SEARCH_QUERIES)], "limit": 10}),
+        ("pfsense_list_firewall_aliases", {}),
+        ("pfsense_get_overview", {}),
+        ("pfsense_list_network_interfaces", {}),
+        ("pfsense_get_status_system", {}),
+    )
+    tool, args = calls[n % len(calls)]
+    await _call(client, recorder, tool, args)
+
+
+async def crud_scenario(client: Client, recorder: Recorder, n: int) -> None:
+    """Create, update and delete an alias, then apply the firewall.
+
+    The delete matches by name: ids are positional, so a concurrent worker's
+    delete can shift this alias's id between create and delete.
+    """
+    name = f"bench{n}"
+    created = await _call(client, recorder, "pfsense_create_firewall_alias", {
+        "name": name, "type_": "host", "address": ["10.9.9.9"], "confirm": True,
+    })
+    if isinstance(created, dict) and "id" in created:
+        await _call(client, recorder, "pfsense_update_firewall_alias", {
+            "id": created["id"], "descr": f"bench {n}", "confirm": True,
+        })
+        await _call(client, recorder, "pfsense_delete_firewall_aliases", {
+            "query": {"name": name}, "confirm": True,
+        })
+    await _call(client, recorder, "pfsense_firewall_apply", {"confirm": True})
+
+
+async def mixed_scenario(client: Client, recorder: Recorder, n: int) -> None:
+    if n % 5 == 4:
+        await crud_scenario(client, recorder, n)
+    else:
+        await read_scenario(client, recorder, n)
+
+
+# ---------------------------------------------------------------------------
+# Replay of bank-tester sessions
+# ---------------------------------------------------------------------------
+
+
+def _load_analyze_results():
+    spec = importlib.util.spec_from_file_location("analyze_results", ANALYZE_RESULTS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_replay_sessions(results_dirs: list[Path]) -> list[list[str]]:
+    """tools_invoked of every task report, in order, with MCP prefixes removed."""
+    analyze = _load_analyze_results()
+    sessions = []
+    for results_dir in results_dirs:
+        for path in sorted(results_dir.glob("*.txt")):
+            for report in analyze.extract_reports_from_text(path):
+                tools = [t.removeprefix("mcp__pfsense__") for t in report.get("tools_invoked", [])]
+                if tools:
+                    sessions.append(tools)
+    return sessions
+
+
+def synthesize_arguments(schema: dict[str, Any]) -> dict[str, Any]:
+    """Minimal valid-looking arguments for a tool's input schema.
+
+    Required fields get a placeholder of the right type (ids are 0, so they
+    hit the mock's first fixture row) and mutations are confirmed.
+    """
+    properties = schema.get("properties", {})
+    args: dict[str, Any] = {}
+    for name in schema.get("required", []):
+        prop = properties.get(name, {})
+        options = prop.get("anyOf") or [prop]
+        types = {o.get("type") for o in options}
+        enum = next((o["enum"] for o in options if o.get("enum")), None)
+        if enum:
+            args[name] = enum[0]
+        elif name in ("id", "parent_id") or "integer" in types:
+            args[name] = 0
+        elif "number" in types:
+            args[name] = 0.0
+        elif "boolean" in types:
+            args[name] = False
+        elif "array" in types:
+            args[name] = []
+        elif "object" in types:
+            args[name] = {}
+        else:
+            args[name] = "bench"
+    if "confirm" in properties:
+        args["confirm"] = True
+    return args
+
+
+def replay_scenario(sessions: list[list[str]], schemas: dict[str, dict[str, Any]]) -> Scenario:
+    """A scenario that replays one recorded session per iteration."""
+
+    async def run(client: Client, recorder: Recorder, n: int) -> None:
+        for tool in sessions[n % len(sessions)]:
+            if tool in schemas:
+                await _call(client, recorder, tool, synthesize_arguments(schemas[tool]))
+            else:
+                recorder.skip(tool)
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Processes
+# ---------------------------------------------------------------------------
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port: int, proc: subprocess.Popen, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{proc.args} exited with {proc.returncode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{proc.args} did not listen on port {port}")
+            time.sleep(0.1)
+
+
+@contextmanager
+def _process(args: list[str], port: int, env: dict[str, str]) -> Iterator[subprocess.Popen]:
+    proc = subprocess.Popen(
+        args, cwd=str(REPO_ROOT), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_port(port, proc)
+        yield proc
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+@contextmanager
+def mock_pfsense(mock_args: list[str]) -> Iterator[str]:
+    """Run the mock pfSense in a subprocess and yield its base URL."""
+    port = _free_port()
+    args = [sys.executable, "-m", "benchmarks.mock_pfsense", "--port", str(port), *mock_args]
+    with _process(args, port, dict(os.environ)):
+        yield f"http://127.0.0.1:{port}"
+
+
+@asynccontextmanager
+async def mcp_session(transport: str, backend_url: str, env: dict[str, str]) -> AsyncIterator[Client]:
+    """Start one pfsense-mcp process against the backend and connect to it."""
+    server_env = {
+        **os.environ,
+        "PFSENSE_HOST": backend_url,
+        "PFSENSE_API_KEY": "mock",
+        # Per-request INFO logging would be measured as server latency.
+        "FASTMCP_LOG_LEVEL": "WARNING",
+        **env,
+    }
+    command = [sys.executable, "-m", "pfsense_mcp", "--preload"]
+    if transport == "stdio":
+        stdio = StdioTransport(
+            command=command[0], args=command[1:], env=server_env, cwd=str(REPO_ROOT)
+        )
+        async with Client(stdio, timeout=120) as client:
+            yield client
+        return
+    port = _free_port()
+    with _process([*command, "--transport", "http", "--port", str(port)], port, server_env):
+        async with Client(f"http://127.0.0.1:{port}/mcp", timeout=120) as client:
+            yield client
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+async def drive(
+    client: Client,
+    scenario: Scenario,
+    *,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> dict[str, Any]:
+    """Run `concurrency` workers for warmup + duration seconds and report."""
+    recorder = Recorder()
+    counter = itertools.count()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    record_from = start + warmup
+    stop_at = record_from + duration
+
+    async def worker() -> None:
+        while loop.time() < stop_at:
+            await scenario(client, recorder, next(counter))
+
+    async def start_recording() -> None:
+        await asyncio.sleep(warmup)
+        recorder.recording = True
+
+    await asyncio.gather(start_recording(), *(worker() for _ in range(concurrency)))
+    # Workers finish their in-flight scenario after stop_at; count that time too.
+    return recorder.report(loop.time() - record_from)
+
+
+async def run(
+    *,
+    transport: str,
+    mix: str,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    mock_args: list[str],
+    server_env: dict[str, str],
+    replay_dirs: list[Path] | None = None,
+) -> dict[str, Any]:
+    """Start the mock and server, drive the chosen mix and return results."""
+    sessions = load_replay_sessions(replay_dirs or []) if mix == "replay" else []
+    if mix == "replay" and not sessions:
+        raise ValueError("no tools_invoked sequences found in the replay directories")
+
+    with mock_pfsense(mock_args) as backend_url:
+        async with mcp_session(transport, backend_url, server_env) as client:
+            tools = await client.list_tools()
+            if mix == "replay":
+                schemas = {t.name: t.inputSchema for t in tools}
+                scenario = replay_scenario(sessions, schemas)
+            else:
+                scenario = {"read": read_scenario, "crud": crud_scenario, "mixed": mixed_scenario}[mix]
+            results = await drive(
+                client, scenario, concurrency=concurrency, duration=duration, warmup=warmup
+            )
+
+    from benchmarks.startup import _git_revision
+
+    results["meta"] = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "transport": transport,
+        "mix": mix,
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "warmup_s": warmup,
+        "mock_args": mock_args,
+        "server_env": server_env,
+        "tools_registered": len(tools),
+        "replay_sessions": len(sessions),
+    }
+    return results
+
+
+def _print_table(results: dict[str, Any]) -> None:
+    s = results["summary"]
+    print(
+        f"{s['calls']} calls in {s['duration_s']:.1f}s = {s['throughput_per_s']:.1f}/s, "
+        f"{s['errors']} errors; p50 {s['p50_ms']}ms p95 {s['p95_ms']}ms "
+        f"p99 {s['p99_ms']}ms max {s['max_ms']}ms",
+        file=sys.stderr,
+    )
+    print(f"  {'tool':<48} {'calls':>6} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8}", file=sys.stderr)
+    for tool, t in results["tools"].items():
+        print(
+            f"  {tool:<48} {t['calls']:>6} {t['errors']:>4} "
+            f"{t['p50_ms']:>8} {t['p95_ms']:>8} {t['p99_ms']:>8}",
+            file=sys.stderr,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="MCP throughput/latency benchmark against a mock pfSense")
+    parser.add_argument("--transport", choices=TRANSPORTS, default="stdio")
+    parser.add_argument("--mix", choices=MIXES, default="mixed")
+    parser.add_argument("--replay", type=Path, nargs="*", default=[], metavar="RESULTS_DIR",
+                        help="bank-tester results directories to replay (--mix replay)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent in-flight scenarios")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before recording")
+    parser.add_argument("--mock-latency", type=float, default=0.0, help="Mock pfSense latency per request (s)")
+    parser.add_argument("--mock-jitter", type=float, default=0.0, help="Extra random mock latency (s)")
+    parser.add_argument("--mock-error-rate", type=float, default=0.0, help="Mock probability of a 500")
+    parser.add_argument("--mock-burst-every", type=int, default=0, help="Mock 502 burst every N requests")
+    parser.add_argument("--mock-records", type=int, default=50, help="Fixture rows per mock collection")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE",
+                        help="Extra environment for the MCP server, e.g. PFSENSE_CACHE_TTL=0")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.mix == "replay" and not args.replay:
+        parser.error("--mix replay needs --replay RESULTS_DIR")
+    mock_args = [
+        "--records", str(args.mock_records),
+        "--seed", str(args.seed),
+        "--latency", str(args.mock_latency),
+        "--jitter", str(args.mock_jitter),
+        "--error-rate", str(args.mock_error_rate),
+        "--burst-every", str(args.mock_burst_every),
+    ]
+    server_env = dict(item.split("=", 1) for item in args.env)
+
+    print(f"Driving {args.mix} mix over {args.transport}, concurrency {args.concurrency}...", file=sys.stderr)
+    results = asyncio.run(run(
+        transport=args.transport,
+        mix=args.mix,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        mock_args=mock_args,
+        server_env=server_env,
+        replay_dirs=args.replay,
+    ))
+    _print_table(results)
+
+    text = json.dumps(results, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,707 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the pfSense REST API v2, built from openapi-spec.json.
+
+Every path in the spec is served from an in-memory store seeded with
+deterministic fixture data synthesized from the component schemas:
+
+- plural endpoints (GET with limit/offset) honor limit, offset, sort_by,
+  sort_order and query filters (field=value, field__contains=...), and
+  support PUT (replace all) and DELETE (matching rows)
+- singular endpoints do CRUD by positional id, re-indexing on delete like
+  pfSense does; child endpoints (parent_id + id) do the same per parent
+- settings endpoints GET/PATCH a single object; action endpoints echo
+- mutations mark their subsystem dirty until its /apply endpoint is POSTed
+
+Faults can be injected for load testing: fixed latency plus jitter, a
+random error rate (500), and periodic bursts of 502 Bad Gateway.
+
+The app is plain ASGI, so tests can drive it in-process with
+httpx.ASGITransport; the CLI serves it with uvicorn.
+
+Usage:
+    python -m benchmarks.mock_pfsense --port 8080 --latency 0.02 --burst-every 500
+    PFSENSE_HOST=http://127.0.0.1:8080 PFSENSE_API_KEY=mock pfsense-mcp
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl
+
+from generator.context_builder import _APPLY_SUBSYSTEMS
+from generator.loader import load_spec, resolve_schema
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SPEC_PATH = REPO_ROOT / "openapi-spec.json"
+
+DEFAULT_RECORDS = 20
+DEFAULT_API_KEY = "mock"
+DEFAULT_SEED = 0
+
+# Query parameters with a meaning of their own; everything else is a filter.
+_RESERVED_PARAMS = frozenset({
+    "limit", "offset", "sort_by", "sort_order", "sort_flags", "query",
+    "id", "parent_id", "apply", "fields",
+})
+
+_STATUS_TEXT = {
+    200: "ok", 400: "bad request", 401: "unauthorized", 404: "not found",
+    405: "method not allowed", 500: "internal server error",
+}
+
+_IP_FIELDS = frozenset({
+    "address", "ip", "ipaddr", "ipaddrv6", "gateway", "host", "dnsserver",
+    "remote_host", "server", "subnet", "monitor", "srcip", "dstip",
+})
+
+
+# ---------------------------------------------------------------------------
+# Endpoint map (from the spec)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """How the mock serves one API path."""
+
+    path: str
+    kind: str  # "plural", "singular", "child", "settings", "action" or "apply"
+    methods: frozenset[str]
+    model: str | None
+    apply_path: str | None  # the /apply endpoint whose subsystem this path dirties
+    required: tuple[str, ...] = ()  # fields a POST body must contain
+
+
+def _response_model(operation: dict[str, Any]) -> str | None:
+    response = json.dumps(operation.get("responses", {}).get("200", {}))
+    for ref in re.findall(r"#/components/schemas/(\w+)", response):
+        if ref != "Success":
+            return ref
+    return None
+
+
+def _apply_path(path: str) -> str | None:
+    for prefix in sorted(_APPLY_SUBSYSTEMS, key=len, reverse=True):
+        if path == prefix or path.startswith(prefix + "/"):
+            return prefix + "/apply"
+    return None
+
+
+def build_endpoints(spec: dict[str, Any]) -> dict[str, Endpoint]:
+    """Classify every spec path by the shape of its operations."""
+    endpoints = {}
+    for path, item in spec["paths"].items():
+        methods = {m for m in ("get", "post", "patch", "put", "delete") if m in item}
+        if not methods:
+            continue
+        operations = [item[m] for m in sorted(methods)]
+        params = {p["name"] for op in operations for p in op.get("parameters", [])}
+        bodies = json.dumps([op.get("requestBody", {}) for op in operations])
+        if path.endswith("/apply"):
+            kind = "apply"
+        elif "limit" in params:
+            kind = "plural"
+        elif "parent_id" in params or '"parent_id"' in bodies:
+            kind = "child"
+        elif "id" in params:
+            kind = "singular"
+        elif "get" in methods or "patch" in methods:
+            kind = "settings"
+        else:
+            kind = "action"
+        model = next(filter(None, map(_response_model, operations)), None)
+        body = item.get("post", {}).get("requestBody", {})
+        body_schema = body.get("content", {}).get("application/json", {}).get("schema")
+        required = resolve_schema(spec, body_schema).get("required", []) if body_schema else []
+        endpoints[path] = Endpoint(
+            path=path,
+            kind=kind,
+            methods=frozenset(m.upper() for m in methods),
+            model=model,
+            apply_path=None if kind == "apply" else _apply_path(path),
+            required=tuple(required),
+        )
+    return endpoints
+
+
+# ---------------------------------------------------------------------------
+# Fixture data
+# ---------------------------------------------------------------------------
+
+
+def _model_words(model: str) -> list[str]:
+    return re.findall(r"[A-Z]+(?![a-z])|[A-Z][a-z]*|\d+", model) or [model]
+
+
+def _fake_value(name: str, prop: dict[str, Any], model: str, i: int) -> Any:
+    """A plausible, deterministic value for one schema property of record i."""
+    enum = [v for v in prop.get("enum") or [] if v is not None]
+    if enum:
+        return enum[i % len(enum)]
+    typ = prop.get("type")
+    if typ == "boolean":
+        # Mostly enabled: one record in five is disabled.
+        return i % 5 == 4 if name.startswith("disable") else i % 5 != 4
+    if typ == "integer":
+        low = prop.get("minimum", 0)
+        high = prop.get("maximum", low + 1000)
+        return low + i % (high - low + 1)
+    if typ == "number":
+        return round(float(i) * 1.5, 2)
+    if typ == "array":
+        items = prop.get("items") or {}
+        if items.get("type") == "object" or "properties" in items:
+            return []
+        count = 1 + i % 3
+        limit = prop.get("maxItems") or count
+        return [_fake_value(name, items, model, i * 3 + k) for k in range(min(count, limit))]
+    if typ == "object":
+        return {}
+
+    words = _model_words(model)
+    if name in ("interface", "if"):
+        value = ("wan", "lan", "opt1")[i % 3]
+    elif name == "mac" or name.endswith("_mac"):
+        value = f"00:1a:2b:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}"
+    elif name in _IP_FIELDS or name.endswith(("_ip", "_address", "_host")):
+        value = f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"
+    elif name == "port" or name.endswith("_port"):
+        value = str(1024 + i)
+    elif name in ("name", "username", "hostname"):
+        value = f"{words[-1].lower()}{i}"
+    elif name in ("descr", "description"):
+        value = f"{' '.join(words).capitalize()} {i}"
+    elif name == "domain":
+        value = "home.arpa"
+    else:
+        value = f"{name}-{i}"
+    max_length = prop.get("maxLength")
+    return value[:max_length] if max_length else value
+
+
+def fake_record(schema: dict[str, Any], model: str, i: int) -> dict[str, Any]:
+    """Synthesize one record for a model, skipping write-only fields."""
+    return {
+        name: _fake_value(name, prop, model, i)
+        for name, prop in (schema.get("properties") or {}).items()
+        if not prop.get("writeOnly")
+    }
+
+
+def _interface_records(schema: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    # Interfaces are keyed by pfSense name (wan, lan, opt1...), not position.
+    records = []
+    for i in range(max(count, 2)):
+        record = fake_record(schema, "NetworkInterface", i)
+        record["id"] = ("wan", "lan")[i] if i < 2 else f"opt{i - 1}"
+        record["if"] = f"em{i}"
+        record["descr"] = record["id"].upper()
+        records.append(record)
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Faults
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Faults:
+    """Failure and latency injection applied to every API request.
+
+    latency/jitter are seconds; error_rate is the probability of a 500;
+    every burst_every requests the next burst_length return 502.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    burst_every: int = 0
+    burst_length: int = 0
+    _forced: list[int] = field(default_factory=list, repr=False)
+
+    def fail_next(self, count: int, status: int = 502) -> None:
+        """Make the next `count` API requests fail with `status`."""
+        self._forced.extend([status] * count)
+
+    def pick(self, seq: int, rng: random.Random) -> int | None:
+        """Status to fail request number `seq` with, or None to serve it."""
+        if self._forced:
+            return self._forced.pop(0)
+        if self.burst_every and self.burst_length and seq % self.burst_every < self.burst_length:
+            if seq >= self.burst_every:
+                return 502
+        if self.error_rate and rng.random() < self.error_rate:
+            return 500
+        return None
+
+    def delay(self, rng: random.Random) -> float:
+        return self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Store and request handling
+# ---------------------------------------------------------------------------
+
+
+class _ApiError(Exception):
+    def __init__(self, code: int, response_id: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.response_id = response_id
+        self.message = message
+
+
+def _coerce_id(raw: Any) -> int:
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        raise _ApiError(400, "FIELD_INVALID_ID", f"Field `id` must be an integer, got {raw!r}.")
+
+
+def _compare(value: Any, op: str, expected: str) -> bool:
+    if op == "contains":
+        if isinstance(value, list):
+            return expected in [str(v) for v in value]
+        return expected in str(value)
+    text = "" if value is None else str(value)
+    if op == "exact":
+        return text == expected
+    if op == "startswith":
+        return text.startswith(expected)
+    if op == "endswith":
+        return text.endswith(expected)
+    if op == "regex":
+        return re.search(expected, text) is not None
+    if op in ("lt", "lte", "gt", "gte"):
+        try:
+            left, right = float(value), float(expected)
+        except (TypeError, ValueError):
+            return False
+        return {"lt": left < right, "lte": left <= right,
+                "gt": left > right, "gte": left >= right}[op]
+    raise _ApiError(400, "QUERY_FILTER_INVALID", f"Unknown query filter `{op}`.")
+
+
+def _matches(record: dict[str, Any], filters: list[tuple[str, str]]) -> bool:
+    for key, expected in filters:
+        name, _, op = key.partition("__")
+        if not _compare(record.get(name), op or "exact", expected):
+            return False
+    return True
+
+
+def _sort_key(value: Any) -> tuple:
+    if isinstance(value, bool) or value is None:
+        return (0, str(value))
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value))
+
+
+class MockPfSense:
+    """ASGI app emulating the pfSense REST API v2."""
+
+    def __init__(
+        self,
+        spec: dict[str, Any] | None = None,
+        *,
+        records: int = DEFAULT_RECORDS,
+        sizes: dict[str, int] | None = None,
+        faults: Faults | None = None,
+        api_key: str | None = DEFAULT_API_KEY,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+        self.spec = spec if spec is not None else load_spec(SPEC_PATH)
+        self.endpoints = build_endpoints(self.spec)
+        self.records = records
+        self.sizes = sizes or {}
+        self.faults = faults or Faults()
+        self.api_key = api_key
+        self.seed = seed
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.failures: Counter[int] = Counter()
+        self.reset()
+
+    # -- state ---------------------------------------------------------------
+
+    def reset(self) -> None:
+        """Re-seed all fixture data and clear pending changes and counters."""
+        self._rng = random.Random(self.seed)
+        self._seq = 0
+        self.requests.clear()
+        self.failures.clear()
+        self.pending: dict[str, set[str]] = {}
+        self._schemas: dict[str, dict[str, Any]] = {}
+        self._collections: dict[str, list[dict[str, Any]]] = {}
+        self._children: dict[str, dict[int, list[dict[str, Any]]]] = {}
+        self._settings: dict[str, dict[str, Any]] = {}
+        child_models = {e.model for e in self.endpoints.values() if e.kind == "child"}
+        for endpoint in self.endpoints.values():
+            model = endpoint.model
+            if model is None or endpoint.kind not in ("plural", "singular", "child"):
+                continue
+            count = self.sizes.get(endpoint.path, self.records)
+            if model in child_models:
+                if model not in self._children or endpoint.path in self.sizes:
+                    self._children[model] = self._seed_children(model, count)
+            elif model not in self._collections or endpoint.path in self.sizes:
+                self._collections[model] = self._seed(model, count)
+
+    def schema(self, model: str) -> dict[str, Any]:
+        if model not in self._schemas:
+            ref = {"$ref": f"#/components/schemas/{model}"}
+            self._schemas[model] = resolve_schema(self.spec, ref)
+        return self._schemas[model]
+
+    def _seed(self, model: str, count: int) -> list[dict[str, Any]]:
+        if model == "NetworkInterface":
+            return _interface_records(self.schema(model), count)
+        rows = [fake_record(self.schema(model), model, i) for i in range(count)]
+        for row in rows:
+            row.pop("id", None)
+        return rows
+
+    def _seed_children(self, model: str, count: int) -> dict[int, list[dict[str, Any]]]:
+        # Spread children over three parents.
+        children: dict[int, list[dict[str, Any]]] = {}
+        for i in range(count):
+            row = fake_record(self.schema(model), model, i)
+            row.pop("id", None)
+            row.pop("parent_id", None)
+            children.setdefault(i % 3, []).append(row)
+        return children
+
+    def collection(self, model: str) -> list[dict[str, Any]]:
+        """Rows of a top-level model, with positional (or interface) ids."""
+        rows = self._collections.setdefault(model, [])
+        if model == "NetworkInterface":
+            return [dict(r) for r in rows]
+        return [{"id": i, **r} for i, r in enumerate(rows)]
+
+    def _child_rows(self, model: str) -> list[dict[str, Any]]:
+        return [
+            {"parent_id": parent, "id": i, **r}
+            for parent, rows in sorted(self._children.get(model, {}).items())
+            for i, r in enumerate(rows)
+        ]
+
+    def _mark_dirty(self, endpoint: Endpoint) -> None:
+        if endpoint.apply_path:
+            subsystem = endpoint.path.removeprefix("/api/v2/").replace("/", "_")
+            self.pending.setdefault(endpoint.apply_path, set()).add(subsystem)
+
+    # -- handlers ------------------------------------------------------------
+
+    def handle(
+        self, method: str, path: str, params: list[tuple[str, str]], body: Any
+    ) -> Any:
+        """Serve one API call and return its `data`, or raise _ApiError."""
+        endpoint = self.endpoints.get(path)
+        if endpoint is None:
+            raise _ApiError(404, "ENDPOINT_NOT_FOUND", f"Endpoint {path} does not exist.")
+        if method not in endpoint.methods:
+            raise _ApiError(405, "METHOD_NOT_ALLOWED", f"{method} is not allowed for {path}.")
+        query = dict(params)
+        handler = getattr(self, f"_handle_{endpoint.kind}")
+        data = handler(endpoint, method, params, query, body)
+        if method != "GET" and endpoint.kind not in ("apply", "action"):
+            self._mark_dirty(endpoint)
+        return data
+
+    def _handle_plural(self, endpoint, method, params, query, body):
+        model = endpoint.model
+        is_child = model in self._children
+        if method == "PUT":
+            if not isinstance(body, list):
+                raise _ApiError(400, "BODY_MUST_BE_ARRAY", "PUT replaces all objects and requires an array.")
+            if is_child:
+                children: dict[int, list[dict[str, Any]]] = {}
+                for row in body:
+                    parent = _coerce_id(row.get("parent_id", 0))
+                    children.setdefault(parent, []).append(
+                        {k: v for k, v in row.items() if k not in ("id", "parent_id")}
+                    )
+                self._children[model] = children
+                return self._child_rows(model)
+            if model == "NetworkInterface":
+                self._collections[model] = [dict(r) for r in body]
+            else:
+                self._collections[model] = [{k: v for k, v in r.items() if k != "id"} for r in body]
+            return self.collection(model)
+
+        rows = self._child_rows(model) if is_child else self.collection(model)
+        filters = [(k, v) for k, v in params if k not in _RESERVED_PARAMS]
+        rows = [r for r in rows if _matches(r, filters)]
+        if method == "GET":
+            sort_by = [v for k, v in params if k == "sort_by"]
+            if sort_by:
+                reverse = query.get("sort_order") == "SORT_DESC"
+                rows.sort(key=lambda r: [_sort_key(r.get(f)) for f in sort_by], reverse=reverse)
+        offset = int(query.get("offset") or 0)
+        limit = int(query.get("limit") or 0)
+        rows = rows[offset:offset + limit] if limit else rows[offset:]
+        if method == "DELETE":
+            self._delete_rows(model, rows, is_child)
+        return rows
+
+    def _delete_rows(self, model: str, rows: list[dict[str, Any]], is_child: bool) -> None:
+        if is_child:
+            doomed = {(r["parent_id"], r["id"]) for r in rows}
+            for parent, children in self._children[model].items():
+                self._children[model][parent] = [
+                    c for i, c in enumerate(children) if (parent, i) not in doomed
+                ]
+        else:
+            doomed_ids = {r["id"] for r in rows}
+            current = self.collection(model)
+            self._collections[model] = [
+                {k: v for k, v in r.items() if k != "id" or model == "NetworkInterface"}
+                for r in current
+                if r["id"] not in doomed_ids
+            ]
+
+    def _find(self, model: str, raw_id: Any) -> int:
+        rows = self._collections.setdefault(model, [])
+        if model == "NetworkInterface":
+            for index, row in enumerate(rows):
+                if row["id"] == raw_id:
+                    return index
+        else:
+            index = _coerce_id(raw_id)
+            if 0 <= index < len(rows):
+                return index
+        raise _ApiError(404, "MODEL_OBJECT_NOT_FOUND", f"Object with ID `{raw_id}` does not exist.")
+
+    def _required(self, endpoint: Endpoint, body: dict[str, Any]) -> None:
+        for name in endpoint.required:
+            if name not in body:
+                raise _ApiError(400, "MODEL_REQUIRED_FIELD_MISSING", f"Field `{name}` is required.")
+
+    def _handle_singular(self, endpoint, method, params, query, body):
+        model = endpoint.model
+        rows = self._collections.setdefault(model, [])
+        body = body if isinstance(body, dict) else {}
+        if method == "POST":
+            self._required(endpoint, body)
+            record = {k: v for k, v in body.items() if k != "id"}
+            if model == "NetworkInterface":
+                record["id"] = f"opt{len(rows) - 1}"
+            rows.append(record)
+            return self.collection(model)[-1]
+        raw_id = query.get("id") if method in ("GET", "DELETE") else body.get("id")
+        if raw_id is None:
+            raise _ApiError(400, "MODEL_REQUIRED_FIELD_MISSING", "Field `id` is required.")
+        index = self._find(model, raw_id)
+        if method == "GET":
+            return self.collection(model)[index]
+        if method == "PATCH":
+            rows[index].update({k: v for k, v in body.items() if k != "id"})
+            return self.collection(model)[index]
+        deleted = self.collection(model)[index]
+        del rows[index]
+        return deleted
+
+    def _handle_child(self, endpoint, method, params, query, body):
+        model = endpoint.model
+        body = body if isinstance(body, dict) else {}
+        source = query if method in ("GET", "DELETE") else body
+        if source.get("parent_id") is None:
+            raise _ApiError(400, "MODEL_REQUIRED_FIELD_MISSING", "Field `parent_id` is required.")
+        parent = _coerce_id(source["parent_id"])
+        children = self._children.setdefault(model, {}).setdefault(parent, [])
+        if method == "POST":
+            self._required(endpoint, body)
+            record = {k: v for k, v in body.items() if k not in ("id", "parent_id")}
+            children.append(record)
+            return {"parent_id": parent, "id": len(children) - 1, **record}
+        index = _coerce_id(source.get("id"))
+        if not 0 <= index < len(children):
+            raise _ApiError(404, "MODEL_OBJECT_NOT_FOUND", f"Object with ID `{index}` does not exist.")
+        if method == "PATCH":
+            children[index].update({k: v for k, v in body.items() if k not in ("id", "parent_id")})
+        record = {"parent_id": parent, "id": index, **children[index]}
+        if method == "DELETE":
+            del children[index]
+        return record
+
+    def _handle_settings(self, endpoint, method, params, query, body):
+        if endpoint.path not in self._settings:
+            schema = self.schema(endpoint.model) if endpoint.model else {}
+            self._settings[endpoint.path] = fake_record(schema, endpoint.model or "Settings", 1)
+        settings = self._settings[endpoint.path]
+        if method == "PATCH" and isinstance(body, dict):
+            settings.update(body)
+        return dict(settings)
+
+    def _handle_action(self, endpoint, method, params, query, body):
+        return body if isinstance(body, dict) else {}
+
+    def _handle_apply(self, endpoint, method, params, query, body):
+        if method == "POST":
+            self.pending.pop(endpoint.path, None)
+        pending = sorted(self.pending.get(endpoint.path, ()))
+        return {"applied": not pending, "pending_subsystems": pending}
+
+    # -- ASGI ----------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": sum(self.requests.values()),
+            "by_endpoint": {f"{m} {p}": n for (m, p), n in self.requests.most_common()},
+            "injected_failures": {str(code): n for code, n in self.failures.items()},
+            "pending": {path: sorted(s) for path, s in self.pending.items()},
+        }
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        method, path = scope["method"], scope["path"]
+        raw = b""
+        while True:
+            message = await receive()
+            raw += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        params = parse_qsl(scope.get("query_string", b"").decode(), keep_blank_values=True)
+
+        if path.startswith("/_mock/"):
+            status, payload = self._control(method, path, raw)
+            await _send_json(send, status, payload)
+            return
+
+        self._seq += 1
+        self.requests[(method, path)] += 1
+        delay = self.faults.delay(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers = {k.decode().lower(): v.decode() for k, v in scope.get("headers", [])}
+        if self.api_key is not None and headers.get("x-api-key") != self.api_key:
+            await _send_json(send, 401, _envelope(401, "AUTH_FAILED", "Authentication failed."))
+            return
+
+        forced = self.faults.pick(self._seq, self._rng)
+        if forced is not None:
+            self.failures[forced] += 1
+            if forced == 502:
+                await _send_raw(send, 502, b"<html><body><h1>502 Bad Gateway</h1></body></html>",
+                                b"text/html")
+            else:
+                await _send_json(send, forced, _envelope(forced, "INJECTED_FAILURE", "Injected failure."))
+            return
+
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            await _send_json(send, 400, _envelope(400, "BODY_INVALID_JSON", "Request body is not valid JSON."))
+            return
+        try:
+            data = self.handle(method, path, params, body)
+        except _ApiError as e:
+            await _send_json(send, e.code, _envelope(e.code, e.response_id, e.message))
+            return
+        await _send_json(send, 200, _envelope(200, "SUCCESS", "", data))
+
+    def _control(self, method: str, path: str, raw: bytes) -> tuple[int, Any]:
+        """Test hooks: GET /_mock/stats, POST /_mock/reset, POST /_mock/faults."""
+        if path == "/_mock/stats" and method == "GET":
+            return 200, self.stats()
+        if path == "/_mock/reset" and method == "POST":
+            self.reset()
+            return 200, {"reset": True}
+        if path == "/_mock/faults" and method == "POST":
+            settings = json.loads(raw or b"{}")
+            fail_next = settings.pop("fail_next", None)
+            for name, value in settings.items():
+                if name.startswith("_") or not hasattr(self.faults, name):
+                    return 400, {"error": f"unknown fault setting {name!r}"}
+                setattr(self.faults, name, value)
+            if fail_next:
+                self.faults.fail_next(int(fail_next.get("count", 1)), int(fail_next.get("status", 502)))
+            return 200, {k: v for k, v in vars(self.faults).items() if not k.startswith("_")}
+        return 404, {"error": f"unknown control endpoint {method} {path}"}
+
+
+def _envelope(code: int, response_id: str, message: str, data: Any = None) -> dict[str, Any]:
+    return {
+        "code": code,
+        "status": _STATUS_TEXT.get(code, "error"),
+        "response_id": response_id,
+        "message": message,
+        "data": [] if data is None else data,
+    }
+
+
+async def _send_raw(send: Any, status: int, body: bytes, content_type: bytes) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send: Any, status: int, payload: Any) -> None:
+    await _send_raw(send, status, json.dumps(payload).encode(), b"application/json")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a mock pfSense REST API v2")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--api-key", default=DEFAULT_API_KEY,
+                        help="Required X-API-Key value (empty string disables auth)")
+    parser.add_argument("--records", type=int, default=DEFAULT_RECORDS,
+                        help="Fixture rows per collection")
+    parser.add_argument("--size", action="append", default=[], metavar="PATH=N",
+                        help="Override fixture rows for one collection, e.g. /api/v2/firewall/rules=5000")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 500 response")
+    parser.add_argument("--burst-every", type=int, default=0, help="Start a 502 burst every N requests")
+    parser.add_argument("--burst-length", type=int, default=5, help="Requests per 502 burst")
+    args = parser.parse_args(argv)
+
+    sizes = {}
+    for item in args.size:
+        path, _, count = item.partition("=")
+        sizes[path] = int(count)
+
+    import uvicorn
+
+    app = MockPfSense(
+        records=args.records,
+        sizes=sizes,
+        api_key=args.api_key or None,
+        seed=args.seed,
+        faults=Faults(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            burst_every=args.burst_every,
+            burst_length=args.burst_length if args.burst_every else 0,
+        ),
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
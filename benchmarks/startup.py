@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Startup and import-time benchmark for the generated pfSense MCP server.
+
+Each configuration (a PFSENSE_MODULES / PFSENSE_READ_ONLY / PFSENSE_LAZY_TOOLS
+combination) is measured in fresh subprocesses, recording:
+
+- import wall time of generated/server.py (fastmcp is imported first and
+  excluded, so only our own startup cost is counted)
+- registered tool count, checked against the count derived from the spec
+- time of the first and a repeat tools/list over an in-memory MCP client,
+  and the size of the serialized tool list
+- RSS growth caused by importing the server, and peak RSS
+
+Results are written as JSON. Pass --compare with an earlier results file to
+fail (exit 1) when any configuration regressed beyond the thresholds.
+
+Usage:
+    python -m benchmarks.startup --output bench-startup.json
+    python -m benchmarks.startup --per-module --repeat 5
+    python -m benchmarks.startup --no-bytecode --compare bench-startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import fastmcp
+
+from generator.context_builder import (
+    MODULE_ORDER,
+    _ALL_MODULES,
+    build_tool_contexts,
+    build_tool_index,
+)
+from generator.loader import load_spec
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SPEC_PATH = REPO_ROOT / "openapi-spec.json"
+SERVER_DIR = REPO_ROOT / "generated"
+
+# Regressions smaller than the absolute floor are treated as noise.
+DEFAULT_MAX_TIME_REGRESSION = 0.25  # fraction of the baseline
+DEFAULT_MIN_TIME_DELTA = 0.05  # seconds
+DEFAULT_MAX_RSS_REGRESSION = 0.15  # fraction of the baseline
+DEFAULT_MIN_RSS_DELTA = 5.0  # MiB
+
+# Metrics compared by --compare: result key -> (kind, description)
+COMPARED_METRICS = {
+    "import_s": ("time", "import time"),
+    "first_list_s": ("time", "first tools/list"),
+    "list_s": ("time", "tools/list"),
+    "rss_delta_mb": ("rss", "RSS growth"),
+}
+
+
+@dataclass(frozen=True)
+class Config:
+    """One server configuration to benchmark."""
+
+    name: str
+    modules: tuple[str, ...]
+    read_only: bool = False
+    lazy: bool = False
+
+    def env(self) -> dict[str, str]:
+        return {
+            "PFSENSE_MODULES": ",".join(self.modules),
+            "PFSENSE_READ_ONLY": "true" if self.read_only else "false",
+            "PFSENSE_LAZY_TOOLS": "true" if self.lazy else "false",
+        }
+
+
+ALL = tuple(m for m in MODULE_ORDER if m in _ALL_MODULES)
+# The module set recommended in the README for day-to-day use.
+RECOMMENDED = (
+    "firewall", "vpn_wireguard", "services_dhcp", "services_dns_resolver",
+    "services_misc", "routing", "interface", "system", "status",
+    "diagnostics", "user", "auth",
+)
+
+DEFAULT_CONFIGS = (
+    Config("all", ALL),
+    Config("all-read-only", ALL, read_only=True),
+    Config("all-lazy", ALL, lazy=True),
+    Config("recommended", RECOMMENDED),
+    Config("monitoring", ("status", "diagnostics"), read_only=True),
+    Config("none", ()),
+)
+
+
+def per_module_configs() -> list[Config]:
+    return [Config(f"module:{m}", (m,)) for m in MODULE_ORDER]
+
+
+# ---------------------------------------------------------------------------
+# Expected tool counts (spec-derived, same approach as test_modules.py)
+# ---------------------------------------------------------------------------
+
+
+# Always-on tools with these methods write config and honour PFSENSE_READ_ONLY.
+_MUTATION_METHODS = ("post", "patch", "put", "delete")
+
+
+def expected_tool_counts(configs: list[Config]) -> dict[str, int]:
+    """Number of tools each configuration should register."""
+    contexts = build_tool_contexts(load_spec(SPEC_PATH))
+    always_on = [e for e in build_tool_index(contexts) if e["module"] == "_always_on"]
+    counts = {}
+    for cfg in configs:
+        counts[cfg.name] = sum(
+            1 for e in always_on if not (cfg.read_only and e["method"] in _MUTATION_METHODS)
+        ) + sum(
+            1
+            for c in contexts
+            if c.module in cfg.modules and not (cfg.read_only and c.is_mutation)
+        )
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Measurement (runs in a fresh interpreter per sample)
+# ---------------------------------------------------------------------------
+
+_MEASURE = """\
+import asyncio, json, os, resource, sys, time
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+import fastmcp
+from fastmcp import Client
+rss_before = rss_mb()
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import server as srv
+import_s = time.perf_counter() - start
+rss_after = rss_mb()
+registered = len(srv.mcp._tool_manager._tools)
+
+async def list_tools():
+    async with Client(srv.mcp) as client:
+        start = time.perf_counter()
+        tools = await client.list_tools()
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        tools = await client.list_tools()
+        again = time.perf_counter() - start
+    payload = json.dumps([t.model_dump(mode="json") for t in tools])
+    return len(tools), first, again, len(payload)
+
+listed, first_list_s, list_s, list_bytes = asyncio.run(list_tools())
+print(json.dumps({
+    "import_s": import_s,
+    "registered_at_import": registered,
+    "tools": listed,
+    "first_list_s": first_list_s,
+    "list_s": list_s,
+    "list_bytes": list_bytes,
+    "rss_delta_mb": rss_after - rss_before,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def measure_once(cfg: Config, server_dir: Path, bytecode: bool) -> dict:
+    """Import the server once in a fresh interpreter and return its metrics."""
+    env = {
+        **os.environ,
+        "PFSENSE_HOST": "https://127.0.0.1:9",
+        "PFSENSE_API_KEY": "bench",
+        "PFSENSE_PREWARM_CONNECTIONS": "0",
+        **cfg.env(),
+    }
+    if bytecode:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    else:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _MEASURE, str(server_dir)],
+        capture_output=True,
+        text=True,
+        cwd=str(REPO_ROOT),
+        env=env,
+        timeout=300,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{cfg.name}: benchmark subprocess failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_config(cfg: Config, expected: int, repeat: int, server_dir: Path, bytecode: bool) -> dict:
+    """Measure one configuration `repeat` times and summarize with medians."""
+    if bytecode:
+        # Untimed warm-up so __pycache__ is populated like a second launch.
+        measure_once(cfg, server_dir, bytecode)
+    samples = [measure_once(cfg, server_dir, bytecode) for _ in range(repeat)]
+    summary: dict = {
+        "modules": list(cfg.modules),
+        "read_only": cfg.read_only,
+        "lazy": cfg.lazy,
+        "expected_tools": expected,
+        "tools": samples[0]["tools"],
+        "registered_at_import": samples[0]["registered_at_import"],
+        "list_bytes": samples[0]["list_bytes"],
+    }
+    for key in ("import_s", "first_list_s", "list_s", "rss_delta_mb", "peak_rss_mb"):
+        values = [s[key] for s in samples]
+        summary[key] = round(statistics.median(values), 4)
+        summary[f"{key}_samples"] = [round(v, 4) for v in values]
+    return summary
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=str(REPO_ROOT), timeout=10,
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def run(configs: list[Config], repeat: int, server_dir: Path, bytecode: bool) -> dict:
+    """Benchmark every configuration and return the JSON-ready results."""
+    expected = expected_tool_counts(configs)
+    if bytecode:
+        return _run(configs, expected, repeat, server_dir, bytecode)
+    # Measure a copy without __pycache__, as a read-only Nix store install
+    # has no bytecode for the generated files.
+    with tempfile.TemporaryDirectory() as tmp:
+        copy = Path(tmp) / "server"
+        shutil.copytree(server_dir, copy, ignore=shutil.ignore_patterns("__pycache__"))
+        return _run(configs, expected, repeat, copy, bytecode, reported_dir=server_dir)
+
+
+def _run(
+    configs: list[Config],
+    expected: dict[str, int],
+    repeat: int,
+    server_dir: Path,
+    bytecode: bool,
+    reported_dir: Path | None = None,
+) -> dict:
+    results = {}
+    for cfg in configs:
+        results[cfg.name] = run_config(cfg, expected[cfg.name], repeat, server_dir, bytecode)
+        r = results[cfg.name]
+        print(
+            f"  {cfg.name:<24} {r['tools']:>4} tools  import {r['import_s']:.3f}s  "
+            f"list {r['first_list_s']:.3f}s/{r['list_s']:.3f}s  "
+            f"rss +{r['rss_delta_mb']:.1f} MiB",
+            file=sys.stderr,
+        )
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fastmcp": fastmcp.__version__,
+            "repeat": repeat,
+            "bytecode": bytecode,
+            "server_dir": str(reported_dir or server_dir),
+        },
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Regression checks
+# ---------------------------------------------------------------------------
+
+
+def check(
+    current: dict,
+    baseline: dict | None = None,
+    *,
+    max_time_regression: float = DEFAULT_MAX_TIME_REGRESSION,
+    min_time_delta: float = DEFAULT_MIN_TIME_DELTA,
+    max_rss_regression: float = DEFAULT_MAX_RSS_REGRESSION,
+    min_rss_delta: float = DEFAULT_MIN_RSS_DELTA,
+) -> list[str]:
+    """Return a description of every failure (empty when all is well).
+
+    Tool counts must always match the spec. With a baseline, a metric fails
+    only if it exceeds the baseline by both the relative and the absolute
+    threshold, so sub-noise jitter on fast configurations never trips it.
+    """
+    failures = []
+    for name, result in current["results"].items():
+        if result["tools"] != result["expected_tools"]:
+            failures.append(
+                f"{name}: {result['tools']} tools listed, expected {result['expected_tools']}"
+            )
+        if baseline is None or name not in baseline["results"]:
+            continue
+        base = baseline["results"][name]
+        for key, (kind, label) in COMPARED_METRICS.items():
+            if key not in base:
+                continue
+            if kind == "time":
+                limit_ratio, floor = max_time_regression, min_time_delta
+            else:
+                limit_ratio, floor = max_rss_regression, min_rss_delta
+            delta = result[key] - base[key]
+            if delta > floor and delta > base[key] * limit_ratio:
+                failures.append(
+                    f"{name}: {label} {result[key]:.3f} vs baseline {base[key]:.3f} "
+                    f"(+{delta:.3f})"
+                )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pfSense MCP server startup")
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to check against")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per configuration (median is reported)")
+    parser.add_argument("--config", action="append", dest="configs", metavar="NAME",
+                        help="Only run the named configuration (repeatable)")
+    parser.add_argument("--per-module", action="store_true", help="Also benchmark each module on its own")
+    parser.add_argument("--no-bytecode", action="store_true",
+                        help="Disable bytecode caching, like running from a read-only Nix store")
+    parser.add_argument("--server-dir", type=Path, default=SERVER_DIR,
+                        help="Directory containing the generated server.py")
+    parser.add_argument("--max-time-regression", type=float, default=DEFAULT_MAX_TIME_REGRESSION)
+    parser.add_argument("--min-time-delta", type=float, default=DEFAULT_MIN_TIME_DELTA)
+    parser.add_argument("--max-rss-regression", type=float, default=DEFAULT_MAX_RSS_REGRESSION)
+    parser.add_argument("--min-rss-delta", type=float, default=DEFAULT_MIN_RSS_DELTA)
+    args = parser.parse_args(argv)
+
+    configs = list(DEFAULT_CONFIGS)
+    if args.per_module:
+        configs += per_module_configs()
+    if args.configs:
+        by_name = {c.name: c for c in DEFAULT_CONFIGS + tuple(per_module_configs())}
+        unknown = [n for n in args.configs if n not in by_name]
+        if unknown:
+            parser.error(f"unknown configuration(s): {', '.join(unknown)} "
+                         f"(choose from {', '.join(by_name)})")
+        configs = [by_name[n] for n in args.configs]
+
+    print(f"Benchmarking {len(configs)} configurations x {args.repeat}...", file=sys.stderr)
+    current = run(configs, args.repeat, args.server_dir, bytecode=not args.no_bytecode)
+
+    text = json.dumps(current, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if baseline and baseline["meta"].get("bytecode") != current["meta"]["bytecode"]:
+        print("WARNING: baseline was measured with a different --no-bytecode setting",
+              file=sys.stderr)
+    failures = check(
+        current,
+        baseline,
+        max_time_regression=args.max_time_regression,
+        min_time_delta=args.min_time_delta,
+        max_rss_regression=args.max_rss_regression,
+        min_rss_delta=args.min_rss_delta,
+    )
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
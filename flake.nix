@@ -25,7 +25,7 @@
         name = "pfsense-mcp";
         runtimeInputs = [pythonEnv];
         text = ''
-          exec fastmcp run ${./generated/server.py}
+          exec fastmcp run ${./generated}/server.py
         '';
       };
     });
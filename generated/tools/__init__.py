@@ -0,0 +1 @@
+"""Auto-generated per-module pfSense MCP tools (loaded by server.py)."""
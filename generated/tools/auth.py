@@ -0,0 +1,218 @@
+# Auto-generated pfSense MCP tools — module: auth
+# 5 tools: 1 read, 4 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "auth" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_auth_keys(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/auth/keys
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, hash, hash_algo, id, key, length_bytes, username
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "hash", "hash_algo", "id", "key", "length_bytes", "username",
+        })))
+    return await _list_paged(
+        "/api/v2/auth/keys",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_post_auth_jwt(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/auth/jwt
+
+        WARNING: This endpoint requires HTTP BasicAuth (username:password).
+        It does NOT accept API key or JWT auth. Will return 401 via MCP.
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/auth/jwt. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/auth/jwt",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_auth_key(
+        confirm: bool = False,
+        descr: str | None = None,
+        hash: str | None = None,
+        hash_algo: str | None = 'sha256',
+        key: str | None = None,
+        length_bytes: int | None = 24,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/auth/key
+
+        WARNING: This endpoint requires HTTP BasicAuth (username:password).
+        It does NOT accept API key or JWT auth. Will return 401 via MCP.
+
+        descr: Sets a description for this API key. This is used to identify the key's purpose and cannot be changed once created.
+        hash: The hash of the generated API key
+        hash_algo: The hash algorithm used for this API key. It is recommended to increase the strength of the algorithm for keys assigned to privileged users. Valid values: ['sha256', 'sha384', 'sha512']
+        key: The real API key. This value is not stored internally and cannot be recovered if lost.
+        length_bytes: The length of the API key (in bytes). Greater key lengths provide greater security, but also increase the number of characters used in the key string. Valid values: [16, 24, 32, 64]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/auth/key. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if descr is not None:
+            body["descr"] = descr
+        if hash is not None:
+            body["hash"] = hash
+        if hash_algo is not None:
+            body["hash_algo"] = hash_algo
+        if key is not None:
+            body["key"] = key
+        if length_bytes is not None:
+            body["length_bytes"] = length_bytes
+        return await _client.request(
+            "POST",
+            "/api/v2/auth/key",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_auth_key(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/auth/key
+
+        WARNING: This endpoint requires HTTP BasicAuth (username:password).
+        It does NOT accept API key or JWT auth. Will return 401 via MCP.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/auth/key. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/auth/key",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_auth_keys(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/auth/keys
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/auth/keys. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/auth/keys",
+            params=params,
+        )
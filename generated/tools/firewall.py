@@ -0,0 +1,5241 @@
+# Auto-generated pfSense MCP tools — module: firewall
+# 99 tools: 33 read, 66 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "firewall" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_advanced_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/advanced_settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/advanced_settings",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_alias(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/alias
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/alias",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_aliases(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/aliases
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: address, descr, detail, id, name, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "name", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/aliases",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_nat_one_to_one_mapping(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/one_to_one/mapping
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/nat/one_to_one/mapping",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_nat_one_to_one_mappings(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/one_to_one/mappings
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, destination, disabled, external, id, interface, ipprotocol, natreflection, nobinat, source
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "destination", "external", "id", "interface", "ipprotocol",
+            "natreflection", "source",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/nat/one_to_one/mappings",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_nat_outbound_mapping(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/outbound/mapping
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/nat/outbound/mapping",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_nat_outbound_mappings(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/outbound/mappings
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, destination, destination_port, disabled, id, interface, nat_port, nonat, nosync, poolopts, protocol, source, source_hash_key, source_port, static_nat_port, target, target_subnet
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "destination", "destination_port", "id", "interface", "nat_port",
+            "poolopts", "protocol", "source", "source_hash_key", "source_port",
+            "target", "target_subnet",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/nat/outbound/mappings",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_nat_outbound_mode(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/outbound/mode
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/nat/outbound/mode",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_nat_port_forward(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/port_forward
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/nat/port_forward",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_nat_port_forwards(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/nat/port_forwards
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: associated_rule_id, created_by, created_time, descr, destination, destination_port, disabled, id, interface, ipprotocol, local_port, natreflection, nordr, nosync, protocol, source, source_port, target, updated_by, updated_time
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "associated_rule_id", "created_by", "created_time", "descr", "destination",
+            "destination_port", "id", "interface", "ipprotocol", "local_port",
+            "natreflection", "protocol", "source", "source_port", "target",
+            "updated_by", "updated_time",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/nat/port_forwards",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_rule(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/rule
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/rule",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_rules(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/rules
+
+    NOTE: Rules reference firewall aliases by name (e.g. source='MY_ALIAS'). To resolve alias names to their actual IPs/networks, call pfsense_list_firewall_aliases and match by name.
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: ackqueue, associated_rule_id, created_by, created_time, defaultqueue, descr, destination, destination_port, direction, disabled, dnpipe, floating, gateway, icmptype, id, interface, ipprotocol, log, pdnpipe, protocol, quick, sched, source, source_port, statetype, tag, tcp_flags_any, tcp_flags_out_of, tcp_flags_set, tracker, type, updated_by, updated_time, interface_descr
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "ackqueue", "associated_rule_id", "created_by", "created_time",
+            "defaultqueue", "descr", "destination", "destination_port", "direction",
+            "dnpipe", "gateway", "id", "ipprotocol", "pdnpipe", "protocol", "sched",
+            "source", "source_port", "statetype", "tag", "tracker", "type",
+            "updated_by", "updated_time",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/rules",
+        params,
+        fields,
+        query,
+        enrich=_enrich_firewall_rules_with_interface_descr,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_schedule(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/schedule
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/schedule",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_schedule_time_range(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/schedule/time_range
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/schedule/time_range",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_schedule_time_ranges(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/schedule/time_ranges
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: day, hour, id, month, parent_id, position, rangedescr
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "hour", "id", "parent_id", "rangedescr",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/schedule/time_ranges",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_schedules(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/schedules
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: active, descr, id, name, schedlabel, timerange
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "name", "schedlabel",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/schedules",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_state(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/state
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/state",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_states(
+    limit: int | None = 100,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/states
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: age, bytes_in, bytes_out, bytes_total, destination, direction, expires_in, id, interface, packets_in, packets_out, packets_total, protocol, source, state
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "age", "bytes_in", "bytes_out", "bytes_total", "destination", "direction",
+            "expires_in", "id", "interface", "packets_in", "packets_out",
+            "packets_total", "protocol", "source", "state",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/states",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_states_size(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/states/size
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/states/size",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_traffic_shaper(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/traffic_shaper",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_traffic_shaper_limiter_bandwidth(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/limiter/bandwidth
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/traffic_shaper/limiter/bandwidth",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_traffic_shaper_limiter_bandwidths(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/limiter/bandwidths
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: bw, bwscale, bwsched, id, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "bw", "bwscale", "bwsched", "id", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/traffic_shaper/limiter/bandwidths",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_traffic_shaper_limiter(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/limiter
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/traffic_shaper/limiter",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_traffic_shaper_limiter_queue(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/limiter/queue
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/traffic_shaper/limiter/queue",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_traffic_shaper_limiter_queues(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/limiter/queues
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: aqm, buckets, description, ecn, enabled, id, mask, maskbits, maskbitsv6, name, number, param_codel_interval, param_codel_target, param_gred_max_p, param_gred_max_th, param_gred_min_th, param_gred_w_q, param_pie_alpha, param_pie_beta, param_pie_max_burst, param_pie_max_ecnth, param_pie_target, param_pie_tupdate, param_red_max_p, param_red_max_th, param_red_min_th, param_red_w_q, parent_id, pie_capdrop, pie_onoff, pie_pderand, pie_qdelay, plr, qlimit, weight
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "aqm", "buckets", "description", "id", "mask", "maskbits", "maskbitsv6",
+            "name", "number", "param_codel_interval", "param_codel_target",
+            "param_gred_max_p", "param_gred_max_th", "param_gred_min_th",
+            "param_gred_w_q", "param_pie_alpha", "param_pie_beta",
+            "param_pie_max_burst", "param_pie_max_ecnth", "param_pie_target",
+            "param_pie_tupdate", "param_red_max_p", "param_red_max_th",
+            "param_red_min_th", "param_red_w_q", "parent_id", "qlimit", "weight",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/traffic_shaper/limiter/queues",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_traffic_shaper_limiters(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/limiters
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: aqm, bandwidth, buckets, delay, description, ecn, enabled, id, mask, maskbits, maskbitsv6, name, number, param_codel_interval, param_codel_target, param_fq_codel_flows, param_fq_codel_interval, param_fq_codel_limit, param_fq_codel_quantum, param_fq_codel_target, param_fq_pie_alpha, param_fq_pie_beta, param_fq_pie_flows, param_fq_pie_limit, param_fq_pie_max_burst, param_fq_pie_max_ecnth, param_fq_pie_quantum, param_fq_pie_target, param_fq_pie_tupdate, param_gred_max_p, param_gred_max_th, param_gred_min_th, param_gred_w_q, param_pie_alpha, param_pie_beta, param_pie_max_burst, param_pie_max_ecnth, param_pie_target, param_pie_tupdate, param_red_max_p, param_red_max_th, param_red_min_th, param_red_w_q, pie_capdrop, pie_onoff, pie_pderand, pie_qdelay, plr, qlimit, queue, sched
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "aqm", "buckets", "delay", "description", "id", "mask", "maskbits",
+            "maskbitsv6", "name", "number", "param_codel_interval",
+            "param_codel_target", "param_fq_codel_flows", "param_fq_codel_interval",
+            "param_fq_codel_limit", "param_fq_codel_quantum", "param_fq_codel_target",
+            "param_fq_pie_alpha", "param_fq_pie_beta", "param_fq_pie_flows",
+            "param_fq_pie_limit", "param_fq_pie_max_burst", "param_fq_pie_max_ecnth",
+            "param_fq_pie_quantum", "param_fq_pie_target", "param_fq_pie_tupdate",
+            "param_gred_max_p", "param_gred_max_th", "param_gred_min_th",
+            "param_gred_w_q", "param_pie_alpha", "param_pie_beta",
+            "param_pie_max_burst", "param_pie_max_ecnth", "param_pie_target",
+            "param_pie_tupdate", "param_red_max_p", "param_red_max_th",
+            "param_red_min_th", "param_red_w_q", "qlimit", "sched",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/traffic_shaper/limiters",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_traffic_shaper_queue(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/queue
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/traffic_shaper/queue",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_traffic_shaper_queues(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shaper/queues
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: bandwidth, bandwidthtype, borrow, buckets, codel, default, description, ecn, enabled, hogs, id, interface, linkshare, linkshare_d, linkshare_m1, linkshare_m2, name, parent_id, priority, qlimit, realtime, realtime_d, realtime_m1, realtime_m2, red, rio, upperlimit, upperlimit_d, upperlimit_m1, upperlimit_m2
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "bandwidth", "bandwidthtype", "buckets", "description", "hogs", "id",
+            "interface", "linkshare_d", "linkshare_m1", "linkshare_m2", "name",
+            "parent_id", "priority", "qlimit", "realtime_d", "realtime_m1",
+            "realtime_m2", "upperlimit_d", "upperlimit_m1", "upperlimit_m2",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/traffic_shaper/queues",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_traffic_shapers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/traffic_shapers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: bandwidth, bandwidthtype, enabled, id, interface, name, qlimit, queue, scheduler, tbrconfig
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "bandwidth", "bandwidthtype", "id", "interface", "name", "qlimit",
+            "scheduler", "tbrconfig",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/traffic_shapers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_virtual_ip_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/virtual_ip/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/virtual_ip/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_firewall_virtual_ip(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/virtual_ip
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/firewall/virtual_ip",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_firewall_virtual_ips(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/firewall/virtual_ips
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: advbase, advskew, carp_mode, carp_peer, carp_status, descr, id, interface, mode, noexpand, password, subnet, subnet_bits, type, uniqid, vhid
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "advbase", "advskew", "carp_mode", "carp_peer", "carp_status", "descr",
+            "id", "interface", "mode", "password", "subnet", "subnet_bits", "type",
+            "uniqid", "vhid",
+        })))
+    return await _list_paged(
+        "/api/v2/firewall/virtual_ips",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_advanced_settings(
+        confirm: bool = False,
+        aliasesresolveinterval: int | None = None,
+        checkaliasesurlcert: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/advanced_settings
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        aliasesresolveinterval: The interval (in seconds) at which to resolve hostnames in aliases.
+        checkaliasesurlcert: Check the certificate of URLs used in aliases.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/advanced_settings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if aliasesresolveinterval is not None:
+            body["aliasesresolveinterval"] = aliasesresolveinterval
+        if checkaliasesurlcert is not None:
+            body["checkaliasesurlcert"] = checkaliasesurlcert
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/advanced_settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_alias(
+        name: str,
+        type_: str,
+        confirm: bool = False,
+        address: list[str] | None = None,
+        descr: str | None = None,
+        detail: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/alias
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        name: Sets the name for the alias. This name must be unique from all other aliases.
+        type_: Sets the type of alias this object will be. This directly impacts what values can be specified in the `address` field. Valid values: ['host', 'network', 'port']
+        address: Sets the host, network or port entries for the alias. When `type` is set to `host`, each entry must be a valid IP address or FQDN. When `type` is set to `network`, each entry must be a valid network CIDR or FQDN. When `type` is set to `port`, each entry must be a valid port or port range. You may also specify an existing alias's `name` as an entry to created nested aliases.
+        descr: Sets a description to help specify the purpose or contents of the alias.
+        detail: Sets descriptions for each alias `address`. Values must match the order of the `address` value it relates to. For example, the first value specified here is the description for the first value specified in the `address` field. This value cannot contain
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if type_ is not None:
+            body["type"] = type_
+        if address is not None:
+            body["address"] = address
+        if descr is not None:
+            body["descr"] = descr
+        if detail is not None:
+            body["detail"] = detail
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/alias",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_alias(
+        id: str | int,
+        confirm: bool = False,
+        address: list[str] | None = None,
+        descr: str | None = None,
+        detail: list[str] | None = None,
+        name: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/alias
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        address: Sets the host, network or port entries for the alias. When `type` is set to `host`, each entry must be a valid IP address or FQDN. When `type` is set to `network`, each entry must be a valid network CIDR or FQDN. When `type` is set to `port`, each entry must be a valid port or port range. You may also specify an existing alias's `name` as an entry to created nested aliases.
+        descr: Sets a description to help specify the purpose or contents of the alias.
+        detail: Sets descriptions for each alias `address`. Values must match the order of the `address` value it relates to. For example, the first value specified here is the description for the first value specified in the `address` field. This value cannot contain
+        name: Sets the name for the alias. This name must be unique from all other aliases.
+        type_: Sets the type of alias this object will be. This directly impacts what values can be specified in the `address` field. Valid values: ['host', 'network', 'port']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if address is not None:
+            body["address"] = address
+        if descr is not None:
+            body["descr"] = descr
+        if detail is not None:
+            body["detail"] = detail
+        if name is not None:
+            body["name"] = name
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/alias",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_alias(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/alias
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/alias",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_aliases(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/aliases
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/aliases. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/aliases",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_aliases(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/aliases
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/aliases. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/aliases",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_firewall_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_nat_one_to_one_mapping(
+        destination: str,
+        external: str,
+        interface: str,
+        source: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        ipprotocol: str | None = 'inet',
+        natreflection: str | None = None,
+        nobinat: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/nat/one_to_one/mapping
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        destination: The destination IP address or subnet that traffic must match to apply this mapping. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        external: The external IP address or interface for the 1:1 mapping. Valid value options are: an IP address. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        interface: The interface this 1:1 NAT mapping applies to.
+        source: The source IP address or subnet that traffic must match to apply this mapping. Valid value options are: an existing interface, an IP address, a subnet CIDR, `any`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        descr: A description for this 1:1 NAT mapping
+        disabled: Disables this 1:1 NAT mapping.
+        ipprotocol: The IP version this mapping applies to. Valid values: ['inet', 'inet6']
+        natreflection: Enables or disables NAT reflection for traffic matching this mapping. Set to `null` to use the system default. Valid values: ['enable', 'disable']
+        nobinat: Exclude traffic matching this mapping from a later, more general, mapping.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/nat/one_to_one/mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if destination is not None:
+            body["destination"] = destination
+        if external is not None:
+            body["external"] = external
+        if interface is not None:
+            body["interface"] = interface
+        if source is not None:
+            body["source"] = source
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if natreflection is not None:
+            body["natreflection"] = natreflection
+        if nobinat is not None:
+            body["nobinat"] = nobinat
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/nat/one_to_one/mapping",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_nat_one_to_one_mapping(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        destination: str | None = None,
+        disabled: bool | None = None,
+        external: str | None = None,
+        interface: str | None = None,
+        ipprotocol: str | None = None,
+        natreflection: str | None = None,
+        nobinat: bool | None = None,
+        source: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/nat/one_to_one/mapping
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description for this 1:1 NAT mapping
+        destination: The destination IP address or subnet that traffic must match to apply this mapping. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        disabled: Disables this 1:1 NAT mapping.
+        external: The external IP address or interface for the 1:1 mapping. Valid value options are: an IP address. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        interface: The interface this 1:1 NAT mapping applies to.
+        ipprotocol: The IP version this mapping applies to. Valid values: ['inet', 'inet6']
+        natreflection: Enables or disables NAT reflection for traffic matching this mapping. Set to `null` to use the system default. Valid values: ['enable', 'disable']
+        nobinat: Exclude traffic matching this mapping from a later, more general, mapping.
+        source: The source IP address or subnet that traffic must match to apply this mapping. Valid value options are: an existing interface, an IP address, a subnet CIDR, `any`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/nat/one_to_one/mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if destination is not None:
+            body["destination"] = destination
+        if disabled is not None:
+            body["disabled"] = disabled
+        if external is not None:
+            body["external"] = external
+        if interface is not None:
+            body["interface"] = interface
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if natreflection is not None:
+            body["natreflection"] = natreflection
+        if nobinat is not None:
+            body["nobinat"] = nobinat
+        if source is not None:
+            body["source"] = source
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/nat/one_to_one/mapping",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_nat_one_to_one_mapping(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/nat/one_to_one/mapping
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/nat/one_to_one/mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/nat/one_to_one/mapping",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_nat_one_to_one_mappings(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/nat/one_to_one/mappings
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/nat/one_to_one/mappings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/nat/one_to_one/mappings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_nat_one_to_one_mappings(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/nat/one_to_one/mappings
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/nat/one_to_one/mappings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/nat/one_to_one/mappings",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_nat_outbound_mapping(
+        destination: str,
+        interface: str,
+        source: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        destination_port: str | None = None,
+        disabled: bool | None = None,
+        nat_port: str | None = None,
+        nonat: bool | None = None,
+        nosync: bool | None = None,
+        poolopts: str | None = None,
+        protocol: str | None = None,
+        source_hash_key: str | None = None,
+        source_port: str | None = None,
+        static_nat_port: bool | None = None,
+        target: str | None = None,
+        target_subnet: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/nat/outbound/mapping
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        destination: The destination network this rule should match. Valid value options are: an existing interface, a subnet CIDR, an existing alias, `any`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        interface: The interface on which traffic is matched as it exits the firewall. In most cases this is a WAN-type or another externally-connected interface.
+        source: The source network this rule should match. Valid value options are: an existing interface, a subnet CIDR, an existing alias, `any`, `(self)`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        descr: A description for the outbound NAT mapping.
+        destination_port: The destination port this rule should match. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall alias
+        disabled: Disable this outbound NAT rule.
+        nat_port: The external source port or port range used for rewriting the original source port on connections matching the rule. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`This field is only available when the following conditions are met:- `static_nat_port` must be equal to `false`- `nonat` must be equal to `false`
+        nonat: Do not NAT traffic matching this rule.
+        nosync: Do not sync this rule to HA peers.
+        poolopts: The pool option used to load balance external IP mapping when `target` is set to a subnet or alias of many addresses. Set to `null` to revert to the system default.This field is only available when the following conditions are met:- `nonat` must be equal to `false` Valid values: ['round-robin', 'round-robin sticky-address', 'random', 'random sticky-address', 'source-hash', 'bitmask']
+        protocol: The protocol this rule should match. Use `null` for any protocol. Valid values: ['tcp', 'udp', 'tcp/udp', 'icmp', 'esp', 'ah', 'gre', 'ipv6', 'igmp', 'pim', 'ospf']
+        source_hash_key: The key that is fed to the hashing algorithm in hex format. This must be a 16 byte (32 character) hex string prefixed with `0x`. If a value is not provided, one will automatically be generatedThis field is only available when the following conditions are met:- `poolopts` must be equal to `'source-hash'`- `nonat` must be equal to `false`
+        source_port: The source port this rule should match. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall alias
+        static_nat_port: Do not rewrite source port for traffic matching this rule.This field is only available when the following conditions are met:- `nonat` must be equal to `false`
+        target: The target network traffic matching this rule should be translated to. Valid value options are: an IP address, an existing alias. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `nonat` must be equal to `false`
+        target_subnet: The subnet bits for the assigned `target`. This field is only applicable if `target` is set to an IP address. This has no affect for alias or interface `targets`.This field is only available when the following conditions are met:- `nonat` must be equal to `false`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/nat/outbound/mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if destination is not None:
+            body["destination"] = destination
+        if interface is not None:
+            body["interface"] = interface
+        if source is not None:
+            body["source"] = source
+        if descr is not None:
+            body["descr"] = descr
+        if destination_port is not None:
+            body["destination_port"] = destination_port
+        if disabled is not None:
+            body["disabled"] = disabled
+        if nat_port is not None:
+            body["nat_port"] = nat_port
+        if nonat is not None:
+            body["nonat"] = nonat
+        if nosync is not None:
+            body["nosync"] = nosync
+        if poolopts is not None:
+            body["poolopts"] = poolopts
+        if protocol is not None:
+            body["protocol"] = protocol
+        if source_hash_key is not None:
+            body["source_hash_key"] = source_hash_key
+        if source_port is not None:
+            body["source_port"] = source_port
+        if static_nat_port is not None:
+            body["static_nat_port"] = static_nat_port
+        if target is not None:
+            body["target"] = target
+        if target_subnet is not None:
+            body["target_subnet"] = target_subnet
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/nat/outbound/mapping",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_nat_outbound_mapping(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        destination: str | None = None,
+        destination_port: str | None = None,
+        disabled: bool | None = None,
+        interface: str | None = None,
+        nat_port: str | None = None,
+        nonat: bool | None = None,
+        nosync: bool | None = None,
+        poolopts: str | None = None,
+        protocol: str | None = None,
+        source: str | None = None,
+        source_hash_key: str | None = None,
+        source_port: str | None = None,
+        static_nat_port: bool | None = None,
+        target: str | None = None,
+        target_subnet: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/nat/outbound/mapping
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description for the outbound NAT mapping.
+        destination: The destination network this rule should match. Valid value options are: an existing interface, a subnet CIDR, an existing alias, `any`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        destination_port: The destination port this rule should match. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall alias
+        disabled: Disable this outbound NAT rule.
+        interface: The interface on which traffic is matched as it exits the firewall. In most cases this is a WAN-type or another externally-connected interface.
+        nat_port: The external source port or port range used for rewriting the original source port on connections matching the rule. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`This field is only available when the following conditions are met:- `static_nat_port` must be equal to `false`- `nonat` must be equal to `false`
+        nonat: Do not NAT traffic matching this rule.
+        nosync: Do not sync this rule to HA peers.
+        poolopts: The pool option used to load balance external IP mapping when `target` is set to a subnet or alias of many addresses. Set to `null` to revert to the system default.This field is only available when the following conditions are met:- `nonat` must be equal to `false` Valid values: ['round-robin', 'round-robin sticky-address', 'random', 'random sticky-address', 'source-hash', 'bitmask']
+        protocol: The protocol this rule should match. Use `null` for any protocol. Valid values: ['tcp', 'udp', 'tcp/udp', 'icmp', 'esp', 'ah', 'gre', 'ipv6', 'igmp', 'pim', 'ospf']
+        source: The source network this rule should match. Valid value options are: an existing interface, a subnet CIDR, an existing alias, `any`, `(self)`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        source_hash_key: The key that is fed to the hashing algorithm in hex format. This must be a 16 byte (32 character) hex string prefixed with `0x`. If a value is not provided, one will automatically be generatedThis field is only available when the following conditions are met:- `poolopts` must be equal to `'source-hash'`- `nonat` must be equal to `false`
+        source_port: The source port this rule should match. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall alias
+        static_nat_port: Do not rewrite source port for traffic matching this rule.This field is only available when the following conditions are met:- `nonat` must be equal to `false`
+        target: The target network traffic matching this rule should be translated to. Valid value options are: an IP address, an existing alias. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `nonat` must be equal to `false`
+        target_subnet: The subnet bits for the assigned `target`. This field is only applicable if `target` is set to an IP address. This has no affect for alias or interface `targets`.This field is only available when the following conditions are met:- `nonat` must be equal to `false`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/nat/outbound/mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if destination is not None:
+            body["destination"] = destination
+        if destination_port is not None:
+            body["destination_port"] = destination_port
+        if disabled is not None:
+            body["disabled"] = disabled
+        if interface is not None:
+            body["interface"] = interface
+        if nat_port is not None:
+            body["nat_port"] = nat_port
+        if nonat is not None:
+            body["nonat"] = nonat
+        if nosync is not None:
+            body["nosync"] = nosync
+        if poolopts is not None:
+            body["poolopts"] = poolopts
+        if protocol is not None:
+            body["protocol"] = protocol
+        if source is not None:
+            body["source"] = source
+        if source_hash_key is not None:
+            body["source_hash_key"] = source_hash_key
+        if source_port is not None:
+            body["source_port"] = source_port
+        if static_nat_port is not None:
+            body["static_nat_port"] = static_nat_port
+        if target is not None:
+            body["target"] = target
+        if target_subnet is not None:
+            body["target_subnet"] = target_subnet
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/nat/outbound/mapping",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_nat_outbound_mapping(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/nat/outbound/mapping
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/nat/outbound/mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/nat/outbound/mapping",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_nat_outbound_mappings(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/nat/outbound/mappings
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/nat/outbound/mappings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/nat/outbound/mappings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_nat_outbound_mappings(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/nat/outbound/mappings
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/nat/outbound/mappings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/nat/outbound/mappings",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_nat_outbound_mode(
+        mode: str,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/nat/outbound/mode
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        mode: The outbound NAT mode to assign this system. Set to `automatic` to have this system automatically generate NAT rules this firewall, `hybrid` to automatically generate NAT rules AND allow manual outbound NAT mappings to be assigned, `manual` to prevent the system from automatically generating NAT rules and only allow manual outbound NAT mappings, or `disabled` to disable outbound NAT on this system entirely. Valid values: ['automatic', 'hybrid', 'advanced', 'disabled']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/nat/outbound/mode. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if mode is not None:
+            body["mode"] = mode
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/nat/outbound/mode",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_nat_port_forward(
+        destination: str,
+        interface: str,
+        protocol: str,
+        source: str,
+        target: str,
+        confirm: bool = False,
+        associated_rule_id: str | None = None,
+        descr: str | None = None,
+        destination_port: str | None = None,
+        disabled: bool | None = None,
+        ipprotocol: str | None = 'inet',
+        local_port: str | None = None,
+        natreflection: str | None = None,
+        nordr: bool | None = None,
+        nosync: bool | None = None,
+        source_port: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/nat/port_forward
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        destination: The destination address this rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        interface: The interface this port forward rule applies to.
+        protocol: The IP/transport protocol this port forward rule should match. Valid values: ['any', 'tcp', 'udp', 'tcp/udp', 'icmp', 'esp', 'ah', 'gre', 'ipv6', 'igmp', 'pim', 'ospf']
+        source: The source address this port forward rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        target: The IP address or alias of the internal host to forward matching traffic to. Valid value options are: an IP address, an existing alias. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        associated_rule_id: The associated firewall rule mode. Use an empty string to require a separate firewall rule to be created to pass traffic matching this port forward rule. Use `new` to create a new associated firewall rule to pass traffic matching this port forward rule. Use `pass` to automatically pass traffic matching this port forward rule without the need for a firewall rule. Otherwise, you can specify the `associated_rule_id` of an existing firewall rule to associate with this port forward rule.
+        descr: A description for this port forward rule.
+        destination_port: The destination port this port forward rule applies to. Set to `null` to allow any destination port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        disabled: Disables this port forward rule.
+        ipprotocol: The IP protocol this port forward rule should match. Valid values: ['inet', 'inet6', 'inet46']
+        local_port: The port on the internal host to forward matching traffic to. In most cases, this must match the `destination_port` value. In the event that the `desintation_port` is a range, this value should be the first value in that range. Valid options are: a TCP/UDP port number, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        natreflection: The NAT reflection mode to use for traffic matching this port forward rule. Set to `null` to use the system default. Valid values: ['enable', 'disable', 'purenat']
+        nordr: Disables redirection for traffic matching this rule.
+        nosync: Prevents this port forward rule from being synced to non-primary CARP members.
+        source_port: The source port this port forward rule applies to. Set to `null` to allow any source port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/nat/port_forward. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if destination is not None:
+            body["destination"] = destination
+        if interface is not None:
+            body["interface"] = interface
+        if protocol is not None:
+            body["protocol"] = protocol
+        if source is not None:
+            body["source"] = source
+        if target is not None:
+            body["target"] = target
+        if associated_rule_id is not None:
+            body["associated_rule_id"] = associated_rule_id
+        if descr is not None:
+            body["descr"] = descr
+        if destination_port is not None:
+            body["destination_port"] = destination_port
+        if disabled is not None:
+            body["disabled"] = disabled
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if local_port is not None:
+            body["local_port"] = local_port
+        if natreflection is not None:
+            body["natreflection"] = natreflection
+        if nordr is not None:
+            body["nordr"] = nordr
+        if nosync is not None:
+            body["nosync"] = nosync
+        if source_port is not None:
+            body["source_port"] = source_port
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/nat/port_forward",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_nat_port_forward(
+        id: str | int,
+        confirm: bool = False,
+        associated_rule_id: str | None = None,
+        descr: str | None = None,
+        destination: str | None = None,
+        destination_port: str | None = None,
+        disabled: bool | None = None,
+        interface: str | None = None,
+        ipprotocol: str | None = None,
+        local_port: str | None = None,
+        natreflection: str | None = None,
+        nordr: bool | None = None,
+        nosync: bool | None = None,
+        protocol: str | None = None,
+        source: str | None = None,
+        source_port: str | None = None,
+        target: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/nat/port_forward
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        associated_rule_id: The associated firewall rule mode. Use an empty string to require a separate firewall rule to be created to pass traffic matching this port forward rule. Use `new` to create a new associated firewall rule to pass traffic matching this port forward rule. Use `pass` to automatically pass traffic matching this port forward rule without the need for a firewall rule. Otherwise, you can specify the `associated_rule_id` of an existing firewall rule to associate with this port forward rule.
+        descr: A description for this port forward rule.
+        destination: The destination address this rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        destination_port: The destination port this port forward rule applies to. Set to `null` to allow any destination port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        disabled: Disables this port forward rule.
+        interface: The interface this port forward rule applies to.
+        ipprotocol: The IP protocol this port forward rule should match. Valid values: ['inet', 'inet6', 'inet46']
+        local_port: The port on the internal host to forward matching traffic to. In most cases, this must match the `destination_port` value. In the event that the `desintation_port` is a range, this value should be the first value in that range. Valid options are: a TCP/UDP port number, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        natreflection: The NAT reflection mode to use for traffic matching this port forward rule. Set to `null` to use the system default. Valid values: ['enable', 'disable', 'purenat']
+        nordr: Disables redirection for traffic matching this rule.
+        nosync: Prevents this port forward rule from being synced to non-primary CARP members.
+        protocol: The IP/transport protocol this port forward rule should match. Valid values: ['any', 'tcp', 'udp', 'tcp/udp', 'icmp', 'esp', 'ah', 'gre', 'ipv6', 'igmp', 'pim', 'ospf']
+        source: The source address this port forward rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        source_port: The source port this port forward rule applies to. Set to `null` to allow any source port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        target: The IP address or alias of the internal host to forward matching traffic to. Valid value options are: an IP address, an existing alias. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/nat/port_forward. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if associated_rule_id is not None:
+            body["associated_rule_id"] = associated_rule_id
+        if descr is not None:
+            body["descr"] = descr
+        if destination is not None:
+            body["destination"] = destination
+        if destination_port is not None:
+            body["destination_port"] = destination_port
+        if disabled is not None:
+            body["disabled"] = disabled
+        if interface is not None:
+            body["interface"] = interface
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if local_port is not None:
+            body["local_port"] = local_port
+        if natreflection is not None:
+            body["natreflection"] = natreflection
+        if nordr is not None:
+            body["nordr"] = nordr
+        if nosync is not None:
+            body["nosync"] = nosync
+        if protocol is not None:
+            body["protocol"] = protocol
+        if source is not None:
+            body["source"] = source
+        if source_port is not None:
+            body["source_port"] = source_port
+        if target is not None:
+            body["target"] = target
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/nat/port_forward",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_nat_port_forward(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/nat/port_forward
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/nat/port_forward. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/nat/port_forward",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_nat_port_forwards(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/nat/port_forwards
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/nat/port_forwards. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/nat/port_forwards",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_nat_port_forwards(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/nat/port_forwards
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/nat/port_forwards. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/nat/port_forwards",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_rule(
+        destination: str,
+        interface: list[str],
+        ipprotocol: str,
+        source: str,
+        type_: str,
+        confirm: bool = False,
+        ackqueue: str | None = None,
+        defaultqueue: str | None = None,
+        descr: str | None = None,
+        destination_port: str | None = None,
+        direction: str | None = None,
+        disabled: bool | None = None,
+        dnpipe: str | None = None,
+        floating: bool | None = None,
+        gateway: str | None = None,
+        icmptype: list[str] | None = None,
+        log: bool | None = None,
+        pdnpipe: str | None = None,
+        protocol: str | None = None,
+        quick: bool | None = None,
+        sched: str | None = None,
+        source_port: str | None = None,
+        statetype: str | None = 'keep state',
+        tag: str | None = None,
+        tcp_flags_any: bool | None = None,
+        tcp_flags_out_of: list[str] | None = None,
+        tcp_flags_set: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/rule
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        destination: The destination address this rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        interface: The interface where packets must originate to match this rule.
+        ipprotocol: The IP version(s) this rule applies to. Valid values: ['inet', 'inet6', 'inet46']
+        source: The source address this rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        type_: The action to take against traffic that matches this rule. Valid values: ['pass', 'block', 'reject']
+        ackqueue: The name of the traffic shaper queue to assume as the ACK queue for ACK traffic matching this rule.
+        defaultqueue: The name of the traffic shaper queue to assume as the default queue for traffic matching this rule.
+        descr: A description detailing the purpose or justification of this firewall rule.
+        destination_port: The destination port this rule applies to. Set to `null` to allow any destination port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        direction: The direction of traffic this firewall rule applies to. This field only applies to floating firewall rules.This field is only available when the following conditions are met:- `floating` must be equal to `true` Valid values: ['any', 'in', 'out']
+        disabled: Enable or disable this firewall rule.
+        dnpipe: The name of the traffic shaper limiter pipe or queue to use for incoming traffic.
+        floating: Mark this rule as a floating firewall rule.
+        gateway: The gateway traffic matching this rule will be routed to. Set to `null` to use default.
+        icmptype: Th ICMP subtypes this rule applies to. This field is only applicable when `ipprotocol` is `inet` and `protocol` is `icmp`.This field is only available when the following conditions are met:- `protocol` must be equal to `'icmp'`
+        log: Enable or disable logging of traffic that matches this rule.
+        pdnpipe: The name of the traffic shaper limiter pipe or queue to use for outgoing traffic.
+        protocol: The IP/transport protocol this rule should match. Valid values: ['tcp', 'udp', 'tcp/udp', 'icmp', 'esp', 'ah', 'gre', 'ipv6', 'igmp', 'pim', 'ospf', 'carp', 'pfsync']
+        quick: Apply this action to traffic that matches this rule immediately. This field only applies to floating firewall rules.This field is only available when the following conditions are met:- `floating` must be equal to `true`
+        sched: The name of an existing firewall schedule to assign to this firewall rule.
+        source_port: The source port this rule applies to. Set to `null` to allow any source port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        statetype: The state mechanism to use for this firewall rule. Valid values: ['keep state', 'sloppy state', 'synproxy state', 'none']
+        tag: A packet matching this rule can be marked and this mark used to match on other NAT/filter rules. It is called
+        tcp_flags_any: Allow any TCP flags.
+        tcp_flags_out_of: The TCP flags that can be set for this rule to match.This field is only available when the following conditions are met:- `tcp_flags_any` must be equal to `false`
+        tcp_flags_set: The TCP flags that must be set for this rule to match.This field is only available when the following conditions are met:- `tcp_flags_any` must be equal to `false`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/rule. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if destination is not None:
+            body["destination"] = destination
+        if interface is not None:
+            body["interface"] = interface
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if source is not None:
+            body["source"] = source
+        if type_ is not None:
+            body["type"] = type_
+        if ackqueue is not None:
+            body["ackqueue"] = ackqueue
+        if defaultqueue is not None:
+            body["defaultqueue"] = defaultqueue
+        if descr is not None:
+            body["descr"] = descr
+        if destination_port is not None:
+            body["destination_port"] = destination_port
+        if direction is not None:
+            body["direction"] = direction
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dnpipe is not None:
+            body["dnpipe"] = dnpipe
+        if floating is not None:
+            body["floating"] = floating
+        if gateway is not None:
+            body["gateway"] = gateway
+        if icmptype is not None:
+            body["icmptype"] = icmptype
+        if log is not None:
+            body["log"] = log
+        if pdnpipe is not None:
+            body["pdnpipe"] = pdnpipe
+        if protocol is not None:
+            body["protocol"] = protocol
+        if quick is not None:
+            body["quick"] = quick
+        if sched is not None:
+            body["sched"] = sched
+        if source_port is not None:
+            body["source_port"] = source_port
+        if statetype is not None:
+            body["statetype"] = statetype
+        if tag is not None:
+            body["tag"] = tag
+        if tcp_flags_any is not None:
+            body["tcp_flags_any"] = tcp_flags_any
+        if tcp_flags_out_of is not None:
+            body["tcp_flags_out_of"] = tcp_flags_out_of
+        if tcp_flags_set is not None:
+            body["tcp_flags_set"] = tcp_flags_set
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/rule",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_rule(
+        id: str | int,
+        confirm: bool = False,
+        ackqueue: str | None = None,
+        defaultqueue: str | None = None,
+        descr: str | None = None,
+        destination: str | None = None,
+        destination_port: str | None = None,
+        direction: str | None = None,
+        disabled: bool | None = None,
+        dnpipe: str | None = None,
+        floating: bool | None = None,
+        gateway: str | None = None,
+        icmptype: list[str] | None = None,
+        interface: list[str] | None = None,
+        ipprotocol: str | None = None,
+        log: bool | None = None,
+        pdnpipe: str | None = None,
+        protocol: str | None = None,
+        quick: bool | None = None,
+        sched: str | None = None,
+        source: str | None = None,
+        source_port: str | None = None,
+        statetype: str | None = None,
+        tag: str | None = None,
+        tcp_flags_any: bool | None = None,
+        tcp_flags_out_of: list[str] | None = None,
+        tcp_flags_set: list[str] | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/rule
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        ackqueue: The name of the traffic shaper queue to assume as the ACK queue for ACK traffic matching this rule.
+        defaultqueue: The name of the traffic shaper queue to assume as the default queue for traffic matching this rule.
+        descr: A description detailing the purpose or justification of this firewall rule.
+        destination: The destination address this rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        destination_port: The destination port this rule applies to. Set to `null` to allow any destination port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        direction: The direction of traffic this firewall rule applies to. This field only applies to floating firewall rules.This field is only available when the following conditions are met:- `floating` must be equal to `true` Valid values: ['any', 'in', 'out']
+        disabled: Enable or disable this firewall rule.
+        dnpipe: The name of the traffic shaper limiter pipe or queue to use for incoming traffic.
+        floating: Mark this rule as a floating firewall rule.
+        gateway: The gateway traffic matching this rule will be routed to. Set to `null` to use default.
+        icmptype: Th ICMP subtypes this rule applies to. This field is only applicable when `ipprotocol` is `inet` and `protocol` is `icmp`.This field is only available when the following conditions are met:- `protocol` must be equal to `'icmp'`
+        interface: The interface where packets must originate to match this rule.
+        ipprotocol: The IP version(s) this rule applies to. Valid values: ['inet', 'inet6', 'inet46']
+        log: Enable or disable logging of traffic that matches this rule.
+        pdnpipe: The name of the traffic shaper limiter pipe or queue to use for outgoing traffic.
+        protocol: The IP/transport protocol this rule should match. Valid values: ['tcp', 'udp', 'tcp/udp', 'icmp', 'esp', 'ah', 'gre', 'ipv6', 'igmp', 'pim', 'ospf', 'carp', 'pfsync']
+        quick: Apply this action to traffic that matches this rule immediately. This field only applies to floating firewall rules.This field is only available when the following conditions are met:- `floating` must be equal to `true`
+        sched: The name of an existing firewall schedule to assign to this firewall rule.
+        source: The source address this rule applies to. Valid value options are: an existing interface, an IP address, a subnet CIDR, an existing alias, `any`, `(self)`, `l2tp`, `pppoe`. The context of this address can be inverted by prefixing the value with `!`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.
+        source_port: The source port this rule applies to. Set to `null` to allow any source port. Valid options are: a TCP/UDP port number, a TCP/UDP port range separated by `:`, an existing port type firewall aliasThis field is only available when the following conditions are met:- `protocol` must be one of [ tcp, udp, tcp/udp ]
+        statetype: The state mechanism to use for this firewall rule. Valid values: ['keep state', 'sloppy state', 'synproxy state', 'none']
+        tag: A packet matching this rule can be marked and this mark used to match on other NAT/filter rules. It is called
+        tcp_flags_any: Allow any TCP flags.
+        tcp_flags_out_of: The TCP flags that can be set for this rule to match.This field is only available when the following conditions are met:- `tcp_flags_any` must be equal to `false`
+        tcp_flags_set: The TCP flags that must be set for this rule to match.This field is only available when the following conditions are met:- `tcp_flags_any` must be equal to `false`
+        type_: The action to take against traffic that matches this rule. Valid values: ['pass', 'block', 'reject']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/rule. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if ackqueue is not None:
+            body["ackqueue"] = ackqueue
+        if defaultqueue is not None:
+            body["defaultqueue"] = defaultqueue
+        if descr is not None:
+            body["descr"] = descr
+        if destination is not None:
+            body["destination"] = destination
+        if destination_port is not None:
+            body["destination_port"] = destination_port
+        if direction is not None:
+            body["direction"] = direction
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dnpipe is not None:
+            body["dnpipe"] = dnpipe
+        if floating is not None:
+            body["floating"] = floating
+        if gateway is not None:
+            body["gateway"] = gateway
+        if icmptype is not None:
+            body["icmptype"] = icmptype
+        if interface is not None:
+            body["interface"] = interface
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if log is not None:
+            body["log"] = log
+        if pdnpipe is not None:
+            body["pdnpipe"] = pdnpipe
+        if protocol is not None:
+            body["protocol"] = protocol
+        if quick is not None:
+            body["quick"] = quick
+        if sched is not None:
+            body["sched"] = sched
+        if source is not None:
+            body["source"] = source
+        if source_port is not None:
+            body["source_port"] = source_port
+        if statetype is not None:
+            body["statetype"] = statetype
+        if tag is not None:
+            body["tag"] = tag
+        if tcp_flags_any is not None:
+            body["tcp_flags_any"] = tcp_flags_any
+        if tcp_flags_out_of is not None:
+            body["tcp_flags_out_of"] = tcp_flags_out_of
+        if tcp_flags_set is not None:
+            body["tcp_flags_set"] = tcp_flags_set
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/rule",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_rule(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/rule
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/rule. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/rule",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_rules(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/rules
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/rules. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/rules",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_rules(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/rules
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/rules. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/rules",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_schedule(
+        name: str,
+        timerange: list[dict[str, Any]],
+        confirm: bool = False,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/schedule
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        name: The unique name to assign this schedule.
+        timerange: The date/times this firewall schedule will be active. Each object accepts: - position (array) - month (array) - day (array) - hour (string) - rangedescr (string)
+        descr: A description of this schedules purpose.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/schedule. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if timerange is not None:
+            body["timerange"] = timerange
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/schedule",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_schedule(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        name: str | None = None,
+        timerange: list[dict[str, Any]] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/schedule
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description of this schedules purpose.
+        name: The unique name to assign this schedule.
+        timerange: The date/times this firewall schedule will be active. Each object accepts: - position (array) - month (array) - day (array) - hour (string) - rangedescr (string)
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/schedule. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if name is not None:
+            body["name"] = name
+        if timerange is not None:
+            body["timerange"] = timerange
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/schedule",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_schedule(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/schedule
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/schedule. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/schedule",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_schedule_time_range(
+        hour: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        day: list[int] | None = None,
+        month: list[int] | None = None,
+        position: list[int] | None = None,
+        rangedescr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/schedule/time_range
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        hour: The start time and end time for this time range in 24-hour format (i.e. HH:MM-HH:MM).
+        parent_id: The ID of the parent this object is nested under.
+        day: The day for each specified `month` value. Each value specified must correspond with a `month` field value and must match the order exactly. For example, a `month` value of `[3, 6]` and a `day` value of `[2, 17]` would evaluate to March 2nd and June 17th respectively.This field is only available when the following conditions are met:- `position` must be equal to `NULL`
+        month: The month for each specified `day` value. Each value specified must correspond with a `day` field value and must match the order exactly. For example, a `month` value of `[3, 6]` and a `day` value of `[2, 17]` would evaluate to March 2nd and June 17th respectively.This field is only available when the following conditions are met:- `position` must be equal to `NULL`
+        position: The day of the week this schedule should be active for. Use `1` for every Monday, `2` for every Tuesday, `3` for every Wednesday, `4` for every Thursday, `5` for every Friday, `6` for every Saturday, or `7` for every Sunday. If this field has a value specified, the `month` and `day` fields will be unavailable.
+        rangedescr: A description detailing this firewall schedule time range's purpose.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/schedule/time_range. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if hour is not None:
+            body["hour"] = hour
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if day is not None:
+            body["day"] = day
+        if month is not None:
+            body["month"] = month
+        if position is not None:
+            body["position"] = position
+        if rangedescr is not None:
+            body["rangedescr"] = rangedescr
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/schedule/time_range",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_schedule_time_range(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        day: list[int] | None = None,
+        hour: str | None = None,
+        month: list[int] | None = None,
+        position: list[int] | None = None,
+        rangedescr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/schedule/time_range
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        day: The day for each specified `month` value. Each value specified must correspond with a `month` field value and must match the order exactly. For example, a `month` value of `[3, 6]` and a `day` value of `[2, 17]` would evaluate to March 2nd and June 17th respectively.This field is only available when the following conditions are met:- `position` must be equal to `NULL`
+        hour: The start time and end time for this time range in 24-hour format (i.e. HH:MM-HH:MM).
+        month: The month for each specified `day` value. Each value specified must correspond with a `day` field value and must match the order exactly. For example, a `month` value of `[3, 6]` and a `day` value of `[2, 17]` would evaluate to March 2nd and June 17th respectively.This field is only available when the following conditions are met:- `position` must be equal to `NULL`
+        position: The day of the week this schedule should be active for. Use `1` for every Monday, `2` for every Tuesday, `3` for every Wednesday, `4` for every Thursday, `5` for every Friday, `6` for every Saturday, or `7` for every Sunday. If this field has a value specified, the `month` and `day` fields will be unavailable.
+        rangedescr: A description detailing this firewall schedule time range's purpose.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/schedule/time_range. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if day is not None:
+            body["day"] = day
+        if hour is not None:
+            body["hour"] = hour
+        if month is not None:
+            body["month"] = month
+        if position is not None:
+            body["position"] = position
+        if rangedescr is not None:
+            body["rangedescr"] = rangedescr
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/schedule/time_range",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_schedule_time_range(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/schedule/time_range
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/schedule/time_range. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/schedule/time_range",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_schedule_time_ranges(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/schedule/time_ranges
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/schedule/time_ranges. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/schedule/time_ranges",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_schedules(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/schedules
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/schedules. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/schedules",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_schedules(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/schedules
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/schedules. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/schedules",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_state(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/state
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/state. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/state",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_states(
+        confirm: bool = False,
+        limit: int | None = 100,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/states
+
+        WARNING: DANGEROUS: Clears all firewall states.
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/states. "
+                "Set confirm=True to execute."
+                "\n\nWARNING: DANGEROUS: Clears all firewall states."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/states",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_states_size(
+        confirm: bool = False,
+        maximumstates: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/states/size
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        maximumstates: The maximum number of firewall state entries allowed by this firewall.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/states/size. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if maximumstates is not None:
+            body["maximumstates"] = maximumstates
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/states/size",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_traffic_shaper(
+        bandwidth: int,
+        bandwidthtype: str,
+        interface: str,
+        scheduler: str,
+        confirm: bool = False,
+        enabled: bool | None = True,
+        qlimit: int | None = None,
+        queue: list[dict[str, Any]] | None = None,
+        tbrconfig: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/traffic_shaper
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        bandwidth: The total bandwidth amount allowed by this traffic shaper.
+        bandwidthtype: The scale type of the `bandwidth` field's value. Valid values: ['%', 'b', 'Kb', 'Mb', 'Gb']
+        interface: The interface this traffic shaper will be applied to.
+        scheduler: The scheduler type to use for this traffic shaper. Changing this value will automatically update any child queues assigned to this traffic shaper. Valid values: ['HFSC', 'CBQ', 'FAIRQ', 'CODELQ', 'PRIQ']
+        enabled: Enables or disables this traffic shaper.
+        qlimit: The number of packets that can be held in a queue waiting to be transmitted by the shaper.This field is only available when the following conditions are met:- `scheduler` must not be one of [ CODELQ ]
+        queue: The child queues assigned to this traffic shaper. Each object accepts: - interface (string) - enabled (boolean) - name (string) - priority (integer) - qlimit (integer) - description (string) - default (boolean) - red (boolean) - rio (boolean) - ecn (boolean) - codel (boolean) - bandwidthtype (string): valid=['%', 'b', 'Kb', 'Mb', 'Gb'] ... and 16 more fields
+        tbrconfig: The size, in bytes, of the token bucket regulator. If `null`, heuristics based on the interface bandwidth are used to determine the size.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/traffic_shaper. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if bandwidth is not None:
+            body["bandwidth"] = bandwidth
+        if bandwidthtype is not None:
+            body["bandwidthtype"] = bandwidthtype
+        if interface is not None:
+            body["interface"] = interface
+        if scheduler is not None:
+            body["scheduler"] = scheduler
+        if enabled is not None:
+            body["enabled"] = enabled
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if queue is not None:
+            body["queue"] = queue
+        if tbrconfig is not None:
+            body["tbrconfig"] = tbrconfig
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/traffic_shaper",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_traffic_shaper(
+        id: str | int,
+        confirm: bool = False,
+        bandwidth: int | None = None,
+        bandwidthtype: str | None = None,
+        enabled: bool | None = None,
+        interface: str | None = None,
+        qlimit: int | None = None,
+        queue: list[dict[str, Any]] | None = None,
+        scheduler: str | None = None,
+        tbrconfig: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/traffic_shaper
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        bandwidth: The total bandwidth amount allowed by this traffic shaper.
+        bandwidthtype: The scale type of the `bandwidth` field's value. Valid values: ['%', 'b', 'Kb', 'Mb', 'Gb']
+        enabled: Enables or disables this traffic shaper.
+        interface: The interface this traffic shaper will be applied to.
+        qlimit: The number of packets that can be held in a queue waiting to be transmitted by the shaper.This field is only available when the following conditions are met:- `scheduler` must not be one of [ CODELQ ]
+        queue: The child queues assigned to this traffic shaper. Each object accepts: - interface (string) - enabled (boolean) - name (string) - priority (integer) - qlimit (integer) - description (string) - default (boolean) - red (boolean) - rio (boolean) - ecn (boolean) - codel (boolean) - bandwidthtype (string): valid=['%', 'b', 'Kb', 'Mb', 'Gb'] ... and 16 more fields
+        scheduler: The scheduler type to use for this traffic shaper. Changing this value will automatically update any child queues assigned to this traffic shaper. Valid values: ['HFSC', 'CBQ', 'FAIRQ', 'CODELQ', 'PRIQ']
+        tbrconfig: The size, in bytes, of the token bucket regulator. If `null`, heuristics based on the interface bandwidth are used to determine the size.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/traffic_shaper. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if bandwidth is not None:
+            body["bandwidth"] = bandwidth
+        if bandwidthtype is not None:
+            body["bandwidthtype"] = bandwidthtype
+        if enabled is not None:
+            body["enabled"] = enabled
+        if interface is not None:
+            body["interface"] = interface
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if queue is not None:
+            body["queue"] = queue
+        if scheduler is not None:
+            body["scheduler"] = scheduler
+        if tbrconfig is not None:
+            body["tbrconfig"] = tbrconfig
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/traffic_shaper",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_traffic_shaper_limiter_bandwidth(
+        bw: int,
+        bwscale: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        bwsched: str | None = 'none',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/traffic_shaper/limiter/bandwidth
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        bw: The amount of bandwidth this profile allows.
+        bwscale: The scale factor of the `bw` fields value. Valid values: ['b', 'Kb', 'Mb']
+        parent_id: The ID of the parent this object is nested under.
+        bwsched: The schedule to assign this bandwidth profile. When this firewall schedule is active, this bandwidth profile will be used.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/traffic_shaper/limiter/bandwidth. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if bw is not None:
+            body["bw"] = bw
+        if bwscale is not None:
+            body["bwscale"] = bwscale
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if bwsched is not None:
+            body["bwsched"] = bwsched
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/traffic_shaper/limiter/bandwidth",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_traffic_shaper_limiter_bandwidth(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        bw: int | None = None,
+        bwscale: str | None = None,
+        bwsched: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/traffic_shaper/limiter/bandwidth
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        bw: The amount of bandwidth this profile allows.
+        bwscale: The scale factor of the `bw` fields value. Valid values: ['b', 'Kb', 'Mb']
+        bwsched: The schedule to assign this bandwidth profile. When this firewall schedule is active, this bandwidth profile will be used.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/traffic_shaper/limiter/bandwidth. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if bw is not None:
+            body["bw"] = bw
+        if bwscale is not None:
+            body["bwscale"] = bwscale
+        if bwsched is not None:
+            body["bwsched"] = bwsched
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/traffic_shaper/limiter/bandwidth",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_limiter_bandwidth(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/limiter/bandwidth
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/limiter/bandwidth. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/limiter/bandwidth",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_limiter_bandwidths(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/limiter/bandwidths
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/limiter/bandwidths. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/limiter/bandwidths",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_traffic_shaper_limiter(
+        aqm: str,
+        name: str,
+        sched: str,
+        confirm: bool = False,
+        bandwidth: list[dict[str, Any]] | None = None,
+        buckets: int | None = None,
+        delay: int | None = None,
+        description: str | None = None,
+        ecn: bool | None = None,
+        enabled: bool | None = None,
+        mask: str | None = 'none',
+        maskbits: int | None = None,
+        maskbitsv6: int | None = None,
+        param_codel_interval: int | None = None,
+        param_codel_target: int | None = None,
+        param_fq_codel_flows: int | None = None,
+        param_fq_codel_interval: int | None = None,
+        param_fq_codel_limit: int | None = None,
+        param_fq_codel_quantum: int | None = None,
+        param_fq_codel_target: int | None = None,
+        param_fq_pie_alpha: int | None = None,
+        param_fq_pie_beta: int | None = None,
+        param_fq_pie_flows: int | None = None,
+        param_fq_pie_limit: int | None = None,
+        param_fq_pie_max_burst: int | None = None,
+        param_fq_pie_max_ecnth: int | None = None,
+        param_fq_pie_quantum: int | None = None,
+        param_fq_pie_target: int | None = None,
+        param_fq_pie_tupdate: int | None = None,
+        param_gred_max_p: int | None = None,
+        param_gred_max_th: int | None = None,
+        param_gred_min_th: int | None = None,
+        param_gred_w_q: int | None = None,
+        param_pie_alpha: int | None = None,
+        param_pie_beta: int | None = None,
+        param_pie_max_burst: int | None = None,
+        param_pie_max_ecnth: int | None = None,
+        param_pie_target: int | None = None,
+        param_pie_tupdate: int | None = None,
+        param_red_max_p: int | None = None,
+        param_red_max_th: int | None = None,
+        param_red_min_th: int | None = None,
+        param_red_w_q: int | None = None,
+        pie_capdrop: bool | None = None,
+        pie_onoff: bool | None = None,
+        pie_pderand: bool | None = None,
+        pie_qdelay: bool | None = None,
+        plr: float | None = None,
+        qlimit: int | None = None,
+        queue: list[dict[str, Any]] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/traffic_shaper/limiter
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        aqm: The Active Queue Management (AQM) algorithm to use for this limiter. AQM is the intelligent drop of network packets inside the limiter, when it becomes full or gets close to becoming full, with the goal of reducing network congestion. Valid values: ['droptail', 'codel', 'pie', 'red', 'gred']
+        name: The unique name for this limiter.
+        sched: The scheduler to use for this limiter. The scheduler manages the sequence of network packets in the limiter's queue. Valid values: ['wf2q+', 'fifo', 'qfq', 'rr', 'prio', 'fq_codel', 'fq_pie']
+        bandwidth: The bandwidth profiles for this limiter. Each object accepts: - bw (integer) - bwscale (string): valid=['b', 'Kb', 'Mb'] - bwsched (string)
+        buckets: The limiter's bucket size (slots).
+        delay: The amount of delay (in milliseconds) added to traffic passing through this limiter.
+        description: The verbose description for this limiter.
+        ecn: Enable or disable ECN. ECN sets a reserved TCP flag when the queue is nearing or exceeding capacity. Not all AQMs or schedulers support this.This field is only available when the following conditions are met:- `aqm` must be one of [ codel, pie, red, gred ]- `sched` must be one of [ fq_codel, fq_pie ]
+        enabled: Enables or disables this limiter and its child queues.
+        mask: If `source` or `destination` slots is chosen a dynamic pipe with the bandwidth, delay, packet loss and queue size given above will be created for each source/destination IP address encountered, respectively. This makes it possible to easily specify bandwidth limits per host or subnet. Valid values: ['none', 'srcaddress', 'dstaddress']
+        maskbits: The IPv4 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        maskbitsv6: The IPv6 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        param_codel_interval: The value for the CoDel interval parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_codel_target: The value for the CoDel target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_fq_codel_flows: The value for the FQ CoDel flows parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_interval: The value for the FQ CoDel interval parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_limit: The value for the FQ CoDel limit parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_quantum: The value for the FQ CoDel quantum parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_target: The value for the FQ CoDel target parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_pie_alpha: The value for the FQ PIE alpha parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_beta: The value for the FQ PIE beta parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_flows: The value for the FQ PIE flows parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_limit: The value for the FQ PIE limit parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_max_burst: The value for the FQ PIE max_burst parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_max_ecnth: The value for the FQ PIE ecnth parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_quantum: The value for the FQ PIE quantum parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_target: The value for the FQ PIE target parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_tupdate: The value for the FQ PIE tupdate parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_gred_max_p: The value for the GRED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_max_th: The value for the GRED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_min_th: The value for the GRED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_w_q: The value for the GRED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_pie_alpha: The value for the PIE alpha parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_beta: The value for the PIE beta parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_burst: The value for the PIE max_burst parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_ecnth: The value for the PIE ecnth parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_target: The value for the PIE target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_tupdate: The value for the PIE tupdate parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_red_max_p: The value for the RED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_max_th: The value for the RED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_min_th: The value for the RED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_w_q: The value for the RED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        pie_capdrop: Enable or disable cap drop adjustment.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_onoff: Enable or disable turning PIE on and off depending on queue load.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_pderand: Enable or disable drop probability de-randomisation.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_qdelay: Set queue delay type to timestamps (true) or departure rate estimation (false).This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        plr: The amount of packet loss (in percentage) added to traffic passing through the limiter.
+        qlimit: The length of the limiter's queue which the scheduler and AQM are responsible for. Set to `null` to assume default.
+        queue: The child queues for this limiter. Each object accepts: - name (string) - number (integer) - enabled (boolean) - mask (string): valid=['none', 'srcaddress', 'dstaddress'] - maskbits (integer) - maskbitsv6 (integer) - qlimit (integer) - ecn (boolean) - description (string) - aqm (string): valid=['droptail', 'codel', 'pie', 'red', 'gred'] - param_codel_target (integer) - param_codel_interval (integer) ... and 21 more fields
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/traffic_shaper/limiter. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if aqm is not None:
+            body["aqm"] = aqm
+        if name is not None:
+            body["name"] = name
+        if sched is not None:
+            body["sched"] = sched
+        if bandwidth is not None:
+            body["bandwidth"] = bandwidth
+        if buckets is not None:
+            body["buckets"] = buckets
+        if delay is not None:
+            body["delay"] = delay
+        if description is not None:
+            body["description"] = description
+        if ecn is not None:
+            body["ecn"] = ecn
+        if enabled is not None:
+            body["enabled"] = enabled
+        if mask is not None:
+            body["mask"] = mask
+        if maskbits is not None:
+            body["maskbits"] = maskbits
+        if maskbitsv6 is not None:
+            body["maskbitsv6"] = maskbitsv6
+        if param_codel_interval is not None:
+            body["param_codel_interval"] = param_codel_interval
+        if param_codel_target is not None:
+            body["param_codel_target"] = param_codel_target
+        if param_fq_codel_flows is not None:
+            body["param_fq_codel_flows"] = param_fq_codel_flows
+        if param_fq_codel_interval is not None:
+            body["param_fq_codel_interval"] = param_fq_codel_interval
+        if param_fq_codel_limit is not None:
+            body["param_fq_codel_limit"] = param_fq_codel_limit
+        if param_fq_codel_quantum is not None:
+            body["param_fq_codel_quantum"] = param_fq_codel_quantum
+        if param_fq_codel_target is not None:
+            body["param_fq_codel_target"] = param_fq_codel_target
+        if param_fq_pie_alpha is not None:
+            body["param_fq_pie_alpha"] = param_fq_pie_alpha
+        if param_fq_pie_beta is not None:
+            body["param_fq_pie_beta"] = param_fq_pie_beta
+        if param_fq_pie_flows is not None:
+            body["param_fq_pie_flows"] = param_fq_pie_flows
+        if param_fq_pie_limit is not None:
+            body["param_fq_pie_limit"] = param_fq_pie_limit
+        if param_fq_pie_max_burst is not None:
+            body["param_fq_pie_max_burst"] = param_fq_pie_max_burst
+        if param_fq_pie_max_ecnth is not None:
+            body["param_fq_pie_max_ecnth"] = param_fq_pie_max_ecnth
+        if param_fq_pie_quantum is not None:
+            body["param_fq_pie_quantum"] = param_fq_pie_quantum
+        if param_fq_pie_target is not None:
+            body["param_fq_pie_target"] = param_fq_pie_target
+        if param_fq_pie_tupdate is not None:
+            body["param_fq_pie_tupdate"] = param_fq_pie_tupdate
+        if param_gred_max_p is not None:
+            body["param_gred_max_p"] = param_gred_max_p
+        if param_gred_max_th is not None:
+            body["param_gred_max_th"] = param_gred_max_th
+        if param_gred_min_th is not None:
+            body["param_gred_min_th"] = param_gred_min_th
+        if param_gred_w_q is not None:
+            body["param_gred_w_q"] = param_gred_w_q
+        if param_pie_alpha is not None:
+            body["param_pie_alpha"] = param_pie_alpha
+        if param_pie_beta is not None:
+            body["param_pie_beta"] = param_pie_beta
+        if param_pie_max_burst is not None:
+            body["param_pie_max_burst"] = param_pie_max_burst
+        if param_pie_max_ecnth is not None:
+            body["param_pie_max_ecnth"] = param_pie_max_ecnth
+        if param_pie_target is not None:
+            body["param_pie_target"] = param_pie_target
+        if param_pie_tupdate is not None:
+            body["param_pie_tupdate"] = param_pie_tupdate
+        if param_red_max_p is not None:
+            body["param_red_max_p"] = param_red_max_p
+        if param_red_max_th is not None:
+            body["param_red_max_th"] = param_red_max_th
+        if param_red_min_th is not None:
+            body["param_red_min_th"] = param_red_min_th
+        if param_red_w_q is not None:
+            body["param_red_w_q"] = param_red_w_q
+        if pie_capdrop is not None:
+            body["pie_capdrop"] = pie_capdrop
+        if pie_onoff is not None:
+            body["pie_onoff"] = pie_onoff
+        if pie_pderand is not None:
+            body["pie_pderand"] = pie_pderand
+        if pie_qdelay is not None:
+            body["pie_qdelay"] = pie_qdelay
+        if plr is not None:
+            body["plr"] = plr
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if queue is not None:
+            body["queue"] = queue
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/traffic_shaper/limiter",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_traffic_shaper_limiter(
+        id: str | int,
+        confirm: bool = False,
+        aqm: str | None = None,
+        bandwidth: list[dict[str, Any]] | None = None,
+        buckets: int | None = None,
+        delay: int | None = None,
+        description: str | None = None,
+        ecn: bool | None = None,
+        enabled: bool | None = None,
+        mask: str | None = None,
+        maskbits: int | None = None,
+        maskbitsv6: int | None = None,
+        name: str | None = None,
+        param_codel_interval: int | None = None,
+        param_codel_target: int | None = None,
+        param_fq_codel_flows: int | None = None,
+        param_fq_codel_interval: int | None = None,
+        param_fq_codel_limit: int | None = None,
+        param_fq_codel_quantum: int | None = None,
+        param_fq_codel_target: int | None = None,
+        param_fq_pie_alpha: int | None = None,
+        param_fq_pie_beta: int | None = None,
+        param_fq_pie_flows: int | None = None,
+        param_fq_pie_limit: int | None = None,
+        param_fq_pie_max_burst: int | None = None,
+        param_fq_pie_max_ecnth: int | None = None,
+        param_fq_pie_quantum: int | None = None,
+        param_fq_pie_target: int | None = None,
+        param_fq_pie_tupdate: int | None = None,
+        param_gred_max_p: int | None = None,
+        param_gred_max_th: int | None = None,
+        param_gred_min_th: int | None = None,
+        param_gred_w_q: int | None = None,
+        param_pie_alpha: int | None = None,
+        param_pie_beta: int | None = None,
+        param_pie_max_burst: int | None = None,
+        param_pie_max_ecnth: int | None = None,
+        param_pie_target: int | None = None,
+        param_pie_tupdate: int | None = None,
+        param_red_max_p: int | None = None,
+        param_red_max_th: int | None = None,
+        param_red_min_th: int | None = None,
+        param_red_w_q: int | None = None,
+        pie_capdrop: bool | None = None,
+        pie_onoff: bool | None = None,
+        pie_pderand: bool | None = None,
+        pie_qdelay: bool | None = None,
+        plr: float | None = None,
+        qlimit: int | None = None,
+        queue: list[dict[str, Any]] | None = None,
+        sched: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/traffic_shaper/limiter
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        aqm: The Active Queue Management (AQM) algorithm to use for this limiter. AQM is the intelligent drop of network packets inside the limiter, when it becomes full or gets close to becoming full, with the goal of reducing network congestion. Valid values: ['droptail', 'codel', 'pie', 'red', 'gred']
+        bandwidth: The bandwidth profiles for this limiter. Each object accepts: - bw (integer) - bwscale (string): valid=['b', 'Kb', 'Mb'] - bwsched (string)
+        buckets: The limiter's bucket size (slots).
+        delay: The amount of delay (in milliseconds) added to traffic passing through this limiter.
+        description: The verbose description for this limiter.
+        ecn: Enable or disable ECN. ECN sets a reserved TCP flag when the queue is nearing or exceeding capacity. Not all AQMs or schedulers support this.This field is only available when the following conditions are met:- `aqm` must be one of [ codel, pie, red, gred ]- `sched` must be one of [ fq_codel, fq_pie ]
+        enabled: Enables or disables this limiter and its child queues.
+        mask: If `source` or `destination` slots is chosen a dynamic pipe with the bandwidth, delay, packet loss and queue size given above will be created for each source/destination IP address encountered, respectively. This makes it possible to easily specify bandwidth limits per host or subnet. Valid values: ['none', 'srcaddress', 'dstaddress']
+        maskbits: The IPv4 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        maskbitsv6: The IPv6 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        name: The unique name for this limiter.
+        param_codel_interval: The value for the CoDel interval parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_codel_target: The value for the CoDel target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_fq_codel_flows: The value for the FQ CoDel flows parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_interval: The value for the FQ CoDel interval parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_limit: The value for the FQ CoDel limit parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_quantum: The value for the FQ CoDel quantum parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_codel_target: The value for the FQ CoDel target parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_codel'`
+        param_fq_pie_alpha: The value for the FQ PIE alpha parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_beta: The value for the FQ PIE beta parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_flows: The value for the FQ PIE flows parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_limit: The value for the FQ PIE limit parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_max_burst: The value for the FQ PIE max_burst parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_max_ecnth: The value for the FQ PIE ecnth parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_quantum: The value for the FQ PIE quantum parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_target: The value for the FQ PIE target parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_fq_pie_tupdate: The value for the FQ PIE tupdate parameter.This field is only available when the following conditions are met:- `sched` must be equal to `'fq_pie'`
+        param_gred_max_p: The value for the GRED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_max_th: The value for the GRED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_min_th: The value for the GRED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_w_q: The value for the GRED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_pie_alpha: The value for the PIE alpha parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_beta: The value for the PIE beta parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_burst: The value for the PIE max_burst parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_ecnth: The value for the PIE ecnth parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_target: The value for the PIE target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_tupdate: The value for the PIE tupdate parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_red_max_p: The value for the RED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_max_th: The value for the RED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_min_th: The value for the RED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_w_q: The value for the RED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        pie_capdrop: Enable or disable cap drop adjustment.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_onoff: Enable or disable turning PIE on and off depending on queue load.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_pderand: Enable or disable drop probability de-randomisation.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_qdelay: Set queue delay type to timestamps (true) or departure rate estimation (false).This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        plr: The amount of packet loss (in percentage) added to traffic passing through the limiter.
+        qlimit: The length of the limiter's queue which the scheduler and AQM are responsible for. Set to `null` to assume default.
+        queue: The child queues for this limiter. Each object accepts: - name (string) - number (integer) - enabled (boolean) - mask (string): valid=['none', 'srcaddress', 'dstaddress'] - maskbits (integer) - maskbitsv6 (integer) - qlimit (integer) - ecn (boolean) - description (string) - aqm (string): valid=['droptail', 'codel', 'pie', 'red', 'gred'] - param_codel_target (integer) - param_codel_interval (integer) ... and 21 more fields
+        sched: The scheduler to use for this limiter. The scheduler manages the sequence of network packets in the limiter's queue. Valid values: ['wf2q+', 'fifo', 'qfq', 'rr', 'prio', 'fq_codel', 'fq_pie']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/traffic_shaper/limiter. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if aqm is not None:
+            body["aqm"] = aqm
+        if bandwidth is not None:
+            body["bandwidth"] = bandwidth
+        if buckets is not None:
+            body["buckets"] = buckets
+        if delay is not None:
+            body["delay"] = delay
+        if description is not None:
+            body["description"] = description
+        if ecn is not None:
+            body["ecn"] = ecn
+        if enabled is not None:
+            body["enabled"] = enabled
+        if mask is not None:
+            body["mask"] = mask
+        if maskbits is not None:
+            body["maskbits"] = maskbits
+        if maskbitsv6 is not None:
+            body["maskbitsv6"] = maskbitsv6
+        if name is not None:
+            body["name"] = name
+        if param_codel_interval is not None:
+            body["param_codel_interval"] = param_codel_interval
+        if param_codel_target is not None:
+            body["param_codel_target"] = param_codel_target
+        if param_fq_codel_flows is not None:
+            body["param_fq_codel_flows"] = param_fq_codel_flows
+        if param_fq_codel_interval is not None:
+            body["param_fq_codel_interval"] = param_fq_codel_interval
+        if param_fq_codel_limit is not None:
+            body["param_fq_codel_limit"] = param_fq_codel_limit
+        if param_fq_codel_quantum is not None:
+            body["param_fq_codel_quantum"] = param_fq_codel_quantum
+        if param_fq_codel_target is not None:
+            body["param_fq_codel_target"] = param_fq_codel_target
+        if param_fq_pie_alpha is not None:
+            body["param_fq_pie_alpha"] = param_fq_pie_alpha
+        if param_fq_pie_beta is not None:
+            body["param_fq_pie_beta"] = param_fq_pie_beta
+        if param_fq_pie_flows is not None:
+            body["param_fq_pie_flows"] = param_fq_pie_flows
+        if param_fq_pie_limit is not None:
+            body["param_fq_pie_limit"] = param_fq_pie_limit
+        if param_fq_pie_max_burst is not None:
+            body["param_fq_pie_max_burst"] = param_fq_pie_max_burst
+        if param_fq_pie_max_ecnth is not None:
+            body["param_fq_pie_max_ecnth"] = param_fq_pie_max_ecnth
+        if param_fq_pie_quantum is not None:
+            body["param_fq_pie_quantum"] = param_fq_pie_quantum
+        if param_fq_pie_target is not None:
+            body["param_fq_pie_target"] = param_fq_pie_target
+        if param_fq_pie_tupdate is not None:
+            body["param_fq_pie_tupdate"] = param_fq_pie_tupdate
+        if param_gred_max_p is not None:
+            body["param_gred_max_p"] = param_gred_max_p
+        if param_gred_max_th is not None:
+            body["param_gred_max_th"] = param_gred_max_th
+        if param_gred_min_th is not None:
+            body["param_gred_min_th"] = param_gred_min_th
+        if param_gred_w_q is not None:
+            body["param_gred_w_q"] = param_gred_w_q
+        if param_pie_alpha is not None:
+            body["param_pie_alpha"] = param_pie_alpha
+        if param_pie_beta is not None:
+            body["param_pie_beta"] = param_pie_beta
+        if param_pie_max_burst is not None:
+            body["param_pie_max_burst"] = param_pie_max_burst
+        if param_pie_max_ecnth is not None:
+            body["param_pie_max_ecnth"] = param_pie_max_ecnth
+        if param_pie_target is not None:
+            body["param_pie_target"] = param_pie_target
+        if param_pie_tupdate is not None:
+            body["param_pie_tupdate"] = param_pie_tupdate
+        if param_red_max_p is not None:
+            body["param_red_max_p"] = param_red_max_p
+        if param_red_max_th is not None:
+            body["param_red_max_th"] = param_red_max_th
+        if param_red_min_th is not None:
+            body["param_red_min_th"] = param_red_min_th
+        if param_red_w_q is not None:
+            body["param_red_w_q"] = param_red_w_q
+        if pie_capdrop is not None:
+            body["pie_capdrop"] = pie_capdrop
+        if pie_onoff is not None:
+            body["pie_onoff"] = pie_onoff
+        if pie_pderand is not None:
+            body["pie_pderand"] = pie_pderand
+        if pie_qdelay is not None:
+            body["pie_qdelay"] = pie_qdelay
+        if plr is not None:
+            body["plr"] = plr
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if queue is not None:
+            body["queue"] = queue
+        if sched is not None:
+            body["sched"] = sched
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/traffic_shaper/limiter",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_limiter(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/limiter
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/limiter. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/limiter",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_traffic_shaper_limiter_queue(
+        aqm: str,
+        name: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        buckets: int | None = None,
+        description: str | None = None,
+        ecn: bool | None = None,
+        enabled: bool | None = None,
+        mask: str | None = 'none',
+        maskbits: int | None = None,
+        maskbitsv6: int | None = None,
+        param_codel_interval: int | None = None,
+        param_codel_target: int | None = None,
+        param_gred_max_p: int | None = None,
+        param_gred_max_th: int | None = None,
+        param_gred_min_th: int | None = None,
+        param_gred_w_q: int | None = None,
+        param_pie_alpha: int | None = None,
+        param_pie_beta: int | None = None,
+        param_pie_max_burst: int | None = None,
+        param_pie_max_ecnth: int | None = None,
+        param_pie_target: int | None = None,
+        param_pie_tupdate: int | None = None,
+        param_red_max_p: int | None = None,
+        param_red_max_th: int | None = None,
+        param_red_min_th: int | None = None,
+        param_red_w_q: int | None = None,
+        pie_capdrop: bool | None = None,
+        pie_onoff: bool | None = None,
+        pie_pderand: bool | None = None,
+        pie_qdelay: bool | None = None,
+        plr: float | None = None,
+        qlimit: int | None = None,
+        weight: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/traffic_shaper/limiter/queue
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        aqm: The Active Queue Management (AQM) algorithm to use for this queue. AQM is the intelligent drop of network packets inside the queue, when it becomes full or gets close to becoming full, with the goal of reducing network congestion. Valid values: ['droptail', 'codel', 'pie', 'red', 'gred']
+        name: The unique name for this limiter queue.
+        parent_id: The ID of the parent this object is nested under.
+        buckets: The limiter queue's bucket size (slots).
+        description: The verbose description for this limiter queue.
+        ecn: Enable or disable ECN. ECN sets a reserved TCP flag when the queue is nearing or exceeding capacity. Not all AQMs or schedulers support this.This field is only available when the following conditions are met:- `aqm` must be one of [ codel, pie, red, gred ]- `sched` must be one of [ fq_codel, fq_pie ]
+        enabled: Enables or disables this limiter queue.
+        mask: If `source` or `destination` slots is chosen a dynamic pipe with the bandwidth, delay, packet loss and queue size given above will be created for each source/destination IP address encountered, respectively. This makes it possible to easily specify bandwidth limits per host or subnet. Valid values: ['none', 'srcaddress', 'dstaddress']
+        maskbits: The IPv4 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        maskbitsv6: The IPv6 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        param_codel_interval: The value for the CoDel interval parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_codel_target: The value for the CoDel target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_gred_max_p: The value for the GRED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_max_th: The value for the GRED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_min_th: The value for the GRED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_w_q: The value for the GRED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_pie_alpha: The value for the PIE alpha parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_beta: The value for the PIE beta parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_burst: The value for the PIE max_burst parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_ecnth: The value for the PIE ecnth parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_target: The value for the PIE target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_tupdate: The value for the PIE tupdate parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_red_max_p: The value for the RED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_max_th: The value for the RED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_min_th: The value for the RED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_w_q: The value for the RED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        pie_capdrop: Enable or disable cap drop adjustment.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_onoff: Enable or disable turning PIE on and off depending on queue load.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_pderand: Enable or disable drop probability de-randomisation.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_qdelay: Set queue delay type to timestamps (true) or departure rate estimation (false).This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        plr: The amount of packet loss (in percentage) added to traffic passing through this limiter queue.
+        qlimit: The length of the limiter's queue which the scheduler and AQM are responsible for. Set to `null` to assume default.
+        weight: The share of the parent limiter this queue gets.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/traffic_shaper/limiter/queue. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if aqm is not None:
+            body["aqm"] = aqm
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if buckets is not None:
+            body["buckets"] = buckets
+        if description is not None:
+            body["description"] = description
+        if ecn is not None:
+            body["ecn"] = ecn
+        if enabled is not None:
+            body["enabled"] = enabled
+        if mask is not None:
+            body["mask"] = mask
+        if maskbits is not None:
+            body["maskbits"] = maskbits
+        if maskbitsv6 is not None:
+            body["maskbitsv6"] = maskbitsv6
+        if param_codel_interval is not None:
+            body["param_codel_interval"] = param_codel_interval
+        if param_codel_target is not None:
+            body["param_codel_target"] = param_codel_target
+        if param_gred_max_p is not None:
+            body["param_gred_max_p"] = param_gred_max_p
+        if param_gred_max_th is not None:
+            body["param_gred_max_th"] = param_gred_max_th
+        if param_gred_min_th is not None:
+            body["param_gred_min_th"] = param_gred_min_th
+        if param_gred_w_q is not None:
+            body["param_gred_w_q"] = param_gred_w_q
+        if param_pie_alpha is not None:
+            body["param_pie_alpha"] = param_pie_alpha
+        if param_pie_beta is not None:
+            body["param_pie_beta"] = param_pie_beta
+        if param_pie_max_burst is not None:
+            body["param_pie_max_burst"] = param_pie_max_burst
+        if param_pie_max_ecnth is not None:
+            body["param_pie_max_ecnth"] = param_pie_max_ecnth
+        if param_pie_target is not None:
+            body["param_pie_target"] = param_pie_target
+        if param_pie_tupdate is not None:
+            body["param_pie_tupdate"] = param_pie_tupdate
+        if param_red_max_p is not None:
+            body["param_red_max_p"] = param_red_max_p
+        if param_red_max_th is not None:
+            body["param_red_max_th"] = param_red_max_th
+        if param_red_min_th is not None:
+            body["param_red_min_th"] = param_red_min_th
+        if param_red_w_q is not None:
+            body["param_red_w_q"] = param_red_w_q
+        if pie_capdrop is not None:
+            body["pie_capdrop"] = pie_capdrop
+        if pie_onoff is not None:
+            body["pie_onoff"] = pie_onoff
+        if pie_pderand is not None:
+            body["pie_pderand"] = pie_pderand
+        if pie_qdelay is not None:
+            body["pie_qdelay"] = pie_qdelay
+        if plr is not None:
+            body["plr"] = plr
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/traffic_shaper/limiter/queue",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_traffic_shaper_limiter_queue(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        aqm: str | None = None,
+        buckets: int | None = None,
+        description: str | None = None,
+        ecn: bool | None = None,
+        enabled: bool | None = None,
+        mask: str | None = None,
+        maskbits: int | None = None,
+        maskbitsv6: int | None = None,
+        name: str | None = None,
+        param_codel_interval: int | None = None,
+        param_codel_target: int | None = None,
+        param_gred_max_p: int | None = None,
+        param_gred_max_th: int | None = None,
+        param_gred_min_th: int | None = None,
+        param_gred_w_q: int | None = None,
+        param_pie_alpha: int | None = None,
+        param_pie_beta: int | None = None,
+        param_pie_max_burst: int | None = None,
+        param_pie_max_ecnth: int | None = None,
+        param_pie_target: int | None = None,
+        param_pie_tupdate: int | None = None,
+        param_red_max_p: int | None = None,
+        param_red_max_th: int | None = None,
+        param_red_min_th: int | None = None,
+        param_red_w_q: int | None = None,
+        pie_capdrop: bool | None = None,
+        pie_onoff: bool | None = None,
+        pie_pderand: bool | None = None,
+        pie_qdelay: bool | None = None,
+        plr: float | None = None,
+        qlimit: int | None = None,
+        weight: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/traffic_shaper/limiter/queue
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        aqm: The Active Queue Management (AQM) algorithm to use for this queue. AQM is the intelligent drop of network packets inside the queue, when it becomes full or gets close to becoming full, with the goal of reducing network congestion. Valid values: ['droptail', 'codel', 'pie', 'red', 'gred']
+        buckets: The limiter queue's bucket size (slots).
+        description: The verbose description for this limiter queue.
+        ecn: Enable or disable ECN. ECN sets a reserved TCP flag when the queue is nearing or exceeding capacity. Not all AQMs or schedulers support this.This field is only available when the following conditions are met:- `aqm` must be one of [ codel, pie, red, gred ]- `sched` must be one of [ fq_codel, fq_pie ]
+        enabled: Enables or disables this limiter queue.
+        mask: If `source` or `destination` slots is chosen a dynamic pipe with the bandwidth, delay, packet loss and queue size given above will be created for each source/destination IP address encountered, respectively. This makes it possible to easily specify bandwidth limits per host or subnet. Valid values: ['none', 'srcaddress', 'dstaddress']
+        maskbits: The IPv4 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        maskbitsv6: The IPv6 mask bits to use when determine the scope of the dynamic pipe for IPv4 traffic.This field is only available when the following conditions are met:- `mask` must be one of [ srcaddress, dstaddress ]
+        name: The unique name for this limiter queue.
+        param_codel_interval: The value for the CoDel interval parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_codel_target: The value for the CoDel target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'codel'`
+        param_gred_max_p: The value for the GRED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_max_th: The value for the GRED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_min_th: The value for the GRED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_gred_w_q: The value for the GRED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'gred'`
+        param_pie_alpha: The value for the PIE alpha parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_beta: The value for the PIE beta parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_burst: The value for the PIE max_burst parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_max_ecnth: The value for the PIE ecnth parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_target: The value for the PIE target parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_pie_tupdate: The value for the PIE tupdate parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        param_red_max_p: The value for the RED max_p parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_max_th: The value for the RED max_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_min_th: The value for the RED min_th parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        param_red_w_q: The value for the RED w_q parameter.This field is only available when the following conditions are met:- `aqm` must be equal to `'red'`
+        pie_capdrop: Enable or disable cap drop adjustment.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_onoff: Enable or disable turning PIE on and off depending on queue load.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_pderand: Enable or disable drop probability de-randomisation.This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        pie_qdelay: Set queue delay type to timestamps (true) or departure rate estimation (false).This field is only available when the following conditions are met:- `aqm` must be equal to `'pie'`
+        plr: The amount of packet loss (in percentage) added to traffic passing through this limiter queue.
+        qlimit: The length of the limiter's queue which the scheduler and AQM are responsible for. Set to `null` to assume default.
+        weight: The share of the parent limiter this queue gets.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/traffic_shaper/limiter/queue. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if aqm is not None:
+            body["aqm"] = aqm
+        if buckets is not None:
+            body["buckets"] = buckets
+        if description is not None:
+            body["description"] = description
+        if ecn is not None:
+            body["ecn"] = ecn
+        if enabled is not None:
+            body["enabled"] = enabled
+        if mask is not None:
+            body["mask"] = mask
+        if maskbits is not None:
+            body["maskbits"] = maskbits
+        if maskbitsv6 is not None:
+            body["maskbitsv6"] = maskbitsv6
+        if name is not None:
+            body["name"] = name
+        if param_codel_interval is not None:
+            body["param_codel_interval"] = param_codel_interval
+        if param_codel_target is not None:
+            body["param_codel_target"] = param_codel_target
+        if param_gred_max_p is not None:
+            body["param_gred_max_p"] = param_gred_max_p
+        if param_gred_max_th is not None:
+            body["param_gred_max_th"] = param_gred_max_th
+        if param_gred_min_th is not None:
+            body["param_gred_min_th"] = param_gred_min_th
+        if param_gred_w_q is not None:
+            body["param_gred_w_q"] = param_gred_w_q
+        if param_pie_alpha is not None:
+            body["param_pie_alpha"] = param_pie_alpha
+        if param_pie_beta is not None:
+            body["param_pie_beta"] = param_pie_beta
+        if param_pie_max_burst is not None:
+            body["param_pie_max_burst"] = param_pie_max_burst
+        if param_pie_max_ecnth is not None:
+            body["param_pie_max_ecnth"] = param_pie_max_ecnth
+        if param_pie_target is not None:
+            body["param_pie_target"] = param_pie_target
+        if param_pie_tupdate is not None:
+            body["param_pie_tupdate"] = param_pie_tupdate
+        if param_red_max_p is not None:
+            body["param_red_max_p"] = param_red_max_p
+        if param_red_max_th is not None:
+            body["param_red_max_th"] = param_red_max_th
+        if param_red_min_th is not None:
+            body["param_red_min_th"] = param_red_min_th
+        if param_red_w_q is not None:
+            body["param_red_w_q"] = param_red_w_q
+        if pie_capdrop is not None:
+            body["pie_capdrop"] = pie_capdrop
+        if pie_onoff is not None:
+            body["pie_onoff"] = pie_onoff
+        if pie_pderand is not None:
+            body["pie_pderand"] = pie_pderand
+        if pie_qdelay is not None:
+            body["pie_qdelay"] = pie_qdelay
+        if plr is not None:
+            body["plr"] = plr
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/traffic_shaper/limiter/queue",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_limiter_queue(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/limiter/queue
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/limiter/queue. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/limiter/queue",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_limiter_queues(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/limiter/queues
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/limiter/queues. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/limiter/queues",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_traffic_shaper_limiters(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/traffic_shaper/limiters
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/traffic_shaper/limiters. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/traffic_shaper/limiters",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_traffic_shaper_queue(
+        name: str,
+        parent_id: str | int,
+        qlimit: int,
+        confirm: bool = False,
+        bandwidth: int | None = None,
+        bandwidthtype: str | None = None,
+        borrow: bool | None = None,
+        buckets: int | None = None,
+        codel: bool | None = None,
+        default: bool | None = None,
+        description: str | None = None,
+        ecn: bool | None = None,
+        enabled: bool | None = None,
+        hogs: int | None = None,
+        linkshare: bool | None = None,
+        linkshare_d: int | None = None,
+        linkshare_m1: str | None = None,
+        linkshare_m2: str | None = None,
+        priority: int | None = None,
+        realtime: bool | None = None,
+        realtime_d: int | None = None,
+        realtime_m1: str | None = None,
+        realtime_m2: str | None = None,
+        red: bool | None = None,
+        rio: bool | None = None,
+        upperlimit: bool | None = None,
+        upperlimit_d: int | None = None,
+        upperlimit_m1: str | None = None,
+        upperlimit_m2: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/traffic_shaper/queue
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        name: The name to assign this traffic shaper queue.
+        parent_id: The ID of the parent this object is nested under.
+        qlimit: The number of packets that can be held in a queue waiting to be transmitted by the shaper.
+        bandwidth: The total bandwidth amount allowed by this traffic shaper.This field is only available when the following conditions are met:- Parent field `scheduler` must be one of [ FAIRQ, CBQ, HFSC ]
+        bandwidthtype: The scale type of the `bandwidth` field's value.This field is only available when the following conditions are met:- Parent field `scheduler` must be one of [ FAIRQ, CBQ, HFSC ] Valid values: ['%', 'b', 'Kb', 'Mb', 'Gb']
+        borrow: Allow this queue to borrow from other queues when available.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'CBQ'`
+        buckets: This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'FAIRQ'`
+        codel: Use the 'Codel Active Queue' scheduler option for this traffic shaper queue.
+        default: Mark this traffic shaper queue as the default queue.
+        description: A description for this traffic shaper queue.
+        ecn: Use the 'Explicit Congestion Notification' scheduler option for this traffic shaper queue.
+        enabled: Enables or disables the traffic shaper queue.
+        hogs: The bandwidth limit per host.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'FAIRQ'`
+        linkshare: Allow sharing bandwidth from this queue for other queues as long as the real time values have been satisfied.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'HFSC'`
+        linkshare_d: The duration (in milliseconds) that the initial bandwidth limit (`linkshare_m1`) is in effect.This field is only available when the following conditions are met:- `linkshare` must be equal to `true`
+        linkshare_m1: The initial bandwidth limit for this traffic shaper queue when link sharing.This field is only available when the following conditions are met:- `linkshare` must be equal to `true`
+        linkshare_m2: The maximum bandwidth this traffic shaper queue is allowed to use. Note: This behaves exactly the same as the `bandwidth` field. If this field is set, it will override whatever value is current assigned to the `bandwidth` field.This field is only available when the following conditions are met:- `linkshare` must be equal to `true`
+        priority: The priority level for this traffic shaper queue.This field is only available when the following conditions are met:- Parent field `scheduler` must be one of [ FAIRQ, CBQ, PRIQ ]
+        realtime: Allow setting the guaranteed bandwidth minimum allotted to the queue.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'HFSC'`
+        realtime_d: The duration (in milliseconds) that the guaranteed bandwidth limit (`realtime_m1`) is in effect.This field is only available when the following conditions are met:- `realtime` must be equal to `true`
+        realtime_m1: The guaranteed minimum bandwidth limit for this traffic shaper queue during real time.This field is only available when the following conditions are met:- `realtime` must be equal to `true`
+        realtime_m2: The maximum bandwidth this traffic shaper queue is allowed to use. Note: This value should not exceed 30% of parent queue's maximum bandwidth.This field is only available when the following conditions are met:- `realtime` must be equal to `true`
+        red: Use the 'Random Early Detection' scheduler option for this traffic shaper queue.
+        rio: Use the 'Random Early Detection In and Out' scheduler option for this traffic shaper queue.
+        upperlimit: Allow setting the maximum bandwidth allowed for the queue. Will force hard bandwidth limiting.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'HFSC'`
+        upperlimit_d: The duration (in milliseconds) that the burst-able bandwidth limit (`upperlimit_m1` is in effect.This field is only available when the following conditions are met:- `upperlimit` must be equal to `true`
+        upperlimit_m1: The burst-able bandwidth limit for this traffic shaper queue.This field is only available when the following conditions are met:- `upperlimit` must be equal to `true`
+        upperlimit_m2: The normal bandwidth limit for this traffic shaper queue. If `upperlimit_m1` is not defined, this limit will always be in effect. If `upperlimit_m1` is defined, this limit will take effect after the `upperlimit_d` duration has expired.This field is only available when the following conditions are met:- `upperlimit` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/traffic_shaper/queue. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if bandwidth is not None:
+            body["bandwidth"] = bandwidth
+        if bandwidthtype is not None:
+            body["bandwidthtype"] = bandwidthtype
+        if borrow is not None:
+            body["borrow"] = borrow
+        if buckets is not None:
+            body["buckets"] = buckets
+        if codel is not None:
+            body["codel"] = codel
+        if default is not None:
+            body["default"] = default
+        if description is not None:
+            body["description"] = description
+        if ecn is not None:
+            body["ecn"] = ecn
+        if enabled is not None:
+            body["enabled"] = enabled
+        if hogs is not None:
+            body["hogs"] = hogs
+        if linkshare is not None:
+            body["linkshare"] = linkshare
+        if linkshare_d is not None:
+            body["linkshare_d"] = linkshare_d
+        if linkshare_m1 is not None:
+            body["linkshare_m1"] = linkshare_m1
+        if linkshare_m2 is not None:
+            body["linkshare_m2"] = linkshare_m2
+        if priority is not None:
+            body["priority"] = priority
+        if realtime is not None:
+            body["realtime"] = realtime
+        if realtime_d is not None:
+            body["realtime_d"] = realtime_d
+        if realtime_m1 is not None:
+            body["realtime_m1"] = realtime_m1
+        if realtime_m2 is not None:
+            body["realtime_m2"] = realtime_m2
+        if red is not None:
+            body["red"] = red
+        if rio is not None:
+            body["rio"] = rio
+        if upperlimit is not None:
+            body["upperlimit"] = upperlimit
+        if upperlimit_d is not None:
+            body["upperlimit_d"] = upperlimit_d
+        if upperlimit_m1 is not None:
+            body["upperlimit_m1"] = upperlimit_m1
+        if upperlimit_m2 is not None:
+            body["upperlimit_m2"] = upperlimit_m2
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/traffic_shaper/queue",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_traffic_shaper_queue(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        bandwidth: int | None = None,
+        bandwidthtype: str | None = None,
+        borrow: bool | None = None,
+        buckets: int | None = None,
+        codel: bool | None = None,
+        default: bool | None = None,
+        description: str | None = None,
+        ecn: bool | None = None,
+        enabled: bool | None = None,
+        hogs: int | None = None,
+        linkshare: bool | None = None,
+        linkshare_d: int | None = None,
+        linkshare_m1: str | None = None,
+        linkshare_m2: str | None = None,
+        name: str | None = None,
+        priority: int | None = None,
+        qlimit: int | None = None,
+        realtime: bool | None = None,
+        realtime_d: int | None = None,
+        realtime_m1: str | None = None,
+        realtime_m2: str | None = None,
+        red: bool | None = None,
+        rio: bool | None = None,
+        upperlimit: bool | None = None,
+        upperlimit_d: int | None = None,
+        upperlimit_m1: str | None = None,
+        upperlimit_m2: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/traffic_shaper/queue
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        bandwidth: The total bandwidth amount allowed by this traffic shaper.This field is only available when the following conditions are met:- Parent field `scheduler` must be one of [ FAIRQ, CBQ, HFSC ]
+        bandwidthtype: The scale type of the `bandwidth` field's value.This field is only available when the following conditions are met:- Parent field `scheduler` must be one of [ FAIRQ, CBQ, HFSC ] Valid values: ['%', 'b', 'Kb', 'Mb', 'Gb']
+        borrow: Allow this queue to borrow from other queues when available.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'CBQ'`
+        buckets: This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'FAIRQ'`
+        codel: Use the 'Codel Active Queue' scheduler option for this traffic shaper queue.
+        default: Mark this traffic shaper queue as the default queue.
+        description: A description for this traffic shaper queue.
+        ecn: Use the 'Explicit Congestion Notification' scheduler option for this traffic shaper queue.
+        enabled: Enables or disables the traffic shaper queue.
+        hogs: The bandwidth limit per host.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'FAIRQ'`
+        linkshare: Allow sharing bandwidth from this queue for other queues as long as the real time values have been satisfied.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'HFSC'`
+        linkshare_d: The duration (in milliseconds) that the initial bandwidth limit (`linkshare_m1`) is in effect.This field is only available when the following conditions are met:- `linkshare` must be equal to `true`
+        linkshare_m1: The initial bandwidth limit for this traffic shaper queue when link sharing.This field is only available when the following conditions are met:- `linkshare` must be equal to `true`
+        linkshare_m2: The maximum bandwidth this traffic shaper queue is allowed to use. Note: This behaves exactly the same as the `bandwidth` field. If this field is set, it will override whatever value is current assigned to the `bandwidth` field.This field is only available when the following conditions are met:- `linkshare` must be equal to `true`
+        name: The name to assign this traffic shaper queue.
+        priority: The priority level for this traffic shaper queue.This field is only available when the following conditions are met:- Parent field `scheduler` must be one of [ FAIRQ, CBQ, PRIQ ]
+        qlimit: The number of packets that can be held in a queue waiting to be transmitted by the shaper.
+        realtime: Allow setting the guaranteed bandwidth minimum allotted to the queue.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'HFSC'`
+        realtime_d: The duration (in milliseconds) that the guaranteed bandwidth limit (`realtime_m1`) is in effect.This field is only available when the following conditions are met:- `realtime` must be equal to `true`
+        realtime_m1: The guaranteed minimum bandwidth limit for this traffic shaper queue during real time.This field is only available when the following conditions are met:- `realtime` must be equal to `true`
+        realtime_m2: The maximum bandwidth this traffic shaper queue is allowed to use. Note: This value should not exceed 30% of parent queue's maximum bandwidth.This field is only available when the following conditions are met:- `realtime` must be equal to `true`
+        red: Use the 'Random Early Detection' scheduler option for this traffic shaper queue.
+        rio: Use the 'Random Early Detection In and Out' scheduler option for this traffic shaper queue.
+        upperlimit: Allow setting the maximum bandwidth allowed for the queue. Will force hard bandwidth limiting.This field is only available when the following conditions are met:- Parent field `scheduler` must be equal to `'HFSC'`
+        upperlimit_d: The duration (in milliseconds) that the burst-able bandwidth limit (`upperlimit_m1` is in effect.This field is only available when the following conditions are met:- `upperlimit` must be equal to `true`
+        upperlimit_m1: The burst-able bandwidth limit for this traffic shaper queue.This field is only available when the following conditions are met:- `upperlimit` must be equal to `true`
+        upperlimit_m2: The normal bandwidth limit for this traffic shaper queue. If `upperlimit_m1` is not defined, this limit will always be in effect. If `upperlimit_m1` is defined, this limit will take effect after the `upperlimit_d` duration has expired.This field is only available when the following conditions are met:- `upperlimit` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/traffic_shaper/queue. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if bandwidth is not None:
+            body["bandwidth"] = bandwidth
+        if bandwidthtype is not None:
+            body["bandwidthtype"] = bandwidthtype
+        if borrow is not None:
+            body["borrow"] = borrow
+        if buckets is not None:
+            body["buckets"] = buckets
+        if codel is not None:
+            body["codel"] = codel
+        if default is not None:
+            body["default"] = default
+        if description is not None:
+            body["description"] = description
+        if ecn is not None:
+            body["ecn"] = ecn
+        if enabled is not None:
+            body["enabled"] = enabled
+        if hogs is not None:
+            body["hogs"] = hogs
+        if linkshare is not None:
+            body["linkshare"] = linkshare
+        if linkshare_d is not None:
+            body["linkshare_d"] = linkshare_d
+        if linkshare_m1 is not None:
+            body["linkshare_m1"] = linkshare_m1
+        if linkshare_m2 is not None:
+            body["linkshare_m2"] = linkshare_m2
+        if name is not None:
+            body["name"] = name
+        if priority is not None:
+            body["priority"] = priority
+        if qlimit is not None:
+            body["qlimit"] = qlimit
+        if realtime is not None:
+            body["realtime"] = realtime
+        if realtime_d is not None:
+            body["realtime_d"] = realtime_d
+        if realtime_m1 is not None:
+            body["realtime_m1"] = realtime_m1
+        if realtime_m2 is not None:
+            body["realtime_m2"] = realtime_m2
+        if red is not None:
+            body["red"] = red
+        if rio is not None:
+            body["rio"] = rio
+        if upperlimit is not None:
+            body["upperlimit"] = upperlimit
+        if upperlimit_d is not None:
+            body["upperlimit_d"] = upperlimit_d
+        if upperlimit_m1 is not None:
+            body["upperlimit_m1"] = upperlimit_m1
+        if upperlimit_m2 is not None:
+            body["upperlimit_m2"] = upperlimit_m2
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/traffic_shaper/queue",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_queue(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/queue
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/queue. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/queue",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shaper_queues(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shaper/queues
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shaper/queues. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shaper/queues",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_firewall_traffic_shapers(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/firewall/traffic_shapers
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/firewall/traffic_shapers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/firewall/traffic_shapers",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_traffic_shapers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/traffic_shapers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/traffic_shapers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/traffic_shapers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_firewall_virtual_ip_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/virtual_ip/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/virtual_ip/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/virtual_ip/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_firewall_virtual_ip(
+        interface: str,
+        mode: str,
+        subnet: str,
+        subnet_bits: int,
+        confirm: bool = False,
+        advbase: int | None = None,
+        advskew: int | None = None,
+        carp_mode: str | None = None,
+        carp_peer: str | None = None,
+        descr: str | None = None,
+        noexpand: bool | None = None,
+        password: str | None = None,
+        type_: str | None = 'single',
+        vhid: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/firewall/virtual_ip
+
+        Note: Call pfsense_firewall_virtual_ip_apply after this to apply changes.
+
+        interface: The interface this virtual IP will apply to.
+        mode: The virtual IP mode to use for this virtual IP. Valid values: ['ipalias', 'proxyarp', 'carp', 'other']
+        subnet: The address for this virtual IP.
+        subnet_bits: The subnet bits for this virtual IP. For `proxyarp` and `other` virtual IPs, this value specifies a block of many IP address. For all other virtual IP modes, this specifies the subnet mask
+        advbase: The base frequency that this machine will advertise.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        advskew: The frequency skew that this machine will advertise.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        carp_mode: The CARP mode to use for this virtual IP. Please note this field is exclusive to pfSense Plus and has no effect on CE.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'` Valid values: ['mcast', 'ucast']
+        carp_peer: The IP address of the CARP peer. Please note this field is exclusive to pfSense Plus and has no effect on CE.This field is only available when the following conditions are met:- `carp_mode` must be equal to `'ucast'`
+        descr: A description for administrative reference
+        noexpand: Disable expansion of this entry into IPs on NAT lists (e.g. 192.168.1.0/24 expands to 256 entries.)This field is only available when the following conditions are met:- `mode` must be one of [ proxyarp, other ]
+        password: The VHID group password shared by all CARP members.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        type_: The virtual IP scope type. The `network` option is only applicable to the `proxyarp` and `other` virtual IP modes. Valid values: ['single', 'network']
+        vhid: The VHID group that the machines will share.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/firewall/virtual_ip. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_virtual_ip_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if interface is not None:
+            body["interface"] = interface
+        if mode is not None:
+            body["mode"] = mode
+        if subnet is not None:
+            body["subnet"] = subnet
+        if subnet_bits is not None:
+            body["subnet_bits"] = subnet_bits
+        if advbase is not None:
+            body["advbase"] = advbase
+        if advskew is not None:
+            body["advskew"] = advskew
+        if carp_mode is not None:
+            body["carp_mode"] = carp_mode
+        if carp_peer is not None:
+            body["carp_peer"] = carp_peer
+        if descr is not None:
+            body["descr"] = descr
+        if noexpand is not None:
+            body["noexpand"] = noexpand
+        if password is not None:
+            body["password"] = password
+        if type_ is not None:
+            body["type"] = type_
+        if vhid is not None:
+            body["vhid"] = vhid
+        return await _client.request(
+            "POST",
+            "/api/v2/firewall/virtual_ip",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_firewall_virtual_ip(
+        id: str | int,
+        confirm: bool = False,
+        advbase: int | None = None,
+        advskew: int | None = None,
+        carp_mode: str | None = None,
+        carp_peer: str | None = None,
+        descr: str | None = None,
+        interface: str | None = None,
+        mode: str | None = None,
+        noexpand: bool | None = None,
+        password: str | None = None,
+        subnet: str | None = None,
+        subnet_bits: int | None = None,
+        type_: str | None = None,
+        vhid: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/firewall/virtual_ip
+
+        Note: Call pfsense_firewall_virtual_ip_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        advbase: The base frequency that this machine will advertise.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        advskew: The frequency skew that this machine will advertise.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        carp_mode: The CARP mode to use for this virtual IP. Please note this field is exclusive to pfSense Plus and has no effect on CE.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'` Valid values: ['mcast', 'ucast']
+        carp_peer: The IP address of the CARP peer. Please note this field is exclusive to pfSense Plus and has no effect on CE.This field is only available when the following conditions are met:- `carp_mode` must be equal to `'ucast'`
+        descr: A description for administrative reference
+        interface: The interface this virtual IP will apply to.
+        mode: The virtual IP mode to use for this virtual IP. Valid values: ['ipalias', 'proxyarp', 'carp', 'other']
+        noexpand: Disable expansion of this entry into IPs on NAT lists (e.g. 192.168.1.0/24 expands to 256 entries.)This field is only available when the following conditions are met:- `mode` must be one of [ proxyarp, other ]
+        password: The VHID group password shared by all CARP members.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        subnet: The address for this virtual IP.
+        subnet_bits: The subnet bits for this virtual IP. For `proxyarp` and `other` virtual IPs, this value specifies a block of many IP address. For all other virtual IP modes, this specifies the subnet mask
+        type_: The virtual IP scope type. The `network` option is only applicable to the `proxyarp` and `other` virtual IP modes. Valid values: ['single', 'network']
+        vhid: The VHID group that the machines will share.This field is only available when the following conditions are met:- `mode` must be equal to `'carp'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/firewall/virtual_ip. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_virtual_ip_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if advbase is not None:
+            body["advbase"] = advbase
+        if advskew is not None:
+            body["advskew"] = advskew
+        if carp_mode is not None:
+            body["carp_mode"] = carp_mode
+        if carp_peer is not None:
+            body["carp_peer"] = carp_peer
+        if descr is not None:
+            body["descr"] = descr
+        if interface is not None:
+            body["interface"] = interface
+        if mode is not None:
+            body["mode"] = mode
+        if noexpand is not None:
+            body["noexpand"] = noexpand
+        if password is not None:
+            body["password"] = password
+        if subnet is not None:
+            body["subnet"] = subnet
+        if subnet_bits is not None:
+            body["subnet_bits"] = subnet_bits
+        if type_ is not None:
+            body["type"] = type_
+        if vhid is not None:
+            body["vhid"] = vhid
+        return await _client.request(
+            "PATCH",
+            "/api/v2/firewall/virtual_ip",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_virtual_ip(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/virtual_ip
+
+        Note: Call pfsense_firewall_virtual_ip_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/virtual_ip. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_virtual_ip_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/virtual_ip",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_firewall_virtual_ips(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/firewall/virtual_ips
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_firewall_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/firewall/virtual_ips. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_firewall_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/firewall/virtual_ips",
+            params=params,
+        )
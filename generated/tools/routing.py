@@ -0,0 +1,1278 @@
+# Auto-generated pfSense MCP tools — module: routing
+# 28 tools: 10 read, 18 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "routing" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_routing_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/routing/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_routing_gateway_default(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateway/default
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/routing/gateway/default",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_routing_gateway(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateway
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/routing/gateway",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_routing_gateway_group(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateway/group
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/routing/gateway/group",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_routing_gateway_group_priorities(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateway/group/priorities
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: gateway, id, parent_id, tier, virtual_ip
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "gateway", "id", "parent_id", "tier", "virtual_ip",
+        })))
+    return await _list_paged(
+        "/api/v2/routing/gateway/group/priorities",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_routing_gateway_group_priority(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateway/group/priority
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/routing/gateway/group/priority",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_routing_gateway_groups(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateway/groups
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, id, ipprotocol, name, priorities, trigger
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "ipprotocol", "name", "trigger",
+        })))
+    return await _list_paged(
+        "/api/v2/routing/gateway/groups",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_routing_gateways(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/gateways
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: action_disable, alert_interval, data_payload, descr, disabled, dpinger_dont_add_static_route, force_down, gateway, gw_down_kill_states, id, interface, interval, ipprotocol, latencyhigh, latencylow, loss_interval, losshigh, losslow, monitor, monitor_disable, name, nonlocalgateway, time_period, weight
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "alert_interval", "data_payload", "descr", "gateway", "gw_down_kill_states",
+            "id", "interface", "interval", "ipprotocol", "latencyhigh", "latencylow",
+            "loss_interval", "losshigh", "losslow", "monitor", "name", "time_period",
+            "weight",
+        })))
+    return await _list_paged(
+        "/api/v2/routing/gateways",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_routing_static_route(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/static_route
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/routing/static_route",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_routing_static_routes(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/routing/static_routes
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, disabled, gateway, id, network
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "gateway", "id", "network",
+        })))
+    return await _list_paged(
+        "/api/v2/routing/static_routes",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_routing_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/routing/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/routing/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/routing/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_routing_gateway_default(
+        confirm: bool = False,
+        defaultgw4: str | None = None,
+        defaultgw6: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/routing/gateway/default
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        defaultgw4: The gateway to assigns as the default IPv4 gateway for this system. Leave blank to automatically determine the default gateway, or set to `-` to assign no gateway.
+        defaultgw6: The gateway to assigns as the default IPv6 gateway for this system. Leave blank to automatically determine the default gateway, or set to `-` to assign no gateway.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/routing/gateway/default. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if defaultgw4 is not None:
+            body["defaultgw4"] = defaultgw4
+        if defaultgw6 is not None:
+            body["defaultgw6"] = defaultgw6
+        return await _client.request(
+            "PATCH",
+            "/api/v2/routing/gateway/default",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_routing_gateway(
+        gateway: str,
+        interface: str,
+        ipprotocol: str,
+        name: str,
+        confirm: bool = False,
+        action_disable: bool | None = None,
+        alert_interval: int | None = 1000,
+        data_payload: int | None = 1,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        dpinger_dont_add_static_route: bool | None = None,
+        force_down: bool | None = None,
+        gw_down_kill_states: str | None = None,
+        interval: int | None = 500,
+        latencyhigh: int | None = 500,
+        latencylow: int | None = 200,
+        loss_interval: int | None = 2000,
+        losshigh: int | None = 20,
+        losslow: int | None = 10,
+        monitor: str | None = None,
+        monitor_disable: bool | None = None,
+        nonlocalgateway: bool | None = True,
+        time_period: int | None = 60000,
+        weight: int | None = 1,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/routing/gateway
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        gateway: Sets the IP address of the remote gateway.
+        interface: Sets the interface this gateway will apply to.
+        ipprotocol: Sets the Internet Protocol version this gateway uses. Valid values: ['inet', 'inet6']
+        name: Sets a name for the gateway.
+        action_disable: Disable actions from taking place when gateway events occur. The gateway will always be considered up.
+        alert_interval: Sets the time interval in milliseconds between checking for an alert conditions.
+        data_payload: Sets the data payload to send in ICMP packets to gateway monitor IP.
+        descr: Sets a descriptions for the gateway.
+        disabled: Disable this gateway.
+        dpinger_dont_add_static_route: Prevents gateway monitoring from adding a static route for this gateway's monitor IP.
+        force_down: Always consider this gateway to be up.
+        gw_down_kill_states: Controls the state killing behavior when this specific gateway goes down. Killing states for specific down gateways only affects states created by policy routing rules and reply-to. Has no effect if gateway monitoring or its action are disabled or if the gateway is forced down. May not have any effect on dynamic gateways during a link loss event. Valid values: ['', 'none', 'down']
+        interval: Sets how often ICMP probes will be sent in milliseconds.
+        latencyhigh: Sets the threshold to consider latency as high. This value must be greater than `latencylow`.
+        latencylow: Sets the threshold to consider latency as low.
+        loss_interval: Sets the time interval in milliseconds before packets are treated as lost.
+        losshigh: Sets the threshold to consider packet loss as high. This value must be greater than `losslow`.
+        losslow: Sets the threshold to consider packet loss as low.
+        monitor: Sets a different IP address to use when monitoring this gateway. This is typically only necessary if the gateway IP does not accept ICMP probes.This field is only available when the following conditions are met:- `monitor_disable` must be equal to `false`
+        monitor_disable: Disable gateway monitoring for this gateway.
+        nonlocalgateway: Allows or disallows gateway IPs that are not a part of the parent interface's subnet(s).
+        time_period: Sets the time period in milliseconds over which results are averaged.
+        weight: Sets the weight for this gateway when used in a Gateway Group.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/routing/gateway. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if gateway is not None:
+            body["gateway"] = gateway
+        if interface is not None:
+            body["interface"] = interface
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if name is not None:
+            body["name"] = name
+        if action_disable is not None:
+            body["action_disable"] = action_disable
+        if alert_interval is not None:
+            body["alert_interval"] = alert_interval
+        if data_payload is not None:
+            body["data_payload"] = data_payload
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dpinger_dont_add_static_route is not None:
+            body["dpinger_dont_add_static_route"] = dpinger_dont_add_static_route
+        if force_down is not None:
+            body["force_down"] = force_down
+        if gw_down_kill_states is not None:
+            body["gw_down_kill_states"] = gw_down_kill_states
+        if interval is not None:
+            body["interval"] = interval
+        if latencyhigh is not None:
+            body["latencyhigh"] = latencyhigh
+        if latencylow is not None:
+            body["latencylow"] = latencylow
+        if loss_interval is not None:
+            body["loss_interval"] = loss_interval
+        if losshigh is not None:
+            body["losshigh"] = losshigh
+        if losslow is not None:
+            body["losslow"] = losslow
+        if monitor is not None:
+            body["monitor"] = monitor
+        if monitor_disable is not None:
+            body["monitor_disable"] = monitor_disable
+        if nonlocalgateway is not None:
+            body["nonlocalgateway"] = nonlocalgateway
+        if time_period is not None:
+            body["time_period"] = time_period
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "POST",
+            "/api/v2/routing/gateway",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_routing_gateway(
+        id: str | int,
+        confirm: bool = False,
+        action_disable: bool | None = None,
+        alert_interval: int | None = None,
+        data_payload: int | None = None,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        dpinger_dont_add_static_route: bool | None = None,
+        force_down: bool | None = None,
+        gateway: str | None = None,
+        gw_down_kill_states: str | None = None,
+        interface: str | None = None,
+        interval: int | None = None,
+        ipprotocol: str | None = None,
+        latencyhigh: int | None = None,
+        latencylow: int | None = None,
+        loss_interval: int | None = None,
+        losshigh: int | None = None,
+        losslow: int | None = None,
+        monitor: str | None = None,
+        monitor_disable: bool | None = None,
+        name: str | None = None,
+        nonlocalgateway: bool | None = None,
+        time_period: int | None = None,
+        weight: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/routing/gateway
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        action_disable: Disable actions from taking place when gateway events occur. The gateway will always be considered up.
+        alert_interval: Sets the time interval in milliseconds between checking for an alert conditions.
+        data_payload: Sets the data payload to send in ICMP packets to gateway monitor IP.
+        descr: Sets a descriptions for the gateway.
+        disabled: Disable this gateway.
+        dpinger_dont_add_static_route: Prevents gateway monitoring from adding a static route for this gateway's monitor IP.
+        force_down: Always consider this gateway to be up.
+        gateway: Sets the IP address of the remote gateway.
+        gw_down_kill_states: Controls the state killing behavior when this specific gateway goes down. Killing states for specific down gateways only affects states created by policy routing rules and reply-to. Has no effect if gateway monitoring or its action are disabled or if the gateway is forced down. May not have any effect on dynamic gateways during a link loss event. Valid values: ['', 'none', 'down']
+        interface: Sets the interface this gateway will apply to.
+        interval: Sets how often ICMP probes will be sent in milliseconds.
+        ipprotocol: Sets the Internet Protocol version this gateway uses. Valid values: ['inet', 'inet6']
+        latencyhigh: Sets the threshold to consider latency as high. This value must be greater than `latencylow`.
+        latencylow: Sets the threshold to consider latency as low.
+        loss_interval: Sets the time interval in milliseconds before packets are treated as lost.
+        losshigh: Sets the threshold to consider packet loss as high. This value must be greater than `losslow`.
+        losslow: Sets the threshold to consider packet loss as low.
+        monitor: Sets a different IP address to use when monitoring this gateway. This is typically only necessary if the gateway IP does not accept ICMP probes.This field is only available when the following conditions are met:- `monitor_disable` must be equal to `false`
+        monitor_disable: Disable gateway monitoring for this gateway.
+        name: Sets a name for the gateway.
+        nonlocalgateway: Allows or disallows gateway IPs that are not a part of the parent interface's subnet(s).
+        time_period: Sets the time period in milliseconds over which results are averaged.
+        weight: Sets the weight for this gateway when used in a Gateway Group.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/routing/gateway. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if action_disable is not None:
+            body["action_disable"] = action_disable
+        if alert_interval is not None:
+            body["alert_interval"] = alert_interval
+        if data_payload is not None:
+            body["data_payload"] = data_payload
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dpinger_dont_add_static_route is not None:
+            body["dpinger_dont_add_static_route"] = dpinger_dont_add_static_route
+        if force_down is not None:
+            body["force_down"] = force_down
+        if gateway is not None:
+            body["gateway"] = gateway
+        if gw_down_kill_states is not None:
+            body["gw_down_kill_states"] = gw_down_kill_states
+        if interface is not None:
+            body["interface"] = interface
+        if interval is not None:
+            body["interval"] = interval
+        if ipprotocol is not None:
+            body["ipprotocol"] = ipprotocol
+        if latencyhigh is not None:
+            body["latencyhigh"] = latencyhigh
+        if latencylow is not None:
+            body["latencylow"] = latencylow
+        if loss_interval is not None:
+            body["loss_interval"] = loss_interval
+        if losshigh is not None:
+            body["losshigh"] = losshigh
+        if losslow is not None:
+            body["losslow"] = losslow
+        if monitor is not None:
+            body["monitor"] = monitor
+        if monitor_disable is not None:
+            body["monitor_disable"] = monitor_disable
+        if name is not None:
+            body["name"] = name
+        if nonlocalgateway is not None:
+            body["nonlocalgateway"] = nonlocalgateway
+        if time_period is not None:
+            body["time_period"] = time_period
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "PATCH",
+            "/api/v2/routing/gateway",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_gateway(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/gateway
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/gateway. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/gateway",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_routing_gateway_group(
+        name: str,
+        priorities: list[dict[str, Any]],
+        confirm: bool = False,
+        descr: str | None = None,
+        trigger: str | None = 'down',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/routing/gateway/group
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        name: The name of the gateway group.
+        priorities: The priorities of the gateways in this group. Each object accepts: - gateway (string) - tier (integer) - virtual_ip (string)
+        descr: A description of the gateway group.
+        trigger: The trigger that will cause a gateway to be excluded from the group. Valid values: ['down', 'downloss', 'downlatency', 'downlosslatency']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/routing/gateway/group. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if priorities is not None:
+            body["priorities"] = priorities
+        if descr is not None:
+            body["descr"] = descr
+        if trigger is not None:
+            body["trigger"] = trigger
+        return await _client.request(
+            "POST",
+            "/api/v2/routing/gateway/group",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_routing_gateway_group(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        name: str | None = None,
+        priorities: list[dict[str, Any]] | None = None,
+        trigger: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/routing/gateway/group
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description of the gateway group.
+        name: The name of the gateway group.
+        priorities: The priorities of the gateways in this group. Each object accepts: - gateway (string) - tier (integer) - virtual_ip (string)
+        trigger: The trigger that will cause a gateway to be excluded from the group. Valid values: ['down', 'downloss', 'downlatency', 'downlosslatency']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/routing/gateway/group. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if name is not None:
+            body["name"] = name
+        if priorities is not None:
+            body["priorities"] = priorities
+        if trigger is not None:
+            body["trigger"] = trigger
+        return await _client.request(
+            "PATCH",
+            "/api/v2/routing/gateway/group",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_gateway_group(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/gateway/group
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/gateway/group. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/gateway/group",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_gateway_group_priorities(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/gateway/group/priorities
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/gateway/group/priorities. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/gateway/group/priorities",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_routing_gateway_group_priority(
+        gateway: str,
+        parent_id: str | int,
+        tier: int,
+        confirm: bool = False,
+        virtual_ip: str | None = 'address',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/routing/gateway/group/priority
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        gateway: The name of the gateway to prioritize in this gateway group.
+        parent_id: The ID of the parent this object is nested under.
+        tier: The priority of this gateway in the group. Lower numbered tiers are higher priority.
+        virtual_ip: The virtual IP to use for this gateway group. Use `address` to use the interface's current IP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/routing/gateway/group/priority. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if gateway is not None:
+            body["gateway"] = gateway
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if tier is not None:
+            body["tier"] = tier
+        if virtual_ip is not None:
+            body["virtual_ip"] = virtual_ip
+        return await _client.request(
+            "POST",
+            "/api/v2/routing/gateway/group/priority",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_routing_gateway_group_priority(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        gateway: str | None = None,
+        tier: int | None = None,
+        virtual_ip: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/routing/gateway/group/priority
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        gateway: The name of the gateway to prioritize in this gateway group.
+        tier: The priority of this gateway in the group. Lower numbered tiers are higher priority.
+        virtual_ip: The virtual IP to use for this gateway group. Use `address` to use the interface's current IP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/routing/gateway/group/priority. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if gateway is not None:
+            body["gateway"] = gateway
+        if tier is not None:
+            body["tier"] = tier
+        if virtual_ip is not None:
+            body["virtual_ip"] = virtual_ip
+        return await _client.request(
+            "PATCH",
+            "/api/v2/routing/gateway/group/priority",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_gateway_group_priority(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/gateway/group/priority
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/gateway/group/priority. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/gateway/group/priority",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_gateway_groups(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/gateway/groups
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/gateway/groups. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/gateway/groups",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_gateways(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/gateways
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/gateways. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/gateways",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_routing_static_route(
+        gateway: str,
+        network: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/routing/static_route
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        gateway: Sets which gateway this route applies to.
+        network: Sets the destination network for this static route in CIDR notation.
+        descr: Sets a description for administrative reference.
+        disabled: Disable this static route.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/routing/static_route. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if gateway is not None:
+            body["gateway"] = gateway
+        if network is not None:
+            body["network"] = network
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        return await _client.request(
+            "POST",
+            "/api/v2/routing/static_route",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_routing_static_route(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        gateway: str | None = None,
+        network: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/routing/static_route
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: Sets a description for administrative reference.
+        disabled: Disable this static route.
+        gateway: Sets which gateway this route applies to.
+        network: Sets the destination network for this static route in CIDR notation.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/routing/static_route. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if gateway is not None:
+            body["gateway"] = gateway
+        if network is not None:
+            body["network"] = network
+        return await _client.request(
+            "PATCH",
+            "/api/v2/routing/static_route",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_static_route(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/static_route
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/static_route. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/static_route",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_routing_static_routes(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/routing/static_routes
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_routing_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/routing/static_routes. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_routing_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/routing/static_routes",
+            params=params,
+        )
@@ -0,0 +1,1862 @@
+# Auto-generated pfSense MCP tools — module: services_bind
+# 42 tools: 13 read, 29 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_bind" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_access_list(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/access_list
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/access_list",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_bind_access_list_entries(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/access_list/entries
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, id, parent_id, value
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "id", "parent_id", "value",
+        })))
+    return await _list_paged(
+        "/api/v2/services/bind/access_list/entries",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_access_list_entry(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/access_list/entry
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/access_list/entry",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_bind_access_lists(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/access_lists
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, entries, id, name
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "id", "name",
+        })))
+    return await _list_paged(
+        "/api/v2/services/bind/access_lists",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/settings",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_sync_remote_host(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/sync/remote_host
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/sync/remote_host",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_bind_sync_remote_hosts(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/sync/remote_hosts
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, ipaddress, password, syncdestinenable, syncport, syncprotocol, username
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "ipaddress", "password", "syncport", "syncprotocol", "username",
+        })))
+    return await _list_paged(
+        "/api/v2/services/bind/sync/remote_hosts",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_sync_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/sync/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/sync/settings",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_view(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/view
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/view",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_bind_views(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/views
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: allow_recursion, bind_custom_options, descr, id, match_clients, name, recursion
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "bind_custom_options", "descr", "id", "name",
+        })))
+    return await _list_paged(
+        "/api/v2/services/bind/views",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_zone(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/zone
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/zone",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_bind_zone_record(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/zone/record
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/bind/zone/record",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_bind_zones(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/bind/zones
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: allowquery, allowtransfer, allowupdate, backupkeys, baseip, custom, customzonerecords, description, disabled, dnssec, enable_updatepolicy, expire, forwarders, id, mail, minimum, name, nameserver, records, refresh, regdhcpstatic, retry, reversev4, reversev6, rpz, serial, slaveip, ttl, type, updatepolicy, view
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "baseip", "custom", "customzonerecords", "description", "expire", "id",
+            "mail", "minimum", "name", "nameserver", "refresh", "retry", "serial",
+            "slaveip", "ttl", "type", "updatepolicy",
+        })))
+    return await _list_paged(
+        "/api/v2/services/bind/zones",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_bind_access_list(
+        entries: list[dict[str, Any]],
+        name: str,
+        confirm: bool = False,
+        description: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/bind/access_list
+
+        entries: The network entries for this access list. Each object accepts: - value (string) - description (string)
+        name: The name of the access list.
+        description: A description for the access list.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/bind/access_list. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if entries is not None:
+            body["entries"] = entries
+        if name is not None:
+            body["name"] = name
+        if description is not None:
+            body["description"] = description
+        return await _client.request(
+            "POST",
+            "/api/v2/services/bind/access_list",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_access_list(
+        id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        entries: list[dict[str, Any]] | None = None,
+        name: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/access_list
+
+        id: The ID of the object or resource to interact with.
+        description: A description for the access list.
+        entries: The network entries for this access list. Each object accepts: - value (string) - description (string)
+        name: The name of the access list.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/access_list. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if description is not None:
+            body["description"] = description
+        if entries is not None:
+            body["entries"] = entries
+        if name is not None:
+            body["name"] = name
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/access_list",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_access_list(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/access_list
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/access_list. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/access_list",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_access_list_entries(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/access_list/entries
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/access_list/entries. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/access_list/entries",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_bind_access_list_entry(
+        parent_id: str | int,
+        value: str,
+        confirm: bool = False,
+        description: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/bind/access_list/entry
+
+        parent_id: The ID of the parent this object is nested under.
+        value: The network CIDR to allow.
+        description: A description of the access list entry.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/bind/access_list/entry. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if value is not None:
+            body["value"] = value
+        if description is not None:
+            body["description"] = description
+        return await _client.request(
+            "POST",
+            "/api/v2/services/bind/access_list/entry",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_access_list_entry(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        value: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/access_list/entry
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        description: A description of the access list entry.
+        value: The network CIDR to allow.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/access_list/entry. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if description is not None:
+            body["description"] = description
+        if value is not None:
+            body["value"] = value
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/access_list/entry",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_access_list_entry(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/access_list/entry
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/access_list/entry. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/access_list/entry",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_bind_access_lists(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/bind/access_lists
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/bind/access_lists. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/bind/access_lists",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_access_lists(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/access_lists
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/access_lists. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/access_lists",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_settings(
+        confirm: bool = False,
+        bind_custom_options: str | None = None,
+        bind_dnssec_validation: str | None = None,
+        bind_forwarder: bool | None = None,
+        bind_forwarder_ips: list[str] | None = None,
+        bind_global_settings: str | None = None,
+        bind_hide_version: bool | None = None,
+        bind_ip_version: str | None = None,
+        bind_logging: bool | None = None,
+        bind_notify: bool | None = None,
+        bind_ram_limit: str | None = None,
+        controlport: str | None = None,
+        enable_bind: bool | None = None,
+        listenon: list[str] | None = None,
+        listenport: str | None = None,
+        log_only: bool | None = None,
+        log_options: list[str] | None = None,
+        log_severity: str | None = None,
+        rate_enabled: bool | None = None,
+        rate_limit: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/settings
+
+        bind_custom_options: Custom BIND options to include in the configuration file.
+        bind_dnssec_validation: Enable DNSSEC validation when BIND is acting as a recursive resolver. Valid values: ['auto', 'on', 'off']
+        bind_forwarder: Enable forwarding queries to other DNS servers listed below rather than this server performing its own recursion.
+        bind_forwarder_ips: The IP addresses of the DNS servers to forward queries to.This field is only available when the following conditions are met:- `bind_forwarder` must be equal to `true`
+        bind_global_settings: Global BIND settings to include in the configuration file.
+        bind_hide_version: Hide the BIND version in responses.
+        bind_ip_version: The IP version to use for the BIND service. Leave empty to use both IPv4 and IPv6. Valid values: ['', '-4', '-6']
+        bind_logging: Enable logging for the BIND service.
+        bind_notify: Notify slave server after any update on master.
+        bind_ram_limit: The maximum amount of RAM to use for the BIND service.
+        controlport: The TCP port to listen on for control requests (localhost only). Valid options are: a TCP/UDP port number
+        enable_bind: Enables the BIND service.
+        listenon: The interfaces to listen on for DNS requests.
+        listenport: The TCP and UDP port to listen on for DNS requests. Valid options are: a TCP/UDP port number
+        log_only: When rate limiting, only log that the query limit has been exceeded. If disabled, the query will be dropped instead.
+        log_options: The categories to log.
+        log_severity: The minimum severity of events to log. Valid values: ['critical', 'error', 'warning', 'notice', 'info', 'debug 1', 'debug 3', 'debug 5', 'dynamic']
+        rate_enabled: Enable rate limiting for the BIND service.
+        rate_limit: The maximum number of queries per second to allow.This field is only available when the following conditions are met:- `rate_enabled` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/settings. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if bind_custom_options is not None:
+            body["bind_custom_options"] = bind_custom_options
+        if bind_dnssec_validation is not None:
+            body["bind_dnssec_validation"] = bind_dnssec_validation
+        if bind_forwarder is not None:
+            body["bind_forwarder"] = bind_forwarder
+        if bind_forwarder_ips is not None:
+            body["bind_forwarder_ips"] = bind_forwarder_ips
+        if bind_global_settings is not None:
+            body["bind_global_settings"] = bind_global_settings
+        if bind_hide_version is not None:
+            body["bind_hide_version"] = bind_hide_version
+        if bind_ip_version is not None:
+            body["bind_ip_version"] = bind_ip_version
+        if bind_logging is not None:
+            body["bind_logging"] = bind_logging
+        if bind_notify is not None:
+            body["bind_notify"] = bind_notify
+        if bind_ram_limit is not None:
+            body["bind_ram_limit"] = bind_ram_limit
+        if controlport is not None:
+            body["controlport"] = controlport
+        if enable_bind is not None:
+            body["enable_bind"] = enable_bind
+        if listenon is not None:
+            body["listenon"] = listenon
+        if listenport is not None:
+            body["listenport"] = listenport
+        if log_only is not None:
+            body["log_only"] = log_only
+        if log_options is not None:
+            body["log_options"] = log_options
+        if log_severity is not None:
+            body["log_severity"] = log_severity
+        if rate_enabled is not None:
+            body["rate_enabled"] = rate_enabled
+        if rate_limit is not None:
+            body["rate_limit"] = rate_limit
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_bind_sync_remote_host(
+        ipaddress: str,
+        password: str,
+        syncport: str,
+        syncprotocol: str,
+        username: str,
+        confirm: bool = False,
+        syncdestinenable: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/bind/sync/remote_host
+
+        ipaddress: The IP address/hostname of the remote host.
+        password: The password to use to authenticate when syncing.
+        syncport: The remote host port to use for syncing. Valid options are: a TCP/UDP port number
+        syncprotocol: The protocol to use for syncing. Valid values: ['http', 'https']
+        username: The username to use to authenticate when syncing.
+        syncdestinenable: Enable this remote host for syncing.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/bind/sync/remote_host. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if ipaddress is not None:
+            body["ipaddress"] = ipaddress
+        if password is not None:
+            body["password"] = password
+        if syncport is not None:
+            body["syncport"] = syncport
+        if syncprotocol is not None:
+            body["syncprotocol"] = syncprotocol
+        if username is not None:
+            body["username"] = username
+        if syncdestinenable is not None:
+            body["syncdestinenable"] = syncdestinenable
+        return await _client.request(
+            "POST",
+            "/api/v2/services/bind/sync/remote_host",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_sync_remote_host(
+        id: str | int,
+        confirm: bool = False,
+        ipaddress: str | None = None,
+        password: str | None = None,
+        syncdestinenable: bool | None = None,
+        syncport: str | None = None,
+        syncprotocol: str | None = None,
+        username: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/sync/remote_host
+
+        id: The ID of the object or resource to interact with.
+        ipaddress: The IP address/hostname of the remote host.
+        password: The password to use to authenticate when syncing.
+        syncdestinenable: Enable this remote host for syncing.
+        syncport: The remote host port to use for syncing. Valid options are: a TCP/UDP port number
+        syncprotocol: The protocol to use for syncing. Valid values: ['http', 'https']
+        username: The username to use to authenticate when syncing.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/sync/remote_host. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if ipaddress is not None:
+            body["ipaddress"] = ipaddress
+        if password is not None:
+            body["password"] = password
+        if syncdestinenable is not None:
+            body["syncdestinenable"] = syncdestinenable
+        if syncport is not None:
+            body["syncport"] = syncport
+        if syncprotocol is not None:
+            body["syncprotocol"] = syncprotocol
+        if username is not None:
+            body["username"] = username
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/sync/remote_host",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_sync_remote_host(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/sync/remote_host
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/sync/remote_host. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/sync/remote_host",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_bind_sync_remote_hosts(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/bind/sync/remote_hosts
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/bind/sync/remote_hosts. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/bind/sync/remote_hosts",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_sync_remote_hosts(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/sync/remote_hosts
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/sync/remote_hosts. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/sync/remote_hosts",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_sync_settings(
+        masterip: str,
+        synconchanges: str,
+        confirm: bool = False,
+        synctimeout: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/sync/settings
+
+        masterip: The IP address of the master BIND server.
+        synconchanges: The sync mode to use. Valid values: ['disabled', 'manual', 'auto']
+        synctimeout: The timeout for the sync process. Valid values: [30, 60, 90, 120, 150, 250]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/sync/settings. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if masterip is not None:
+            body["masterip"] = masterip
+        if synconchanges is not None:
+            body["synconchanges"] = synconchanges
+        if synctimeout is not None:
+            body["synctimeout"] = synctimeout
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/sync/settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_bind_view(
+        name: str,
+        confirm: bool = False,
+        allow_recursion: list[str] | None = None,
+        bind_custom_options: str | None = None,
+        descr: str | None = None,
+        match_clients: list[str] | None = None,
+        recursion: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/bind/view
+
+        name: The name of the view.
+        allow_recursion: The access lists to allow recursion for.
+        bind_custom_options: Custom BIND options for the view.
+        descr: A description for the view.
+        match_clients: The access lists to match clients against.
+        recursion: Enables or disables recursion for the view.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/bind/view. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if allow_recursion is not None:
+            body["allow_recursion"] = allow_recursion
+        if bind_custom_options is not None:
+            body["bind_custom_options"] = bind_custom_options
+        if descr is not None:
+            body["descr"] = descr
+        if match_clients is not None:
+            body["match_clients"] = match_clients
+        if recursion is not None:
+            body["recursion"] = recursion
+        return await _client.request(
+            "POST",
+            "/api/v2/services/bind/view",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_view(
+        id: str | int,
+        confirm: bool = False,
+        allow_recursion: list[str] | None = None,
+        bind_custom_options: str | None = None,
+        descr: str | None = None,
+        match_clients: list[str] | None = None,
+        name: str | None = None,
+        recursion: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/view
+
+        id: The ID of the object or resource to interact with.
+        allow_recursion: The access lists to allow recursion for.
+        bind_custom_options: Custom BIND options for the view.
+        descr: A description for the view.
+        match_clients: The access lists to match clients against.
+        name: The name of the view.
+        recursion: Enables or disables recursion for the view.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/view. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if allow_recursion is not None:
+            body["allow_recursion"] = allow_recursion
+        if bind_custom_options is not None:
+            body["bind_custom_options"] = bind_custom_options
+        if descr is not None:
+            body["descr"] = descr
+        if match_clients is not None:
+            body["match_clients"] = match_clients
+        if name is not None:
+            body["name"] = name
+        if recursion is not None:
+            body["recursion"] = recursion
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/view",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_view(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/view
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/view. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/view",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_bind_views(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/bind/views
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/bind/views. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/bind/views",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_views(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/views
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/views. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/views",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_bind_zone(
+        name: str,
+        confirm: bool = False,
+        allowquery: list[str] | None = None,
+        allowtransfer: list[str] | None = None,
+        allowupdate: list[str] | None = None,
+        backupkeys: bool | None = None,
+        baseip: str | None = None,
+        custom: str | None = None,
+        customzonerecords: str | None = None,
+        description: str | None = None,
+        disabled: bool | None = None,
+        dnssec: bool | None = None,
+        enable_updatepolicy: bool | None = None,
+        expire: str | None = None,
+        forwarders: list[str] | None = None,
+        mail: str | None = None,
+        minimum: str | None = None,
+        nameserver: str | None = None,
+        records: list[dict[str, Any]] | None = None,
+        refresh: str | None = None,
+        regdhcpstatic: bool | None = None,
+        retry: str | None = None,
+        reversev4: bool | None = None,
+        reversev6: bool | None = None,
+        rpz: bool | None = None,
+        serial: int | None = None,
+        slaveip: str | None = None,
+        ttl: int | None = None,
+        type_: str | None = 'master',
+        updatepolicy: str | None = None,
+        view: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/bind/zone
+
+        name: The name of this BIND zone.
+        allowquery: The access lists that are allowed to query this BIND zone.
+        allowtransfer: The access lists that are allowed to transfer this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        allowupdate: The access lists that are allowed to submit dynamic updates for 'master' zones (e.g. dynamic DNS).This field is only available when the following conditions are met:- `type` must be equal to `'master'`- `enable_updatepolicy` must be equal to `false`
+        backupkeys: Enable backing up DNSSEC keys in the XML configuration for this BIND zone.This field is only available when the following conditions are met:- `dnssec` must be equal to `true`
+        baseip: The IP address of the base domain for this zone. This sets an A record for the base domain.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        custom: Custom BIND options for this BIND zone.
+        customzonerecords: Custom records for this BIND zone.
+        description: A description for this BIND zone.
+        disabled: Disable this BIND zone.
+        dnssec: Enable DNSSEC for this BIND zone.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        enable_updatepolicy: Enable a specific dynamic update policy for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        expire: The SOA expiry interval for this zone. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        forwarders: The forwarders for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'forward'`
+        mail: The SOA email address (RNAME) for this zone. This must be in an FQDN format.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        minimum: The SOA minimum TTL interval (in seconds) for this zone. This is also referred to as the negative TTL. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        nameserver: The SOA nameserver for this zone.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        records: The records for this BIND zone. Each object accepts: - name (string) - type (string) - rdata (string) - priority (integer)
+        refresh: The SOA refresh interval for this zone. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        regdhcpstatic: Register DHCP static mappings as records in this BIND zone.
+        retry: The SOA retry interval for this zone. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        reversev4: Enable reverse DNS for this BIND zone.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        reversev6: Enable reverse IPv6 DNS for this BIND zone.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        rpz: Enable this zone as part of a response policy.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        serial: The SOA serial number for this zone.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        slaveip: The IP address of the slave server for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'slave'`
+        ttl: The default TTL interval (in seconds) for records within this BIND zone without a specific TTL.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        type_: The type of this BIND zone. Valid values: ['master', 'slave', 'forward', 'redirect']
+        updatepolicy: The update policy for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'master'`- `enable_updatepolicy` must be equal to `true`
+        view: The views this BIND zone belongs to.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/bind/zone. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if allowquery is not None:
+            body["allowquery"] = allowquery
+        if allowtransfer is not None:
+            body["allowtransfer"] = allowtransfer
+        if allowupdate is not None:
+            body["allowupdate"] = allowupdate
+        if backupkeys is not None:
+            body["backupkeys"] = backupkeys
+        if baseip is not None:
+            body["baseip"] = baseip
+        if custom is not None:
+            body["custom"] = custom
+        if customzonerecords is not None:
+            body["customzonerecords"] = customzonerecords
+        if description is not None:
+            body["description"] = description
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dnssec is not None:
+            body["dnssec"] = dnssec
+        if enable_updatepolicy is not None:
+            body["enable_updatepolicy"] = enable_updatepolicy
+        if expire is not None:
+            body["expire"] = expire
+        if forwarders is not None:
+            body["forwarders"] = forwarders
+        if mail is not None:
+            body["mail"] = mail
+        if minimum is not None:
+            body["minimum"] = minimum
+        if nameserver is not None:
+            body["nameserver"] = nameserver
+        if records is not None:
+            body["records"] = records
+        if refresh is not None:
+            body["refresh"] = refresh
+        if regdhcpstatic is not None:
+            body["regdhcpstatic"] = regdhcpstatic
+        if retry is not None:
+            body["retry"] = retry
+        if reversev4 is not None:
+            body["reversev4"] = reversev4
+        if reversev6 is not None:
+            body["reversev6"] = reversev6
+        if rpz is not None:
+            body["rpz"] = rpz
+        if serial is not None:
+            body["serial"] = serial
+        if slaveip is not None:
+            body["slaveip"] = slaveip
+        if ttl is not None:
+            body["ttl"] = ttl
+        if type_ is not None:
+            body["type"] = type_
+        if updatepolicy is not None:
+            body["updatepolicy"] = updatepolicy
+        if view is not None:
+            body["view"] = view
+        return await _client.request(
+            "POST",
+            "/api/v2/services/bind/zone",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_zone(
+        id: str | int,
+        confirm: bool = False,
+        allowquery: list[str] | None = None,
+        allowtransfer: list[str] | None = None,
+        allowupdate: list[str] | None = None,
+        backupkeys: bool | None = None,
+        baseip: str | None = None,
+        custom: str | None = None,
+        customzonerecords: str | None = None,
+        description: str | None = None,
+        disabled: bool | None = None,
+        dnssec: bool | None = None,
+        enable_updatepolicy: bool | None = None,
+        expire: str | None = None,
+        forwarders: list[str] | None = None,
+        mail: str | None = None,
+        minimum: str | None = None,
+        name: str | None = None,
+        nameserver: str | None = None,
+        records: list[dict[str, Any]] | None = None,
+        refresh: str | None = None,
+        regdhcpstatic: bool | None = None,
+        retry: str | None = None,
+        reversev4: bool | None = None,
+        reversev6: bool | None = None,
+        rpz: bool | None = None,
+        serial: int | None = None,
+        slaveip: str | None = None,
+        ttl: int | None = None,
+        type_: str | None = None,
+        updatepolicy: str | None = None,
+        view: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/zone
+
+        id: The ID of the object or resource to interact with.
+        allowquery: The access lists that are allowed to query this BIND zone.
+        allowtransfer: The access lists that are allowed to transfer this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        allowupdate: The access lists that are allowed to submit dynamic updates for 'master' zones (e.g. dynamic DNS).This field is only available when the following conditions are met:- `type` must be equal to `'master'`- `enable_updatepolicy` must be equal to `false`
+        backupkeys: Enable backing up DNSSEC keys in the XML configuration for this BIND zone.This field is only available when the following conditions are met:- `dnssec` must be equal to `true`
+        baseip: The IP address of the base domain for this zone. This sets an A record for the base domain.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        custom: Custom BIND options for this BIND zone.
+        customzonerecords: Custom records for this BIND zone.
+        description: A description for this BIND zone.
+        disabled: Disable this BIND zone.
+        dnssec: Enable DNSSEC for this BIND zone.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        enable_updatepolicy: Enable a specific dynamic update policy for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        expire: The SOA expiry interval for this zone. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        forwarders: The forwarders for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'forward'`
+        mail: The SOA email address (RNAME) for this zone. This must be in an FQDN format.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        minimum: The SOA minimum TTL interval (in seconds) for this zone. This is also referred to as the negative TTL. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        name: The name of this BIND zone.
+        nameserver: The SOA nameserver for this zone.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        records: The records for this BIND zone. Each object accepts: - name (string) - type (string) - rdata (string) - priority (integer)
+        refresh: The SOA refresh interval for this zone. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        regdhcpstatic: Register DHCP static mappings as records in this BIND zone.
+        retry: The SOA retry interval for this zone. TTL-style time-unit suffixes are supported (e.g. 1h, 1d, 1w), otherwise time in seconds is assumed.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        reversev4: Enable reverse DNS for this BIND zone.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        reversev6: Enable reverse IPv6 DNS for this BIND zone.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        rpz: Enable this zone as part of a response policy.This field is only available when the following conditions are met:- `type` must be one of [ master, slave ]
+        serial: The SOA serial number for this zone.This field is only available when the following conditions are met:- `type` must be one of [ master, redirect ]
+        slaveip: The IP address of the slave server for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'slave'`
+        ttl: The default TTL interval (in seconds) for records within this BIND zone without a specific TTL.This field is only available when the following conditions are met:- `type` must be equal to `'master'`
+        type_: The type of this BIND zone. Valid values: ['master', 'slave', 'forward', 'redirect']
+        updatepolicy: The update policy for this BIND zone.This field is only available when the following conditions are met:- `type` must be equal to `'master'`- `enable_updatepolicy` must be equal to `true`
+        view: The views this BIND zone belongs to.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/zone. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if allowquery is not None:
+            body["allowquery"] = allowquery
+        if allowtransfer is not None:
+            body["allowtransfer"] = allowtransfer
+        if allowupdate is not None:
+            body["allowupdate"] = allowupdate
+        if backupkeys is not None:
+            body["backupkeys"] = backupkeys
+        if baseip is not None:
+            body["baseip"] = baseip
+        if custom is not None:
+            body["custom"] = custom
+        if customzonerecords is not None:
+            body["customzonerecords"] = customzonerecords
+        if description is not None:
+            body["description"] = description
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dnssec is not None:
+            body["dnssec"] = dnssec
+        if enable_updatepolicy is not None:
+            body["enable_updatepolicy"] = enable_updatepolicy
+        if expire is not None:
+            body["expire"] = expire
+        if forwarders is not None:
+            body["forwarders"] = forwarders
+        if mail is not None:
+            body["mail"] = mail
+        if minimum is not None:
+            body["minimum"] = minimum
+        if name is not None:
+            body["name"] = name
+        if nameserver is not None:
+            body["nameserver"] = nameserver
+        if records is not None:
+            body["records"] = records
+        if refresh is not None:
+            body["refresh"] = refresh
+        if regdhcpstatic is not None:
+            body["regdhcpstatic"] = regdhcpstatic
+        if retry is not None:
+            body["retry"] = retry
+        if reversev4 is not None:
+            body["reversev4"] = reversev4
+        if reversev6 is not None:
+            body["reversev6"] = reversev6
+        if rpz is not None:
+            body["rpz"] = rpz
+        if serial is not None:
+            body["serial"] = serial
+        if slaveip is not None:
+            body["slaveip"] = slaveip
+        if ttl is not None:
+            body["ttl"] = ttl
+        if type_ is not None:
+            body["type"] = type_
+        if updatepolicy is not None:
+            body["updatepolicy"] = updatepolicy
+        if view is not None:
+            body["view"] = view
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/zone",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_zone(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/zone
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/zone. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/zone",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_bind_zone_record(
+        name: str,
+        parent_id: str | int,
+        rdata: str,
+        type_: str,
+        confirm: bool = False,
+        priority: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/bind/zone/record
+
+        name: The domain name for this record.
+        parent_id: The ID of the parent this object is nested under.
+        rdata: The data for this record. This can be an IP address, domain name, or other data depending on the record type.
+        type_: The type of record. Valid values: ['A', 'AAAA', 'CNAME', 'MX', 'NS', 'LOC', 'PTR', 'SRV', 'TXT', 'SPF']
+        priority: The priority for this record.This field is only available when the following conditions are met:- `type` must be one of [ MX, SRV ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/bind/zone/record. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if rdata is not None:
+            body["rdata"] = rdata
+        if type_ is not None:
+            body["type"] = type_
+        if priority is not None:
+            body["priority"] = priority
+        return await _client.request(
+            "POST",
+            "/api/v2/services/bind/zone/record",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_bind_zone_record(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        name: str | None = None,
+        priority: int | None = None,
+        rdata: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/bind/zone/record
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        name: The domain name for this record.
+        priority: The priority for this record.This field is only available when the following conditions are met:- `type` must be one of [ MX, SRV ]
+        rdata: The data for this record. This can be an IP address, domain name, or other data depending on the record type.
+        type_: The type of record. Valid values: ['A', 'AAAA', 'CNAME', 'MX', 'NS', 'LOC', 'PTR', 'SRV', 'TXT', 'SPF']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/bind/zone/record. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if name is not None:
+            body["name"] = name
+        if priority is not None:
+            body["priority"] = priority
+        if rdata is not None:
+            body["rdata"] = rdata
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/bind/zone/record",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_zone_record(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/zone/record
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/zone/record. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/zone/record",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_bind_zones(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/bind/zones
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/bind/zones. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/bind/zones",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_bind_zones(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/bind/zones
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/bind/zones. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/bind/zones",
+            params=params,
+        )
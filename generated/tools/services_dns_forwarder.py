@@ -0,0 +1,603 @@
+# Auto-generated pfSense MCP tools — module: services_dns_forwarder
+# 15 tools: 5 read, 10 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_dns_forwarder" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_forwarder_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_forwarder/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_forwarder/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_forwarder_host_override_alias(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_forwarder/host_override/alias
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_forwarder/host_override/alias",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_forwarder_host_override_aliases(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_forwarder/host_override/aliases
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, domain, host, id, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "domain", "host", "id", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_forwarder/host_override/aliases",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_forwarder_host_override(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_forwarder/host_override
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_forwarder/host_override",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_forwarder_host_overrides(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_forwarder/host_overrides
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: aliases, descr, domain, host, id, ip
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "domain", "host", "id", "ip",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_forwarder/host_overrides",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_services_dns_forwarder_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_forwarder/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_forwarder/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_forwarder/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_forwarder_host_override_alias(
+        domain: str,
+        host: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_forwarder/host_override/alias
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        domain: The domain of this override alias.
+        host: The hostname of this override alias.
+        parent_id: The ID of the parent this object is nested under.
+        description: The description of this override alias.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_forwarder/host_override/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if description is not None:
+            body["description"] = description
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_forwarder/host_override/alias",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_forwarder_host_override_alias(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        domain: str | None = None,
+        host: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_forwarder/host_override/alias
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        description: The description of this override alias.
+        domain: The domain of this override alias.
+        host: The hostname of this override alias.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_forwarder/host_override/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if description is not None:
+            body["description"] = description
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_forwarder/host_override/alias",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_forwarder_host_override_alias(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_forwarder/host_override/alias
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_forwarder/host_override/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_forwarder/host_override/alias",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_forwarder_host_override_aliases(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_forwarder/host_override/aliases
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_forwarder/host_override/aliases. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_forwarder/host_override/aliases",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_forwarder_host_override(
+        domain: str,
+        host: str,
+        ip: str,
+        confirm: bool = False,
+        aliases: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_forwarder/host_override
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        domain: The domain of this override.
+        host: The hostname of this override.
+        ip: The IP address of this override.
+        aliases: The aliases for this override. Each object accepts: - host (string) - domain (string) - description (string)
+        descr: The description for this override.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_forwarder/host_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        if ip is not None:
+            body["ip"] = ip
+        if aliases is not None:
+            body["aliases"] = aliases
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_forwarder/host_override",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_forwarder_host_override(
+        id: str | int,
+        confirm: bool = False,
+        aliases: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        domain: str | None = None,
+        host: str | None = None,
+        ip: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_forwarder/host_override
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        aliases: The aliases for this override. Each object accepts: - host (string) - domain (string) - description (string)
+        descr: The description for this override.
+        domain: The domain of this override.
+        host: The hostname of this override.
+        ip: The IP address of this override.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_forwarder/host_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if aliases is not None:
+            body["aliases"] = aliases
+        if descr is not None:
+            body["descr"] = descr
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        if ip is not None:
+            body["ip"] = ip
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_forwarder/host_override",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_forwarder_host_override(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_forwarder/host_override
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_forwarder/host_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_forwarder/host_override",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_dns_forwarder_host_overrides(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/dns_forwarder/host_overrides
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/dns_forwarder/host_overrides. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/dns_forwarder/host_overrides",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_forwarder_host_overrides(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_forwarder/host_overrides
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_forwarder_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_forwarder/host_overrides. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_forwarder_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_forwarder/host_overrides",
+            params=params,
+        )
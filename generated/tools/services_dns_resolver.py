@@ -0,0 +1,1554 @@
+# Auto-generated pfSense MCP tools — module: services_dns_resolver
+# 37 tools: 12 read, 25 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_dns_resolver" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_access_list(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/access_list
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/access_list",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_access_list_network(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/access_list/network
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/access_list/network",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_resolver_access_list_networks(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/access_list/networks
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, id, mask, network, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "id", "mask", "network", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_resolver/access_list/networks",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_resolver_access_lists(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/access_lists
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: action, description, id, name, networks
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "action", "description", "id", "name",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_resolver/access_lists",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_domain_override(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/domain_override
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/domain_override",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_resolver_domain_overrides(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/domain_overrides
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, domain, forward_tls_upstream, id, ip, tls_hostname
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "domain", "id", "ip", "tls_hostname",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_resolver/domain_overrides",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_host_override_alias(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/host_override/alias
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/host_override/alias",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_resolver_host_override_aliases(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/host_override/aliases
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, domain, host, id, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "domain", "host", "id", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_resolver/host_override/aliases",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_host_override(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/host_override
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/host_override",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dns_resolver_host_overrides(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/host_overrides
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: aliases, descr, domain, host, id, ip
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "domain", "host", "id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dns_resolver/host_overrides",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dns_resolver_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dns_resolver/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dns_resolver/settings",
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_resolver_access_list(
+        action: str,
+        name: str,
+        networks: list[dict[str, Any]],
+        confirm: bool = False,
+        description: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_resolver/access_list
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        action: The action to take when an access list match is found. Valid values: ['allow', 'deny', 'refuse', 'allow snoop', 'deny nonlocal', 'refuse nonlocal']
+        name: The name of this access list.
+        networks: The DNS Resolver access list network entries to include in this access list. Each object accepts: - network (string) - mask (integer) - description (string)
+        description: A description for this access list.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_resolver/access_list. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if action is not None:
+            body["action"] = action
+        if name is not None:
+            body["name"] = name
+        if networks is not None:
+            body["networks"] = networks
+        if description is not None:
+            body["description"] = description
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_resolver/access_list",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_resolver_access_list(
+        id: str | int,
+        confirm: bool = False,
+        action: str | None = None,
+        description: str | None = None,
+        name: str | None = None,
+        networks: list[dict[str, Any]] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_resolver/access_list
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        action: The action to take when an access list match is found. Valid values: ['allow', 'deny', 'refuse', 'allow snoop', 'deny nonlocal', 'refuse nonlocal']
+        description: A description for this access list.
+        name: The name of this access list.
+        networks: The DNS Resolver access list network entries to include in this access list. Each object accepts: - network (string) - mask (integer) - description (string)
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_resolver/access_list. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if action is not None:
+            body["action"] = action
+        if description is not None:
+            body["description"] = description
+        if name is not None:
+            body["name"] = name
+        if networks is not None:
+            body["networks"] = networks
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_resolver/access_list",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_access_list(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/access_list
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/access_list. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/access_list",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_resolver_access_list_network(
+        mask: int,
+        network: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_resolver/access_list/network
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        mask: The subnet mask of this access list entry's network.
+        network: The network address of this access list entry.
+        parent_id: The ID of the parent this object is nested under.
+        description: A description for this access list entry.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_resolver/access_list/network. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if mask is not None:
+            body["mask"] = mask
+        if network is not None:
+            body["network"] = network
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if description is not None:
+            body["description"] = description
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_resolver/access_list/network",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_resolver_access_list_network(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        mask: int | None = None,
+        network: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_resolver/access_list/network
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        description: A description for this access list entry.
+        mask: The subnet mask of this access list entry's network.
+        network: The network address of this access list entry.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_resolver/access_list/network. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if description is not None:
+            body["description"] = description
+        if mask is not None:
+            body["mask"] = mask
+        if network is not None:
+            body["network"] = network
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_resolver/access_list/network",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_access_list_network(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/access_list/network
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/access_list/network. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/access_list/network",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_access_list_networks(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/access_list/networks
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/access_list/networks. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/access_list/networks",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_dns_resolver_access_lists(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/dns_resolver/access_lists
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/dns_resolver/access_lists. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/dns_resolver/access_lists",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_access_lists(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/access_lists
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/access_lists. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/access_lists",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_services_dns_resolver_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_resolver/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_resolver/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_resolver/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_resolver_domain_override(
+        domain: str,
+        ip: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        forward_tls_upstream: bool | None = None,
+        tls_hostname: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_resolver/domain_override
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        domain: The domain to override.
+        ip: The IP address to which the domain should resolve.
+        descr: The description for this domain override.
+        forward_tls_upstream: Enables or disables forwarding DNS queries to the upstream DNS server using TLS.
+        tls_hostname: The hostname to use for the TLS connection to the upstream DNS server.This field is only available when the following conditions are met:- `forward_tls_upstream` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_resolver/domain_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if domain is not None:
+            body["domain"] = domain
+        if ip is not None:
+            body["ip"] = ip
+        if descr is not None:
+            body["descr"] = descr
+        if forward_tls_upstream is not None:
+            body["forward_tls_upstream"] = forward_tls_upstream
+        if tls_hostname is not None:
+            body["tls_hostname"] = tls_hostname
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_resolver/domain_override",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_resolver_domain_override(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        domain: str | None = None,
+        forward_tls_upstream: bool | None = None,
+        ip: str | None = None,
+        tls_hostname: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_resolver/domain_override
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: The description for this domain override.
+        domain: The domain to override.
+        forward_tls_upstream: Enables or disables forwarding DNS queries to the upstream DNS server using TLS.
+        ip: The IP address to which the domain should resolve.
+        tls_hostname: The hostname to use for the TLS connection to the upstream DNS server.This field is only available when the following conditions are met:- `forward_tls_upstream` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_resolver/domain_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if domain is not None:
+            body["domain"] = domain
+        if forward_tls_upstream is not None:
+            body["forward_tls_upstream"] = forward_tls_upstream
+        if ip is not None:
+            body["ip"] = ip
+        if tls_hostname is not None:
+            body["tls_hostname"] = tls_hostname
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_resolver/domain_override",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_domain_override(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/domain_override
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/domain_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/domain_override",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_dns_resolver_domain_overrides(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/dns_resolver/domain_overrides
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/dns_resolver/domain_overrides. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/dns_resolver/domain_overrides",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_domain_overrides(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/domain_overrides
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/domain_overrides. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/domain_overrides",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_resolver_host_override_alias(
+        domain: str,
+        host: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_resolver/host_override/alias
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        domain: The hostname portion of the host override alias.
+        host: The hostname portion of the host override alias.
+        parent_id: The ID of the parent this object is nested under.
+        descr: A detailed description for this host override alias.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_resolver/host_override/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_resolver/host_override/alias",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_resolver_host_override_alias(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        domain: str | None = None,
+        host: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_resolver/host_override/alias
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        descr: A detailed description for this host override alias.
+        domain: The hostname portion of the host override alias.
+        host: The hostname portion of the host override alias.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_resolver/host_override/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if descr is not None:
+            body["descr"] = descr
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_resolver/host_override/alias",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_host_override_alias(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/host_override/alias
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/host_override/alias. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/host_override/alias",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_host_override_aliases(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/host_override/aliases
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/host_override/aliases. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/host_override/aliases",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dns_resolver_host_override(
+        domain: str,
+        host: str,
+        ip: list[str],
+        confirm: bool = False,
+        aliases: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dns_resolver/host_override
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        domain: The hostname portion of the host override.
+        host: The hostname portion of the host override.
+        ip: The IP addresses this host override will resolve.
+        aliases: Additional alias hostnames that should resolve the same IP(s). Each object accepts: - host (string) - domain (string) - descr (string)
+        descr: A detailed description for this host override.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dns_resolver/host_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        if ip is not None:
+            body["ip"] = ip
+        if aliases is not None:
+            body["aliases"] = aliases
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dns_resolver/host_override",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_resolver_host_override(
+        id: str | int,
+        confirm: bool = False,
+        aliases: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        domain: str | None = None,
+        host: str | None = None,
+        ip: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_resolver/host_override
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        aliases: Additional alias hostnames that should resolve the same IP(s). Each object accepts: - host (string) - domain (string) - descr (string)
+        descr: A detailed description for this host override.
+        domain: The hostname portion of the host override.
+        host: The hostname portion of the host override.
+        ip: The IP addresses this host override will resolve.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_resolver/host_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if aliases is not None:
+            body["aliases"] = aliases
+        if descr is not None:
+            body["descr"] = descr
+        if domain is not None:
+            body["domain"] = domain
+        if host is not None:
+            body["host"] = host
+        if ip is not None:
+            body["ip"] = ip
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_resolver/host_override",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_host_override(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/host_override
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/host_override. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/host_override",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_dns_resolver_host_overrides(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/dns_resolver/host_overrides
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/dns_resolver/host_overrides. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/dns_resolver/host_overrides",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dns_resolver_host_overrides(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dns_resolver/host_overrides
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dns_resolver/host_overrides. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dns_resolver/host_overrides",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dns_resolver_settings(
+        confirm: bool = False,
+        active_interface: list[str] | None = None,
+        custom_options: str | None = None,
+        dnssec: bool | None = None,
+        enable: bool | None = None,
+        enablessl: bool | None = None,
+        forwarding: bool | None = None,
+        outgoing_interface: list[str] | None = None,
+        port: str | None = None,
+        python: bool | None = None,
+        python_order: str | None = None,
+        python_script: str | None = None,
+        regdhcp: bool | None = None,
+        regdhcpstatic: bool | None = None,
+        regovpnclients: bool | None = None,
+        sslcertref: str | None = None,
+        strictout: bool | None = None,
+        system_domain_local_zone_type: str | None = None,
+        tlsport: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dns_resolver/settings
+
+        Note: Call pfsense_services_dns_resolver_apply after this to apply changes.
+
+        active_interface: The interface on which the DNS Resolver service listens for DNS queries. Set empty value ". "to listen on all interfaces.
+        custom_options: Custom options to add to the DNS Resolver configuration.
+        dnssec: Enables or disables DNSSEC validation.
+        enable: Enables or disables the DNS Resolver service.
+        enablessl: Enables or disables SSL/TLS for the DNS Resolver service.
+        forwarding: Enables or disables DNS Resolver forwarding mode.
+        outgoing_interface: The interface on which the DNS Resolver service sends outgoing DNS queries. Set empty value ". "to use any interface.
+        port: The port on which the DNS Resolver service listens. Valid options are: a TCP/UDP port number
+        python: Enables or disables the Python module.
+        python_order: The order in which the Python module is loaded.This field is only available when the following conditions are met:- `python` must be equal to `true` Valid values: ['pre_validator', 'post_validator']
+        python_script: The Python module to utilize.This field is only available when the following conditions are met:- `python` must be equal to `true`
+        regdhcp: Enables or disables registering DHCP leases in the DNS Resolver service.
+        regdhcpstatic: Enables or disables registering static DHCP mappings in the DNS Resolver service.
+        regovpnclients: Enables or disables registering OpenVPN clients in the DNS Resolver service.
+        sslcertref: The SSL/TLS certificate to use for the DNS Resolver service.This field is only available when the following conditions are met:- `enablessl` must be equal to `true`
+        strictout: Enables or disables sending recursive queries if none of the selected Outgoing Network ". "Interfaces are available.
+        system_domain_local_zone_type: The type of local zone used for the system domain. Valid values: ['deny', 'refuse', 'static', 'transparent', 'typetransparent', 'redirect', 'inform', 'inform_deny', 'nodefault']
+        tlsport: The port on which the DNS Resolver service listens for SSL/TLS connections. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `enablessl` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dns_resolver/settings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dns_resolver_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if active_interface is not None:
+            body["active_interface"] = active_interface
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if dnssec is not None:
+            body["dnssec"] = dnssec
+        if enable is not None:
+            body["enable"] = enable
+        if enablessl is not None:
+            body["enablessl"] = enablessl
+        if forwarding is not None:
+            body["forwarding"] = forwarding
+        if outgoing_interface is not None:
+            body["outgoing_interface"] = outgoing_interface
+        if port is not None:
+            body["port"] = port
+        if python is not None:
+            body["python"] = python
+        if python_order is not None:
+            body["python_order"] = python_order
+        if python_script is not None:
+            body["python_script"] = python_script
+        if regdhcp is not None:
+            body["regdhcp"] = regdhcp
+        if regdhcpstatic is not None:
+            body["regdhcpstatic"] = regdhcpstatic
+        if regovpnclients is not None:
+            body["regovpnclients"] = regovpnclients
+        if sslcertref is not None:
+            body["sslcertref"] = sslcertref
+        if strictout is not None:
+            body["strictout"] = strictout
+        if system_domain_local_zone_type is not None:
+            body["system_domain_local_zone_type"] = system_domain_local_zone_type
+        if tlsport is not None:
+            body["tlsport"] = tlsport
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dns_resolver/settings",
+            json_body=body,
+        )
@@ -0,0 +1,4658 @@
+# Auto-generated pfSense MCP tools — module: services_haproxy
+# 91 tools: 30 read, 61 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_haproxy" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_backend_acl(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/acl
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/backend/acl",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_backend_acls(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/acls
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: casesensitive, expression, id, name, not, parent_id, value
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "expression", "id", "name", "parent_id", "value",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/backend/acls",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_backend_action(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/action
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/backend/action",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_backend_actions(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/actions
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: acl, action, customaction, deny_status, find, fmt, id, lua_function, name, parent_id, path, realm, reason, replace, rule, server, status
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "acl", "action", "customaction", "deny_status", "find", "fmt", "id",
+            "lua_function", "name", "parent_id", "path", "realm", "reason", "replace",
+            "rule", "server", "status",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/backend/actions",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_backend(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/backend",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_backend_error_file(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/error_file
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/backend/error_file",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_backend_error_files(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/errorfiles
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: errorcode, errorfile, id, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "errorcode", "errorfile", "id", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/backend/errorfiles",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_backend_server(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/server
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/backend/server",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_backend_servers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backend/servers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: address, advanced, id, name, parent_id, port, serverid, ssl, sslserververify, status, weight
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "address", "advanced", "id", "name", "parent_id", "port", "serverid",
+            "status", "weight",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/backend/servers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_backends(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/backends
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: acls, actions, advanced, advanced_backend, agent_checks, agent_inter, agent_port, balance, balance_uridepth, balance_urilen, balance_uriwhole, check_type, checkinter, connection_timeout, cookie_attribute_secure, email_level, email_to, errorfiles, haproxy_cookie_domains, haproxy_cookie_dynamic_cookie_key, haproxy_cookie_maxidle, haproxy_cookie_maxlife, httpcheck_method, id, log_health_checks, monitor_domain, monitor_httpversion, monitor_uri, monitor_username, name, persist_cookie_cachable, persist_cookie_enabled, persist_cookie_httponly, persist_cookie_mode, persist_cookie_name, persist_cookie_postonly, persist_cookie_secure, persist_stick_cookiename, persist_stick_expire, persist_stick_length, persist_stick_tablesize, persist_sticky_type, retries, server_timeout, servers, stats_admin, stats_desc, stats_enabled, stats_node, stats_password, stats_realm, stats_refresh, stats_scope, stats_uri, stats_username, strict_transport_security, transparent_clientip, transparent_interface
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "advanced", "advanced_backend", "agent_inter", "agent_port", "balance",
+            "balance_uridepth", "balance_urilen", "check_type", "checkinter",
+            "connection_timeout", "email_level", "email_to",
+            "haproxy_cookie_dynamic_cookie_key", "haproxy_cookie_maxidle",
+            "haproxy_cookie_maxlife", "httpcheck_method", "id", "monitor_domain",
+            "monitor_httpversion", "monitor_uri", "monitor_username", "name",
+            "persist_cookie_mode", "persist_cookie_name", "persist_stick_cookiename",
+            "persist_stick_expire", "persist_stick_length", "persist_stick_tablesize",
+            "persist_sticky_type", "retries", "server_timeout", "stats_admin",
+            "stats_desc", "stats_node", "stats_password", "stats_realm",
+            "stats_refresh", "stats_uri", "stats_username", "strict_transport_security",
+            "transparent_interface",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/backends",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_file(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/file
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/file",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_files(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/files
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: content, id, name, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "content", "id", "name", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/files",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_frontend_acl(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/acl
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/frontend/acl",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_frontend_acls(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/acls
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: casesensitive, expression, id, name, not, parent_id, value
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "expression", "id", "name", "parent_id", "value",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/frontend/acls",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_frontend_action(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/action
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/frontend/action",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_frontend_actions(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/actions
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: acl, action, backend, customaction, deny_status, find, fmt, id, lua_function, name, parent_id, path, realm, reason, replace, rule, status
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "acl", "action", "backend", "customaction", "deny_status", "find", "fmt",
+            "id", "lua_function", "name", "parent_id", "path", "realm", "reason",
+            "replace", "rule", "status",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/frontend/actions",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_frontend_address(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/address
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/frontend/address",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_frontend_addresses(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/addresses
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: exaddr_advanced, extaddr, extaddr_custom, extaddr_port, extaddr_ssl, id, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "exaddr_advanced", "extaddr", "extaddr_custom", "extaddr_port", "id",
+            "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/frontend/addresses",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_frontend_certificate(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/certificate
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/frontend/certificate",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_frontend_certificates(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/certificates
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, parent_id, ssl_certificate
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "parent_id", "ssl_certificate",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/frontend/certificates",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_frontend(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/frontend",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_frontend_error_file(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/error_file
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/frontend/error_file",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_frontend_error_files(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontend/error_files
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: errorcode, errorfile, id, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "errorcode", "errorfile", "id", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/frontend/error_files",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_frontends(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/frontends
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: a_actionitems, a_errorfiles, a_extaddr, advanced, advanced_bind, backend_serverpool, client_timeout, descr, dontlog_normal, dontlognull, forwardfor, ha_acls, ha_certificates, httpclose, id, log_detailed, log_separate_errors, max_connections, name, socket_stats, ssloffloadcert, status, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "advanced", "advanced_bind", "backend_serverpool", "client_timeout",
+            "descr", "httpclose", "id", "max_connections", "name", "ssloffloadcert",
+            "status", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/frontends",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_settings_dns_resolver(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/settings/dns_resolver
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/settings/dns_resolver",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_settings_dns_resolvers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/settings/dns_resolvers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, name, parent_id, port, server
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "name", "parent_id", "port", "server",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/settings/dns_resolvers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_settings_email_mailer(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/settings/email_mailer
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/settings/email_mailer",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_haproxy_settings_email_mailers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/settings/email_mailers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, mailserver, mailserverport, name, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "mailserver", "mailserverport", "name", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/haproxy/settings/email_mailers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_haproxy_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/haproxy/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/haproxy/settings",
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_services_haproxy_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_backend_acl(
+        expression: str,
+        name: str,
+        parent_id: str | int,
+        value: str,
+        confirm: bool = False,
+        casesensitive: bool | None = None,
+        not_: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/backend/acl
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        expression: The expression to use to determine the match for this ACL. Valid values: ['host_starts_with', 'host_ends_with', 'host_matches', 'host_regex', 'host_contains', 'path_starts_with', 'path_ends_with', 'path_matches', 'path_regex', 'path_contains', 'path_dir', 'url_parameter', 'ssl_c_verify_code', 'ssl_c_verify', 'ssl_c_ca_commonname', 'source_ip', 'backendservercount', 'traffic_is_http', 'traffic_is_ssl', 'ssl_sni_matches', 'ssl_sni_contains', 'ssl_sni_starts_with', 'ssl_sni_ends_with', 'ssl_sni_regex', 'custom']
+        name: The unique name for this backend ACL.
+        parent_id: The ID of the parent this object is nested under.
+        value: The value which indicates a match for this ACL.
+        casesensitive: Enables or disables case-sensitive matching for this ACL.
+        not_: Enables or disables inverting the context of this ACL.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/backend/acl. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if expression is not None:
+            body["expression"] = expression
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if value is not None:
+            body["value"] = value
+        if casesensitive is not None:
+            body["casesensitive"] = casesensitive
+        if not_ is not None:
+            body["not"] = not_
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/backend/acl",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_backend_acl(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        casesensitive: bool | None = None,
+        expression: str | None = None,
+        name: str | None = None,
+        not_: bool | None = None,
+        value: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/backend/acl
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        casesensitive: Enables or disables case-sensitive matching for this ACL.
+        expression: The expression to use to determine the match for this ACL. Valid values: ['host_starts_with', 'host_ends_with', 'host_matches', 'host_regex', 'host_contains', 'path_starts_with', 'path_ends_with', 'path_matches', 'path_regex', 'path_contains', 'path_dir', 'url_parameter', 'ssl_c_verify_code', 'ssl_c_verify', 'ssl_c_ca_commonname', 'source_ip', 'backendservercount', 'traffic_is_http', 'traffic_is_ssl', 'ssl_sni_matches', 'ssl_sni_contains', 'ssl_sni_starts_with', 'ssl_sni_ends_with', 'ssl_sni_regex', 'custom']
+        name: The unique name for this backend ACL.
+        not_: Enables or disables inverting the context of this ACL.
+        value: The value which indicates a match for this ACL.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/backend/acl. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if casesensitive is not None:
+            body["casesensitive"] = casesensitive
+        if expression is not None:
+            body["expression"] = expression
+        if name is not None:
+            body["name"] = name
+        if not_ is not None:
+            body["not"] = not_
+        if value is not None:
+            body["value"] = value
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/backend/acl",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_acl(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/acl
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/acl. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/acl",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_acls(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/acls
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/acls. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/acls",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_backend_action(
+        acl: str,
+        action: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        customaction: str | None = None,
+        deny_status: str | None = None,
+        find: str | None = None,
+        fmt: str | None = None,
+        lua_function: str | None = None,
+        name: str | None = None,
+        path: str | None = None,
+        realm: str | None = None,
+        reason: str | None = None,
+        replace: str | None = None,
+        rule: str | None = None,
+        server: str | None = None,
+        status: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/backend/action
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        acl: The name of the backend ACL this action is associated with.
+        action: The action to take when an ACL match is found. Valid values: ['use_server', 'custom', 'http-request_allow', 'http-request_deny', 'http-request_tarpit', 'http-request_auth', 'http-request_redirect', 'http-request_lua', 'http-request_use-service', 'http-request_add-header', 'http-request_set-header', 'http-request_del-header', 'http-request_replace-header', 'http-request_replace-path', 'http-request_replace-value', 'http-request_set-method', 'http-request_set-path', 'http-request_set-query', 'http-request_set-uri', 'http-response_allow', 'http-response_deny', 'http-response_lua', 'http-response_add-header', 'http-response_set-header', 'http-response_del-header', 'http-response_replace-header', 'http-response_replace-value', 'http-response_set-status', 'http-after-response_add-header', 'http-after-response_set-header', 'http-after-response_del-header', 'http-after-response_replace-header', 'http-after-response_replace-value', 'http-after-response_set-status', 'tcp-request_connection_accept', 'tcp-request_connection_reject', 'tcp-request_content_accept', 'tcp-request_content_reject', 'tcp-request_content_lua', 'tcp-request_content_use-service', 'tcp-response_content_accept', 'tcp-response_content_close', 'tcp-response_content_reject', 'tcp-response_content_lua']
+        parent_id: The ID of the parent this object is nested under.
+        customaction: The custom action to take when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'custom'`
+        deny_status: The deny status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_deny, http-request_tarpit ]
+        find: The value to find when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-response_replace-header, http-request_replace-path, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        fmt: The fmt value to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_set-method, http-request_set-path, http-request_set-query, http-request_set-uri, http-response_add-header, http-response_set-header, http-after-response_add-header, http-after-response_set-header ]
+        lua_function: The Lua function to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_lua, http-request_use-service, http-response_lua, tcp-request_content_lua, tcp-request_content_use-service, tcp-response_content_lua ]
+        name: The name to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_del-header, http-request_replace-header, http-request_replace-value, http-response_add-header, http-response_set-header, http-response_del-header, http-response_replace-header, http-response_replace-value, http-after-response_add-header, http-after-response_set-header, http-after-response_del-header, http-after-response_replace-header, http-after-response_replace-value ]
+        path: The path to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_replace-path'`
+        realm: The authentication realm to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_auth'`
+        reason: The status reason to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        replace: The value to replace with when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-request_replace-path, http-response_replace-header, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        rule: The redirect rule to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_redirect'`
+        server: The backend server to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'use_server'`
+        status: The status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/backend/action. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if acl is not None:
+            body["acl"] = acl
+        if action is not None:
+            body["action"] = action
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if customaction is not None:
+            body["customaction"] = customaction
+        if deny_status is not None:
+            body["deny_status"] = deny_status
+        if find is not None:
+            body["find"] = find
+        if fmt is not None:
+            body["fmt"] = fmt
+        if lua_function is not None:
+            body["lua_function"] = lua_function
+        if name is not None:
+            body["name"] = name
+        if path is not None:
+            body["path"] = path
+        if realm is not None:
+            body["realm"] = realm
+        if reason is not None:
+            body["reason"] = reason
+        if replace is not None:
+            body["replace"] = replace
+        if rule is not None:
+            body["rule"] = rule
+        if server is not None:
+            body["server"] = server
+        if status is not None:
+            body["status"] = status
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/backend/action",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_backend_action(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        acl: str | None = None,
+        action: str | None = None,
+        customaction: str | None = None,
+        deny_status: str | None = None,
+        find: str | None = None,
+        fmt: str | None = None,
+        lua_function: str | None = None,
+        name: str | None = None,
+        path: str | None = None,
+        realm: str | None = None,
+        reason: str | None = None,
+        replace: str | None = None,
+        rule: str | None = None,
+        server: str | None = None,
+        status: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/backend/action
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        acl: The name of the backend ACL this action is associated with.
+        action: The action to take when an ACL match is found. Valid values: ['use_server', 'custom', 'http-request_allow', 'http-request_deny', 'http-request_tarpit', 'http-request_auth', 'http-request_redirect', 'http-request_lua', 'http-request_use-service', 'http-request_add-header', 'http-request_set-header', 'http-request_del-header', 'http-request_replace-header', 'http-request_replace-path', 'http-request_replace-value', 'http-request_set-method', 'http-request_set-path', 'http-request_set-query', 'http-request_set-uri', 'http-response_allow', 'http-response_deny', 'http-response_lua', 'http-response_add-header', 'http-response_set-header', 'http-response_del-header', 'http-response_replace-header', 'http-response_replace-value', 'http-response_set-status', 'http-after-response_add-header', 'http-after-response_set-header', 'http-after-response_del-header', 'http-after-response_replace-header', 'http-after-response_replace-value', 'http-after-response_set-status', 'tcp-request_connection_accept', 'tcp-request_connection_reject', 'tcp-request_content_accept', 'tcp-request_content_reject', 'tcp-request_content_lua', 'tcp-request_content_use-service', 'tcp-response_content_accept', 'tcp-response_content_close', 'tcp-response_content_reject', 'tcp-response_content_lua']
+        customaction: The custom action to take when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'custom'`
+        deny_status: The deny status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_deny, http-request_tarpit ]
+        find: The value to find when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-response_replace-header, http-request_replace-path, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        fmt: The fmt value to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_set-method, http-request_set-path, http-request_set-query, http-request_set-uri, http-response_add-header, http-response_set-header, http-after-response_add-header, http-after-response_set-header ]
+        lua_function: The Lua function to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_lua, http-request_use-service, http-response_lua, tcp-request_content_lua, tcp-request_content_use-service, tcp-response_content_lua ]
+        name: The name to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_del-header, http-request_replace-header, http-request_replace-value, http-response_add-header, http-response_set-header, http-response_del-header, http-response_replace-header, http-response_replace-value, http-after-response_add-header, http-after-response_set-header, http-after-response_del-header, http-after-response_replace-header, http-after-response_replace-value ]
+        path: The path to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_replace-path'`
+        realm: The authentication realm to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_auth'`
+        reason: The status reason to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        replace: The value to replace with when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-request_replace-path, http-response_replace-header, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        rule: The redirect rule to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_redirect'`
+        server: The backend server to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'use_server'`
+        status: The status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/backend/action. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if acl is not None:
+            body["acl"] = acl
+        if action is not None:
+            body["action"] = action
+        if customaction is not None:
+            body["customaction"] = customaction
+        if deny_status is not None:
+            body["deny_status"] = deny_status
+        if find is not None:
+            body["find"] = find
+        if fmt is not None:
+            body["fmt"] = fmt
+        if lua_function is not None:
+            body["lua_function"] = lua_function
+        if name is not None:
+            body["name"] = name
+        if path is not None:
+            body["path"] = path
+        if realm is not None:
+            body["realm"] = realm
+        if reason is not None:
+            body["reason"] = reason
+        if replace is not None:
+            body["replace"] = replace
+        if rule is not None:
+            body["rule"] = rule
+        if server is not None:
+            body["server"] = server
+        if status is not None:
+            body["status"] = status
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/backend/action",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_action(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/action
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/action. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/action",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_actions(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/actions
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/actions. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/actions",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_backend(
+        name: str,
+        confirm: bool = False,
+        acls: list[dict[str, Any]] | None = None,
+        actions: list[dict[str, Any]] | None = None,
+        advanced: str | None = None,
+        advanced_backend: str | None = None,
+        agent_checks: bool | None = None,
+        agent_inter: int | None = None,
+        agent_port: str | None = None,
+        balance: str | None = None,
+        balance_uridepth: int | None = None,
+        balance_urilen: int | None = None,
+        balance_uriwhole: bool | None = None,
+        check_type: str | None = 'none',
+        checkinter: int | None = None,
+        connection_timeout: int | None = 30000,
+        cookie_attribute_secure: bool | None = None,
+        email_level: str | None = None,
+        email_to: str | None = None,
+        errorfiles: list[dict[str, Any]] | None = None,
+        haproxy_cookie_domains: list[str] | None = None,
+        haproxy_cookie_dynamic_cookie_key: str | None = None,
+        haproxy_cookie_maxidle: int | None = None,
+        haproxy_cookie_maxlife: int | None = None,
+        httpcheck_method: str | None = None,
+        log_health_checks: bool | None = None,
+        monitor_domain: str | None = None,
+        monitor_httpversion: str | None = None,
+        monitor_uri: str | None = None,
+        monitor_username: str | None = None,
+        persist_cookie_cachable: bool | None = None,
+        persist_cookie_enabled: bool | None = None,
+        persist_cookie_httponly: bool | None = None,
+        persist_cookie_mode: str | None = None,
+        persist_cookie_name: str | None = None,
+        persist_cookie_postonly: bool | None = None,
+        persist_cookie_secure: bool | None = None,
+        persist_stick_cookiename: str | None = None,
+        persist_stick_expire: str | None = None,
+        persist_stick_length: int | None = None,
+        persist_stick_tablesize: str | None = None,
+        persist_sticky_type: str | None = 'none',
+        retries: int | None = None,
+        server_timeout: int | None = 30000,
+        servers: list[dict[str, Any]] | None = None,
+        stats_admin: str | None = None,
+        stats_desc: str | None = None,
+        stats_enabled: bool | None = None,
+        stats_node: str | None = None,
+        stats_password: str | None = None,
+        stats_realm: str | None = None,
+        stats_refresh: int | None = None,
+        stats_scope: list[str] | None = None,
+        stats_uri: str | None = None,
+        stats_username: str | None = None,
+        strict_transport_security: int | None = None,
+        transparent_clientip: bool | None = None,
+        transparent_interface: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/backend
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        name: The unique name for this backend.
+        acls: The ACLs to apply to this backend. Each object accepts: - name (string) - expression (string) - value (string) - casesensitive (boolean) - not (boolean)
+        actions: The actions to apply to this backend. Each object accepts: - action (string) - acl (string) - server (string) - customaction (string) - deny_status (string) - realm (string) - rule (string) - lua_function (string) - name (string) - fmt (string) - find (string) - replace (string) ... and 3 more fields
+        advanced: The per server pass thru to apply to each server line.
+        advanced_backend: The backend pass thru to apply to the backend section.
+        agent_checks: Enables or disables using a TCP connection to read an ASCII string of the form.
+        agent_inter: The interval (in milliseconds) between agent checks.This field is only available when the following conditions are met:- `agent_checks` must be equal to `true`
+        agent_port: Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `agent_checks` must be equal to `true`
+        balance: The load balancing option to use for servers assigned to this backend. Valid values: ['', 'roundrobin', 'static-rr', 'leastconn', 'source', 'uri']
+        balance_uridepth: The maximum directory depth to be used to compute the hash. One level is counted for each slash in the request.This field is only available when the following conditions are met:- `balance` must be equal to `'uri'`
+        balance_urilen: The number of URI characters the algorithm should consider when hashing.This field is only available when the following conditions are met:- `balance` must be equal to `'uri'`
+        balance_uriwhole: Enables or disables allowing the use of whole URIs, including URL parameters.This field is only available when the following conditions are met:- `balance` must be equal to `'uri'`
+        check_type: The health check method to use when checking the health of backend servers. Valid values: ['none', 'Basic', 'HTTP', 'LDAP', 'MySQL', 'PostgreSQL', 'Redis', 'SMTP', 'ESMTP', 'SSL']
+        checkinter: The interval (in milliseconds) in which health checks will be performed.This field is only available when the following conditions are met:- `check_type` must not be equal to `'none'`
+        connection_timeout: The amount of time (in milliseconds) to wait before giving up on connections.
+        cookie_attribute_secure: Enables or disables assigning the secure attributes on cookies for this backend.
+        email_level: The maximum log level to send emails for. Leave empty to disable sending email alerts. If left empty, the value set in the global settings will be used. Valid values: ['', 'dontlog', 'emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug']
+        email_to: The email address to send emails to. If left empty, the value set in the global settings will be used.
+        errorfiles: The HAProxy error file mappings to use for this backend. Each object accepts: - errorcode (integer) - errorfile (string)
+        haproxy_cookie_domains: The domains to set the cookies for.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        haproxy_cookie_dynamic_cookie_key: The dynamic cookie secret key. This is will be used to generate dynamic cookies for this backend.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        haproxy_cookie_maxidle: The max-idle time to allow. This option only applies to insert mode cookies.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        haproxy_cookie_maxlife: The max-life time to allow. This option only applies to insert mode cookies.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        httpcheck_method: The HTTP method to use for HTTP health checks.This field is only available when the following conditions are met:- `check_type` must be equal to `'HTTP'` Valid values: ['OPTIONS', 'HEAD', 'GET', 'POST', 'PUT', 'DELETE', 'TRACE']
+        log_health_checks: Enables or disables logging changes to the health check statusThis field is only available when the following conditions are met:- `check_type` must not be equal to `'none'`
+        monitor_domain: The domain to use for SMTP or ESMTP health checks.This field is only available when the following conditions are met:- `check_type` must be one of [ SMTP, ESMTP ]
+        monitor_httpversion: The HTTP version to use for HTTP health checks.This field is only available when the following conditions are met:- `check_type` must be equal to `'HTTP'`
+        monitor_uri: The URL to use for HTTP health checks.This field is only available when the following conditions are met:- `check_type` must be equal to `'HTTP'`
+        monitor_username: The username to use for MySQL or PostgreSQL health checks.This field is only available when the following conditions are met:- `check_type` must be one of [ MySQL, PostgreSQL ]
+        persist_cookie_cachable: Enables or disables allowing shared caches to cache the server response.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_enabled: Enables or disables cookie based persistence.
+        persist_cookie_httponly: Enables or disables preventing the use of cookies with non-HTTP components.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_mode: The mode HAProxy uses to insert/prefix/replace or examine cookie and set-cookie headers.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true` Valid values: ['passive', 'passive-silent', 'reset', 'set', 'set-silent', 'insert-only', 'insert-only-silent', 'session-prefix', 'passive-session-prefix']
+        persist_cookie_name: The string name to track in Set-Cookie and Cookie HTTP headers.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_postonly: Enables or disables only inserting cookies on POST requests.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_secure: Enables or disables prevention of cookie usage over non-secure channels.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_stick_cookiename: The cookie name to use for stick table.This field is only available when the following conditions are met:- `persist_sticky_type` must be one of [ stick_cookie_value, stick_rdp_cookie ]
+        persist_stick_expire: The maximum duration of an entry in the stick-table since it was last created, refreshed or matched.This field is only available when the following conditions are met:- `persist_sticky_type` must not be equal to `'none'`
+        persist_stick_length: The maximum number of characters allowed in a string type stick tableThis field is only available when the following conditions are met:- `persist_sticky_type` must be one of [ stick_cookie_value, stick_rdp_cookie ]
+        persist_stick_tablesize: The maximum number of entries allowed in the table. This value directly impacts memory usage.This field is only available when the following conditions are met:- `persist_sticky_type` must not be equal to `'none'`
+        persist_sticky_type: The sticky table mode to use for this backend. These options are used to make sure subsequent requests from a single client go to the same backend. Valid values: ['none', 'stick_sslsessionid', 'stick_sourceipv4', 'stick_sourceipv6', 'stick_cookie_value', 'stick_rdp_cookie']
+        retries: The number of retry attempts to allow after a connection failure to the server.
+        server_timeout: The amount of time (in milliseconds) to wait for data transferred to or from the server.
+        servers: The pool of servers this backend will use. Each object accepts: - name (string) - status (string): valid=['active', 'backup', 'disabled', 'inactive'] - address (string) - port (string) - weight (integer) - ssl (boolean) - sslserververify (boolean) - serverid (integer) - advanced (string)
+        stats_admin: The admin to make use of the options disable/enable/softstop/softstart/killsessions from the stats page.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_desc: The verbose description for this node.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_enabled: Enables or disables the HAProxy statistics page for this backend.
+        stats_node: The short name displayed in stats and helps differentiate which server in the cluster is actually serving clients.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_password: The stats page password.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_realm: The realm that is shown when authentication is requested by HAProxy.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_refresh: The interval (in seconds) in which the stats page is refreshed.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_scope: The frontends and backends stats to be shown, leave empty to show all.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_uri: The statistics URL for this backend.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_username: The stats page usernameThis field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        strict_transport_security: The HSTS validity period for this backend. Leave empty to disable HSTS.
+        transparent_clientip: Enables or disables using the client-IP to connect to backend servers.
+        transparent_interface: The interface that will connect to the backend server.This field is only available when the following conditions are met:- `transparent_clientip` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/backend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if acls is not None:
+            body["acls"] = acls
+        if actions is not None:
+            body["actions"] = actions
+        if advanced is not None:
+            body["advanced"] = advanced
+        if advanced_backend is not None:
+            body["advanced_backend"] = advanced_backend
+        if agent_checks is not None:
+            body["agent_checks"] = agent_checks
+        if agent_inter is not None:
+            body["agent_inter"] = agent_inter
+        if agent_port is not None:
+            body["agent_port"] = agent_port
+        if balance is not None:
+            body["balance"] = balance
+        if balance_uridepth is not None:
+            body["balance_uridepth"] = balance_uridepth
+        if balance_urilen is not None:
+            body["balance_urilen"] = balance_urilen
+        if balance_uriwhole is not None:
+            body["balance_uriwhole"] = balance_uriwhole
+        if check_type is not None:
+            body["check_type"] = check_type
+        if checkinter is not None:
+            body["checkinter"] = checkinter
+        if connection_timeout is not None:
+            body["connection_timeout"] = connection_timeout
+        if cookie_attribute_secure is not None:
+            body["cookie_attribute_secure"] = cookie_attribute_secure
+        if email_level is not None:
+            body["email_level"] = email_level
+        if email_to is not None:
+            body["email_to"] = email_to
+        if errorfiles is not None:
+            body["errorfiles"] = errorfiles
+        if haproxy_cookie_domains is not None:
+            body["haproxy_cookie_domains"] = haproxy_cookie_domains
+        if haproxy_cookie_dynamic_cookie_key is not None:
+            body["haproxy_cookie_dynamic_cookie_key"] = haproxy_cookie_dynamic_cookie_key
+        if haproxy_cookie_maxidle is not None:
+            body["haproxy_cookie_maxidle"] = haproxy_cookie_maxidle
+        if haproxy_cookie_maxlife is not None:
+            body["haproxy_cookie_maxlife"] = haproxy_cookie_maxlife
+        if httpcheck_method is not None:
+            body["httpcheck_method"] = httpcheck_method
+        if log_health_checks is not None:
+            body["log_health_checks"] = log_health_checks
+        if monitor_domain is not None:
+            body["monitor_domain"] = monitor_domain
+        if monitor_httpversion is not None:
+            body["monitor_httpversion"] = monitor_httpversion
+        if monitor_uri is not None:
+            body["monitor_uri"] = monitor_uri
+        if monitor_username is not None:
+            body["monitor_username"] = monitor_username
+        if persist_cookie_cachable is not None:
+            body["persist_cookie_cachable"] = persist_cookie_cachable
+        if persist_cookie_enabled is not None:
+            body["persist_cookie_enabled"] = persist_cookie_enabled
+        if persist_cookie_httponly is not None:
+            body["persist_cookie_httponly"] = persist_cookie_httponly
+        if persist_cookie_mode is not None:
+            body["persist_cookie_mode"] = persist_cookie_mode
+        if persist_cookie_name is not None:
+            body["persist_cookie_name"] = persist_cookie_name
+        if persist_cookie_postonly is not None:
+            body["persist_cookie_postonly"] = persist_cookie_postonly
+        if persist_cookie_secure is not None:
+            body["persist_cookie_secure"] = persist_cookie_secure
+        if persist_stick_cookiename is not None:
+            body["persist_stick_cookiename"] = persist_stick_cookiename
+        if persist_stick_expire is not None:
+            body["persist_stick_expire"] = persist_stick_expire
+        if persist_stick_length is not None:
+            body["persist_stick_length"] = persist_stick_length
+        if persist_stick_tablesize is not None:
+            body["persist_stick_tablesize"] = persist_stick_tablesize
+        if persist_sticky_type is not None:
+            body["persist_sticky_type"] = persist_sticky_type
+        if retries is not None:
+            body["retries"] = retries
+        if server_timeout is not None:
+            body["server_timeout"] = server_timeout
+        if servers is not None:
+            body["servers"] = servers
+        if stats_admin is not None:
+            body["stats_admin"] = stats_admin
+        if stats_desc is not None:
+            body["stats_desc"] = stats_desc
+        if stats_enabled is not None:
+            body["stats_enabled"] = stats_enabled
+        if stats_node is not None:
+            body["stats_node"] = stats_node
+        if stats_password is not None:
+            body["stats_password"] = stats_password
+        if stats_realm is not None:
+            body["stats_realm"] = stats_realm
+        if stats_refresh is not None:
+            body["stats_refresh"] = stats_refresh
+        if stats_scope is not None:
+            body["stats_scope"] = stats_scope
+        if stats_uri is not None:
+            body["stats_uri"] = stats_uri
+        if stats_username is not None:
+            body["stats_username"] = stats_username
+        if strict_transport_security is not None:
+            body["strict_transport_security"] = strict_transport_security
+        if transparent_clientip is not None:
+            body["transparent_clientip"] = transparent_clientip
+        if transparent_interface is not None:
+            body["transparent_interface"] = transparent_interface
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/backend",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_backend(
+        id: str | int,
+        confirm: bool = False,
+        acls: list[dict[str, Any]] | None = None,
+        actions: list[dict[str, Any]] | None = None,
+        advanced: str | None = None,
+        advanced_backend: str | None = None,
+        agent_checks: bool | None = None,
+        agent_inter: int | None = None,
+        agent_port: str | None = None,
+        balance: str | None = None,
+        balance_uridepth: int | None = None,
+        balance_urilen: int | None = None,
+        balance_uriwhole: bool | None = None,
+        check_type: str | None = None,
+        checkinter: int | None = None,
+        connection_timeout: int | None = None,
+        cookie_attribute_secure: bool | None = None,
+        email_level: str | None = None,
+        email_to: str | None = None,
+        errorfiles: list[dict[str, Any]] | None = None,
+        haproxy_cookie_domains: list[str] | None = None,
+        haproxy_cookie_dynamic_cookie_key: str | None = None,
+        haproxy_cookie_maxidle: int | None = None,
+        haproxy_cookie_maxlife: int | None = None,
+        httpcheck_method: str | None = None,
+        log_health_checks: bool | None = None,
+        monitor_domain: str | None = None,
+        monitor_httpversion: str | None = None,
+        monitor_uri: str | None = None,
+        monitor_username: str | None = None,
+        name: str | None = None,
+        persist_cookie_cachable: bool | None = None,
+        persist_cookie_enabled: bool | None = None,
+        persist_cookie_httponly: bool | None = None,
+        persist_cookie_mode: str | None = None,
+        persist_cookie_name: str | None = None,
+        persist_cookie_postonly: bool | None = None,
+        persist_cookie_secure: bool | None = None,
+        persist_stick_cookiename: str | None = None,
+        persist_stick_expire: str | None = None,
+        persist_stick_length: int | None = None,
+        persist_stick_tablesize: str | None = None,
+        persist_sticky_type: str | None = None,
+        retries: int | None = None,
+        server_timeout: int | None = None,
+        servers: list[dict[str, Any]] | None = None,
+        stats_admin: str | None = None,
+        stats_desc: str | None = None,
+        stats_enabled: bool | None = None,
+        stats_node: str | None = None,
+        stats_password: str | None = None,
+        stats_realm: str | None = None,
+        stats_refresh: int | None = None,
+        stats_scope: list[str] | None = None,
+        stats_uri: str | None = None,
+        stats_username: str | None = None,
+        strict_transport_security: int | None = None,
+        transparent_clientip: bool | None = None,
+        transparent_interface: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/backend
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        acls: The ACLs to apply to this backend. Each object accepts: - name (string) - expression (string) - value (string) - casesensitive (boolean) - not (boolean)
+        actions: The actions to apply to this backend. Each object accepts: - action (string) - acl (string) - server (string) - customaction (string) - deny_status (string) - realm (string) - rule (string) - lua_function (string) - name (string) - fmt (string) - find (string) - replace (string) ... and 3 more fields
+        advanced: The per server pass thru to apply to each server line.
+        advanced_backend: The backend pass thru to apply to the backend section.
+        agent_checks: Enables or disables using a TCP connection to read an ASCII string of the form.
+        agent_inter: The interval (in milliseconds) between agent checks.This field is only available when the following conditions are met:- `agent_checks` must be equal to `true`
+        agent_port: Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `agent_checks` must be equal to `true`
+        balance: The load balancing option to use for servers assigned to this backend. Valid values: ['', 'roundrobin', 'static-rr', 'leastconn', 'source', 'uri']
+        balance_uridepth: The maximum directory depth to be used to compute the hash. One level is counted for each slash in the request.This field is only available when the following conditions are met:- `balance` must be equal to `'uri'`
+        balance_urilen: The number of URI characters the algorithm should consider when hashing.This field is only available when the following conditions are met:- `balance` must be equal to `'uri'`
+        balance_uriwhole: Enables or disables allowing the use of whole URIs, including URL parameters.This field is only available when the following conditions are met:- `balance` must be equal to `'uri'`
+        check_type: The health check method to use when checking the health of backend servers. Valid values: ['none', 'Basic', 'HTTP', 'LDAP', 'MySQL', 'PostgreSQL', 'Redis', 'SMTP', 'ESMTP', 'SSL']
+        checkinter: The interval (in milliseconds) in which health checks will be performed.This field is only available when the following conditions are met:- `check_type` must not be equal to `'none'`
+        connection_timeout: The amount of time (in milliseconds) to wait before giving up on connections.
+        cookie_attribute_secure: Enables or disables assigning the secure attributes on cookies for this backend.
+        email_level: The maximum log level to send emails for. Leave empty to disable sending email alerts. If left empty, the value set in the global settings will be used. Valid values: ['', 'dontlog', 'emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug']
+        email_to: The email address to send emails to. If left empty, the value set in the global settings will be used.
+        errorfiles: The HAProxy error file mappings to use for this backend. Each object accepts: - errorcode (integer) - errorfile (string)
+        haproxy_cookie_domains: The domains to set the cookies for.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        haproxy_cookie_dynamic_cookie_key: The dynamic cookie secret key. This is will be used to generate dynamic cookies for this backend.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        haproxy_cookie_maxidle: The max-idle time to allow. This option only applies to insert mode cookies.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        haproxy_cookie_maxlife: The max-life time to allow. This option only applies to insert mode cookies.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        httpcheck_method: The HTTP method to use for HTTP health checks.This field is only available when the following conditions are met:- `check_type` must be equal to `'HTTP'` Valid values: ['OPTIONS', 'HEAD', 'GET', 'POST', 'PUT', 'DELETE', 'TRACE']
+        log_health_checks: Enables or disables logging changes to the health check statusThis field is only available when the following conditions are met:- `check_type` must not be equal to `'none'`
+        monitor_domain: The domain to use for SMTP or ESMTP health checks.This field is only available when the following conditions are met:- `check_type` must be one of [ SMTP, ESMTP ]
+        monitor_httpversion: The HTTP version to use for HTTP health checks.This field is only available when the following conditions are met:- `check_type` must be equal to `'HTTP'`
+        monitor_uri: The URL to use for HTTP health checks.This field is only available when the following conditions are met:- `check_type` must be equal to `'HTTP'`
+        monitor_username: The username to use for MySQL or PostgreSQL health checks.This field is only available when the following conditions are met:- `check_type` must be one of [ MySQL, PostgreSQL ]
+        name: The unique name for this backend.
+        persist_cookie_cachable: Enables or disables allowing shared caches to cache the server response.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_enabled: Enables or disables cookie based persistence.
+        persist_cookie_httponly: Enables or disables preventing the use of cookies with non-HTTP components.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_mode: The mode HAProxy uses to insert/prefix/replace or examine cookie and set-cookie headers.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true` Valid values: ['passive', 'passive-silent', 'reset', 'set', 'set-silent', 'insert-only', 'insert-only-silent', 'session-prefix', 'passive-session-prefix']
+        persist_cookie_name: The string name to track in Set-Cookie and Cookie HTTP headers.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_postonly: Enables or disables only inserting cookies on POST requests.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_cookie_secure: Enables or disables prevention of cookie usage over non-secure channels.This field is only available when the following conditions are met:- `persist_cookie_enabled` must be equal to `true`
+        persist_stick_cookiename: The cookie name to use for stick table.This field is only available when the following conditions are met:- `persist_sticky_type` must be one of [ stick_cookie_value, stick_rdp_cookie ]
+        persist_stick_expire: The maximum duration of an entry in the stick-table since it was last created, refreshed or matched.This field is only available when the following conditions are met:- `persist_sticky_type` must not be equal to `'none'`
+        persist_stick_length: The maximum number of characters allowed in a string type stick tableThis field is only available when the following conditions are met:- `persist_sticky_type` must be one of [ stick_cookie_value, stick_rdp_cookie ]
+        persist_stick_tablesize: The maximum number of entries allowed in the table. This value directly impacts memory usage.This field is only available when the following conditions are met:- `persist_sticky_type` must not be equal to `'none'`
+        persist_sticky_type: The sticky table mode to use for this backend. These options are used to make sure subsequent requests from a single client go to the same backend. Valid values: ['none', 'stick_sslsessionid', 'stick_sourceipv4', 'stick_sourceipv6', 'stick_cookie_value', 'stick_rdp_cookie']
+        retries: The number of retry attempts to allow after a connection failure to the server.
+        server_timeout: The amount of time (in milliseconds) to wait for data transferred to or from the server.
+        servers: The pool of servers this backend will use. Each object accepts: - name (string) - status (string): valid=['active', 'backup', 'disabled', 'inactive'] - address (string) - port (string) - weight (integer) - ssl (boolean) - sslserververify (boolean) - serverid (integer) - advanced (string)
+        stats_admin: The admin to make use of the options disable/enable/softstop/softstart/killsessions from the stats page.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_desc: The verbose description for this node.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_enabled: Enables or disables the HAProxy statistics page for this backend.
+        stats_node: The short name displayed in stats and helps differentiate which server in the cluster is actually serving clients.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_password: The stats page password.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_realm: The realm that is shown when authentication is requested by HAProxy.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_refresh: The interval (in seconds) in which the stats page is refreshed.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_scope: The frontends and backends stats to be shown, leave empty to show all.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_uri: The statistics URL for this backend.This field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        stats_username: The stats page usernameThis field is only available when the following conditions are met:- `stats_enabled` must be equal to `true`
+        strict_transport_security: The HSTS validity period for this backend. Leave empty to disable HSTS.
+        transparent_clientip: Enables or disables using the client-IP to connect to backend servers.
+        transparent_interface: The interface that will connect to the backend server.This field is only available when the following conditions are met:- `transparent_clientip` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/backend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if acls is not None:
+            body["acls"] = acls
+        if actions is not None:
+            body["actions"] = actions
+        if advanced is not None:
+            body["advanced"] = advanced
+        if advanced_backend is not None:
+            body["advanced_backend"] = advanced_backend
+        if agent_checks is not None:
+            body["agent_checks"] = agent_checks
+        if agent_inter is not None:
+            body["agent_inter"] = agent_inter
+        if agent_port is not None:
+            body["agent_port"] = agent_port
+        if balance is not None:
+            body["balance"] = balance
+        if balance_uridepth is not None:
+            body["balance_uridepth"] = balance_uridepth
+        if balance_urilen is not None:
+            body["balance_urilen"] = balance_urilen
+        if balance_uriwhole is not None:
+            body["balance_uriwhole"] = balance_uriwhole
+        if check_type is not None:
+            body["check_type"] = check_type
+        if checkinter is not None:
+            body["checkinter"] = checkinter
+        if connection_timeout is not None:
+            body["connection_timeout"] = connection_timeout
+        if cookie_attribute_secure is not None:
+            body["cookie_attribute_secure"] = cookie_attribute_secure
+        if email_level is not None:
+            body["email_level"] = email_level
+        if email_to is not None:
+            body["email_to"] = email_to
+        if errorfiles is not None:
+            body["errorfiles"] = errorfiles
+        if haproxy_cookie_domains is not None:
+            body["haproxy_cookie_domains"] = haproxy_cookie_domains
+        if haproxy_cookie_dynamic_cookie_key is not None:
+            body["haproxy_cookie_dynamic_cookie_key"] = haproxy_cookie_dynamic_cookie_key
+        if haproxy_cookie_maxidle is not None:
+            body["haproxy_cookie_maxidle"] = haproxy_cookie_maxidle
+        if haproxy_cookie_maxlife is not None:
+            body["haproxy_cookie_maxlife"] = haproxy_cookie_maxlife
+        if httpcheck_method is not None:
+            body["httpcheck_method"] = httpcheck_method
+        if log_health_checks is not None:
+            body["log_health_checks"] = log_health_checks
+        if monitor_domain is not None:
+            body["monitor_domain"] = monitor_domain
+        if monitor_httpversion is not None:
+            body["monitor_httpversion"] = monitor_httpversion
+        if monitor_uri is not None:
+            body["monitor_uri"] = monitor_uri
+        if monitor_username is not None:
+            body["monitor_username"] = monitor_username
+        if name is not None:
+            body["name"] = name
+        if persist_cookie_cachable is not None:
+            body["persist_cookie_cachable"] = persist_cookie_cachable
+        if persist_cookie_enabled is not None:
+            body["persist_cookie_enabled"] = persist_cookie_enabled
+        if persist_cookie_httponly is not None:
+            body["persist_cookie_httponly"] = persist_cookie_httponly
+        if persist_cookie_mode is not None:
+            body["persist_cookie_mode"] = persist_cookie_mode
+        if persist_cookie_name is not None:
+            body["persist_cookie_name"] = persist_cookie_name
+        if persist_cookie_postonly is not None:
+            body["persist_cookie_postonly"] = persist_cookie_postonly
+        if persist_cookie_secure is not None:
+            body["persist_cookie_secure"] = persist_cookie_secure
+        if persist_stick_cookiename is not None:
+            body["persist_stick_cookiename"] = persist_stick_cookiename
+        if persist_stick_expire is not None:
+            body["persist_stick_expire"] = persist_stick_expire
+        if persist_stick_length is not None:
+            body["persist_stick_length"] = persist_stick_length
+        if persist_stick_tablesize is not None:
+            body["persist_stick_tablesize"] = persist_stick_tablesize
+        if persist_sticky_type is not None:
+            body["persist_sticky_type"] = persist_sticky_type
+        if retries is not None:
+            body["retries"] = retries
+        if server_timeout is not None:
+            body["server_timeout"] = server_timeout
+        if servers is not None:
+            body["servers"] = servers
+        if stats_admin is not None:
+            body["stats_admin"] = stats_admin
+        if stats_desc is not None:
+            body["stats_desc"] = stats_desc
+        if stats_enabled is not None:
+            body["stats_enabled"] = stats_enabled
+        if stats_node is not None:
+            body["stats_node"] = stats_node
+        if stats_password is not None:
+            body["stats_password"] = stats_password
+        if stats_realm is not None:
+            body["stats_realm"] = stats_realm
+        if stats_refresh is not None:
+            body["stats_refresh"] = stats_refresh
+        if stats_scope is not None:
+            body["stats_scope"] = stats_scope
+        if stats_uri is not None:
+            body["stats_uri"] = stats_uri
+        if stats_username is not None:
+            body["stats_username"] = stats_username
+        if strict_transport_security is not None:
+            body["strict_transport_security"] = strict_transport_security
+        if transparent_clientip is not None:
+            body["transparent_clientip"] = transparent_clientip
+        if transparent_interface is not None:
+            body["transparent_interface"] = transparent_interface
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/backend",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_backend_error_file(
+        errorcode: int,
+        errorfile: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/backend/error_file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        errorcode: The HTTP status code that will trigger this error file to be used.
+        errorfile: The HAProxy error file object that should be used for the assigned HTTP status code.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/backend/error_file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if errorcode is not None:
+            body["errorcode"] = errorcode
+        if errorfile is not None:
+            body["errorfile"] = errorfile
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/backend/error_file",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_backend_error_file(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        errorcode: int | None = None,
+        errorfile: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/backend/error_file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        errorcode: The HTTP status code that will trigger this error file to be used.
+        errorfile: The HAProxy error file object that should be used for the assigned HTTP status code.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/backend/error_file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if errorcode is not None:
+            body["errorcode"] = errorcode
+        if errorfile is not None:
+            body["errorfile"] = errorfile
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/backend/error_file",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_error_file(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/error_file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/error_file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/error_file",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_error_files(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/errorfiles
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/errorfiles. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/errorfiles",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_backend_server(
+        address: str,
+        name: str,
+        parent_id: str | int,
+        port: str,
+        confirm: bool = False,
+        advanced: str | None = None,
+        ssl: bool | None = None,
+        sslserververify: bool | None = None,
+        status: str | None = 'active',
+        weight: int | None = 1,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/backend/server
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        address: The hostname or IP address of this backend server. Hostname values are only resolved at service startup.
+        name: The unique name for this backend server.
+        parent_id: The ID of the parent this object is nested under.
+        port: The port to forward to for this backend server. Valid options are: a TCP/UDP port number
+        advanced: Allows adding custom HAProxy server settings to the server.
+        ssl: Enables or disables using SSL/TLS when forwarding to this backend server.
+        sslserververify: Enables or disables verifying the SSL/TLS certificate when forwarding to this backend server.
+        status: The eligibility status for this backend server. Valid values: ['active', 'backup', 'disabled', 'inactive']
+        weight: The weight of this backend server when load balancing.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/backend/server. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if address is not None:
+            body["address"] = address
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if port is not None:
+            body["port"] = port
+        if advanced is not None:
+            body["advanced"] = advanced
+        if ssl is not None:
+            body["ssl"] = ssl
+        if sslserververify is not None:
+            body["sslserververify"] = sslserververify
+        if status is not None:
+            body["status"] = status
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/backend/server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_backend_server(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        address: str | None = None,
+        advanced: str | None = None,
+        name: str | None = None,
+        port: str | None = None,
+        ssl: bool | None = None,
+        sslserververify: bool | None = None,
+        status: str | None = None,
+        weight: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/backend/server
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        address: The hostname or IP address of this backend server. Hostname values are only resolved at service startup.
+        advanced: Allows adding custom HAProxy server settings to the server.
+        name: The unique name for this backend server.
+        port: The port to forward to for this backend server. Valid options are: a TCP/UDP port number
+        ssl: Enables or disables using SSL/TLS when forwarding to this backend server.
+        sslserververify: Enables or disables verifying the SSL/TLS certificate when forwarding to this backend server.
+        status: The eligibility status for this backend server. Valid values: ['active', 'backup', 'disabled', 'inactive']
+        weight: The weight of this backend server when load balancing.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/backend/server. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if address is not None:
+            body["address"] = address
+        if advanced is not None:
+            body["advanced"] = advanced
+        if name is not None:
+            body["name"] = name
+        if port is not None:
+            body["port"] = port
+        if ssl is not None:
+            body["ssl"] = ssl
+        if sslserververify is not None:
+            body["sslserververify"] = sslserververify
+        if status is not None:
+            body["status"] = status
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/backend/server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_server(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/server
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/server. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/server",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backend_servers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backend/servers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backend/servers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backend/servers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_haproxy_backends(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/haproxy/backends
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/haproxy/backends. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/haproxy/backends",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_backends(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/backends
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/backends. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/backends",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_file(
+        content: str,
+        name: str,
+        confirm: bool = False,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        content: The content of this file.
+        name: The unique name for this file.
+        type_: The type of file. Use `null` to assume an Errorfile. Valid values: ['luascript', 'writetodisk']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if content is not None:
+            body["content"] = content
+        if name is not None:
+            body["name"] = name
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/file",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_file(
+        id: str | int,
+        confirm: bool = False,
+        content: str | None = None,
+        name: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        content: The content of this file.
+        name: The unique name for this file.
+        type_: The type of file. Use `null` to assume an Errorfile. Valid values: ['luascript', 'writetodisk']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if content is not None:
+            body["content"] = content
+        if name is not None:
+            body["name"] = name
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/file",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_file(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/file",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_haproxy_files(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/haproxy/files
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/haproxy/files. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/haproxy/files",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_files(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/files
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/files. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/files",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_frontend_acl(
+        expression: str,
+        name: str,
+        parent_id: str | int,
+        value: str,
+        confirm: bool = False,
+        casesensitive: bool | None = None,
+        not_: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/frontend/acl
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        expression: The expression to use to determine the match for this ACL. Valid values: ['host_starts_with', 'host_ends_with', 'host_matches', 'host_regex', 'host_contains', 'path_starts_with', 'path_ends_with', 'path_matches', 'path_regex', 'path_contains', 'path_dir', 'url_parameter', 'ssl_c_verify_code', 'ssl_c_verify', 'ssl_c_ca_commonname', 'source_ip', 'backendservercount', 'traffic_is_http', 'traffic_is_ssl', 'ssl_sni_matches', 'ssl_sni_contains', 'ssl_sni_starts_with', 'ssl_sni_ends_with', 'ssl_sni_regex', 'custom']
+        name: The unique name for this frontend ACL.
+        parent_id: The ID of the parent this object is nested under.
+        value: The value which indicates a match for this ACL.
+        casesensitive: Enables or disables case-sensitive matching for this ACL.
+        not_: Enables or disables inverting the context of this ACL.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/frontend/acl. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if expression is not None:
+            body["expression"] = expression
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if value is not None:
+            body["value"] = value
+        if casesensitive is not None:
+            body["casesensitive"] = casesensitive
+        if not_ is not None:
+            body["not"] = not_
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/frontend/acl",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_frontend_acl(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        casesensitive: bool | None = None,
+        expression: str | None = None,
+        name: str | None = None,
+        not_: bool | None = None,
+        value: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/frontend/acl
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        casesensitive: Enables or disables case-sensitive matching for this ACL.
+        expression: The expression to use to determine the match for this ACL. Valid values: ['host_starts_with', 'host_ends_with', 'host_matches', 'host_regex', 'host_contains', 'path_starts_with', 'path_ends_with', 'path_matches', 'path_regex', 'path_contains', 'path_dir', 'url_parameter', 'ssl_c_verify_code', 'ssl_c_verify', 'ssl_c_ca_commonname', 'source_ip', 'backendservercount', 'traffic_is_http', 'traffic_is_ssl', 'ssl_sni_matches', 'ssl_sni_contains', 'ssl_sni_starts_with', 'ssl_sni_ends_with', 'ssl_sni_regex', 'custom']
+        name: The unique name for this frontend ACL.
+        not_: Enables or disables inverting the context of this ACL.
+        value: The value which indicates a match for this ACL.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/frontend/acl. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if casesensitive is not None:
+            body["casesensitive"] = casesensitive
+        if expression is not None:
+            body["expression"] = expression
+        if name is not None:
+            body["name"] = name
+        if not_ is not None:
+            body["not"] = not_
+        if value is not None:
+            body["value"] = value
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/frontend/acl",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_acl(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/acl
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/acl. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/acl",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_acls(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/acls
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/acls. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/acls",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_frontend_action(
+        acl: str,
+        action: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        backend: str | None = None,
+        customaction: str | None = None,
+        deny_status: str | None = None,
+        find: str | None = None,
+        fmt: str | None = None,
+        lua_function: str | None = None,
+        name: str | None = None,
+        path: str | None = None,
+        realm: str | None = None,
+        reason: str | None = None,
+        replace: str | None = None,
+        rule: str | None = None,
+        status: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/frontend/action
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        acl: The name of the frontend ACL this action is associated with. For unconditional actions, use the name of any existing ACL (the action will apply regardless). Cannot be empty.
+        action: The action to take when an ACL match is found. Valid values: ['use_backend', 'custom', 'http-request_allow', 'http-request_deny', 'http-request_tarpit', 'http-request_auth', 'http-request_redirect', 'http-request_lua', 'http-request_use-service', 'http-request_add-header', 'http-request_set-header', 'http-request_del-header', 'http-request_replace-header', 'http-request_replace-path', 'http-request_replace-value', 'http-request_set-method', 'http-request_set-path', 'http-request_set-query', 'http-request_set-uri', 'http-response_allow', 'http-response_deny', 'http-response_lua', 'http-response_add-header', 'http-response_set-header', 'http-response_del-header', 'http-response_replace-header', 'http-response_replace-value', 'http-response_set-status', 'http-after-response_add-header', 'http-after-response_set-header', 'http-after-response_del-header', 'http-after-response_replace-header', 'http-after-response_replace-value', 'http-after-response_set-status', 'tcp-request_connection_accept', 'tcp-request_connection_reject', 'tcp-request_content_accept', 'tcp-request_content_reject', 'tcp-request_content_lua', 'tcp-request_content_use-service', 'tcp-response_content_accept', 'tcp-response_content_close', 'tcp-response_content_reject', 'tcp-response_content_lua']
+        parent_id: The ID of the parent this object is nested under.
+        backend: The backend to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'use_backend'`
+        customaction: The custom action to take when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'custom'`
+        deny_status: The deny status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_deny, http-request_tarpit ]
+        find: The value to find when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-response_replace-header, http-request_replace-path, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        fmt: The fmt value to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_set-method, http-request_set-path, http-request_set-query, http-request_set-uri, http-response_add-header, http-response_set-header, http-after-response_add-header, http-after-response_set-header ]
+        lua_function: The Lua function to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_lua, http-request_use-service, http-response_lua, tcp-request_content_lua, tcp-request_content_use-service, tcp-response_content_lua ]
+        name: The name to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_del-header, http-request_replace-header, http-request_replace-value, http-response_add-header, http-response_set-header, http-response_del-header, http-response_replace-header, http-response_replace-value, http-after-response_add-header, http-after-response_set-header, http-after-response_del-header, http-after-response_replace-header, http-after-response_replace-value ]
+        path: The path to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_replace-path'`
+        realm: The authentication realm to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_auth'`
+        reason: The status reason to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        replace: The value to replace with when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-request_replace-path, http-response_replace-header, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        rule: The redirect rule to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_redirect'`
+        status: The status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/frontend/action. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if acl is not None:
+            body["acl"] = acl
+        if action is not None:
+            body["action"] = action
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if backend is not None:
+            body["backend"] = backend
+        if customaction is not None:
+            body["customaction"] = customaction
+        if deny_status is not None:
+            body["deny_status"] = deny_status
+        if find is not None:
+            body["find"] = find
+        if fmt is not None:
+            body["fmt"] = fmt
+        if lua_function is not None:
+            body["lua_function"] = lua_function
+        if name is not None:
+            body["name"] = name
+        if path is not None:
+            body["path"] = path
+        if realm is not None:
+            body["realm"] = realm
+        if reason is not None:
+            body["reason"] = reason
+        if replace is not None:
+            body["replace"] = replace
+        if rule is not None:
+            body["rule"] = rule
+        if status is not None:
+            body["status"] = status
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/frontend/action",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_frontend_action(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        acl: str | None = None,
+        action: str | None = None,
+        backend: str | None = None,
+        customaction: str | None = None,
+        deny_status: str | None = None,
+        find: str | None = None,
+        fmt: str | None = None,
+        lua_function: str | None = None,
+        name: str | None = None,
+        path: str | None = None,
+        realm: str | None = None,
+        reason: str | None = None,
+        replace: str | None = None,
+        rule: str | None = None,
+        status: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/frontend/action
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        acl: The name of the frontend ACL this action is associated with.
+        action: The action to take when an ACL match is found. Valid values: ['use_backend', 'custom', 'http-request_allow', 'http-request_deny', 'http-request_tarpit', 'http-request_auth', 'http-request_redirect', 'http-request_lua', 'http-request_use-service', 'http-request_add-header', 'http-request_set-header', 'http-request_del-header', 'http-request_replace-header', 'http-request_replace-path', 'http-request_replace-value', 'http-request_set-method', 'http-request_set-path', 'http-request_set-query', 'http-request_set-uri', 'http-response_allow', 'http-response_deny', 'http-response_lua', 'http-response_add-header', 'http-response_set-header', 'http-response_del-header', 'http-response_replace-header', 'http-response_replace-value', 'http-response_set-status', 'http-after-response_add-header', 'http-after-response_set-header', 'http-after-response_del-header', 'http-after-response_replace-header', 'http-after-response_replace-value', 'http-after-response_set-status', 'tcp-request_connection_accept', 'tcp-request_connection_reject', 'tcp-request_content_accept', 'tcp-request_content_reject', 'tcp-request_content_lua', 'tcp-request_content_use-service', 'tcp-response_content_accept', 'tcp-response_content_close', 'tcp-response_content_reject', 'tcp-response_content_lua']
+        backend: The backend to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'use_backend'`
+        customaction: The custom action to take when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'custom'`
+        deny_status: The deny status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_deny, http-request_tarpit ]
+        find: The value to find when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-response_replace-header, http-request_replace-path, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        fmt: The fmt value to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_set-method, http-request_set-path, http-request_set-query, http-request_set-uri, http-response_add-header, http-response_set-header, http-after-response_add-header, http-after-response_set-header ]
+        lua_function: The Lua function to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_lua, http-request_use-service, http-response_lua, tcp-request_content_lua, tcp-request_content_use-service, tcp-response_content_lua ]
+        name: The name to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_add-header, http-request_set-header, http-request_del-header, http-request_replace-header, http-request_replace-value, http-response_add-header, http-response_set-header, http-response_del-header, http-response_replace-header, http-response_replace-value, http-after-response_add-header, http-after-response_set-header, http-after-response_del-header, http-after-response_replace-header, http-after-response_replace-value ]
+        path: The path to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_replace-path'`
+        realm: The authentication realm to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_auth'`
+        reason: The status reason to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        replace: The value to replace with when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-request_replace-header, http-request_replace-value, http-request_replace-path, http-response_replace-header, http-response_replace-value, http-after-response_replace-header, http-after-response_replace-value ]
+        rule: The redirect rule to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be equal to `'http-request_redirect'`
+        status: The status to use when an ACL match is found.This field is only available when the following conditions are met:- `action` must be one of [ http-response_set-status, http-after-response_set-status ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/frontend/action. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if acl is not None:
+            body["acl"] = acl
+        if action is not None:
+            body["action"] = action
+        if backend is not None:
+            body["backend"] = backend
+        if customaction is not None:
+            body["customaction"] = customaction
+        if deny_status is not None:
+            body["deny_status"] = deny_status
+        if find is not None:
+            body["find"] = find
+        if fmt is not None:
+            body["fmt"] = fmt
+        if lua_function is not None:
+            body["lua_function"] = lua_function
+        if name is not None:
+            body["name"] = name
+        if path is not None:
+            body["path"] = path
+        if realm is not None:
+            body["realm"] = realm
+        if reason is not None:
+            body["reason"] = reason
+        if replace is not None:
+            body["replace"] = replace
+        if rule is not None:
+            body["rule"] = rule
+        if status is not None:
+            body["status"] = status
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/frontend/action",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_action(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/action
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/action. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/action",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_actions(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/actions
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/actions. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/actions",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_frontend_address(
+        extaddr: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        exaddr_advanced: str | None = None,
+        extaddr_custom: str | None = None,
+        extaddr_port: str | None = None,
+        extaddr_ssl: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/frontend/address
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        extaddr: The external address to use. Valid values: ['custom', 'any_ipv4', 'any_ipv6', 'localhost_ipv4', 'localhost_ipv6']
+        parent_id: The ID of the parent this object is nested under.
+        exaddr_advanced: The advanced configuration to apply to this address.
+        extaddr_custom: The custom IPv4 or IPv6 address to use as the external address.This field is only available when the following conditions are met:- `extaddr` must be equal to `'custom'`
+        extaddr_port: The port to bind to for this address. Valid options are: a TCP/UDP port number
+        extaddr_ssl: Enables or disables using SSL/TLS for this address.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/frontend/address. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if extaddr is not None:
+            body["extaddr"] = extaddr
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if exaddr_advanced is not None:
+            body["exaddr_advanced"] = exaddr_advanced
+        if extaddr_custom is not None:
+            body["extaddr_custom"] = extaddr_custom
+        if extaddr_port is not None:
+            body["extaddr_port"] = extaddr_port
+        if extaddr_ssl is not None:
+            body["extaddr_ssl"] = extaddr_ssl
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/frontend/address",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_frontend_address(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        exaddr_advanced: str | None = None,
+        extaddr: str | None = None,
+        extaddr_custom: str | None = None,
+        extaddr_port: str | None = None,
+        extaddr_ssl: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/frontend/address
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        exaddr_advanced: The advanced configuration to apply to this address.
+        extaddr: The external address to use. Valid values: ['custom', 'any_ipv4', 'any_ipv6', 'localhost_ipv4', 'localhost_ipv6']
+        extaddr_custom: The custom IPv4 or IPv6 address to use as the external address.This field is only available when the following conditions are met:- `extaddr` must be equal to `'custom'`
+        extaddr_port: The port to bind to for this address. Valid options are: a TCP/UDP port number
+        extaddr_ssl: Enables or disables using SSL/TLS for this address.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/frontend/address. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if exaddr_advanced is not None:
+            body["exaddr_advanced"] = exaddr_advanced
+        if extaddr is not None:
+            body["extaddr"] = extaddr
+        if extaddr_custom is not None:
+            body["extaddr_custom"] = extaddr_custom
+        if extaddr_port is not None:
+            body["extaddr_port"] = extaddr_port
+        if extaddr_ssl is not None:
+            body["extaddr_ssl"] = extaddr_ssl
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/frontend/address",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_address(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/address
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/address. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/address",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_addresses(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/addresses
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/addresses. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/addresses",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_frontend_certificate(
+        parent_id: str | int,
+        confirm: bool = False,
+        ssl_certificate: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/frontend/certificate
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        parent_id: The ID of the parent this object is nested under.
+        ssl_certificate: The SSL/TLS certificate refid to add to this frontend.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/frontend/certificate. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if ssl_certificate is not None:
+            body["ssl_certificate"] = ssl_certificate
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/frontend/certificate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_frontend_certificate(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        ssl_certificate: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/frontend/certificate
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        ssl_certificate: The SSL/TLS certificate refid to add to this frontend.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/frontend/certificate. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if ssl_certificate is not None:
+            body["ssl_certificate"] = ssl_certificate
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/frontend/certificate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_certificate(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/certificate
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/certificate. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/certificate",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_certificates(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/certificates
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/certificates. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/certificates",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_frontend(
+        name: str,
+        type_: str,
+        confirm: bool = False,
+        a_actionitems: list[dict[str, Any]] | None = None,
+        a_errorfiles: list[dict[str, Any]] | None = None,
+        a_extaddr: list[dict[str, Any]] | None = None,
+        advanced: str | None = None,
+        advanced_bind: str | None = None,
+        backend_serverpool: str | None = None,
+        client_timeout: int | None = 30000,
+        descr: str | None = None,
+        dontlog_normal: bool | None = None,
+        dontlognull: bool | None = None,
+        forwardfor: bool | None = None,
+        ha_acls: list[dict[str, Any]] | None = None,
+        ha_certificates: list[dict[str, Any]] | None = None,
+        httpclose: str | None = 'http-keep-alive',
+        log_detailed: bool | None = None,
+        log_separate_errors: bool | None = None,
+        max_connections: int | None = None,
+        socket_stats: bool | None = None,
+        ssloffloadcert: str | None = None,
+        status: str | None = 'active',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/frontend
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        name: The unique name for this HAProxy frontend.
+        type_: The processing type for this frontend. Valid values: ['http', 'https', 'tcp']
+        a_actionitems: The actions to take when an ACL match is found. Each object accepts: - action (string) - acl (string) - backend (string) - customaction (string) - deny_status (string) - realm (string) - rule (string) - lua_function (string) - name (string) - fmt (string) - find (string) - replace (string) ... and 3 more fields
+        a_errorfiles: The custom error files to use for this frontend. Each object accepts: - errorcode (integer) - errorfile (string)
+        a_extaddr: The external addresses assigned to this frontend. Each object accepts: - extaddr (string): valid=['custom', 'any_ipv4', 'any_ipv6', 'localhost_ipv4', 'localhost_ipv6'] - extaddr_custom (string) - extaddr_port (string) - extaddr_ssl (boolean) - exaddr_advanced (string)
+        advanced: Custom configuration to pass to this frontend.
+        advanced_bind: Custom value to pass behind each bind option.
+        backend_serverpool: The default backend to use for this frontend.
+        client_timeout: The amount of time (in milliseconds) to wait for data from the client.
+        descr: The description for this HAProxy frontend.
+        dontlog_normal: Enables or disables only logging anomalous (not normal) connection.
+        dontlognull: Enables or disables logging connections with no data transferred.
+        forwardfor: Enables or disables the HTTP X-Forwarded-For header which contains the client's IP address.This field is only available when the following conditions are met:- `type` must be equal to `'http'`
+        ha_acls: The ACLs to apply to this frontend. Each object accepts: - name (string) - expression (string) - value (string) - casesensitive (boolean) - not (boolean)
+        ha_certificates: The additional SSL/TLS certificates to use on this frontend. Each object accepts: - ssl_certificate (string)
+        httpclose: The `httpclose` option this frontend will operate. Valid values: ['http-keep-alive', 'http-tunnel', 'httpclose', 'http-server-close', 'forceclose']
+        log_detailed: Enables or disables more detailed logging.
+        log_separate_errors: Enables or disables changing the log level from info to err on potentially interesting info.
+        max_connections: The maximum number of connections allowed by this frontend.
+        socket_stats: Enables or disables collecting and providing separate statistics for each socket.
+        ssloffloadcert: The default SSL/TLS certificate refid to use for this frontend.
+        status: The activation status for this HAProxy frontend. Valid values: ['active', 'disabled']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/frontend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if type_ is not None:
+            body["type"] = type_
+        if a_actionitems is not None:
+            body["a_actionitems"] = a_actionitems
+        if a_errorfiles is not None:
+            body["a_errorfiles"] = a_errorfiles
+        if a_extaddr is not None:
+            body["a_extaddr"] = a_extaddr
+        if advanced is not None:
+            body["advanced"] = advanced
+        if advanced_bind is not None:
+            body["advanced_bind"] = advanced_bind
+        if backend_serverpool is not None:
+            body["backend_serverpool"] = backend_serverpool
+        if client_timeout is not None:
+            body["client_timeout"] = client_timeout
+        if descr is not None:
+            body["descr"] = descr
+        if dontlog_normal is not None:
+            body["dontlog_normal"] = dontlog_normal
+        if dontlognull is not None:
+            body["dontlognull"] = dontlognull
+        if forwardfor is not None:
+            body["forwardfor"] = forwardfor
+        if ha_acls is not None:
+            body["ha_acls"] = ha_acls
+        if ha_certificates is not None:
+            body["ha_certificates"] = ha_certificates
+        if httpclose is not None:
+            body["httpclose"] = httpclose
+        if log_detailed is not None:
+            body["log_detailed"] = log_detailed
+        if log_separate_errors is not None:
+            body["log_separate_errors"] = log_separate_errors
+        if max_connections is not None:
+            body["max_connections"] = max_connections
+        if socket_stats is not None:
+            body["socket_stats"] = socket_stats
+        if ssloffloadcert is not None:
+            body["ssloffloadcert"] = ssloffloadcert
+        if status is not None:
+            body["status"] = status
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/frontend",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_frontend(
+        id: str | int,
+        confirm: bool = False,
+        a_actionitems: list[dict[str, Any]] | None = None,
+        a_errorfiles: list[dict[str, Any]] | None = None,
+        a_extaddr: list[dict[str, Any]] | None = None,
+        advanced: str | None = None,
+        advanced_bind: str | None = None,
+        backend_serverpool: str | None = None,
+        client_timeout: int | None = None,
+        descr: str | None = None,
+        dontlog_normal: bool | None = None,
+        dontlognull: bool | None = None,
+        forwardfor: bool | None = None,
+        ha_acls: list[dict[str, Any]] | None = None,
+        ha_certificates: list[dict[str, Any]] | None = None,
+        httpclose: str | None = None,
+        log_detailed: bool | None = None,
+        log_separate_errors: bool | None = None,
+        max_connections: int | None = None,
+        name: str | None = None,
+        socket_stats: bool | None = None,
+        ssloffloadcert: str | None = None,
+        status: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/frontend
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        a_actionitems: The actions to take when an ACL match is found. Each object accepts: - action (string) - acl (string) - backend (string) - customaction (string) - deny_status (string) - realm (string) - rule (string) - lua_function (string) - name (string) - fmt (string) - find (string) - replace (string) ... and 3 more fields
+        a_errorfiles: The custom error files to use for this frontend. Each object accepts: - errorcode (integer) - errorfile (string)
+        a_extaddr: The external addresses assigned to this frontend. Each object accepts: - extaddr (string): valid=['custom', 'any_ipv4', 'any_ipv6', 'localhost_ipv4', 'localhost_ipv6'] - extaddr_custom (string) - extaddr_port (string) - extaddr_ssl (boolean) - exaddr_advanced (string)
+        advanced: Custom configuration to pass to this frontend.
+        advanced_bind: Custom value to pass behind each bind option.
+        backend_serverpool: The default backend to use for this frontend.
+        client_timeout: The amount of time (in milliseconds) to wait for data from the client.
+        descr: The description for this HAProxy frontend.
+        dontlog_normal: Enables or disables only logging anomalous (not normal) connection.
+        dontlognull: Enables or disables logging connections with no data transferred.
+        forwardfor: Enables or disables the HTTP X-Forwarded-For header which contains the client's IP address.This field is only available when the following conditions are met:- `type` must be equal to `'http'`
+        ha_acls: The ACLs to apply to this frontend. Each object accepts: - name (string) - expression (string) - value (string) - casesensitive (boolean) - not (boolean)
+        ha_certificates: The additional SSL/TLS certificates to use on this frontend. Each object accepts: - ssl_certificate (string)
+        httpclose: The `httpclose` option this frontend will operate. Valid values: ['http-keep-alive', 'http-tunnel', 'httpclose', 'http-server-close', 'forceclose']
+        log_detailed: Enables or disables more detailed logging.
+        log_separate_errors: Enables or disables changing the log level from info to err on potentially interesting info.
+        max_connections: The maximum number of connections allowed by this frontend.
+        name: The unique name for this HAProxy frontend.
+        socket_stats: Enables or disables collecting and providing separate statistics for each socket.
+        ssloffloadcert: The default SSL/TLS certificate refid to use for this frontend.
+        status: The activation status for this HAProxy frontend. Valid values: ['active', 'disabled']
+        type_: The processing type for this frontend. Valid values: ['http', 'https', 'tcp']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/frontend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if a_actionitems is not None:
+            body["a_actionitems"] = a_actionitems
+        if a_errorfiles is not None:
+            body["a_errorfiles"] = a_errorfiles
+        if a_extaddr is not None:
+            body["a_extaddr"] = a_extaddr
+        if advanced is not None:
+            body["advanced"] = advanced
+        if advanced_bind is not None:
+            body["advanced_bind"] = advanced_bind
+        if backend_serverpool is not None:
+            body["backend_serverpool"] = backend_serverpool
+        if client_timeout is not None:
+            body["client_timeout"] = client_timeout
+        if descr is not None:
+            body["descr"] = descr
+        if dontlog_normal is not None:
+            body["dontlog_normal"] = dontlog_normal
+        if dontlognull is not None:
+            body["dontlognull"] = dontlognull
+        if forwardfor is not None:
+            body["forwardfor"] = forwardfor
+        if ha_acls is not None:
+            body["ha_acls"] = ha_acls
+        if ha_certificates is not None:
+            body["ha_certificates"] = ha_certificates
+        if httpclose is not None:
+            body["httpclose"] = httpclose
+        if log_detailed is not None:
+            body["log_detailed"] = log_detailed
+        if log_separate_errors is not None:
+            body["log_separate_errors"] = log_separate_errors
+        if max_connections is not None:
+            body["max_connections"] = max_connections
+        if name is not None:
+            body["name"] = name
+        if socket_stats is not None:
+            body["socket_stats"] = socket_stats
+        if ssloffloadcert is not None:
+            body["ssloffloadcert"] = ssloffloadcert
+        if status is not None:
+            body["status"] = status
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/frontend",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_frontend_error_file(
+        errorcode: int,
+        errorfile: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/frontend/error_file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        errorcode: The HTTP status code that will trigger this error file to be used.
+        errorfile: The HAProxy error file object that should be used for the assigned HTTP status code.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/frontend/error_file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if errorcode is not None:
+            body["errorcode"] = errorcode
+        if errorfile is not None:
+            body["errorfile"] = errorfile
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/frontend/error_file",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_frontend_error_file(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        errorcode: int | None = None,
+        errorfile: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/frontend/error_file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        errorcode: The HTTP status code that will trigger this error file to be used.
+        errorfile: The HAProxy error file object that should be used for the assigned HTTP status code.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/frontend/error_file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if errorcode is not None:
+            body["errorcode"] = errorcode
+        if errorfile is not None:
+            body["errorfile"] = errorfile
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/frontend/error_file",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_error_file(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/error_file
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/error_file. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/error_file",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontend_error_files(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontend/error_files
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontend/error_files. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontend/error_files",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_haproxy_frontends(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/haproxy/frontends
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/haproxy/frontends. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/haproxy/frontends",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_frontends(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/frontends
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/frontends. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/frontends",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_settings_dns_resolver(
+        name: str,
+        server: str,
+        confirm: bool = False,
+        port: str | None = '53',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/settings/dns_resolver
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        name: The descriptive name for this DNS server.
+        server: The IP or hostname of the DNS server.
+        port: The port used by this DNS server. Valid options are: a TCP/UDP port number
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/settings/dns_resolver. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if server is not None:
+            body["server"] = server
+        if port is not None:
+            body["port"] = port
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/settings/dns_resolver",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_settings_dns_resolver(
+        id: str | int,
+        confirm: bool = False,
+        name: str | None = None,
+        port: str | None = None,
+        server: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/settings/dns_resolver
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        name: The descriptive name for this DNS server.
+        port: The port used by this DNS server. Valid options are: a TCP/UDP port number
+        server: The IP or hostname of the DNS server.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/settings/dns_resolver. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if name is not None:
+            body["name"] = name
+        if port is not None:
+            body["port"] = port
+        if server is not None:
+            body["server"] = server
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/settings/dns_resolver",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_settings_dns_resolver(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/settings/dns_resolver
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/settings/dns_resolver. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/settings/dns_resolver",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_settings_dns_resolvers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/settings/dns_resolvers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/settings/dns_resolvers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/settings/dns_resolvers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_haproxy_settings_email_mailer(
+        mailserver: str,
+        name: str,
+        confirm: bool = False,
+        mailserverport: str | None = '53',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/haproxy/settings/email_mailer
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        mailserver: The IP or hostname of the mail server.
+        name: The descriptive name for this mail server.
+        mailserverport: The port used by this mail server. Valid options are: a TCP/UDP port number
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/haproxy/settings/email_mailer. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if mailserver is not None:
+            body["mailserver"] = mailserver
+        if name is not None:
+            body["name"] = name
+        if mailserverport is not None:
+            body["mailserverport"] = mailserverport
+        return await _client.request(
+            "POST",
+            "/api/v2/services/haproxy/settings/email_mailer",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_settings_email_mailer(
+        id: str | int,
+        confirm: bool = False,
+        mailserver: str | None = None,
+        mailserverport: str | None = None,
+        name: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/settings/email_mailer
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        mailserver: The IP or hostname of the mail server.
+        mailserverport: The port used by this mail server. Valid options are: a TCP/UDP port number
+        name: The descriptive name for this mail server.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/settings/email_mailer. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if mailserver is not None:
+            body["mailserver"] = mailserver
+        if mailserverport is not None:
+            body["mailserverport"] = mailserverport
+        if name is not None:
+            body["name"] = name
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/settings/email_mailer",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_settings_email_mailer(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/settings/email_mailer
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/settings/email_mailer. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/settings/email_mailer",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_haproxy_settings_email_mailers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/haproxy/settings/email_mailers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/haproxy/settings/email_mailers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/haproxy/settings/email_mailers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_haproxy_settings(
+        confirm: bool = False,
+        advanced: str | None = None,
+        carpdev: str | None = None,
+        dns_resolvers: list[dict[str, Any]] | None = None,
+        email_from: str | None = None,
+        email_level: str | None = None,
+        email_mailers: list[dict[str, Any]] | None = None,
+        email_myhostname: str | None = None,
+        email_to: str | None = None,
+        enable: bool | None = None,
+        enablesync: bool | None = None,
+        hard_stop_after: str | None = None,
+        localstats_refreshtime: int | None = None,
+        localstats_sticktable_refreshtime: int | None = None,
+        localstatsport: str | None = None,
+        log_send_hostname: str | None = None,
+        logfacility: str | None = None,
+        loglevel: str | None = None,
+        maxconn: int | None = None,
+        nbthread: int | None = None,
+        remotesyslog: str | None = None,
+        resolver_holdvalid: str | None = None,
+        resolver_retries: int | None = None,
+        resolver_timeoutretry: str | None = None,
+        sslcompatibilitymode: str | None = None,
+        ssldefaultdhparam: int | None = None,
+        terminate_on_reload: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/haproxy/settings
+
+        Note: Call pfsense_services_haproxy_apply after this to apply changes.
+
+        advanced: Additional HAProxy options to include in the global settings area.
+        carpdev: The CARP interface IP to monitor. HAProxy will only run on the firewall whose interface is MASTER.
+        dns_resolvers: The DNS resolvers HAProxy will use for DNS queries. Each object accepts: - name (string) - server (string) - port (string)
+        email_from: The email address to be used as the sender of the emails.
+        email_level: The maximum log level to send emails for. Leave empty to disable sending email alerts. Valid values: ['', 'emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug']
+        email_mailers: The email servers HAProxy will use to send SMTP alerts. Each object accepts: - name (string) - mailserver (string) - mailserverport (string)
+        email_myhostname: The hostname to use as the origin of the email.
+        email_to: The email address to send emails to.
+        enable: Enables or disable HAProxy on the system.
+        enablesync: Enables or disables including HAProxy configurations in HA sync if configured.
+        hard_stop_after: The maximum time allowed to perform a clean soft-stop. This can be represented as different time values such as 30s, 15m, 3h or 1d.
+        localstats_refreshtime: The internal (in seconds) in which local stats will be refreshed.
+        localstats_sticktable_refreshtime: The internal (in seconds) in which the sticktable stats will be refreshed.
+        localstatsport: The internal port to be used for the stats tab. Set to null to disable local stats. Valid options are: a TCP/UDP port number
+        log_send_hostname: The hostname field to include in the syslog header. Leave empty to use the system hostname.
+        logfacility: The logging facility to log to. Valid values: ['kern', 'user', 'mail', 'daemon', 'auth', 'syslog', 'lpr', 'news', 'uucp', 'cron', 'auth2', 'ftp', 'ntp', 'audit', 'cron2', 'local0', 'local1', 'local2', 'local3', 'local4', 'local5', 'local6', 'local7']
+        loglevel: The log level to begin logging events. Only events of this level or higher will be logged. Valid values: ['emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug']
+        maxconn: The maximum per-process number of concurrent connections
+        nbthread: The number of threads to start per process. This setting is experimental.
+        remotesyslog: The IP address or hostname of the remote syslog server to send logs to. Use `/var/run/log` to to log to the local pfSense system log.
+        resolver_holdvalid: The interval between two successive name resolution when the last answer was valid.
+        resolver_retries: The number of queries to send to resolve a server name before giving up.
+        resolver_timeoutretry: The time between two DNS queries, when no response have been received.
+        sslcompatibilitymode: The SSL/TLS compatibility mode which determines the cipher suites and TLS versions supported. Valid values: ['auto', 'modern', 'intermediate', 'old']
+        ssldefaultdhparam: The maximum size of the Diffie-Hellman parameters used for generating the ephemeral/temporary Diffie-Hellman key in case of DHE key exchange
+        terminate_on_reload: Enables or disables an immediate stop of old process on reload. (closes existing connections)
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/haproxy/settings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_haproxy_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if advanced is not None:
+            body["advanced"] = advanced
+        if carpdev is not None:
+            body["carpdev"] = carpdev
+        if dns_resolvers is not None:
+            body["dns_resolvers"] = dns_resolvers
+        if email_from is not None:
+            body["email_from"] = email_from
+        if email_level is not None:
+            body["email_level"] = email_level
+        if email_mailers is not None:
+            body["email_mailers"] = email_mailers
+        if email_myhostname is not None:
+            body["email_myhostname"] = email_myhostname
+        if email_to is not None:
+            body["email_to"] = email_to
+        if enable is not None:
+            body["enable"] = enable
+        if enablesync is not None:
+            body["enablesync"] = enablesync
+        if hard_stop_after is not None:
+            body["hard_stop_after"] = hard_stop_after
+        if localstats_refreshtime is not None:
+            body["localstats_refreshtime"] = localstats_refreshtime
+        if localstats_sticktable_refreshtime is not None:
+            body["localstats_sticktable_refreshtime"] = localstats_sticktable_refreshtime
+        if localstatsport is not None:
+            body["localstatsport"] = localstatsport
+        if log_send_hostname is not None:
+            body["log_send_hostname"] = log_send_hostname
+        if logfacility is not None:
+            body["logfacility"] = logfacility
+        if loglevel is not None:
+            body["loglevel"] = loglevel
+        if maxconn is not None:
+            body["maxconn"] = maxconn
+        if nbthread is not None:
+            body["nbthread"] = nbthread
+        if remotesyslog is not None:
+            body["remotesyslog"] = remotesyslog
+        if resolver_holdvalid is not None:
+            body["resolver_holdvalid"] = resolver_holdvalid
+        if resolver_retries is not None:
+            body["resolver_retries"] = resolver_retries
+        if resolver_timeoutretry is not None:
+            body["resolver_timeoutretry"] = resolver_timeoutretry
+        if sslcompatibilitymode is not None:
+            body["sslcompatibilitymode"] = sslcompatibilitymode
+        if ssldefaultdhparam is not None:
+            body["ssldefaultdhparam"] = ssldefaultdhparam
+        if terminate_on_reload is not None:
+            body["terminate_on_reload"] = terminate_on_reload
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/haproxy/settings",
+            json_body=body,
+        )
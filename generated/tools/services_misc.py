@@ -0,0 +1,1011 @@
+# Auto-generated pfSense MCP tools — module: services_misc
+# 26 tools: 8 read, 18 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_misc" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_cron_job(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/cron/job
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/cron/job",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_cron_jobs(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/cron/jobs
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: command, hour, id, mday, minute, month, wday, who
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "command", "hour", "id", "mday", "minute", "month", "wday", "who",
+        })))
+    return await _list_paged(
+        "/api/v2/services/cron/jobs",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_ntp_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/ntp/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/ntp/settings",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_ntp_time_server(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/ntp/time_server
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/ntp/time_server",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_ntp_time_servers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/ntp/time_servers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, noselect, prefer, timeserver, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "timeserver", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/services/ntp/time_servers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_ssh(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/ssh
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/ssh",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_service_watchdog(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/service_watchdog
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/service_watchdog",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_service_watchdogs(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/service_watchdogs
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, enabled, id, name, notify
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "id", "name",
+        })))
+    return await _list_paged(
+        "/api/v2/services/service_watchdogs",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_cron_job(
+        command: str,
+        minute: str,
+        who: str,
+        confirm: bool = False,
+        hour: str | None = None,
+        mday: str | None = None,
+        month: str | None = None,
+        wday: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/cron/job
+
+        command: The command to run. Use full file paths for this command and include an command parameters.
+        minute: The minute(s) at which the command will be executed or a special @ event string. (0-59, ranges, divided, @ event or delay, *=all). When using a special @ event, such as @reboot, the other time fields must be empty.
+        who: The OS user to use when cron runs the command.
+        hour: The hour(s) at which the command will be executed. (0-23, ranges, or divided, *=all)This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        mday: The day(s) of the month on which the command will be executed. (1-31, ranges, or divided, *=all).This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        month: The month(s) of the year in which the command will be executed. (1-31, ranges, or divided, *=all).This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        wday: The day(s) of the week on which the command will be executed. (0-7, 7=Sun or use names, ranges, or divided, *=all).This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/cron/job. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if command is not None:
+            body["command"] = command
+        if minute is not None:
+            body["minute"] = minute
+        if who is not None:
+            body["who"] = who
+        if hour is not None:
+            body["hour"] = hour
+        if mday is not None:
+            body["mday"] = mday
+        if month is not None:
+            body["month"] = month
+        if wday is not None:
+            body["wday"] = wday
+        return await _client.request(
+            "POST",
+            "/api/v2/services/cron/job",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_cron_job(
+        id: str | int,
+        confirm: bool = False,
+        command: str | None = None,
+        hour: str | None = None,
+        mday: str | None = None,
+        minute: str | None = None,
+        month: str | None = None,
+        wday: str | None = None,
+        who: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/cron/job
+
+        id: The ID of the object or resource to interact with.
+        command: The command to run. Use full file paths for this command and include an command parameters.
+        hour: The hour(s) at which the command will be executed. (0-23, ranges, or divided, *=all)This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        mday: The day(s) of the month on which the command will be executed. (1-31, ranges, or divided, *=all).This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        minute: The minute(s) at which the command will be executed or a special @ event string. (0-59, ranges, divided, @ event or delay, *=all). When using a special @ event, such as @reboot, the other time fields must be empty.
+        month: The month(s) of the year in which the command will be executed. (1-31, ranges, or divided, *=all).This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        wday: The day(s) of the week on which the command will be executed. (0-7, 7=Sun or use names, ranges, or divided, *=all).This field is only available when the following conditions are met:- `minute` must not be one of [ @reboot, @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly, @every_minute, @every_second ]
+        who: The OS user to use when cron runs the command.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/cron/job. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if command is not None:
+            body["command"] = command
+        if hour is not None:
+            body["hour"] = hour
+        if mday is not None:
+            body["mday"] = mday
+        if minute is not None:
+            body["minute"] = minute
+        if month is not None:
+            body["month"] = month
+        if wday is not None:
+            body["wday"] = wday
+        if who is not None:
+            body["who"] = who
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/cron/job",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_cron_job(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/cron/job
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/cron/job. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/cron/job",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_cron_jobs(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/cron/jobs
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/cron/jobs. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/cron/jobs",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_cron_jobs(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/cron/jobs
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/cron/jobs. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/cron/jobs",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_ntp_settings(
+        confirm: bool = False,
+        clockstats: bool | None = None,
+        dnsresolv: str | None = None,
+        enable: bool | None = None,
+        interface: list[str] | None = None,
+        leapsec: str | None = None,
+        logpeer: bool | None = None,
+        logsys: bool | None = None,
+        loopstats: bool | None = None,
+        ntpmaxpeers: int | None = None,
+        ntpmaxpoll: str | None = None,
+        ntpminpoll: str | None = None,
+        orphan: int | None = None,
+        peerstats: bool | None = None,
+        serverauth: bool | None = None,
+        serverauthalgo: str | None = None,
+        serverauthkey: str | None = None,
+        statsgraph: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/ntp/settings
+
+        clockstats: Enable or disable logging reference clock statistics.
+        dnsresolv: The IP protocol peers are forced to use for DNS resolution. Valid values: ['auto', 'inet', 'inet6']
+        enable: Enables or disabled the NTP server.
+        interface: The interfaces the NTP server will listen on.
+        leapsec: The Leap second configuration as text.
+        logpeer: Enable or disable logging peer messages.
+        logsys: Enable or disable logging system messages.
+        loopstats: Enable or disable logging clock discipline statistics.
+        ntpmaxpeers: The maximum number of candidate peers in the NTP pool.
+        ntpmaxpoll: The maximum poll interval for NTP messages. Use empty string to assume system default, and `omit` to not set this value. This value must be greater than the `ntpminpoll`. Valid values: ['', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14', '15', '16', '17', 'omit']
+        ntpminpoll: The minimum poll interval for NTP messages. Use empty string to assume system default, and `omit` to not set this value. Valid values: ['', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14', '15', '16', '17', 'omit']
+        orphan: The orphan mode stratum to set. Orphan mode allows the system clock to be used when no other clocks are available. The number here specifies the stratum reported during orphan mode and should normally be set to a number high enough to ensure that any other servers available to clients are preferred over this server
+        peerstats: Enable or disable logging peer statistics.
+        serverauth: Enable or disable NTPv3 server authentication. (RFC 1305)
+        serverauthalgo: The digest algorithm for the server authentication key. Valid values: ['md5', 'sha1', 'sha256']
+        serverauthkey: The NTP server authentication key.This field is only available when the following conditions are met:- `serverauth` must be equal to `true`
+        statsgraph: Enable or disable RRD graphs for NTP statistics.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/ntp/settings. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if clockstats is not None:
+            body["clockstats"] = clockstats
+        if dnsresolv is not None:
+            body["dnsresolv"] = dnsresolv
+        if enable is not None:
+            body["enable"] = enable
+        if interface is not None:
+            body["interface"] = interface
+        if leapsec is not None:
+            body["leapsec"] = leapsec
+        if logpeer is not None:
+            body["logpeer"] = logpeer
+        if logsys is not None:
+            body["logsys"] = logsys
+        if loopstats is not None:
+            body["loopstats"] = loopstats
+        if ntpmaxpeers is not None:
+            body["ntpmaxpeers"] = ntpmaxpeers
+        if ntpmaxpoll is not None:
+            body["ntpmaxpoll"] = ntpmaxpoll
+        if ntpminpoll is not None:
+            body["ntpminpoll"] = ntpminpoll
+        if orphan is not None:
+            body["orphan"] = orphan
+        if peerstats is not None:
+            body["peerstats"] = peerstats
+        if serverauth is not None:
+            body["serverauth"] = serverauth
+        if serverauthalgo is not None:
+            body["serverauthalgo"] = serverauthalgo
+        if serverauthkey is not None:
+            body["serverauthkey"] = serverauthkey
+        if statsgraph is not None:
+            body["statsgraph"] = statsgraph
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/ntp/settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_ntp_time_server(
+        timeserver: str,
+        confirm: bool = False,
+        noselect: bool | None = None,
+        prefer: bool | None = None,
+        type_: str | None = 'server',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/ntp/time_server
+
+        timeserver: The IP or hostname of the remote NTP time server, pool or peer.
+        noselect: Prevent NTP from using this timeserver, but continue collecting stats.This field is only available when the following conditions are met:- `type` must not be equal to `'pool'`
+        prefer: Enable NTP favoring the use of this server more than all others.
+        type_: The type of this timeserver. Use `server` is `timeserver` is a standalone NTP server, use `pool` if `timeserver` represents an NTP pool, or `peer` if `timeserver` is an NTP peer. Note: If the `timeserver` value ends with the `pool.ntp.org` suffix, this field will be forced to use `pool`. Valid values: ['server', 'pool', 'peer']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/ntp/time_server. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if timeserver is not None:
+            body["timeserver"] = timeserver
+        if noselect is not None:
+            body["noselect"] = noselect
+        if prefer is not None:
+            body["prefer"] = prefer
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/services/ntp/time_server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_ntp_time_server(
+        id: str | int,
+        confirm: bool = False,
+        noselect: bool | None = None,
+        prefer: bool | None = None,
+        timeserver: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/ntp/time_server
+
+        id: The ID of the object or resource to interact with.
+        noselect: Prevent NTP from using this timeserver, but continue collecting stats.This field is only available when the following conditions are met:- `type` must not be equal to `'pool'`
+        prefer: Enable NTP favoring the use of this server more than all others.
+        timeserver: The IP or hostname of the remote NTP time server, pool or peer.
+        type_: The type of this timeserver. Use `server` is `timeserver` is a standalone NTP server, use `pool` if `timeserver` represents an NTP pool, or `peer` if `timeserver` is an NTP peer. Note: If the `timeserver` value ends with the `pool.ntp.org` suffix, this field will be forced to use `pool`. Valid values: ['server', 'pool', 'peer']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/ntp/time_server. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if noselect is not None:
+            body["noselect"] = noselect
+        if prefer is not None:
+            body["prefer"] = prefer
+        if timeserver is not None:
+            body["timeserver"] = timeserver
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/ntp/time_server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_ntp_time_server(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/ntp/time_server
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/ntp/time_server. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/ntp/time_server",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_ntp_time_servers(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/ntp/time_servers
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/ntp/time_servers. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/ntp/time_servers",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_ntp_time_servers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/ntp/time_servers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/ntp/time_servers. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/ntp/time_servers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_ssh(
+        confirm: bool = False,
+        enable: bool | None = None,
+        port: str | None = None,
+        sshdagentforwarding: bool | None = None,
+        sshdkeyonly: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/ssh
+
+        enable: Enable the SSH server on this system.
+        port: The TCP port the SSH server will listen on. Valid options are: a TCP/UDP port number
+        sshdagentforwarding: Enable support for ssh-agent forwarding.
+        sshdkeyonly: The SSH authentication mode to use. Use `enabled` to require public key authentication, use both to require both a public key AND a password, or use `null` to allow a password OR a public key. Valid values: ['enabled', 'both']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/ssh. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if enable is not None:
+            body["enable"] = enable
+        if port is not None:
+            body["port"] = port
+        if sshdagentforwarding is not None:
+            body["sshdagentforwarding"] = sshdagentforwarding
+        if sshdkeyonly is not None:
+            body["sshdkeyonly"] = sshdkeyonly
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/ssh",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_service_watchdog(
+        name: str,
+        confirm: bool = False,
+        notify: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/service_watchdog
+
+        name: The name of the service to be watched. Use the `name` field from pfsense_list_status_services to find valid service names (e.g. 'syslogd', 'dpinger', 'ntpd').
+        notify: Enable or disable notifications being sent when Service Watchdogs finds this service stopped.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/service_watchdog. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if notify is not None:
+            body["notify"] = notify
+        return await _client.request(
+            "POST",
+            "/api/v2/services/service_watchdog",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_service_watchdog(
+        id: str | int,
+        confirm: bool = False,
+        name: str | None = None,
+        notify: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/service_watchdog
+
+        id: The ID of the object or resource to interact with.
+        name: The name of the service to be watched. Use the `name` field from pfsense_list_status_services to find valid service names (e.g. 'syslogd', 'dpinger', 'ntpd').
+        notify: Enable or disable notifications being sent when Service Watchdogs finds this service stopped.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/service_watchdog. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if name is not None:
+            body["name"] = name
+        if notify is not None:
+            body["notify"] = notify
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/service_watchdog",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_service_watchdog(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/service_watchdog
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/service_watchdog. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/service_watchdog",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_service_watchdogs(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/service_watchdogs
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/service_watchdogs. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/service_watchdogs",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_service_watchdogs(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/service_watchdogs
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/service_watchdogs. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/service_watchdogs",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_wake_on_lan_send(
+        interface: str,
+        mac_addr: str,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/wake_on_lan/send
+
+        interface: The interface the host to be woken up is connected to.
+        mac_addr: The MAC address of the host to be awoken.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/wake_on_lan/send. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if interface is not None:
+            body["interface"] = interface
+        if mac_addr is not None:
+            body["mac_addr"] = mac_addr
+        return await _client.request(
+            "POST",
+            "/api/v2/services/wake_on_lan/send",
+            json_body=body,
+        )
@@ -0,0 +1,1516 @@
+# Auto-generated pfSense MCP tools — module: vpn_ipsec
+# 28 tools: 9 read, 19 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "vpn_ipsec" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_ipsec_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/ipsec/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_ipsec_phase1_encryption(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase1/encryption
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/ipsec/phase1/encryption",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_ipsec_phase1_encryptions(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase1/encryptions
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: dhgroup, encryption_algorithm_keylen, encryption_algorithm_name, hash_algorithm, id, parent_id, prf_algorithm
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "dhgroup", "encryption_algorithm_keylen", "encryption_algorithm_name",
+            "hash_algorithm", "id", "parent_id", "prf_algorithm",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/ipsec/phase1/encryptions",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_ipsec_phase1(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase1
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/ipsec/phase1",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_ipsec_phase1s(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase1s
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: authentication_method, caref, certref, closeaction, descr, disabled, dpd_delay, dpd_maxfail, encryption, gw_duplicates, id, ikeid, ikeport, iketype, interface, lifetime, mobike, mode, myid_data, myid_type, nat_traversal, nattport, peerid_data, peerid_type, pre_shared_key, prfselect_enable, protocol, rand_time, reauth_time, rekey_time, remote_gateway, splitconn, startaction
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "authentication_method", "caref", "certref", "closeaction", "descr",
+            "dpd_delay", "dpd_maxfail", "id", "ikeid", "ikeport", "iketype",
+            "interface", "lifetime", "mode", "myid_data", "myid_type", "nat_traversal",
+            "nattport", "peerid_data", "peerid_type", "pre_shared_key", "protocol",
+            "rand_time", "reauth_time", "rekey_time", "remote_gateway", "startaction",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/ipsec/phase1s",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_ipsec_phase2_encryption(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase2/encryption
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/ipsec/phase2/encryption",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_ipsec_phase2_encryptions(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase2/encryptions
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, keylen, name, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "keylen", "name", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/ipsec/phase2/encryptions",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_ipsec_phase2(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase2
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/ipsec/phase2",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_ipsec_phase2s(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/ipsec/phase2s
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, disabled, encryption_algorithm_option, hash_algorithm_option, id, ikeid, keepalive, lifetime, localid_address, localid_netbits, localid_type, mode, natlocalid_address, natlocalid_netbits, natlocalid_type, pfsgroup, pinghost, protocol, rand_time, rekey_time, remoteid_address, remoteid_netbits, remoteid_type, reqid, uniqid
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "ikeid", "lifetime", "localid_address", "localid_netbits",
+            "localid_type", "mode", "natlocalid_address", "natlocalid_netbits",
+            "natlocalid_type", "pfsgroup", "pinghost", "protocol", "rand_time",
+            "rekey_time", "remoteid_address", "remoteid_netbits", "remoteid_type",
+            "reqid", "uniqid",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/ipsec/phase2s",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_vpn_ipsec_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/ipsec/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/ipsec/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/ipsec/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_ipsec_phase1_encryption(
+        dhgroup: int,
+        encryption_algorithm_name: str,
+        hash_algorithm: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        encryption_algorithm_keylen: int | None = None,
+        prf_algorithm: str | None = 'sha256',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/ipsec/phase1/encryption
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        dhgroup: The Diffie-Hellman (DH) group to use for this P1 encryption item. Valid values: [1, 2, 5, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
+        encryption_algorithm_name: The name of the encryption algorithm to use for this P1 encryption item. Valid values: ['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305']
+        hash_algorithm: The hash algorithm to use for this P1 encryption item. Valid values: ['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc']
+        parent_id: The ID of the parent this object is nested under.
+        encryption_algorithm_keylen: The key length for the encryption algorithm.This field is only available when the following conditions are met:- `encryption_algorithm_name` must be one of [ aes, aes128gcm, aes192gcm, aes256gcm ]
+        prf_algorithm: The PRF algorithm to use for this P1 encryption item. This value has no affect unless the P1 entry has PRF enabled. Valid values: ['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/ipsec/phase1/encryption. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if dhgroup is not None:
+            body["dhgroup"] = dhgroup
+        if encryption_algorithm_name is not None:
+            body["encryption_algorithm_name"] = encryption_algorithm_name
+        if hash_algorithm is not None:
+            body["hash_algorithm"] = hash_algorithm
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if encryption_algorithm_keylen is not None:
+            body["encryption_algorithm_keylen"] = encryption_algorithm_keylen
+        if prf_algorithm is not None:
+            body["prf_algorithm"] = prf_algorithm
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/ipsec/phase1/encryption",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_ipsec_phase1_encryption(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        dhgroup: int | None = None,
+        encryption_algorithm_keylen: int | None = None,
+        encryption_algorithm_name: str | None = None,
+        hash_algorithm: str | None = None,
+        prf_algorithm: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/ipsec/phase1/encryption
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        dhgroup: The Diffie-Hellman (DH) group to use for this P1 encryption item. Valid values: [1, 2, 5, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
+        encryption_algorithm_keylen: The key length for the encryption algorithm.This field is only available when the following conditions are met:- `encryption_algorithm_name` must be one of [ aes, aes128gcm, aes192gcm, aes256gcm ]
+        encryption_algorithm_name: The name of the encryption algorithm to use for this P1 encryption item. Valid values: ['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305']
+        hash_algorithm: The hash algorithm to use for this P1 encryption item. Valid values: ['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc']
+        prf_algorithm: The PRF algorithm to use for this P1 encryption item. This value has no affect unless the P1 entry has PRF enabled. Valid values: ['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/ipsec/phase1/encryption. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if dhgroup is not None:
+            body["dhgroup"] = dhgroup
+        if encryption_algorithm_keylen is not None:
+            body["encryption_algorithm_keylen"] = encryption_algorithm_keylen
+        if encryption_algorithm_name is not None:
+            body["encryption_algorithm_name"] = encryption_algorithm_name
+        if hash_algorithm is not None:
+            body["hash_algorithm"] = hash_algorithm
+        if prf_algorithm is not None:
+            body["prf_algorithm"] = prf_algorithm
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/ipsec/phase1/encryption",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase1_encryption(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase1/encryption
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase1/encryption. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase1/encryption",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase1_encryptions(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase1/encryptions
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase1/encryptions. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase1/encryptions",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_ipsec_phase1(
+        authentication_method: str,
+        encryption: list[dict[str, Any]],
+        iketype: str,
+        interface: str,
+        myid_type: str,
+        peerid_type: str,
+        protocol: str,
+        remote_gateway: str,
+        confirm: bool = False,
+        caref: str | None = None,
+        certref: str | None = None,
+        closeaction: str | None = None,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        dpd_delay: int | None = 10,
+        dpd_maxfail: int | None = 5,
+        gw_duplicates: bool | None = None,
+        ikeport: str | None = '500',
+        lifetime: int | None = 28800,
+        mobike: bool | None = None,
+        mode: str | None = None,
+        myid_data: str | None = None,
+        nat_traversal: str | None = 'on',
+        nattport: str | None = '4500',
+        peerid_data: str | None = None,
+        pre_shared_key: str | None = None,
+        prfselect_enable: bool | None = None,
+        rand_time: int | None = 2880,
+        reauth_time: int | None = None,
+        rekey_time: int | None = 25920,
+        splitconn: bool | None = None,
+        startaction: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/ipsec/phase1
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        authentication_method: The IPsec authentication method this tunnel will use. Valid values: ['pre_shared_key', 'cert']
+        encryption: The encryption algorithms supported by this P1 encryption. Each object accepts: - encryption_algorithm_name (string): valid=['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305'] - encryption_algorithm_keylen (integer) - hash_algorithm (string): valid=['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc'] - dhgroup (integer) - prf_algorithm (string): valid=['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc']
+        iketype: The IKE protocol version this phase 1 entry will use. Valid values: ['ikev1', 'ikev2', 'auto']
+        interface: The interface for the local endpoint of this phase 1 entry. This should be an interface that is reachable by the remote peer.
+        myid_type: The identifier type used by the local end of the tunnel. Valid values: ['myaddress', 'address', 'fqdn', 'user_fqdn', 'asn1dn', 'keyid tag', 'dyn_dns', 'auto']
+        peerid_type: The identifier type used by the remote end of the tunnel. Valid values: ['any', 'peeraddress', 'address', 'fqdn', 'user_fqdn', 'asn1dn', 'keyid tag', 'dyn_dns', 'auto']
+        protocol: The IP version this phase 1 entry will use. Valid values: ['inet', 'inet6', 'both']
+        remote_gateway: The IP address or hostname of the remote gateway.
+        caref: The certificate authority to use when validating the peer certificate.This field is only available when the following conditions are met:- `authentication_method` must be equal to `'cert'`
+        certref: The certificate which identifies this system. The certificate must have at least one non-wildcard SAN.This field is only available when the following conditions are met:- `authentication_method` must be equal to `'cert'`
+        closeaction: The option used to control the behavior when the remote peer unexpectedly closes a child SA (P2) Valid values: ['', 'none', 'start', 'trap']
+        descr: A description for this IPsec phase 1 entry.
+        disabled: Disables this IPsec phase 1 entry.
+        dpd_delay: The delay (in seconds) between sending peer acknowledgement messages.
+        dpd_maxfail: The number of consecutive failures allowed before disconnecting.
+        gw_duplicates: Enables or disables the allowance of multiple phase 1 configurations with the same remote gateway endpoint.
+        ikeport: The UDP port for IKE on the remote gateway. Valid options are: a TCP/UDP port number
+        lifetime: The hard child SA lifetime (in seconds) after which the child SA will be expired.
+        mobike: Enables or disables the use of MOBIKE for this tunnel.
+        mode: The IKEv1 negotiation mode this phase 1 entry will use.This field is only available when the following conditions are met:- `iketype` must be one of [ ikev1, auto ] Valid values: ['main', 'aggressive']
+        myid_data: The identifier value used by the local end of the tunnel. This must be a value that corresponds with the current `myid_type` value.This field is only available when the following conditions are met:- `myid_type` must not be equal to `'myaddress'`
+        nat_traversal: The option used to enable the use of NAT-T (i.e. the encapsulation of ESP in UDP packets) if needed, which can help with clients that are behind restrictive firewalls. Valid values: ['on', 'force']
+        nattport: The UDP port for NAT-T on the remote gateway. Valid options are: a TCP/UDP port number
+        peerid_data: The identifier value used by the remote end of the tunnel. This must be a value that corresponds with the current `peerid_type` value.This field is only available when the following conditions are met:- `peerid_type` must not be one of [ any, peeraddress ]
+        pre_shared_key: The Pre-Shared Key (PSK) value. This key must match on both peers and should be long and random to protect the tunnel and its contents. A weak Pre-Shared Key can lead to a tunnel compromise.This field is only available when the following conditions are met:- `authentication_method` must be equal to `'pre_shared_key'`
+        prfselect_enable: Enables or disables manual Pseudo-Random Function (PRF) selection.
+        rand_time: A random value up to this amount will be subtracted from the `rekey_time` to avoid simultaneous renegotiation.
+        reauth_time: The amount of time (in seconds) before an child SA is torn down and recreated from scratch, including authentication.
+        rekey_time: The amount of time (in seconds) before an child SA establishes new keys.
+        splitconn: Enables or disables the use split connection entries with multiple phase 2 configurations. Required for remote endpoints that support only a single traffic selector per child SA.
+        startaction: The option used to force specific initiation/responder behavior for child SA (P2) entries. Valid values: ['', 'none', 'start', 'trap']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/ipsec/phase1. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if authentication_method is not None:
+            body["authentication_method"] = authentication_method
+        if encryption is not None:
+            body["encryption"] = encryption
+        if iketype is not None:
+            body["iketype"] = iketype
+        if interface is not None:
+            body["interface"] = interface
+        if myid_type is not None:
+            body["myid_type"] = myid_type
+        if peerid_type is not None:
+            body["peerid_type"] = peerid_type
+        if protocol is not None:
+            body["protocol"] = protocol
+        if remote_gateway is not None:
+            body["remote_gateway"] = remote_gateway
+        if caref is not None:
+            body["caref"] = caref
+        if certref is not None:
+            body["certref"] = certref
+        if closeaction is not None:
+            body["closeaction"] = closeaction
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dpd_delay is not None:
+            body["dpd_delay"] = dpd_delay
+        if dpd_maxfail is not None:
+            body["dpd_maxfail"] = dpd_maxfail
+        if gw_duplicates is not None:
+            body["gw_duplicates"] = gw_duplicates
+        if ikeport is not None:
+            body["ikeport"] = ikeport
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if mobike is not None:
+            body["mobike"] = mobike
+        if mode is not None:
+            body["mode"] = mode
+        if myid_data is not None:
+            body["myid_data"] = myid_data
+        if nat_traversal is not None:
+            body["nat_traversal"] = nat_traversal
+        if nattport is not None:
+            body["nattport"] = nattport
+        if peerid_data is not None:
+            body["peerid_data"] = peerid_data
+        if pre_shared_key is not None:
+            body["pre_shared_key"] = pre_shared_key
+        if prfselect_enable is not None:
+            body["prfselect_enable"] = prfselect_enable
+        if rand_time is not None:
+            body["rand_time"] = rand_time
+        if reauth_time is not None:
+            body["reauth_time"] = reauth_time
+        if rekey_time is not None:
+            body["rekey_time"] = rekey_time
+        if splitconn is not None:
+            body["splitconn"] = splitconn
+        if startaction is not None:
+            body["startaction"] = startaction
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/ipsec/phase1",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_ipsec_phase1(
+        id: str | int,
+        confirm: bool = False,
+        authentication_method: str | None = None,
+        caref: str | None = None,
+        certref: str | None = None,
+        closeaction: str | None = None,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        dpd_delay: int | None = None,
+        dpd_maxfail: int | None = None,
+        encryption: list[dict[str, Any]] | None = None,
+        gw_duplicates: bool | None = None,
+        ikeport: str | None = None,
+        iketype: str | None = None,
+        interface: str | None = None,
+        lifetime: int | None = None,
+        mobike: bool | None = None,
+        mode: str | None = None,
+        myid_data: str | None = None,
+        myid_type: str | None = None,
+        nat_traversal: str | None = None,
+        nattport: str | None = None,
+        peerid_data: str | None = None,
+        peerid_type: str | None = None,
+        pre_shared_key: str | None = None,
+        prfselect_enable: bool | None = None,
+        protocol: str | None = None,
+        rand_time: int | None = None,
+        reauth_time: int | None = None,
+        rekey_time: int | None = None,
+        remote_gateway: str | None = None,
+        splitconn: bool | None = None,
+        startaction: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/ipsec/phase1
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        authentication_method: The IPsec authentication method this tunnel will use. Valid values: ['pre_shared_key', 'cert']
+        caref: The certificate authority to use when validating the peer certificate.This field is only available when the following conditions are met:- `authentication_method` must be equal to `'cert'`
+        certref: The certificate which identifies this system. The certificate must have at least one non-wildcard SAN.This field is only available when the following conditions are met:- `authentication_method` must be equal to `'cert'`
+        closeaction: The option used to control the behavior when the remote peer unexpectedly closes a child SA (P2) Valid values: ['', 'none', 'start', 'trap']
+        descr: A description for this IPsec phase 1 entry.
+        disabled: Disables this IPsec phase 1 entry.
+        dpd_delay: The delay (in seconds) between sending peer acknowledgement messages.
+        dpd_maxfail: The number of consecutive failures allowed before disconnecting.
+        encryption: The encryption algorithms supported by this P1 encryption. Each object accepts: - encryption_algorithm_name (string): valid=['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305'] - encryption_algorithm_keylen (integer) - hash_algorithm (string): valid=['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc'] - dhgroup (integer) - prf_algorithm (string): valid=['sha1', 'sha256', 'sha384', 'sha512', 'aesxcbc']
+        gw_duplicates: Enables or disables the allowance of multiple phase 1 configurations with the same remote gateway endpoint.
+        ikeport: The UDP port for IKE on the remote gateway. Valid options are: a TCP/UDP port number
+        iketype: The IKE protocol version this phase 1 entry will use. Valid values: ['ikev1', 'ikev2', 'auto']
+        interface: The interface for the local endpoint of this phase 1 entry. This should be an interface that is reachable by the remote peer.
+        lifetime: The hard child SA lifetime (in seconds) after which the child SA will be expired.
+        mobike: Enables or disables the use of MOBIKE for this tunnel.
+        mode: The IKEv1 negotiation mode this phase 1 entry will use.This field is only available when the following conditions are met:- `iketype` must be one of [ ikev1, auto ] Valid values: ['main', 'aggressive']
+        myid_data: The identifier value used by the local end of the tunnel. This must be a value that corresponds with the current `myid_type` value.This field is only available when the following conditions are met:- `myid_type` must not be equal to `'myaddress'`
+        myid_type: The identifier type used by the local end of the tunnel. Valid values: ['myaddress', 'address', 'fqdn', 'user_fqdn', 'asn1dn', 'keyid tag', 'dyn_dns', 'auto']
+        nat_traversal: The option used to enable the use of NAT-T (i.e. the encapsulation of ESP in UDP packets) if needed, which can help with clients that are behind restrictive firewalls. Valid values: ['on', 'force']
+        nattport: The UDP port for NAT-T on the remote gateway. Valid options are: a TCP/UDP port number
+        peerid_data: The identifier value used by the remote end of the tunnel. This must be a value that corresponds with the current `peerid_type` value.This field is only available when the following conditions are met:- `peerid_type` must not be one of [ any, peeraddress ]
+        peerid_type: The identifier type used by the remote end of the tunnel. Valid values: ['any', 'peeraddress', 'address', 'fqdn', 'user_fqdn', 'asn1dn', 'keyid tag', 'dyn_dns', 'auto']
+        pre_shared_key: The Pre-Shared Key (PSK) value. This key must match on both peers and should be long and random to protect the tunnel and its contents. A weak Pre-Shared Key can lead to a tunnel compromise.This field is only available when the following conditions are met:- `authentication_method` must be equal to `'pre_shared_key'`
+        prfselect_enable: Enables or disables manual Pseudo-Random Function (PRF) selection.
+        protocol: The IP version this phase 1 entry will use. Valid values: ['inet', 'inet6', 'both']
+        rand_time: A random value up to this amount will be subtracted from the `rekey_time` to avoid simultaneous renegotiation.
+        reauth_time: The amount of time (in seconds) before an child SA is torn down and recreated from scratch, including authentication.
+        rekey_time: The amount of time (in seconds) before an child SA establishes new keys.
+        remote_gateway: The IP address or hostname of the remote gateway.
+        splitconn: Enables or disables the use split connection entries with multiple phase 2 configurations. Required for remote endpoints that support only a single traffic selector per child SA.
+        startaction: The option used to force specific initiation/responder behavior for child SA (P2) entries. Valid values: ['', 'none', 'start', 'trap']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/ipsec/phase1. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if authentication_method is not None:
+            body["authentication_method"] = authentication_method
+        if caref is not None:
+            body["caref"] = caref
+        if certref is not None:
+            body["certref"] = certref
+        if closeaction is not None:
+            body["closeaction"] = closeaction
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if dpd_delay is not None:
+            body["dpd_delay"] = dpd_delay
+        if dpd_maxfail is not None:
+            body["dpd_maxfail"] = dpd_maxfail
+        if encryption is not None:
+            body["encryption"] = encryption
+        if gw_duplicates is not None:
+            body["gw_duplicates"] = gw_duplicates
+        if ikeport is not None:
+            body["ikeport"] = ikeport
+        if iketype is not None:
+            body["iketype"] = iketype
+        if interface is not None:
+            body["interface"] = interface
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if mobike is not None:
+            body["mobike"] = mobike
+        if mode is not None:
+            body["mode"] = mode
+        if myid_data is not None:
+            body["myid_data"] = myid_data
+        if myid_type is not None:
+            body["myid_type"] = myid_type
+        if nat_traversal is not None:
+            body["nat_traversal"] = nat_traversal
+        if nattport is not None:
+            body["nattport"] = nattport
+        if peerid_data is not None:
+            body["peerid_data"] = peerid_data
+        if peerid_type is not None:
+            body["peerid_type"] = peerid_type
+        if pre_shared_key is not None:
+            body["pre_shared_key"] = pre_shared_key
+        if prfselect_enable is not None:
+            body["prfselect_enable"] = prfselect_enable
+        if protocol is not None:
+            body["protocol"] = protocol
+        if rand_time is not None:
+            body["rand_time"] = rand_time
+        if reauth_time is not None:
+            body["reauth_time"] = reauth_time
+        if rekey_time is not None:
+            body["rekey_time"] = rekey_time
+        if remote_gateway is not None:
+            body["remote_gateway"] = remote_gateway
+        if splitconn is not None:
+            body["splitconn"] = splitconn
+        if startaction is not None:
+            body["startaction"] = startaction
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/ipsec/phase1",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase1(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase1
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase1. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase1",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_vpn_ipsec_phase1s(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/vpn/ipsec/phase1s
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/vpn/ipsec/phase1s. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/vpn/ipsec/phase1s",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase1s(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase1s
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase1s. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase1s",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_ipsec_phase2_encryption(
+        name: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        keylen: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/ipsec/phase2/encryption
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        name: The name of the encryption algorithm to use for this P2 encryption item. Valid values: ['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305']
+        parent_id: The ID of the parent this object is nested under.
+        keylen: The key length for the encryption algorithm.This field is only available when the following conditions are met:- `name` must be one of [ aes, aes128gcm, aes192gcm, aes256gcm ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/ipsec/phase2/encryption. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if keylen is not None:
+            body["keylen"] = keylen
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/ipsec/phase2/encryption",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_ipsec_phase2_encryption(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        keylen: int | None = None,
+        name: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/ipsec/phase2/encryption
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        keylen: The key length for the encryption algorithm.This field is only available when the following conditions are met:- `name` must be one of [ aes, aes128gcm, aes192gcm, aes256gcm ]
+        name: The name of the encryption algorithm to use for this P2 encryption item. Valid values: ['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/ipsec/phase2/encryption. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if keylen is not None:
+            body["keylen"] = keylen
+        if name is not None:
+            body["name"] = name
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/ipsec/phase2/encryption",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase2_encryption(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase2/encryption
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase2/encryption. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase2/encryption",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase2_encryptions(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase2/encryptions
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase2/encryptions. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase2/encryptions",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_ipsec_phase2(
+        hash_algorithm_option: list[str],
+        ikeid: int,
+        mode: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        encryption_algorithm_option: list[dict[str, Any]] | None = None,
+        keepalive: bool | None = None,
+        lifetime: int | None = 3600,
+        localid_address: str | None = None,
+        localid_netbits: int | None = None,
+        localid_type: str | None = None,
+        natlocalid_address: str | None = None,
+        natlocalid_netbits: int | None = None,
+        natlocalid_type: str | None = None,
+        pfsgroup: int | None = 14,
+        pinghost: str | None = None,
+        protocol: str | None = 'esp',
+        rand_time: int | None = 360,
+        rekey_time: int | None = 3240,
+        remoteid_address: str | None = None,
+        remoteid_netbits: int | None = None,
+        remoteid_type: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/ipsec/phase2
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        hash_algorithm_option: The hashing algorithms used by this IPsec phase 2 entry. Note: Hash is ignored with GCM algorithms. SHA1 provides weak security and should be avoided. Valid values: ['hmac_sha1', 'hmac_sha256', 'hmac_sha384', 'hmac_sha512', 'aesxcbc']. Note: use hmac_ prefix (not plain sha256).
+        ikeid: The `ikeid` of the parent IPsec phase 1 entry this IPsec phase 2 entry belongs to.
+        mode: The IPsec phase 2 mode this entry will use. Valid values: ['tunnel', 'tunnel6', 'transport', 'vti']
+        descr: A description for this IPsec phase 2 entry.
+        disabled: Disables this IPsec phase 2 entry.
+        encryption_algorithm_option: The encryption algorithms to be used by this phase 2 entry.This field is only available when the following conditions are met:- `protocol` must be equal to `'esp'` Each object accepts: - name (string): valid=['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305'] - keylen (integer)
+        keepalive: Enables or disables checking this P2 and initiating if disconnected; does not send traffic inside the tunnel. This check ignores the P1 option 'Child SA Start Action' and works for both VTI and tunnel mode P2s. For IKEv2 without split connections, this only needs to be enabled on one P2.
+        lifetime: The hard IKE SA lifetime (in seconds) after which the IKE SA will be expired.
+        localid_address: The local network IP component of this IPsec security association.This field is only available when the following conditions are met:- `localid_type` must be one of [ address, network ]
+        localid_netbits: The subnet bits of the `localid_address` network.This field is only available when the following conditions are met:- `localid_type` must be equal to `'network'`
+        localid_type: The local ID type to use for this phase 2 entry. Valid value options are: an existing interface, `address`, `network`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `mode` must not be equal to `'transport'`
+        natlocalid_address: The NAT/BINAT local network IP component of this IPsec security association.This field is only available when the following conditions are met:- `natlocalid_type` must be one of [ address, network ]
+        natlocalid_netbits: The subnet bits of the `natlocalid_address` network.This field is only available when the following conditions are met:- `natlocalid_type` must be equal to `'network'`
+        natlocalid_type: The NAT/BINAT translation type for this IPsec phase 2 entry. Leave as `null` if NAT/BINAT is not needed. Valid value options are: an existing interface, `address`, `network`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `mode` must not be one of [ transport, vti ]
+        pfsgroup: The PFS key group this IPsec phase 2 entry should use. Note: Groups 1, 2, 5, 22, 23, and 24 provide weak security and should be avoided. Valid values: [0, 1, 2, 5, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
+        pinghost: The IP address to send an ICMP echo request to inside the tunnel. Can trigger initiation of a tunnel mode P2, but does not trigger initiation of a VTI mode P2.
+        protocol: the IPsec phase 2 proposal protocol for this entry. Encapsulating Security Payload (`esp`) performs encryption and authentication, Authentication Header (`ah`) is authentication only. Valid values: ['esp', 'ah']
+        rand_time: A random value up to this amount will be subtracted from the `rekey_time` and `reauth_time` to avoid simultaneous renegotiation.
+        rekey_time: The amount of time (in seconds) before an IKE SA establishes new keys.
+        remoteid_address: The remote network IP component of this IPsec security association.This field is only available when the following conditions are met:- `remoteid_type` must be one of [ address, network ]
+        remoteid_netbits: The subnet bits of the `remoteid_address` network.This field is only available when the following conditions are met:- `remoteid_type` must be equal to `'network'`
+        remoteid_type: The remote ID type to use for this phase 2 entry. Valid value options are: `address`, `network`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `mode` must not be equal to `'transport'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/ipsec/phase2. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if hash_algorithm_option is not None:
+            body["hash_algorithm_option"] = hash_algorithm_option
+        if ikeid is not None:
+            body["ikeid"] = ikeid
+        if mode is not None:
+            body["mode"] = mode
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if encryption_algorithm_option is not None:
+            body["encryption_algorithm_option"] = encryption_algorithm_option
+        if keepalive is not None:
+            body["keepalive"] = keepalive
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if localid_address is not None:
+            body["localid_address"] = localid_address
+        if localid_netbits is not None:
+            body["localid_netbits"] = localid_netbits
+        if localid_type is not None:
+            body["localid_type"] = localid_type
+        if natlocalid_address is not None:
+            body["natlocalid_address"] = natlocalid_address
+        if natlocalid_netbits is not None:
+            body["natlocalid_netbits"] = natlocalid_netbits
+        if natlocalid_type is not None:
+            body["natlocalid_type"] = natlocalid_type
+        if pfsgroup is not None:
+            body["pfsgroup"] = pfsgroup
+        if pinghost is not None:
+            body["pinghost"] = pinghost
+        if protocol is not None:
+            body["protocol"] = protocol
+        if rand_time is not None:
+            body["rand_time"] = rand_time
+        if rekey_time is not None:
+            body["rekey_time"] = rekey_time
+        if remoteid_address is not None:
+            body["remoteid_address"] = remoteid_address
+        if remoteid_netbits is not None:
+            body["remoteid_netbits"] = remoteid_netbits
+        if remoteid_type is not None:
+            body["remoteid_type"] = remoteid_type
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/ipsec/phase2",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_ipsec_phase2(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        encryption_algorithm_option: list[dict[str, Any]] | None = None,
+        hash_algorithm_option: list[str] | None = None,
+        ikeid: int | None = None,
+        keepalive: bool | None = None,
+        lifetime: int | None = None,
+        localid_address: str | None = None,
+        localid_netbits: int | None = None,
+        localid_type: str | None = None,
+        mode: str | None = None,
+        natlocalid_address: str | None = None,
+        natlocalid_netbits: int | None = None,
+        natlocalid_type: str | None = None,
+        pfsgroup: int | None = None,
+        pinghost: str | None = None,
+        protocol: str | None = None,
+        rand_time: int | None = None,
+        rekey_time: int | None = None,
+        remoteid_address: str | None = None,
+        remoteid_netbits: int | None = None,
+        remoteid_type: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/ipsec/phase2
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description for this IPsec phase 2 entry.
+        disabled: Disables this IPsec phase 2 entry.
+        encryption_algorithm_option: The encryption algorithms to be used by this phase 2 entry.This field is only available when the following conditions are met:- `protocol` must be equal to `'esp'` Each object accepts: - name (string): valid=['aes', 'aes128gcm', 'aes192gcm', 'aes256gcm', 'chacha20poly1305'] - keylen (integer)
+        hash_algorithm_option: The hashing algorithms used by this IPsec phase 2 entry. Note: Hash is ignored with GCM algorithms. SHA1 provides weak security and should be avoided. Valid values: ['hmac_sha1', 'hmac_sha256', 'hmac_sha384', 'hmac_sha512', 'aesxcbc']. Note: use hmac_ prefix (not plain sha256).
+        ikeid: The `ikeid` of the parent IPsec phase 1 entry this IPsec phase 2 entry belongs to.
+        keepalive: Enables or disables checking this P2 and initiating if disconnected; does not send traffic inside the tunnel. This check ignores the P1 option 'Child SA Start Action' and works for both VTI and tunnel mode P2s. For IKEv2 without split connections, this only needs to be enabled on one P2.
+        lifetime: The hard IKE SA lifetime (in seconds) after which the IKE SA will be expired.
+        localid_address: The local network IP component of this IPsec security association.This field is only available when the following conditions are met:- `localid_type` must be one of [ address, network ]
+        localid_netbits: The subnet bits of the `localid_address` network.This field is only available when the following conditions are met:- `localid_type` must be equal to `'network'`
+        localid_type: The local ID type to use for this phase 2 entry. Valid value options are: an existing interface, `address`, `network`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `mode` must not be equal to `'transport'`
+        mode: The IPsec phase 2 mode this entry will use. Valid values: ['tunnel', 'tunnel6', 'transport', 'vti']
+        natlocalid_address: The NAT/BINAT local network IP component of this IPsec security association.This field is only available when the following conditions are met:- `natlocalid_type` must be one of [ address, network ]
+        natlocalid_netbits: The subnet bits of the `natlocalid_address` network.This field is only available when the following conditions are met:- `natlocalid_type` must be equal to `'network'`
+        natlocalid_type: The NAT/BINAT translation type for this IPsec phase 2 entry. Leave as `null` if NAT/BINAT is not needed. Valid value options are: an existing interface, `address`, `network`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `mode` must not be one of [ transport, vti ]
+        pfsgroup: The PFS key group this IPsec phase 2 entry should use. Note: Groups 1, 2, 5, 22, 23, and 24 provide weak security and should be avoided. Valid values: [0, 1, 2, 5, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
+        pinghost: The IP address to send an ICMP echo request to inside the tunnel. Can trigger initiation of a tunnel mode P2, but does not trigger initiation of a VTI mode P2.
+        protocol: the IPsec phase 2 proposal protocol for this entry. Encapsulating Security Payload (`esp`) performs encryption and authentication, Authentication Header (`ah`) is authentication only. Valid values: ['esp', 'ah']
+        rand_time: A random value up to this amount will be subtracted from the `rekey_time` and `reauth_time` to avoid simultaneous renegotiation.
+        rekey_time: The amount of time (in seconds) before an IKE SA establishes new keys.
+        remoteid_address: The remote network IP component of this IPsec security association.This field is only available when the following conditions are met:- `remoteid_type` must be one of [ address, network ]
+        remoteid_netbits: The subnet bits of the `remoteid_address` network.This field is only available when the following conditions are met:- `remoteid_type` must be equal to `'network'`
+        remoteid_type: The remote ID type to use for this phase 2 entry. Valid value options are: `address`, `network`. For interface values, the `:ip` modifier can be appended to the value to use the interface's IP address instead of its entire subnet.This field is only available when the following conditions are met:- `mode` must not be equal to `'transport'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/ipsec/phase2. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if encryption_algorithm_option is not None:
+            body["encryption_algorithm_option"] = encryption_algorithm_option
+        if hash_algorithm_option is not None:
+            body["hash_algorithm_option"] = hash_algorithm_option
+        if ikeid is not None:
+            body["ikeid"] = ikeid
+        if keepalive is not None:
+            body["keepalive"] = keepalive
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if localid_address is not None:
+            body["localid_address"] = localid_address
+        if localid_netbits is not None:
+            body["localid_netbits"] = localid_netbits
+        if localid_type is not None:
+            body["localid_type"] = localid_type
+        if mode is not None:
+            body["mode"] = mode
+        if natlocalid_address is not None:
+            body["natlocalid_address"] = natlocalid_address
+        if natlocalid_netbits is not None:
+            body["natlocalid_netbits"] = natlocalid_netbits
+        if natlocalid_type is not None:
+            body["natlocalid_type"] = natlocalid_type
+        if pfsgroup is not None:
+            body["pfsgroup"] = pfsgroup
+        if pinghost is not None:
+            body["pinghost"] = pinghost
+        if protocol is not None:
+            body["protocol"] = protocol
+        if rand_time is not None:
+            body["rand_time"] = rand_time
+        if rekey_time is not None:
+            body["rekey_time"] = rekey_time
+        if remoteid_address is not None:
+            body["remoteid_address"] = remoteid_address
+        if remoteid_netbits is not None:
+            body["remoteid_netbits"] = remoteid_netbits
+        if remoteid_type is not None:
+            body["remoteid_type"] = remoteid_type
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/ipsec/phase2",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase2(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase2
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase2. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase2",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_vpn_ipsec_phase2s(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/vpn/ipsec/phase2s
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/vpn/ipsec/phase2s. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/vpn/ipsec/phase2s",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_ipsec_phase2s(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/ipsec/phase2s
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_ipsec_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/ipsec/phase2s. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_ipsec_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/ipsec/phase2s",
+            params=params,
+        )
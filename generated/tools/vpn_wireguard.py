@@ -0,0 +1,1264 @@
+# Auto-generated pfSense MCP tools — module: vpn_wireguard
+# 30 tools: 10 read, 20 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "vpn_wireguard" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_wireguard_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/wireguard/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_wireguard_peer_allowed_ip(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/peer/allowed_ip
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/wireguard/peer/allowed_ip",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_wireguard_peer_allowed_ips(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/peer/allowed_ips
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: address, descr, id, mask, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "address", "descr", "id", "mask", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/wireguard/peer/allowed_ips",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_wireguard_peer(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/peer
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/wireguard/peer",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_wireguard_peers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/peers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: allowedips, descr, enabled, endpoint, id, persistentkeepalive, port, presharedkey, publickey, tun
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "endpoint", "id", "persistentkeepalive", "port", "presharedkey",
+            "publickey", "tun",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/wireguard/peers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_wireguard_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/wireguard/settings",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_wireguard_tunnel_address(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/tunnel/address
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/wireguard/tunnel/address",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_wireguard_tunnel_addresses(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/tunnel/addresses
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: address, descr, id, mask, parent_id
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "address", "descr", "id", "mask", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/wireguard/tunnel/addresses",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_wireguard_tunnel(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/tunnel
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/wireguard/tunnel",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_wireguard_tunnels(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/wireguard/tunnels
+
+    NOTE: Tunnel addresses shown here may differ from the runtime interface addresses. The interface config (see pfsense_list_interfaces) determines the actual IP. Both configs are independent — pfSense does not enforce consistency between them.
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: addresses, descr, enabled, id, listenport, mtu, name, privatekey, publickey
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "listenport", "mtu", "name", "privatekey", "publickey",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/wireguard/tunnels",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_vpn_wireguard_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/wireguard/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/wireguard/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/wireguard/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_wireguard_peer_allowed_ip(
+        address: str,
+        mask: int,
+        parent_id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/wireguard/peer/allowed_ip
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        address: The IPv4 or IPv6 address for this peer IP.
+        mask: The subnet mask for this peer IP.
+        parent_id: The ID of the parent this object is nested under.
+        descr: A description for this allowed peer IP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/wireguard/peer/allowed_ip. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if address is not None:
+            body["address"] = address
+        if mask is not None:
+            body["mask"] = mask
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/wireguard/peer/allowed_ip",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_wireguard_peer_allowed_ip(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        address: str | None = None,
+        descr: str | None = None,
+        mask: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/wireguard/peer/allowed_ip
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        address: The IPv4 or IPv6 address for this peer IP.
+        descr: A description for this allowed peer IP.
+        mask: The subnet mask for this peer IP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/wireguard/peer/allowed_ip. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if address is not None:
+            body["address"] = address
+        if descr is not None:
+            body["descr"] = descr
+        if mask is not None:
+            body["mask"] = mask
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/wireguard/peer/allowed_ip",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_peer_allowed_ip(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/peer/allowed_ip
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/peer/allowed_ip. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/peer/allowed_ip",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_peer_allowed_ips(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/peer/allowed_ips
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/peer/allowed_ips. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/peer/allowed_ips",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_wireguard_peer(
+        publickey: str,
+        confirm: bool = False,
+        allowedips: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        enabled: bool | None = None,
+        endpoint: str | None = None,
+        persistentkeepalive: int | None = None,
+        port: str | None = None,
+        presharedkey: str | None = None,
+        tun: str | None = 'unassigned',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/wireguard/peer
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        publickey: The public key for this peer.
+        allowedips: The allowed IP/subnets for this WireGuard peer. Each object accepts: - address (string) - mask (integer) - descr (string)
+        descr: The description for this peer.
+        enabled: Enables or disables this WireGuard peer.
+        endpoint: The IP address or hostname of the remote peer. Set to `null` to make this a dynamic endpoint.
+        persistentkeepalive: The interval (in seconds) for Keep Alive packets sent to this peer. Set to `null` to disable.
+        port: The port used by the remote peer. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `endpoint` must not be equal to `NULL`
+        presharedkey: The pre-shared key for this tunnel.
+        tun: The WireGuard tunnel for this peer.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/wireguard/peer. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if publickey is not None:
+            body["publickey"] = publickey
+        if allowedips is not None:
+            body["allowedips"] = allowedips
+        if descr is not None:
+            body["descr"] = descr
+        if enabled is not None:
+            body["enabled"] = enabled
+        if endpoint is not None:
+            body["endpoint"] = endpoint
+        if persistentkeepalive is not None:
+            body["persistentkeepalive"] = persistentkeepalive
+        if port is not None:
+            body["port"] = port
+        if presharedkey is not None:
+            body["presharedkey"] = presharedkey
+        if tun is not None:
+            body["tun"] = tun
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/wireguard/peer",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_wireguard_peer(
+        id: str | int,
+        confirm: bool = False,
+        allowedips: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        enabled: bool | None = None,
+        endpoint: str | None = None,
+        persistentkeepalive: int | None = None,
+        port: str | None = None,
+        presharedkey: str | None = None,
+        publickey: str | None = None,
+        tun: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/wireguard/peer
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        allowedips: The allowed IP/subnets for this WireGuard peer. Each object accepts: - address (string) - mask (integer) - descr (string)
+        descr: The description for this peer.
+        enabled: Enables or disables this WireGuard peer.
+        endpoint: The IP address or hostname of the remote peer. Set to `null` to make this a dynamic endpoint.
+        persistentkeepalive: The interval (in seconds) for Keep Alive packets sent to this peer. Set to `null` to disable.
+        port: The port used by the remote peer. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `endpoint` must not be equal to `NULL`
+        presharedkey: The pre-shared key for this tunnel.
+        publickey: The public key for this peer.
+        tun: The WireGuard tunnel for this peer.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/wireguard/peer. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if allowedips is not None:
+            body["allowedips"] = allowedips
+        if descr is not None:
+            body["descr"] = descr
+        if enabled is not None:
+            body["enabled"] = enabled
+        if endpoint is not None:
+            body["endpoint"] = endpoint
+        if persistentkeepalive is not None:
+            body["persistentkeepalive"] = persistentkeepalive
+        if port is not None:
+            body["port"] = port
+        if presharedkey is not None:
+            body["presharedkey"] = presharedkey
+        if publickey is not None:
+            body["publickey"] = publickey
+        if tun is not None:
+            body["tun"] = tun
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/wireguard/peer",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_peer(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/peer
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/peer. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/peer",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_vpn_wireguard_peers(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/vpn/wireguard/peers
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/vpn/wireguard/peers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/vpn/wireguard/peers",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_peers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/peers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/peers. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/peers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_wireguard_settings(
+        confirm: bool = False,
+        enable: bool | None = None,
+        hide_peers: bool | None = None,
+        hide_secrets: bool | None = None,
+        interface_group: str | None = None,
+        keep_conf: bool | None = None,
+        resolve_interval: int | None = None,
+        resolve_interval_track: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/wireguard/settings
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        enable: Enables or disables WireGuard on this system. WireGuard cannot be disabled when one or more tunnels is assigned to a pfSense interface.
+        hide_peers: Enables or disables initially hiding all peers in the user interface.
+        hide_secrets: Enables or disables hiding all secrets (private and pre-shared keys) in the user interface.
+        interface_group: Configures which WireGuard tunnels are members of the WireGuard interface group. Valid values: ['all', 'unassigned', 'none']
+        keep_conf: Enables or disables keeping the WireGuard configuration when the package is uninstalled/reinstalled.
+        resolve_interval: The interval (in seconds) for re-resolving endpoint host/domain names.This field is only available when the following conditions are met:- `resolve_interval_track` must be equal to `false`
+        resolve_interval_track: Enables or disables tracking the 'Aliases Hostnames Resolve Interval' value as the `resolve_internal` value instead of specifying a value directly.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/wireguard/settings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if enable is not None:
+            body["enable"] = enable
+        if hide_peers is not None:
+            body["hide_peers"] = hide_peers
+        if hide_secrets is not None:
+            body["hide_secrets"] = hide_secrets
+        if interface_group is not None:
+            body["interface_group"] = interface_group
+        if keep_conf is not None:
+            body["keep_conf"] = keep_conf
+        if resolve_interval is not None:
+            body["resolve_interval"] = resolve_interval
+        if resolve_interval_track is not None:
+            body["resolve_interval_track"] = resolve_interval_track
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/wireguard/settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_wireguard_tunnel_address(
+        address: str,
+        mask: int,
+        parent_id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/wireguard/tunnel/address
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        address: The IPv4 or IPv6 address for this WireGuard tunnel.
+        mask: The subnet mask for this WireGuard tunnel.
+        parent_id: The ID of the parent this object is nested under.
+        descr: A description for this WireGuard tunnel address entry.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/wireguard/tunnel/address. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if address is not None:
+            body["address"] = address
+        if mask is not None:
+            body["mask"] = mask
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/wireguard/tunnel/address",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_wireguard_tunnel_address(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        address: str | None = None,
+        descr: str | None = None,
+        mask: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/wireguard/tunnel/address
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        address: The IPv4 or IPv6 address for this WireGuard tunnel.
+        descr: A description for this WireGuard tunnel address entry.
+        mask: The subnet mask for this WireGuard tunnel.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/wireguard/tunnel/address. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if address is not None:
+            body["address"] = address
+        if descr is not None:
+            body["descr"] = descr
+        if mask is not None:
+            body["mask"] = mask
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/wireguard/tunnel/address",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_tunnel_address(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/tunnel/address
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/tunnel/address. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/tunnel/address",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_tunnel_addresses(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/tunnel/addresses
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/tunnel/addresses. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/tunnel/addresses",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_wireguard_tunnel(
+        privatekey: str,
+        confirm: bool = False,
+        addresses: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        enabled: bool | None = True,
+        listenport: str | None = '51820',
+        mtu: int | None = 1420,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/wireguard/tunnel
+
+        NOTE: WireGuard tunnel addresses and interface addresses are independent configs. After creating a tunnel, assign it to an interface via the interface endpoint. The interface IP (not the tunnel address) determines the actual runtime address. Keep both in sync to avoid confusion.
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        privatekey: The private key for this tunnel. Must be a valid WireGuard Curve25519 private key (base64-encoded, 32 bytes with proper bit clamping). Generate with `wg genkey`.
+        addresses: The IPv4 or IPv6 addresses to assign this WireGuard tunnel interface. This field is ignored if this tunnel interface is assigned to an existing pfSense interface object. Each object accepts: - address (string) - mask (integer) - descr (string)
+        descr: A description for this WireGuard tunnel.
+        enabled: Enables or disables this tunnels and any associated peers.
+        listenport: The port WireGuard will listen on for this tunnel. Valid options are: a TCP/UDP port number
+        mtu: The MTU for this WireGuard tunnel interface. This value is ignored if this tunnel is assigned as a pfSense interface.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/wireguard/tunnel. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if privatekey is not None:
+            body["privatekey"] = privatekey
+        if addresses is not None:
+            body["addresses"] = addresses
+        if descr is not None:
+            body["descr"] = descr
+        if enabled is not None:
+            body["enabled"] = enabled
+        if listenport is not None:
+            body["listenport"] = listenport
+        if mtu is not None:
+            body["mtu"] = mtu
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/wireguard/tunnel",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_wireguard_tunnel(
+        id: str | int,
+        confirm: bool = False,
+        addresses: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        enabled: bool | None = None,
+        listenport: str | None = None,
+        mtu: int | None = None,
+        privatekey: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/wireguard/tunnel
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        addresses: The IPv4 or IPv6 addresses to assign this WireGuard tunnel interface. This field is ignored if this tunnel interface is assigned to an existing pfSense interface object. Each object accepts: - address (string) - mask (integer) - descr (string)
+        descr: A description for this WireGuard tunnel.
+        enabled: Enables or disables this tunnels and any associated peers.
+        listenport: The port WireGuard will listen on for this tunnel. Valid options are: a TCP/UDP port number
+        mtu: The MTU for this WireGuard tunnel interface. This value is ignored if this tunnel is assigned as a pfSense interface.
+        privatekey: The private key for this tunnel. Must be a valid WireGuard Curve25519 private key (base64-encoded, 32 bytes with proper bit clamping). Generate with `wg genkey`.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/wireguard/tunnel. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if addresses is not None:
+            body["addresses"] = addresses
+        if descr is not None:
+            body["descr"] = descr
+        if enabled is not None:
+            body["enabled"] = enabled
+        if listenport is not None:
+            body["listenport"] = listenport
+        if mtu is not None:
+            body["mtu"] = mtu
+        if privatekey is not None:
+            body["privatekey"] = privatekey
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/wireguard/tunnel",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_tunnel(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/tunnel
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/tunnel. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/tunnel",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_vpn_wireguard_tunnels(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/vpn/wireguard/tunnels
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/vpn/wireguard/tunnels. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/vpn/wireguard/tunnels",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_wireguard_tunnels(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/wireguard/tunnels
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_vpn_wireguard_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/wireguard/tunnels. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_vpn_wireguard_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/wireguard/tunnels",
+            params=params,
+        )
@@ -11,7 +11,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from .codegen import render, write_output
+from .codegen import render, render_search_index, render_tool_modules, write_output
 from .context_builder import MODULE_ORDER, build_tool_contexts
 from .loader import load_spec
 
@@ -63,17 +63,23 @@ def main() -> None:
     # --- Generate server ---
     print("Rendering server...")
     content = render(contexts)
+    tool_modules = render_tool_modules(contexts)
+    search_index = render_search_index(contexts)
 
-    print(f"Writing server to {args.output}...")
-    path = write_output(content, args.output)
+    print(f"Writing server to {args.output} (+ {len(tool_modules)} tool modules)...")
+    path = write_output(content, args.output, tool_modules, search_index)
 
     print("Verifying server syntax...")
-    try:
-        compile(content, str(path), "exec")
-        print("  Valid Python syntax")
-    except SyntaxError as e:
-        print(f"  SYNTAX ERROR: {e}", file=sys.stderr)
-        sys.exit(1)
+    sources = {str(path): content}
+    for module, source in tool_modules.items():
+        sources[str(path.parent / "tools" / f"{module}.py")] = source
+    for filename, source in sources.items():
+        try:
+            compile(source, filename, "exec")
+        except SyntaxError as e:
+            print(f"  SYNTAX ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+    print("  Valid Python syntax")
 
     print(f"\nDone! Server: {args.output} ({len(contexts)} tools)")
 
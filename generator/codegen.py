@@ -2,30 +2,43 @@
 Render the Jinja2 template and write the generated server.
 
 Uses tool contexts from context_builder and the server.py.j2 template
-to produce generated/server.py. Tool functions are generated
-programmatically for precise formatting control.
+to produce generated/server.py, plus one generated/tools/<module>.py per
+module. Tool functions are generated programmatically for precise
+formatting control.
 """
 
 from __future__ import annotations
 
+import json
 import re
+import textwrap
 from pathlib import Path
 from typing import Any
 
 import jinja2
 
-from .context_builder import MODULE_ORDER, ToolContext, build_tool_index
+from .context_builder import (
+    MODULE_ORDER,
+    SEARCH_B,
+    SEARCH_K1,
+    ToolContext,
+    build_search_index,
+    build_tool_index,
+)
 from .schema_parser import ToolParameter
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 TEMPLATE_DIR = REPO_ROOT / "templates"
 OUTPUT_FILE = REPO_ROOT / "generated" / "server.py"
+TOOLS_DIRNAME = "tools"
+SEARCH_INDEX_FILENAME = "search_index.json"
 
 
 def _gen_signature(tool: ToolContext) -> str:
     """Generate the function signature lines."""
     lines = []
     lines.append("@mcp.tool()")
+    lines.append("@_targeted")
     lines.append(f"async def {tool.tool_name}(")
 
     # Python requires: required params first, then optional (with defaults).
@@ -54,6 +67,14 @@ def _gen_signature(tool: ToolContext) -> str:
     if tool.is_list_tool:
         lines.append("    fields: str | None = None,")
         lines.append("    query: dict[str, Any] | None = None,")
+        lines.append("    compact: bool = False,")
+        lines.append("    max_tokens: int | None = None,")
+        if _is_paged(tool):
+            lines.append("    cursor: str | None = None,")
+
+    # Every tool can be pointed at any registered firewall (see `_targeted`).
+    # Named `firewall` because several request bodies already use `target`.
+    lines.append("    firewall: str | None = None,")
 
     lines.append(") -> dict[str, Any] | list[Any] | str:")
 
@@ -132,6 +153,12 @@ def _gen_docstring(tool: ToolContext) -> str:
                 else:
                     desc = f"Valid values: [{enum_str}]"
             doc_lines.append(f"    {p.name}: {desc}")
+    if not has_param_docs:
+        doc_lines.append("")
+    doc_lines.append(
+        "    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the "
+        "default one."
+    )
 
     # List tool extras: fields/query param docs and known fields
     if tool.is_list_tool:
@@ -141,13 +168,45 @@ def _gen_docstring(tool: ToolContext) -> str:
             "Reduces response size. The 'id' field is always included."
         )
         doc_lines.append(
-            "    query: Row filter dict (e.g. {'name': 'foo'}). For list tools, keys are "
-            "also forwarded as URL query params for server-side filtering when supported. "
-            "Rows are additionally filtered client-side so behavior is consistent. "
-            "Pass query as an object/dict, not a JSON-encoded string. Matching uses "
-            "exact string-coerced equality; list-valued fields must match the field's "
-            "exact value shape."
+            "    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. "
+            "A plain field key uses exact string-coerced equality (list-valued fields "
+            "must match the field's exact value shape). A 'field__op' key applies an "
+            "operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in "
+            "(list or comma-separated values), cidr (address/network inside a network, "
+            "e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field "
+            "if any element matches. Exact matches on scalar fields are also forwarded "
+            "as URL query params for server-side filtering; rows are always filtered "
+            "client-side so behavior is consistent. Pass query as an object/dict, "
+            "not a JSON-encoded string."
+        )
+        doc_lines.append(
+            "    compact: Drop empty fields (null, '', [], {}) from each row to save space."
         )
+        if _is_paged(tool):
+            doc_lines.append(
+                "    max_tokens: Approximate response size budget in tokens (default "
+                "PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't "
+                "fit, the leading rows are returned as {data, returned, omitted, "
+                "next_offset, cursor}. omitted counts the matching rows already read but "
+                "not returned; when more_available is also set, reading stopped early and "
+                "more matching rows may follow, so omitted is only a lower bound."
+            )
+            doc_lines.append(
+                "    cursor: Continue a trimmed result from where it stopped, served from "
+                "the server's buffer without re-reading earlier rows. All other arguments "
+                "except max_tokens are ignored. Cursors are single-use and short-lived; "
+                "if one expired, repeat the query with offset=next_offset."
+            )
+            doc_lines.append(
+                "    Rows are fetched in pages; limit counts matching rows and paging "
+                "stops as soon as it is reached."
+            )
+        else:
+            doc_lines.append(
+                "    max_tokens: Approximate response size budget in tokens (default "
+                "PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't "
+                "fit, the leading rows are returned as {data, returned, omitted}."
+            )
         if tool.response_fields:
             known_fields = list(tool.response_fields)
             if (
@@ -170,6 +229,12 @@ def _gen_docstring(tool: ToolContext) -> str:
     return "\n".join(doc_lines)
 
 
+def _is_paged(tool: ToolContext) -> bool:
+    """True for list tools whose endpoint accepts limit/offset paging."""
+    names = {p.api_name or p.name for p in tool.query_params}
+    return tool.is_list_tool and {"limit", "offset"} <= names
+
+
 def _gen_confirmation_gate(tool: ToolContext) -> str:
     """Generate the confirmation gate for mutations."""
     if not tool.is_mutation:
@@ -215,11 +280,21 @@ def _gen_body(tool: ToolContext) -> str:
                 lines.append(f"    if {p.name} is not None:")
                 lines.append(f'        params["{api_key}"] = {p.name}')
 
-    # For list tools, forward `query` keys as server-side URL filters.
-    # `_filter_response` still applies `query` client-side after the API call.
-    if tool.is_list_tool:
+    # For list tools, forward exact matches on scalar fields as server-side
+    # URL filters, where pfSense agrees with the client-side check. The full
+    # query is still applied client-side.
+    if tool.is_list_tool and tool.server_filter_fields:
+        names = textwrap.fill(
+            " ".join(f'"{name}",' for name in tool.server_filter_fields),
+            width=88,
+            initial_indent=" " * 12,
+            subsequent_indent=" " * 12,
+            break_on_hyphens=False,
+        )
         lines.append("    if query is not None:")
-        lines.append("        params.update(query)")
+        lines.append("        params.update(_server_query(query, frozenset({")
+        lines.append(names)
+        lines.append("        })))")
 
     # Request body
     if tool.has_request_body and tool.method != "put":
@@ -241,13 +316,28 @@ def _gen_body(tool: ToolContext) -> str:
     if tool.has_request_body:
         call_args.append("        json_body=body,")
 
-    if tool.is_list_tool:
+    enrich = tool.tool_name == "pfsense_list_firewall_rules"
+    if _is_paged(tool):
+        # Plural endpoints are read page by page (see `_list_paged` in the
+        # template) so `limit` can stop the transfer early.
+        lines.append("    return await _list_paged(")
+        lines.append(f'        "{tool.path}",')
+        lines.append("        params,")
+        lines.append("        fields,")
+        lines.append("        query,")
+        if enrich:
+            lines.append("        enrich=_enrich_firewall_rules_with_interface_descr,")
+        lines.append("        compact=compact,")
+        lines.append("        max_tokens=max_tokens,")
+        lines.append("        cursor=cursor,")
+        lines.append("    )")
+    elif tool.is_list_tool:
         lines.append("    result = await _client.request(")
         lines.extend(call_args)
         lines.append("    )")
-        if tool.tool_name == "pfsense_list_firewall_rules":
+        if enrich:
             lines.append("    result = await _enrich_firewall_rules_with_interface_descr(result)")
-        lines.append("    return _filter_response(result, fields, query)")
+        lines.append("    return _filter_response(result, fields, query, compact, max_tokens)")
     else:
         lines.append("    return await _client.request(")
         lines.extend(call_args)
@@ -279,77 +369,141 @@ def _indent(code: str, spaces: int = 4) -> str:
     )
 
 
-def _format_tool_index(index: list[dict]) -> str:
-    """Format tool index as Python literal lines for embedding in template."""
-    lines = []
-    for entry in index:
-        lines.append(f"    {repr(entry)},")
-    return "\n".join(lines)
-
-
-def render(contexts: list[ToolContext]) -> str:
-    """Render the complete server file, grouped by module."""
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(TEMPLATE_DIR)),
-        keep_trailing_newline=True,
-    )
-    template = env.get_template("server.py.j2")
+def render_search_index(contexts: list[ToolContext]) -> str:
+    """Render the tool index and its inverted index as search_index.json.
 
-    # Group contexts by module
+    Kept out of server.py because compiling a large literal dominates import
+    time whenever bytecode can't be cached (e.g. a read-only Nix store);
+    json.loads of the same data is far cheaper and only runs on first search.
+    """
+    tool_index = build_tool_index(contexts)
+    search_index = build_search_index(tool_index)
+    return json.dumps(
+        {
+            "tools": tool_index,
+            "postings": search_index["postings"],
+            "doc_len": search_index["doc_len"],
+            "avg_len": search_index["avg_len"],
+            "k1": SEARCH_K1,
+            "b": SEARCH_B,
+        },
+        separators=(",", ":"),
+    ) + "\n"
+
+
+def _group_by_module(contexts: list[ToolContext]) -> dict[str, list[ToolContext]]:
+    """Group tool contexts by module, in canonical module order."""
     by_module: dict[str, list[ToolContext]] = {m: [] for m in MODULE_ORDER}
     for ctx in contexts:
         by_module[ctx.module].append(ctx)
+    return by_module
+
+
+def render_tool_modules(contexts: list[ToolContext]) -> dict[str, str]:
+    """Render one tools/<module>.py source file per module.
 
-    # Build module-grouped code
-    sections: list[str] = []
-    for module in MODULE_ORDER:
-        tools = by_module[module]
+    The server executes an enabled module's file inside its own namespace,
+    so the tool functions see mcp, _client and the helpers as globals.
+    A comment header is used instead of a docstring so executing the file
+    does not overwrite the server's __doc__.
+    """
+    files: dict[str, str] = {}
+    for module, tools in _group_by_module(contexts).items():
         if not tools:
             continue
 
         reads = [t for t in tools if not t.is_mutation]
         writes = [t for t in tools if t.is_mutation]
 
-        section_comment = (
-            f"# === Module: {module} "
-            f"({len(tools)} tools: {len(reads)} read, {len(writes)} write) ==="
-        )
-        sections.append(section_comment)
-
-        # Read-only tools: gated on module membership only
+        sections: list[str] = [
+            f"# Auto-generated pfSense MCP tools — module: {module}\n"
+            f"# {len(tools)} tools: {len(reads)} read, {len(writes)} write\n"
+            "#\n"
+            "# Generated by: python -m generator\n"
+            "# DO NOT EDIT THIS FILE DIRECTLY.\n"
+            "#\n"
+            f'# Loaded by server.py only when "{module}" is in PFSENSE_MODULES and\n'
+            "# executed in the server's namespace (mcp, _client, helpers are globals).\n"
+            "\n"
+            "from __future__ import annotations"
+        ]
+
+        # Read-only tools: gated on module membership only (by the loader)
         if reads:
-            read_code = "\n\n\n".join(_gen_tool_function(t) for t in reads)
-            sections.append(f'if "{module}" in _PFSENSE_MODULES:')
-            sections.append(_indent(read_code))
+            sections.append("\n\n".join(_gen_tool_function(t) for t in reads))
 
-        # Mutation tools: gated on module membership AND not read-only
+        # Mutation tools: also gated on read-only mode
         if writes:
             write_code = "\n\n\n".join(_gen_tool_function(t) for t in writes)
-            sections.append(f'if "{module}" in _PFSENSE_MODULES and not _PFSENSE_READ_ONLY:')
-            sections.append(_indent(write_code))
+            sections.append("if not _PFSENSE_READ_ONLY:\n" + _indent(write_code))
+
+        files[module] = "\n\n\n".join(sections) + "\n"
+    return files
+
+
+def render(contexts: list[ToolContext]) -> str:
+    """Render the server core: client, helpers, always-on tools and module loader."""
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(TEMPLATE_DIR)),
+        keep_trailing_newline=True,
+    )
+    template = env.get_template("server.py.j2")
 
-    module_code = "\n\n\n".join(sections)
+    module_summary = []
+    for module, tools in _group_by_module(contexts).items():
+        if tools:
+            module_summary.append(f"#   {module}: {len(tools)} tools")
 
     # Generate the _ALL_MODULES set literal for the template
     from .context_builder import _ALL_MODULES
     all_modules_repr = "{" + ", ".join(repr(m) for m in sorted(_ALL_MODULES)) + "}"
 
-    # Build tool index for pfsense_search_tools
-    tool_index = build_tool_index(contexts)
-    tool_index_code = _format_tool_index(tool_index)
+    # Cache invalidation scopes: module prefixes plus apply subsystems,
+    # longest first so the most specific scope wins.
+    from .context_builder import _APPLY_SUBSYSTEMS, _PATH_TO_MODULE
+    scopes = {prefix for prefix, _ in _PATH_TO_MODULE} | set(_APPLY_SUBSYSTEMS)
+    cache_scopes_repr = "[\n" + "".join(
+        f"    {s!r},\n" for s in sorted(scopes, key=lambda s: (-len(s), s))
+    ) + "]"
+    apply_subsystems_repr = "[\n" + "".join(
+        f"    {s!r},\n" for s in sorted(_APPLY_SUBSYSTEMS, key=lambda s: (-len(s), s))
+    ) + "]"
 
     return template.render(
         tool_count=len(contexts),
-        module_code="\n\n\n" + module_code + "\n",
+        module_summary="\n".join(module_summary),
+        module_order=repr(MODULE_ORDER),
         all_modules=all_modules_repr,
-        tool_index_code=tool_index_code,
-        tool_index_count=len(tool_index),
+        cache_scopes=cache_scopes_repr,
+        apply_subsystems=apply_subsystems_repr,
+        search_index_file=SEARCH_INDEX_FILENAME,
     )
 
 
-def write_output(content: str, output_path: Path | None = None) -> Path:
-    """Write the rendered content to the output file."""
+def write_output(
+    content: str,
+    output_path: Path | None = None,
+    tool_modules: dict[str, str] | None = None,
+    search_index: str | None = None,
+) -> Path:
+    """Write the rendered server, plus tools/ and search_index.json beside it."""
     path = output_path or OUTPUT_FILE
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content)
+
+    if tool_modules is not None:
+        tools_dir = path.parent / TOOLS_DIRNAME
+        tools_dir.mkdir(exist_ok=True)
+        # Drop files for modules that no longer exist in the spec.
+        for stale in tools_dir.glob("*.py"):
+            if stale.stem != "__init__" and stale.stem not in tool_modules:
+                stale.unlink()
+        (tools_dir / "__init__.py").write_text(
+            '"""Auto-generated per-module pfSense MCP tools (loaded by server.py)."""\n'
+        )
+        for module, source in tool_modules.items():
+            (tools_dir / f"{module}.py").write_text(source)
+
+    if search_index is not None:
+        (path.parent / SEARCH_INDEX_FILENAME).write_text(search_index)
     return path
@@ -7,12 +7,19 @@ complete data structure needed by the Jinja2 template.
 
 from __future__ import annotations
 
+import math
+import re
 from dataclasses import dataclass, field
 from typing import Any
 
 from .loader import Operation, load_spec, parse_operations
 from .naming import operation_id_to_tool_name
-from .schema_parser import ToolParameter, extract_tool_parameters, extract_response_fields
+from .schema_parser import (
+    ToolParameter,
+    extract_response_fields,
+    extract_server_filter_fields,
+    extract_tool_parameters,
+)
 
 # Canonical module ordering — used for code generation and env var docs.
 MODULE_ORDER = [
@@ -196,6 +203,7 @@ class ToolContext:
     docstring_note: str | None = None  # Extra note appended to docstring
     is_list_tool: bool = False  # True for pfsense_list_* tools
     response_fields: list[str] | None = None  # Known response fields for list tools
+    server_filter_fields: list[str] = field(default_factory=list)  # Exact-filterable by pfSense
 
 
 def _path_to_module(path: str) -> str:
@@ -251,8 +259,6 @@ def _build_docstring(
     # Summary line
     summary = op.summary or op.description or f"{op.method.upper()} {op.path}"
     # Clean HTML
-    import re
-
     summary = re.sub(r"<[^>]+>", "", summary).strip()
     if summary:
         parts.append(summary)
@@ -345,8 +351,10 @@ def build_tool_contexts(spec: dict[str, Any]) -> list[ToolContext]:
         # List tool detection and response field extraction
         is_list_tool = tool_name.startswith("pfsense_list_")
         response_fields = None
+        server_filter_fields: list[str] = []
         if is_list_tool:
             response_fields = extract_response_fields(spec, op)
+            server_filter_fields = extract_server_filter_fields(spec, op)
 
         contexts.append(
             ToolContext(
@@ -371,6 +379,7 @@ def build_tool_contexts(spec: dict[str, Any]) -> list[ToolContext]:
                 query_params=query_params,
                 is_list_tool=is_list_tool,
                 response_fields=response_fields,
+                server_filter_fields=server_filter_fields,
             )
         )
 
@@ -386,17 +395,227 @@ _GENERIC_PARAMS = frozenset({
     "confirm", "parent_id", "items",
 })
 
+_ASSOCIATED_MODEL = re.compile(r"\*\*Associated model\*\*:\s*(\w+)")
+
+_NETWORK_INTERFACES = "pfsense_list_network_interfaces"
+_ROUTING_GATEWAYS = "pfsense_list_routing_gateways"
+_HAPROXY_BACKENDS = "pfsense_list_services_haproxy_backends"
+
+# Fields that name another collection's object, for ordering
+# pfsense_reconcile. Most references are only spelled out in prose, so
+# descriptions are matched first and the remaining field names are listed.
+_REFERENCE_PHRASES = (
+    ("existing alias", "pfsense_list_firewall_aliases"),
+    ("firewall alias", "pfsense_list_firewall_aliases"),
+    ("existing firewall schedule", "pfsense_list_firewall_schedules"),
+    ("existing interface", _NETWORK_INTERFACES),
+    ("existing certificate", "pfsense_list_system_certificates"),
+)
+_REFERENCE_FIELDS: dict[str, tuple[str, ...]] = {
+    "interface": (_NETWORK_INTERFACES,),
+    "if": (
+        "pfsense_list_interface_vlans",
+        "pfsense_list_interface_laggs",
+        "pfsense_list_interface_gres",
+        "pfsense_list_interface_bridges",
+    ),
+    "gateway": (_ROUTING_GATEWAYS,),
+    "sched": ("pfsense_list_firewall_schedules",),
+    "backend": (_HAPROXY_BACKENDS,),
+    "backend_serverpool": (_HAPROXY_BACKENDS,),
+    "ikeid": ("pfsense_list_vpn_ipsec_phase1s",),
+    "tun": ("pfsense_list_vpn_wireguard_tunnels",),
+    "caref": ("pfsense_list_system_certificate_authorities",),
+    "ldap_caref": ("pfsense_list_system_certificate_authorities",),
+    "certref": ("pfsense_list_system_certificates",),
+    "authmode": ("pfsense_list_user_auth_servers",),
+    "member": ("pfsense_list_users",),
+    "virtual_ip": ("pfsense_list_firewall_virtual_ips",),
+}
+# Per-collection exceptions, by (list tool, field). An empty tuple means the
+# field holds a value, not a reference (DHCP gateways are IP addresses,
+# limiter `sched` is a queueing discipline), or is a back-reference that
+# would close a cycle: a gateway sits on an interface, so a WAN's upstream
+# gateway can only be set on an existing interface.
+_REFERENCE_OVERRIDES: dict[tuple[str, str], tuple[str, ...]] = {
+    ("pfsense_list_network_interfaces", "gateway"): (),
+    ("pfsense_list_routing_gateways", "gateway"): (),
+    ("pfsense_list_services_dhcp_servers", "gateway"): (),
+    ("pfsense_list_services_dhcp_server_address_pools", "gateway"): (),
+    ("pfsense_list_services_dhcp_server_static_mappings", "gateway"): (),
+    ("pfsense_list_firewall_traffic_shaper_limiters", "sched"): (),
+    ("pfsense_list_interface_gres", "if"): (),
+    ("pfsense_list_interface_vlans", "if"): ("pfsense_list_interface_laggs",),
+    ("pfsense_list_interface_groups", "members"): (_NETWORK_INTERFACES,),
+    ("pfsense_list_services_haproxy_backend_actions", "acl"): (
+        "pfsense_list_services_haproxy_backend_acls",
+    ),
+    ("pfsense_list_services_haproxy_backend_actions", "server"): (
+        "pfsense_list_services_haproxy_backend_servers",
+    ),
+    ("pfsense_list_services_haproxy_frontend_actions", "acl"): (
+        "pfsense_list_services_haproxy_frontend_acls",
+    ),
+    ("pfsense_list_services_haproxy_backend_error_files", "errorfile"): (
+        "pfsense_list_services_haproxy_files",
+    ),
+    ("pfsense_list_services_haproxy_frontend_error_files", "errorfile"): (
+        "pfsense_list_services_haproxy_files",
+    ),
+    ("pfsense_list_services_haproxy_frontend_certificates", "ssl_certificate"): (
+        "pfsense_list_system_certificates",
+    ),
+    ("pfsense_list_vpn_openvpn_servers", "interface"): (
+        _NETWORK_INTERFACES,
+        "pfsense_list_firewall_virtual_ips",
+    ),
+    ("pfsense_list_vpn_openvpn_client_export_configs", "server"): (
+        "pfsense_list_vpn_openvpn_servers",
+    ),
+}
+
+# Fields the pfSense REST API treats as sensitive: omitted from responses
+# unless expose_sensitive_fields is on. The spec does not mark them, so they
+# are listed here; writeOnly fields are detected from the schema.
+_SENSITIVE_FIELDS = frozenset({
+    "accountkey", "auth_pass", "haproxy_cookie_dynamic_cookie_key", "ipsecpsk",
+    "keypaste", "ldap_bindpw", "motp_secret", "naspassword", "password",
+    "pre_shared_key", "presharedkey", "privatekey", "proxy_passwd", "proxypass",
+    "prv", "radius_secret", "secret", "stats_password", "tls",
+})
+
+
+def _collection_sync_tools(contexts: list[ToolContext]) -> dict[str, dict[str, Any]]:
+    """Map each list tool to the tools pfsense_sync_collection writes it with.
+
+    The singular create/update/delete endpoints are matched to the plural
+    collection by the model both operate on ("Associated model" in the spec).
+    replace is the plural bulk PUT, where one exists. Child collections
+    (create takes parent_id) name their parent collection's list tool.
+    sensitive lists the fields a read does not return (secrets and writeOnly
+    fields), which a bulk PUT of read-back objects would lose. rank orders
+    collections for pfsense_reconcile (see `_reconcile_ranks`).
+    """
+    models: dict[str, str] = {}
+    for ctx in contexts:
+        match = _ASSOCIATED_MODEL.search(ctx.description)
+        if match:
+            models[ctx.tool_name] = match.group(1)
+
+    sync: dict[str, dict[str, Any]] = {}
+    creates: dict[str, ToolContext] = {}
+    create_paths: dict[str, str] = {}
+    for lst in contexts:
+        model = models.get(lst.tool_name)
+        if not lst.is_list_tool or model is None:
+            continue
+        tools: dict[str, Any] = {"path": lst.path}
+        create = None
+        for ctx in contexts:
+            if models.get(ctx.tool_name) != model:
+                continue
+            if ctx.path == lst.path:
+                if ctx.method == "put" and any(p.name == "items" for p in ctx.body_params):
+                    tools["replace"] = ctx.tool_name
+                continue
+            action = {"post": "create", "patch": "update", "delete": "delete"}.get(ctx.method)
+            if action:
+                tools[action] = ctx.tool_name
+                if action == "create":
+                    create = ctx
+        if create is None or not {"update", "delete"} <= set(tools):
+            continue
+        if any(p.name == "parent_id" for p in create.parameters):
+            tools["parent"] = create.path.rsplit("/", 1)[0]
+        sensitive = sorted(
+            p.api_name for p in create.body_params
+            if p.write_only or p.api_name in _SENSITIVE_FIELDS
+        )
+        if sensitive:
+            tools["sensitive"] = sensitive
+        sync[lst.tool_name] = tools
+        creates[lst.tool_name] = create
+        create_paths[create.path] = lst.tool_name
+
+    # Resolve parent paths (e.g. /api/v2/services/dhcp_server) to list tools.
+    for tools in sync.values():
+        if "parent" in tools:
+            parent = create_paths.get(tools["parent"])
+            if parent:
+                tools["parent"] = parent
+            else:
+                del tools["parent"]
+
+    for name, rank in _reconcile_ranks(sync, creates).items():
+        sync[name]["rank"] = rank
+    return sync
+
+
+def _collection_references(collection: str, create: ToolContext) -> set[str]:
+    """List tools of the collections whose objects `create`'s fields refer to."""
+    refs: set[str] = set()
+    for p in create.body_params:
+        override = _REFERENCE_OVERRIDES.get((collection, p.api_name))
+        if override is not None:
+            refs.update(override)
+            continue
+        refs.update(_REFERENCE_FIELDS.get(p.api_name, ()))
+        desc = p.description.lower()
+        refs.update(target for phrase, target in _REFERENCE_PHRASES if phrase in desc)
+    refs.discard(collection)
+    return refs
+
+
+def _reconcile_ranks(
+    sync: dict[str, dict[str, Any]], creates: dict[str, ToolContext]
+) -> dict[str, int]:
+    """Rank each collection one above everything it depends on.
+
+    A collection depends on its parent (parent_id) and on the collections its
+    fields refer to. pfsense_reconcile writes in ascending rank and deletes in
+    descending rank, so referenced objects exist before, and outlive, the
+    objects that use them.
+    """
+    deps = {
+        name: {
+            ref for ref in _collection_references(name, creates[name]) if ref in sync
+        } | ({tools["parent"]} if "parent" in tools else set())
+        for name, tools in sync.items()
+    }
+    ranks: dict[str, int] = {}
+    visiting: list[str] = []
+
+    def rank(name: str) -> int:
+        if name in ranks:
+            return ranks[name]
+        if name in visiting:
+            cycle = visiting[visiting.index(name):] + [name]
+            raise ValueError(f"Reference cycle between collections: {' -> '.join(cycle)}")
+        visiting.append(name)
+        ranks[name] = max((rank(dep) + 1 for dep in deps[name]), default=0)
+        visiting.pop()
+        return ranks[name]
+
+    for name in sorted(sync):
+        rank(name)
+    return ranks
+
 
 def build_tool_index(
     contexts: list[ToolContext],
-) -> list[dict[str, str | list[str]]]:
+) -> list[dict[str, Any]]:
     """Build a searchable tool index for the pfsense_search_tools discovery tool.
 
-    Each entry: name, module, method, desc (one-line summary), kw (keywords).
+    Each entry: name, module, method, desc (one-line summary), kw (keywords),
+    plus apply (the subsystem's apply tool) for mutations that need one,
+    dangerous for endpoints in _DANGEROUS_ENDPOINTS (both used by
+    pfsense_run_batch) and sync on list tools pfsense_sync_collection and
+    pfsense_reconcile can write.
     Keywords derived from tool name, module, path segments, and field names.
     Rebuilds automatically when the generator runs — zero manual maintenance.
     """
-    index: list[dict[str, str | list[str]]] = []
+    index: list[dict[str, Any]] = []
+    sync = _collection_sync_tools(contexts)
     for ctx in contexts:
         kw: set[str] = set()
 
@@ -418,13 +637,20 @@ def build_tool_index(
         # One-line summary
         desc = ctx.description.split("\n")[0].strip()
 
-        index.append({
+        entry: dict[str, Any] = {
             "name": ctx.tool_name,
             "module": ctx.module,
             "method": ctx.method,
             "desc": desc,
             "kw": sorted(kw),
-        })
+        }
+        if ctx.needs_apply and ctx.apply_tool_name:
+            entry["apply"] = ctx.apply_tool_name
+        if ctx.is_dangerous:
+            entry["dangerous"] = True
+        if ctx.tool_name in sync:
+            entry["sync"] = sync[ctx.tool_name]
+        index.append(entry)
 
     # Always-on tools (not in the spec, hand-maintained)
     index.append({
@@ -441,6 +667,69 @@ def build_tool_index(
         "desc": "Get a concise pfSense system overview: version, interfaces, gateways, and services",
         "kw": ["gateways", "interfaces", "overview", "services", "status", "summary", "version"],
     })
+    index.append({
+        "name": "pfsense_get_server_stats",
+        "module": "_always_on",
+        "method": "none",
+        "desc": "Get MCP server runtime metrics: response cache, request queue and connection pool",
+        "kw": ["cache", "concurrency", "connection", "latency", "metrics", "pool", "queue", "server", "stats"],
+    })
+    index.append({
+        "name": "pfsense_get_managed_firewalls",
+        "module": "_always_on",
+        "method": "none",
+        "desc": "List the pfSense firewalls this server manages, for the firewall argument",
+        "kw": ["fleet", "firewalls", "hosts", "multi", "target", "targets"],
+    })
+    index.append({
+        "name": "pfsense_query_fleet",
+        "module": "_always_on",
+        "method": "get",
+        "desc": "Run one read tool on many firewalls concurrently and merge the rows",
+        "kw": ["aggregate", "all", "fan", "fleet", "firewalls", "hosts", "multi", "query", "sites"],
+    })
+    index.append({
+        "name": "pfsense_run_batch",
+        "module": "_always_on",
+        "method": "post",
+        "desc": "Run many create/update/delete calls as one batch with a single apply per subsystem",
+        "kw": ["batch", "bulk", "create", "delete", "many", "mass", "multiple", "update"],
+    })
+    index.append({
+        "name": "pfsense_sync_collection",
+        "module": "_always_on",
+        "method": "put",
+        "desc": "Make a whole collection match a desired list, writing only the difference",
+        "kw": ["bulk", "converge", "declarative", "desired", "diff", "replace", "sync"],
+    })
+    index.append({
+        "name": "pfsense_reconcile",
+        "module": "_always_on",
+        "method": "put",
+        "desc": "Converge several collections to a declared state in dependency order with one apply each",
+        "kw": ["converge", "declarative", "dependency", "desired", "plan", "reconcile", "state"],
+    })
+    index.append({
+        "name": "pfsense_create_with_children",
+        "module": "_always_on",
+        "method": "post",
+        "desc": "Create a parent object and its nested parent_id children concurrently, rolling back on failure",
+        "kw": ["children", "composite", "create", "nested", "parent", "parent_id", "rollback"],
+    })
+    index.append({
+        "name": "pfsense_get_pending_changes",
+        "module": "_always_on",
+        "method": "none",
+        "desc": "List subsystems with changes that still need an apply (dirty subsystems)",
+        "kw": ["apply", "changes", "deferred", "dirty", "pending", "reload", "unapplied"],
+    })
+    index.append({
+        "name": "pfsense_apply_pending_changes",
+        "module": "_always_on",
+        "method": "post",
+        "desc": "Apply every subsystem with pending or deferred changes now, once each",
+        "kw": ["apply", "changes", "deferred", "dirty", "flush", "pending", "reload"],
+    })
     index.append({
         "name": "pfsense_search_tools",
         "module": "_always_on",
@@ -450,3 +739,87 @@ def build_tool_index(
     })
 
     return index
+
+
+# ---------------------------------------------------------------------------
+# Inverted search index (BM25F) for pfsense_search_tools
+# ---------------------------------------------------------------------------
+
+# Per-field term-frequency weights. Tool names and curated keywords say far
+# more about what a tool does than the long HTML-derived description.
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "kw": 2.0, "module": 1.5, "desc": 1.0}
+
+# BM25 saturation and length-normalization constants.
+SEARCH_K1 = 1.2
+SEARCH_B = 0.75
+
+# Terms dropped from both the index and queries. Every tool name starts with
+# "pfsense", so it carries no signal; a query that kept it would match nothing.
+SEARCH_STOP_TERMS = frozenset({"pfsense"})
+
+
+def search_terms(text: str) -> list[str]:
+    """Tokenize text for the search index.
+
+    Lowercases, splits on anything non-alphanumeric (so snake_case names
+    split into words), and folds common plurals ("rules" → "rule",
+    "aliases" → "alias", "entries" → "entry"). Stop terms are dropped.
+    Must stay in sync with `_search_terms` in templates/server.py.j2.
+    """
+    terms = []
+    for token in re.findall(r"[a-z0-9]+", text.lower()):
+        if len(token) > 3:
+            if token.endswith("ies"):
+                token = token[:-3] + "y"
+            elif token.endswith(("ses", "xes")):
+                token = token[:-2]
+            elif token.endswith("s") and not token.endswith(("ss", "us", "is", "as")):
+                token = token[:-1]
+        if token not in SEARCH_STOP_TERMS:
+            terms.append(token)
+    return terms
+
+
+def build_search_index(
+    index: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Build an inverted index over a tool index for BM25 ranking.
+
+    Returns:
+        postings: term → (idf, ((doc, weighted_tf), ...)); doc is the
+            position of the entry in `index`.
+        doc_len: weighted length of each document.
+        avg_len: mean of doc_len.
+    """
+    doc_tfs: list[dict[str, float]] = []
+    for entry in index:
+        tf: dict[str, float] = {}
+        fields = {
+            "name": entry["name"],
+            "kw": " ".join(entry["kw"]),
+            "module": entry["module"],
+            "desc": entry["desc"],
+        }
+        for field_name, text in fields.items():
+            weight = SEARCH_FIELD_WEIGHTS[field_name]
+            for term in search_terms(str(text)):
+                tf[term] = tf.get(term, 0.0) + weight
+        doc_tfs.append(tf)
+
+    doc_len = [round(sum(tf.values()), 2) for tf in doc_tfs]
+    avg_len = round(sum(doc_len) / len(doc_len), 4) if doc_len else 0.0
+
+    n_docs = len(doc_tfs)
+    by_term: dict[str, list[tuple[int, float]]] = {}
+    for doc, tf in enumerate(doc_tfs):
+        for term, freq in tf.items():
+            by_term.setdefault(term, []).append((doc, freq))
+
+    postings: dict[str, tuple[float, tuple[tuple[int, float], ...]]] = {}
+    for term in sorted(by_term):
+        docs = by_term[term]
+        df = len(docs)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        postings[term] = (round(idf, 4), tuple(docs))
+
+    return {"postings": postings, "doc_len": doc_len, "avg_len": avg_len}
@@ -37,6 +37,7 @@ class ToolParameter:
     enum: list[str] | None = None
     source: str = "query"  # "query", "body", "path"
     api_name: str = ""  # Original API name (for body/query keys)
+    write_only: bool = False  # Accepted on write, never returned on read
 
 
 def _openapi_type_to_python(schema: dict[str, Any]) -> str:
@@ -216,6 +217,7 @@ def extract_tool_parameters(
                         enum=resolved_prop.get("enum"),
                         source="body",
                         api_name=prop_name,
+                        write_only=resolved_prop.get("writeOnly", False),
                     )
                 )
                 seen_names.add(prop_name)
@@ -234,22 +236,46 @@ def extract_response_fields(
     Returns the property names if the response data is an array of objects,
     otherwise returns None.
     """
-    if operation.response_schema is None:
-        return None
-
-    schema = operation.response_schema
-    if schema.get("type") != "array":
-        return None
-
-    items = schema.get("items", {})
-    resolved_items = resolve_schema(spec, items)
-    properties = resolved_items.get("properties", {})
+    properties = _response_item_properties(spec, operation)
     if not properties:
         return None
 
     return sorted(properties.keys())
 
 
+# Field types whose pfSense URL filter matches the client-side exact check:
+# the whole value compared as a string. Booleans and floats stringify
+# differently on each side, and list-valued fields are matched per element.
+_SERVER_FILTER_TYPES = frozenset({"string", "integer"})
+
+
+def extract_server_filter_fields(
+    spec: dict[str, Any], operation: Operation
+) -> list[str]:
+    """Sorted names of a list endpoint's fields that pfSense can filter on exactly.
+
+    These are the scalar string and integer response fields; every other
+    field is only ever filtered client-side.
+    """
+    properties = _response_item_properties(spec, operation)
+    return sorted(
+        name
+        for name, prop in properties.items()
+        if resolve_schema(spec, prop).get("type") in _SERVER_FILTER_TYPES
+    )
+
+
+def _response_item_properties(
+    spec: dict[str, Any], operation: Operation
+) -> dict[str, Any]:
+    """The row properties of an array response schema ({} for other responses)."""
+    schema = operation.response_schema
+    if schema is None or schema.get("type") != "array":
+        return {}
+    resolved_items = resolve_schema(spec, schema.get("items", {}))
+    return resolved_items.get("properties", {})
+
+
 def _clean_description(desc: str) -> str:
     """Clean HTML tags and whitespace from descriptions."""
     import re
@@ -1,21 +1,59 @@
 """Entry point for `python -m pfsense_mcp` and the `pfsense-mcp` console script.
 
-Runs the FastMCP server on stdio transport.
+Imports the generated server and runs it in this process, on stdio
+transport by default or streamable HTTP with --transport http.
 """
 
 from __future__ import annotations
 
-import importlib.resources
-import subprocess
-import sys
+import argparse
+import importlib
+import os
 
+TRANSPORTS = ("stdio", "http")
 
-def main() -> None:
-    """Run the generated MCP server via fastmcp."""
-    # Locate the generated server module
-    server_path = importlib.resources.files("pfsense_mcp") / "server.py"
-    # Use fastmcp CLI to run it (handles stdio transport setup)
-    sys.exit(subprocess.call([sys.executable, "-m", "fastmcp", "run", str(server_path)]))
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pfsense-mcp", description="Run the pfSense MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=os.environ.get("PFSENSE_TRANSPORT", "stdio"),
+        help="MCP transport (default: $PFSENSE_TRANSPORT or stdio)",
+    )
+    parser.add_argument(
+        "--host",
+        default=os.environ.get("PFSENSE_HTTP_HOST", "127.0.0.1"),
+        help="Bind address for --transport http (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=os.environ.get("PFSENSE_HTTP_PORT", "8000"),
+        help="Port for --transport http (default: 8000)",
+    )
+    parser.add_argument(
+        "--preload",
+        action=argparse.BooleanOptionalAction,
+        default=os.environ.get("PFSENSE_PRELOAD", "").lower() in ("1", "true", "yes"),
+        help="Load all enabled tools and the search index before serving",
+    )
+    args = parser.parse_args(argv)
+    if args.transport not in TRANSPORTS:
+        parser.error(f"invalid transport {args.transport!r} (choose from {', '.join(TRANSPORTS)})")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the generated MCP server in-process."""
+    args = _parse_args(argv)
+    server = importlib.import_module("pfsense_mcp.server")
+    if args.preload:
+        server.preload()
+    if args.transport == "http":
+        server.mcp.run(transport="http", host=args.host, port=args.port)
+    else:
+        server.mcp.run(transport="stdio")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,1954 @@
+# Auto-generated pfSense MCP tools — module: interface
+# 39 tools: 14 read, 25 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "interface" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_interface_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/interface/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_interface_available_interfaces(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/available_interfaces
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: dmesg, id, if, in_use_by, mac
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "dmesg", "id", "if", "in_use_by", "mac",
+        })))
+    return await _list_paged(
+        "/api/v2/interface/available_interfaces",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_interface_bridge(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/bridge
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/interface/bridge",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_interface_bridges(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/bridges
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: bridgeif, descr, id, members
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "bridgeif", "descr", "id",
+        })))
+    return await _list_paged(
+        "/api/v2/interface/bridges",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_interface_gre(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/gre
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/interface/gre",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_interface_gres(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/gres
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: add_static_route, descr, greif, id, if, remote_addr, tunnel_local_addr, tunnel_local_addr6, tunnel_remote_addr, tunnel_remote_addr6, tunnel_remote_net, tunnel_remote_net6
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "greif", "id", "if", "remote_addr", "tunnel_local_addr",
+            "tunnel_local_addr6", "tunnel_remote_addr", "tunnel_remote_addr6",
+            "tunnel_remote_net", "tunnel_remote_net6",
+        })))
+    return await _list_paged(
+        "/api/v2/interface/gres",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_interface_group(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/group
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/interface/group",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_interface_groups(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/groups
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, id, ifname, members
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "ifname",
+        })))
+    return await _list_paged(
+        "/api/v2/interface/groups",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_interface_lagg(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/lagg
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/interface/lagg",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_interface_laggs(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/laggs
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, failovermaster, id, lacptimeout, lagghash, laggif, members, proto
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "failovermaster", "id", "lacptimeout", "lagghash", "laggif",
+            "proto",
+        })))
+    return await _list_paged(
+        "/api/v2/interface/laggs",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_interface_vlan(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/vlan
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/interface/vlan",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_interface_vlans(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface/vlans
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, id, if, pcp, tag, vlanif
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "if", "pcp", "tag", "vlanif",
+        })))
+    return await _list_paged(
+        "/api/v2/interface/vlans",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_network_interface(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interface
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/interface",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_network_interfaces(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/interfaces
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: adv_dhcp_config_advanced, adv_dhcp_config_file_override, adv_dhcp_config_file_override_path, adv_dhcp_option_modifiers, adv_dhcp_pt_backoff_cutoff, adv_dhcp_pt_initial_interval, adv_dhcp_pt_reboot, adv_dhcp_pt_retry, adv_dhcp_pt_select_timeout, adv_dhcp_pt_timeout, adv_dhcp_pt_values, adv_dhcp_request_options, adv_dhcp_required_options, adv_dhcp_send_options, alias_address, alias_subnet, blockbogons, blockpriv, descr, dhcphostname, dhcprejectfrom, enable, gateway, gateway_6rd, gatewayv6, id, if, ipaddr, ipaddrv6, ipv6usev4iface, media, mediaopt, mss, mtu, prefix_6rd, prefix_6rd_v4plen, slaacusev4iface, spoofmac, subnet, subnetv6, track6_interface, track6_prefix_id_hex, typev4, typev6
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "adv_dhcp_config_file_override_path", "adv_dhcp_option_modifiers",
+            "adv_dhcp_pt_backoff_cutoff", "adv_dhcp_pt_initial_interval",
+            "adv_dhcp_pt_reboot", "adv_dhcp_pt_retry", "adv_dhcp_pt_select_timeout",
+            "adv_dhcp_pt_timeout", "adv_dhcp_pt_values", "adv_dhcp_request_options",
+            "adv_dhcp_required_options", "adv_dhcp_send_options", "alias_address",
+            "alias_subnet", "descr", "dhcphostname", "gateway", "gateway_6rd",
+            "gatewayv6", "id", "if", "ipaddr", "ipaddrv6", "media", "mediaopt", "mss",
+            "mtu", "prefix_6rd", "prefix_6rd_v4plen", "spoofmac", "subnet", "subnetv6",
+            "track6_interface", "track6_prefix_id_hex", "typev4", "typev6",
+        })))
+    return await _list_paged(
+        "/api/v2/interfaces",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_interface_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/interface/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_interface_bridge(
+        members: list[str],
+        confirm: bool = False,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface/bridge
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        members: The member interfaces to include in this bridge.
+        descr: A description for this interface bridge.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface/bridge. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if members is not None:
+            body["members"] = members
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/interface/bridge",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_interface_bridge(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        members: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/interface/bridge
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description for this interface bridge.
+        members: The member interfaces to include in this bridge.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/interface/bridge. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if members is not None:
+            body["members"] = members
+        return await _client.request(
+            "PATCH",
+            "/api/v2/interface/bridge",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_bridge(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/bridge
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/bridge. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/bridge",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_interface_gre(
+        if_: str,
+        remote_addr: str,
+        confirm: bool = False,
+        add_static_route: bool | None = None,
+        descr: str | None = None,
+        tunnel_local_addr: str | None = None,
+        tunnel_local_addr6: str | None = None,
+        tunnel_remote_addr: str | None = None,
+        tunnel_remote_addr6: str | None = None,
+        tunnel_remote_net: int | None = None,
+        tunnel_remote_net6: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface/gre
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        if_: The pfSense interface interface serving as the local address to be used for the GRE tunnel.
+        remote_addr: The remote address to use for the GRE tunnel.
+        add_static_route: Whether to add an explicit static route for the remote inner tunnel address/subnet via the local tunnel address.
+        descr: A description for this GRE interface.
+        tunnel_local_addr: The local IPv4 address to use for the GRE tunnel.
+        tunnel_local_addr6: The local IPv6 address to use for the GRE tunnel.
+        tunnel_remote_addr: The remote IPv4 address to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr` must not be equal to `NULL`
+        tunnel_remote_addr6: The remote IPv6 address to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr6` must not be equal to `NULL`
+        tunnel_remote_net: The remote IPv4 subnet bitmask to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr` must not be equal to `NULL`
+        tunnel_remote_net6: The remote IPv6 subnet bitmask to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr6` must not be equal to `NULL`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface/gre. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if if_ is not None:
+            body["if"] = if_
+        if remote_addr is not None:
+            body["remote_addr"] = remote_addr
+        if add_static_route is not None:
+            body["add_static_route"] = add_static_route
+        if descr is not None:
+            body["descr"] = descr
+        if tunnel_local_addr is not None:
+            body["tunnel_local_addr"] = tunnel_local_addr
+        if tunnel_local_addr6 is not None:
+            body["tunnel_local_addr6"] = tunnel_local_addr6
+        if tunnel_remote_addr is not None:
+            body["tunnel_remote_addr"] = tunnel_remote_addr
+        if tunnel_remote_addr6 is not None:
+            body["tunnel_remote_addr6"] = tunnel_remote_addr6
+        if tunnel_remote_net is not None:
+            body["tunnel_remote_net"] = tunnel_remote_net
+        if tunnel_remote_net6 is not None:
+            body["tunnel_remote_net6"] = tunnel_remote_net6
+        return await _client.request(
+            "POST",
+            "/api/v2/interface/gre",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_interface_gre(
+        id: str | int,
+        confirm: bool = False,
+        add_static_route: bool | None = None,
+        descr: str | None = None,
+        if_: str | None = None,
+        remote_addr: str | None = None,
+        tunnel_local_addr: str | None = None,
+        tunnel_local_addr6: str | None = None,
+        tunnel_remote_addr: str | None = None,
+        tunnel_remote_addr6: str | None = None,
+        tunnel_remote_net: int | None = None,
+        tunnel_remote_net6: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/interface/gre
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        add_static_route: Whether to add an explicit static route for the remote inner tunnel address/subnet via the local tunnel address.
+        descr: A description for this GRE interface.
+        if_: The pfSense interface interface serving as the local address to be used for the GRE tunnel.
+        remote_addr: The remote address to use for the GRE tunnel.
+        tunnel_local_addr: The local IPv4 address to use for the GRE tunnel.
+        tunnel_local_addr6: The local IPv6 address to use for the GRE tunnel.
+        tunnel_remote_addr: The remote IPv4 address to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr` must not be equal to `NULL`
+        tunnel_remote_addr6: The remote IPv6 address to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr6` must not be equal to `NULL`
+        tunnel_remote_net: The remote IPv4 subnet bitmask to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr` must not be equal to `NULL`
+        tunnel_remote_net6: The remote IPv6 subnet bitmask to use for the GRE tunnel.This field is only available when the following conditions are met:- `tunnel_local_addr6` must not be equal to `NULL`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/interface/gre. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if add_static_route is not None:
+            body["add_static_route"] = add_static_route
+        if descr is not None:
+            body["descr"] = descr
+        if if_ is not None:
+            body["if"] = if_
+        if remote_addr is not None:
+            body["remote_addr"] = remote_addr
+        if tunnel_local_addr is not None:
+            body["tunnel_local_addr"] = tunnel_local_addr
+        if tunnel_local_addr6 is not None:
+            body["tunnel_local_addr6"] = tunnel_local_addr6
+        if tunnel_remote_addr is not None:
+            body["tunnel_remote_addr"] = tunnel_remote_addr
+        if tunnel_remote_addr6 is not None:
+            body["tunnel_remote_addr6"] = tunnel_remote_addr6
+        if tunnel_remote_net is not None:
+            body["tunnel_remote_net"] = tunnel_remote_net
+        if tunnel_remote_net6 is not None:
+            body["tunnel_remote_net6"] = tunnel_remote_net6
+        return await _client.request(
+            "PATCH",
+            "/api/v2/interface/gre",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_gre(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/gre
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/gre. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/gre",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_gres(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/gres
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/gres. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/gres",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_interface_group(
+        ifname: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        members: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface/group
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        ifname: The name of this interface group.
+        descr: The description for this interface group.
+        members: The member interfaces to assign to this interface group.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface/group. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if ifname is not None:
+            body["ifname"] = ifname
+        if descr is not None:
+            body["descr"] = descr
+        if members is not None:
+            body["members"] = members
+        return await _client.request(
+            "POST",
+            "/api/v2/interface/group",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_interface_group(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        ifname: str | None = None,
+        members: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/interface/group
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: The description for this interface group.
+        ifname: The name of this interface group.
+        members: The member interfaces to assign to this interface group.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/interface/group. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if ifname is not None:
+            body["ifname"] = ifname
+        if members is not None:
+            body["members"] = members
+        return await _client.request(
+            "PATCH",
+            "/api/v2/interface/group",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_group(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/group
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/group. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/group",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_interface_groups(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/interface/groups
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/interface/groups. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/interface/groups",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_groups(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/groups
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/groups. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/groups",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_interface_lagg(
+        members: list[str],
+        proto: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        failovermaster: str | None = None,
+        lacptimeout: str | None = None,
+        lagghash: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface/lagg
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        members: A list of member interfaces to include in the LAGG.
+        proto: The LAGG protocol to use. Valid values: ['lacp', 'failover', 'loadbalance', 'roundrobin', 'none']
+        descr: A description to help document the purpose of this LAGG interface.
+        failovermaster: The failover master interface to use.This field is only available when the following conditions are met:- `proto` must be equal to `'failover'`
+        lacptimeout: The LACP timeout mode to use.This field is only available when the following conditions are met:- `proto` must be equal to `'lacp'` Valid values: ['slow', 'fast']
+        lagghash: The LAGG hash algorithm to use.This field is only available when the following conditions are met:- `proto` must be one of [ lacp, loadbalance ] Valid values: ['l2', 'l3', 'l4', 'l2,l3', 'l2,l4', 'l3,l4', 'l2,l3,l4']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface/lagg. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if members is not None:
+            body["members"] = members
+        if proto is not None:
+            body["proto"] = proto
+        if descr is not None:
+            body["descr"] = descr
+        if failovermaster is not None:
+            body["failovermaster"] = failovermaster
+        if lacptimeout is not None:
+            body["lacptimeout"] = lacptimeout
+        if lagghash is not None:
+            body["lagghash"] = lagghash
+        return await _client.request(
+            "POST",
+            "/api/v2/interface/lagg",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_interface_lagg(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        failovermaster: str | None = None,
+        lacptimeout: str | None = None,
+        lagghash: str | None = None,
+        members: list[str] | None = None,
+        proto: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/interface/lagg
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description to help document the purpose of this LAGG interface.
+        failovermaster: The failover master interface to use.This field is only available when the following conditions are met:- `proto` must be equal to `'failover'`
+        lacptimeout: The LACP timeout mode to use.This field is only available when the following conditions are met:- `proto` must be equal to `'lacp'` Valid values: ['slow', 'fast']
+        lagghash: The LAGG hash algorithm to use.This field is only available when the following conditions are met:- `proto` must be one of [ lacp, loadbalance ] Valid values: ['l2', 'l3', 'l4', 'l2,l3', 'l2,l4', 'l3,l4', 'l2,l3,l4']
+        members: A list of member interfaces to include in the LAGG.
+        proto: The LAGG protocol to use. Valid values: ['lacp', 'failover', 'loadbalance', 'roundrobin', 'none']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/interface/lagg. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if failovermaster is not None:
+            body["failovermaster"] = failovermaster
+        if lacptimeout is not None:
+            body["lacptimeout"] = lacptimeout
+        if lagghash is not None:
+            body["lagghash"] = lagghash
+        if members is not None:
+            body["members"] = members
+        if proto is not None:
+            body["proto"] = proto
+        return await _client.request(
+            "PATCH",
+            "/api/v2/interface/lagg",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_lagg(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/lagg
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/lagg. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/lagg",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_laggs(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/laggs
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/laggs. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/laggs",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_interface_vlan(
+        if_: str,
+        tag: int,
+        confirm: bool = False,
+        descr: str | None = None,
+        pcp: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface/vlan
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        if_: The real parent interface this VLAN will be applied to.
+        tag: The VLAN ID tag to use. This must be unique from all other VLANs on the parent interface.
+        descr: A description to help document the purpose of this VLAN.
+        pcp: The 802.1p VLAN priority code point (PCP) to assign to this VLAN.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface/vlan. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if if_ is not None:
+            body["if"] = if_
+        if tag is not None:
+            body["tag"] = tag
+        if descr is not None:
+            body["descr"] = descr
+        if pcp is not None:
+            body["pcp"] = pcp
+        return await _client.request(
+            "POST",
+            "/api/v2/interface/vlan",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_interface_vlan(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        if_: str | None = None,
+        pcp: int | None = None,
+        tag: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/interface/vlan
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        descr: A description to help document the purpose of this VLAN.
+        if_: The real parent interface this VLAN will be applied to.
+        pcp: The 802.1p VLAN priority code point (PCP) to assign to this VLAN.
+        tag: The VLAN ID tag to use. This must be unique from all other VLANs on the parent interface.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/interface/vlan. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if if_ is not None:
+            body["if"] = if_
+        if pcp is not None:
+            body["pcp"] = pcp
+        if tag is not None:
+            body["tag"] = tag
+        return await _client.request(
+            "PATCH",
+            "/api/v2/interface/vlan",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_vlan(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/vlan
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/vlan. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/vlan",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_interface_vlans(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface/vlans
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface/vlans. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface/vlans",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_network_interface(
+        descr: str,
+        if_: str,
+        typev4: str,
+        confirm: bool = False,
+        adv_dhcp_config_advanced: bool | None = None,
+        adv_dhcp_config_file_override: bool | None = None,
+        adv_dhcp_config_file_override_path: str | None = None,
+        adv_dhcp_option_modifiers: str | None = None,
+        adv_dhcp_pt_backoff_cutoff: int | None = None,
+        adv_dhcp_pt_initial_interval: int | None = None,
+        adv_dhcp_pt_reboot: int | None = None,
+        adv_dhcp_pt_retry: int | None = None,
+        adv_dhcp_pt_select_timeout: int | None = None,
+        adv_dhcp_pt_timeout: int | None = None,
+        adv_dhcp_pt_values: str | None = None,
+        adv_dhcp_request_options: str | None = None,
+        adv_dhcp_required_options: str | None = None,
+        adv_dhcp_send_options: str | None = None,
+        alias_address: str | None = None,
+        alias_subnet: int | None = None,
+        blockbogons: bool | None = None,
+        blockpriv: bool | None = None,
+        dhcphostname: str | None = None,
+        dhcprejectfrom: list[str] | None = None,
+        enable: bool | None = None,
+        gateway: str | None = None,
+        gateway_6rd: str | None = None,
+        gatewayv6: str | None = None,
+        ipaddr: str | None = None,
+        ipaddrv6: str | None = None,
+        ipv6usev4iface: bool | None = None,
+        media: str | None = None,
+        mediaopt: str | None = None,
+        mss: int | None = None,
+        mtu: int | None = None,
+        prefix_6rd: str | None = None,
+        prefix_6rd_v4plen: int | None = None,
+        slaacusev4iface: bool | None = None,
+        spoofmac: str | None = None,
+        subnet: int | None = None,
+        subnetv6: int | None = None,
+        track6_interface: str | None = None,
+        track6_prefix_id_hex: str | None = None,
+        typev6: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/interface
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        descr: The descriptive name for this interface.
+        if_: The real interface this configuration will be applied to.
+        typev4: Selects the IPv4 address type to assign this interface. Valid values: ['static', 'dhcp', 'none']
+        adv_dhcp_config_advanced: Enables or disables the advanced DHCP settings on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        adv_dhcp_config_file_override: Enables or disables overriding the entire DHCP configuration file for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        adv_dhcp_config_file_override_path: Sets the local file path of the custom DHCP configuration file.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_file_override` must be equal to `true`
+        adv_dhcp_option_modifiers: Sets DHCP option modifiers applied to the obtained DHCP lease.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_backoff_cutoff: Manually sets the backoff cutoff timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_initial_interval: Manually sets the initial interval timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_reboot: Manually sets the reboot timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_retry: Manually sets the retry timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_select_timeout: Manually sets the select timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_timeout: Manually sets the timeout timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_values: Selects the advanced DHCP timing preset.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true` Valid values: ['SavedCfg']
+        adv_dhcp_request_options: Sets DHCP option 55 values to be sent when requesting a DHCP lease for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_required_options: Sets DHCP options required by the client when requesting a DHCP lease for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_send_options: Sets DHCP options to be sent when requesting a DHCP lease for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        alias_address: Sets the value used as a fixed alias IPv4 address by the DHCP client.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        alias_subnet: Sets the value used as the fixed alias IPv4 address's subnet bit count by the DHCP client.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        blockbogons: Enable or disable automatically blocking bogon networks on this interface.
+        blockpriv: Enable or disable automatically blocking RFC 1918 private networks on this interface.
+        dhcphostname: Sets the DHCP hostname this interface will advertise via DHCP.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        dhcprejectfrom: Sets a list of IPv4 DHCP server addresses to reject DHCP offers for on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        enable: Enable or disable this interface.
+        gateway: Sets the upstream gateway this interface will use. This is only applicable for WAN-type interfaces.This field is only available when the following conditions are met:- `typev4` must be equal to `'static'`
+        gateway_6rd: Sets the 6RD IPv4 gateway address assigned by the ISP for this interface.This field is only available when the following conditions are met:- `typev6` must be equal to `'6rd'`
+        gatewayv6: Sets the upstream IPv6 gateway this interface will use. This is only applicable for WAN-type interfaces.This field is only available when the following conditions are met:- `typev6` must be equal to `'staticv6'`
+        ipaddr: Sets the IPv4 address to assign to this interface.This field is only available when the following conditions are met:- `typev4` must be one of [ static, dhcp ]
+        ipaddrv6: Sets the IPv6 address to assign to this interface.This field is only available when the following conditions are met:- `typev6` must be one of [ staticv6, dhcp6, slaac, 6rd, track6, 6to4 ]
+        ipv6usev4iface: Enable or disable IPv6 using the IPv4 connectivity link (PPPoE).This field is only available when the following conditions are met:- `typev6` must be equal to `'staticv6'`
+        media: Sets the link speed for this interface. In most situations this can be left as the default.
+        mediaopt: Sets the link duplex for this interface. In most situations this can be left as the default.
+        mss: Sets the MSS for this interface. Assumes default MSS if value is `null`.
+        mtu: Sets the MTU for this interface. Assumes default MTU if value is `null`.
+        prefix_6rd: Sets the 6RD IPv6 prefix assigned by the ISP for this interface.This field is only available when the following conditions are met:- `typev6` must be equal to `'6rd'`
+        prefix_6rd_v4plen: Sets the 6RD IPv4 prefix length. Normally specified by the ISP. A value of 0 means embed theentire IPv4 address in the 6RD prefix.This field is only available when the following conditions are met:- `typev6` must be equal to `'6rd'`
+        slaacusev4iface: Enable or disable IPv6 using the IPv4 connectivity link (PPPoE).This field is only available when the following conditions are met:- `typev6` must be equal to `'slaac'`
+        spoofmac: Assigns (spoofs) the MAC address for this interface instead of using the interface's real MAC.
+        subnet: Sets the subnet bit count to assign this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'static'`
+        subnetv6: Sets the subnet bit count to assign this interface.This field is only available when the following conditions are met:- `typev6` must be equal to `'staticv6'`
+        track6_interface: Sets the dynamic IPv6 WAN interface to track for configuration.This field is only available when the following conditions are met:- `typev6` must be equal to `'track6'`
+        track6_prefix_id_hex: Sets the hexadecimal IPv6 prefix ID. This determines the configurable network ID based on the dynamic IPv6 connection.This field is only available when the following conditions are met:- `typev6` must be equal to `'track6'`
+        typev6: Selects the IPv6 address type to assign this interface. Valid values: ['staticv6', 'dhcp6', 'slaac', '6rd', 'track6', '6to4', 'none']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/interface. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if descr is not None:
+            body["descr"] = descr
+        if if_ is not None:
+            body["if"] = if_
+        if typev4 is not None:
+            body["typev4"] = typev4
+        if adv_dhcp_config_advanced is not None:
+            body["adv_dhcp_config_advanced"] = adv_dhcp_config_advanced
+        if adv_dhcp_config_file_override is not None:
+            body["adv_dhcp_config_file_override"] = adv_dhcp_config_file_override
+        if adv_dhcp_config_file_override_path is not None:
+            body["adv_dhcp_config_file_override_path"] = adv_dhcp_config_file_override_path
+        if adv_dhcp_option_modifiers is not None:
+            body["adv_dhcp_option_modifiers"] = adv_dhcp_option_modifiers
+        if adv_dhcp_pt_backoff_cutoff is not None:
+            body["adv_dhcp_pt_backoff_cutoff"] = adv_dhcp_pt_backoff_cutoff
+        if adv_dhcp_pt_initial_interval is not None:
+            body["adv_dhcp_pt_initial_interval"] = adv_dhcp_pt_initial_interval
+        if adv_dhcp_pt_reboot is not None:
+            body["adv_dhcp_pt_reboot"] = adv_dhcp_pt_reboot
+        if adv_dhcp_pt_retry is not None:
+            body["adv_dhcp_pt_retry"] = adv_dhcp_pt_retry
+        if adv_dhcp_pt_select_timeout is not None:
+            body["adv_dhcp_pt_select_timeout"] = adv_dhcp_pt_select_timeout
+        if adv_dhcp_pt_timeout is not None:
+            body["adv_dhcp_pt_timeout"] = adv_dhcp_pt_timeout
+        if adv_dhcp_pt_values is not None:
+            body["adv_dhcp_pt_values"] = adv_dhcp_pt_values
+        if adv_dhcp_request_options is not None:
+            body["adv_dhcp_request_options"] = adv_dhcp_request_options
+        if adv_dhcp_required_options is not None:
+            body["adv_dhcp_required_options"] = adv_dhcp_required_options
+        if adv_dhcp_send_options is not None:
+            body["adv_dhcp_send_options"] = adv_dhcp_send_options
+        if alias_address is not None:
+            body["alias_address"] = alias_address
+        if alias_subnet is not None:
+            body["alias_subnet"] = alias_subnet
+        if blockbogons is not None:
+            body["blockbogons"] = blockbogons
+        if blockpriv is not None:
+            body["blockpriv"] = blockpriv
+        if dhcphostname is not None:
+            body["dhcphostname"] = dhcphostname
+        if dhcprejectfrom is not None:
+            body["dhcprejectfrom"] = dhcprejectfrom
+        if enable is not None:
+            body["enable"] = enable
+        if gateway is not None:
+            body["gateway"] = gateway
+        if gateway_6rd is not None:
+            body["gateway_6rd"] = gateway_6rd
+        if gatewayv6 is not None:
+            body["gatewayv6"] = gatewayv6
+        if ipaddr is not None:
+            body["ipaddr"] = ipaddr
+        if ipaddrv6 is not None:
+            body["ipaddrv6"] = ipaddrv6
+        if ipv6usev4iface is not None:
+            body["ipv6usev4iface"] = ipv6usev4iface
+        if media is not None:
+            body["media"] = media
+        if mediaopt is not None:
+            body["mediaopt"] = mediaopt
+        if mss is not None:
+            body["mss"] = mss
+        if mtu is not None:
+            body["mtu"] = mtu
+        if prefix_6rd is not None:
+            body["prefix_6rd"] = prefix_6rd
+        if prefix_6rd_v4plen is not None:
+            body["prefix_6rd_v4plen"] = prefix_6rd_v4plen
+        if slaacusev4iface is not None:
+            body["slaacusev4iface"] = slaacusev4iface
+        if spoofmac is not None:
+            body["spoofmac"] = spoofmac
+        if subnet is not None:
+            body["subnet"] = subnet
+        if subnetv6 is not None:
+            body["subnetv6"] = subnetv6
+        if track6_interface is not None:
+            body["track6_interface"] = track6_interface
+        if track6_prefix_id_hex is not None:
+            body["track6_prefix_id_hex"] = track6_prefix_id_hex
+        if typev6 is not None:
+            body["typev6"] = typev6
+        return await _client.request(
+            "POST",
+            "/api/v2/interface",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_network_interface(
+        id: str | int,
+        confirm: bool = False,
+        adv_dhcp_config_advanced: bool | None = None,
+        adv_dhcp_config_file_override: bool | None = None,
+        adv_dhcp_config_file_override_path: str | None = None,
+        adv_dhcp_option_modifiers: str | None = None,
+        adv_dhcp_pt_backoff_cutoff: int | None = None,
+        adv_dhcp_pt_initial_interval: int | None = None,
+        adv_dhcp_pt_reboot: int | None = None,
+        adv_dhcp_pt_retry: int | None = None,
+        adv_dhcp_pt_select_timeout: int | None = None,
+        adv_dhcp_pt_timeout: int | None = None,
+        adv_dhcp_pt_values: str | None = None,
+        adv_dhcp_request_options: str | None = None,
+        adv_dhcp_required_options: str | None = None,
+        adv_dhcp_send_options: str | None = None,
+        alias_address: str | None = None,
+        alias_subnet: int | None = None,
+        blockbogons: bool | None = None,
+        blockpriv: bool | None = None,
+        descr: str | None = None,
+        dhcphostname: str | None = None,
+        dhcprejectfrom: list[str] | None = None,
+        enable: bool | None = None,
+        gateway: str | None = None,
+        gateway_6rd: str | None = None,
+        gatewayv6: str | None = None,
+        if_: str | None = None,
+        ipaddr: str | None = None,
+        ipaddrv6: str | None = None,
+        ipv6usev4iface: bool | None = None,
+        media: str | None = None,
+        mediaopt: str | None = None,
+        mss: int | None = None,
+        mtu: int | None = None,
+        prefix_6rd: str | None = None,
+        prefix_6rd_v4plen: int | None = None,
+        slaacusev4iface: bool | None = None,
+        spoofmac: str | None = None,
+        subnet: int | None = None,
+        subnetv6: int | None = None,
+        track6_interface: str | None = None,
+        track6_prefix_id_hex: str | None = None,
+        typev4: str | None = None,
+        typev6: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/interface
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        adv_dhcp_config_advanced: Enables or disables the advanced DHCP settings on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        adv_dhcp_config_file_override: Enables or disables overriding the entire DHCP configuration file for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        adv_dhcp_config_file_override_path: Sets the local file path of the custom DHCP configuration file.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_file_override` must be equal to `true`
+        adv_dhcp_option_modifiers: Sets DHCP option modifiers applied to the obtained DHCP lease.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_backoff_cutoff: Manually sets the backoff cutoff timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_initial_interval: Manually sets the initial interval timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_reboot: Manually sets the reboot timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_retry: Manually sets the retry timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_select_timeout: Manually sets the select timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_timeout: Manually sets the timeout timing value used when requested DHCP leases on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_pt_values: Selects the advanced DHCP timing preset.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true` Valid values: ['SavedCfg']
+        adv_dhcp_request_options: Sets DHCP option 55 values to be sent when requesting a DHCP lease for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_required_options: Sets DHCP options required by the client when requesting a DHCP lease for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        adv_dhcp_send_options: Sets DHCP options to be sent when requesting a DHCP lease for this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`- `adv_dhcp_config_advanced` must be equal to `true`
+        alias_address: Sets the value used as a fixed alias IPv4 address by the DHCP client.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        alias_subnet: Sets the value used as the fixed alias IPv4 address's subnet bit count by the DHCP client.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        blockbogons: Enable or disable automatically blocking bogon networks on this interface.
+        blockpriv: Enable or disable automatically blocking RFC 1918 private networks on this interface.
+        descr: The descriptive name for this interface.
+        dhcphostname: Sets the DHCP hostname this interface will advertise via DHCP.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        dhcprejectfrom: Sets a list of IPv4 DHCP server addresses to reject DHCP offers for on this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'dhcp'`
+        enable: Enable or disable this interface.
+        gateway: Sets the upstream gateway this interface will use. This is only applicable for WAN-type interfaces.This field is only available when the following conditions are met:- `typev4` must be equal to `'static'`
+        gateway_6rd: Sets the 6RD IPv4 gateway address assigned by the ISP for this interface.This field is only available when the following conditions are met:- `typev6` must be equal to `'6rd'`
+        gatewayv6: Sets the upstream IPv6 gateway this interface will use. This is only applicable for WAN-type interfaces.This field is only available when the following conditions are met:- `typev6` must be equal to `'staticv6'`
+        if_: The real interface this configuration will be applied to.
+        ipaddr: Sets the IPv4 address to assign to this interface.This field is only available when the following conditions are met:- `typev4` must be one of [ static, dhcp ]
+        ipaddrv6: Sets the IPv6 address to assign to this interface.This field is only available when the following conditions are met:- `typev6` must be one of [ staticv6, dhcp6, slaac, 6rd, track6, 6to4 ]
+        ipv6usev4iface: Enable or disable IPv6 using the IPv4 connectivity link (PPPoE).This field is only available when the following conditions are met:- `typev6` must be equal to `'staticv6'`
+        media: Sets the link speed for this interface. In most situations this can be left as the default.
+        mediaopt: Sets the link duplex for this interface. In most situations this can be left as the default.
+        mss: Sets the MSS for this interface. Assumes default MSS if value is `null`.
+        mtu: Sets the MTU for this interface. Assumes default MTU if value is `null`.
+        prefix_6rd: Sets the 6RD IPv6 prefix assigned by the ISP for this interface.This field is only available when the following conditions are met:- `typev6` must be equal to `'6rd'`
+        prefix_6rd_v4plen: Sets the 6RD IPv4 prefix length. Normally specified by the ISP. A value of 0 means embed theentire IPv4 address in the 6RD prefix.This field is only available when the following conditions are met:- `typev6` must be equal to `'6rd'`
+        slaacusev4iface: Enable or disable IPv6 using the IPv4 connectivity link (PPPoE).This field is only available when the following conditions are met:- `typev6` must be equal to `'slaac'`
+        spoofmac: Assigns (spoofs) the MAC address for this interface instead of using the interface's real MAC.
+        subnet: Sets the subnet bit count to assign this interface.This field is only available when the following conditions are met:- `typev4` must be equal to `'static'`
+        subnetv6: Sets the subnet bit count to assign this interface.This field is only available when the following conditions are met:- `typev6` must be equal to `'staticv6'`
+        track6_interface: Sets the dynamic IPv6 WAN interface to track for configuration.This field is only available when the following conditions are met:- `typev6` must be equal to `'track6'`
+        track6_prefix_id_hex: Sets the hexadecimal IPv6 prefix ID. This determines the configurable network ID based on the dynamic IPv6 connection.This field is only available when the following conditions are met:- `typev6` must be equal to `'track6'`
+        typev4: Selects the IPv4 address type to assign this interface. Valid values: ['static', 'dhcp', 'none']
+        typev6: Selects the IPv6 address type to assign this interface. Valid values: ['staticv6', 'dhcp6', 'slaac', '6rd', 'track6', '6to4', 'none']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/interface. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if adv_dhcp_config_advanced is not None:
+            body["adv_dhcp_config_advanced"] = adv_dhcp_config_advanced
+        if adv_dhcp_config_file_override is not None:
+            body["adv_dhcp_config_file_override"] = adv_dhcp_config_file_override
+        if adv_dhcp_config_file_override_path is not None:
+            body["adv_dhcp_config_file_override_path"] = adv_dhcp_config_file_override_path
+        if adv_dhcp_option_modifiers is not None:
+            body["adv_dhcp_option_modifiers"] = adv_dhcp_option_modifiers
+        if adv_dhcp_pt_backoff_cutoff is not None:
+            body["adv_dhcp_pt_backoff_cutoff"] = adv_dhcp_pt_backoff_cutoff
+        if adv_dhcp_pt_initial_interval is not None:
+            body["adv_dhcp_pt_initial_interval"] = adv_dhcp_pt_initial_interval
+        if adv_dhcp_pt_reboot is not None:
+            body["adv_dhcp_pt_reboot"] = adv_dhcp_pt_reboot
+        if adv_dhcp_pt_retry is not None:
+            body["adv_dhcp_pt_retry"] = adv_dhcp_pt_retry
+        if adv_dhcp_pt_select_timeout is not None:
+            body["adv_dhcp_pt_select_timeout"] = adv_dhcp_pt_select_timeout
+        if adv_dhcp_pt_timeout is not None:
+            body["adv_dhcp_pt_timeout"] = adv_dhcp_pt_timeout
+        if adv_dhcp_pt_values is not None:
+            body["adv_dhcp_pt_values"] = adv_dhcp_pt_values
+        if adv_dhcp_request_options is not None:
+            body["adv_dhcp_request_options"] = adv_dhcp_request_options
+        if adv_dhcp_required_options is not None:
+            body["adv_dhcp_required_options"] = adv_dhcp_required_options
+        if adv_dhcp_send_options is not None:
+            body["adv_dhcp_send_options"] = adv_dhcp_send_options
+        if alias_address is not None:
+            body["alias_address"] = alias_address
+        if alias_subnet is not None:
+            body["alias_subnet"] = alias_subnet
+        if blockbogons is not None:
+            body["blockbogons"] = blockbogons
+        if blockpriv is not None:
+            body["blockpriv"] = blockpriv
+        if descr is not None:
+            body["descr"] = descr
+        if dhcphostname is not None:
+            body["dhcphostname"] = dhcphostname
+        if dhcprejectfrom is not None:
+            body["dhcprejectfrom"] = dhcprejectfrom
+        if enable is not None:
+            body["enable"] = enable
+        if gateway is not None:
+            body["gateway"] = gateway
+        if gateway_6rd is not None:
+            body["gateway_6rd"] = gateway_6rd
+        if gatewayv6 is not None:
+            body["gatewayv6"] = gatewayv6
+        if if_ is not None:
+            body["if"] = if_
+        if ipaddr is not None:
+            body["ipaddr"] = ipaddr
+        if ipaddrv6 is not None:
+            body["ipaddrv6"] = ipaddrv6
+        if ipv6usev4iface is not None:
+            body["ipv6usev4iface"] = ipv6usev4iface
+        if media is not None:
+            body["media"] = media
+        if mediaopt is not None:
+            body["mediaopt"] = mediaopt
+        if mss is not None:
+            body["mss"] = mss
+        if mtu is not None:
+            body["mtu"] = mtu
+        if prefix_6rd is not None:
+            body["prefix_6rd"] = prefix_6rd
+        if prefix_6rd_v4plen is not None:
+            body["prefix_6rd_v4plen"] = prefix_6rd_v4plen
+        if slaacusev4iface is not None:
+            body["slaacusev4iface"] = slaacusev4iface
+        if spoofmac is not None:
+            body["spoofmac"] = spoofmac
+        if subnet is not None:
+            body["subnet"] = subnet
+        if subnetv6 is not None:
+            body["subnetv6"] = subnetv6
+        if track6_interface is not None:
+            body["track6_interface"] = track6_interface
+        if track6_prefix_id_hex is not None:
+            body["track6_prefix_id_hex"] = track6_prefix_id_hex
+        if typev4 is not None:
+            body["typev4"] = typev4
+        if typev6 is not None:
+            body["typev6"] = typev6
+        return await _client.request(
+            "PATCH",
+            "/api/v2/interface",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_network_interface(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interface
+
+        Note: Call pfsense_interface_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interface. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_interface_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interface",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_network_interfaces(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/interfaces
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/interfaces. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/interfaces",
+            params=params,
+        )
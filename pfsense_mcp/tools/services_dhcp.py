@@ -0,0 +1,1528 @@
+# Auto-generated pfSense MCP tools — module: services_dhcp
+# 29 tools: 10 read, 19 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_dhcp" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dhcp_relay(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_relay
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dhcp_relay",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dhcp_server_address_pool(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/address_pool
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dhcp_server/address_pool",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dhcp_server_address_pools(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/address_pools
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: defaultleasetime, denyunknown, dnsserver, domain, domainsearchlist, gateway, id, ignorebootp, ignoreclientuids, mac_allow, mac_deny, maxleasetime, ntpserver, parent_id, range_from, range_to, winsserver
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "defaultleasetime", "denyunknown", "domain", "gateway", "id",
+            "maxleasetime", "parent_id", "range_from", "range_to",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dhcp_server/address_pools",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dhcp_server_apply_status(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/apply
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dhcp_server/apply",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dhcp_server_custom_option(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/custom_option
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dhcp_server/custom_option",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dhcp_server_custom_options(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/custom_options
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: id, number, parent_id, type, value
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "id", "number", "parent_id", "type", "value",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dhcp_server/custom_options",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dhcp_server(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dhcp_server",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_dhcp_server_static_mapping(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/static_mapping
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/dhcp_server/static_mapping",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dhcp_server_static_mappings(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_server/static_mappings
+
+    NOTE: Results include static mappings from ALL interfaces. Use the parent_id parameter to filter by interface (e.g. parent_id='lan' or parent_id='opt3').
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: arp_table_static_entry, cid, defaultleasetime, descr, dnsserver, domain, domainsearchlist, gateway, hostname, id, ipaddr, mac, maxleasetime, ntpserver, parent_id, winsserver
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "cid", "defaultleasetime", "descr", "domain", "gateway", "hostname", "id",
+            "ipaddr", "mac", "maxleasetime", "parent_id",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dhcp_server/static_mappings",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_dhcp_servers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/dhcp_servers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: defaultleasetime, denyunknown, dhcpleaseinlocaltime, disablepingcheck, dnsserver, domain, domainsearchlist, enable, failover_peerip, gateway, id, ignorebootp, ignoreclientuids, interface, mac_allow, mac_deny, maxleasetime, nonak, ntpserver, numberoptions, pool, range_from, range_to, staticarp, staticmap, statsgraph, winsserver
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "defaultleasetime", "denyunknown", "domain", "failover_peerip", "gateway",
+            "id", "interface", "maxleasetime", "range_from", "range_to",
+        })))
+    return await _list_paged(
+        "/api/v2/services/dhcp_servers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dhcp_relay(
+        server: list[str],
+        confirm: bool = False,
+        agentoption: bool | None = None,
+        carpstatusvip: str | None = None,
+        enable: bool | None = None,
+        interface: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dhcp_relay
+
+        server: The IPv4 addresses of the DHCP server to relay requests to.
+        agentoption: Enables or disables appending the circuit ID (interface number) and the agent ID to the DHCP request.
+        carpstatusvip: DHCP Relay will be stopped when the chosen VIP is in BACKUP status, and started in MASTER status.
+        enable: Enables or disables the DHCP relay.
+        interface: The downstream interfaces to listen on for DHCP requests.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dhcp_relay. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if server is not None:
+            body["server"] = server
+        if agentoption is not None:
+            body["agentoption"] = agentoption
+        if carpstatusvip is not None:
+            body["carpstatusvip"] = carpstatusvip
+        if enable is not None:
+            body["enable"] = enable
+        if interface is not None:
+            body["interface"] = interface
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dhcp_relay",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dhcp_server_address_pool(
+        parent_id: str | int,
+        range_from: str,
+        range_to: str,
+        confirm: bool = False,
+        defaultleasetime: int | None = 7200,
+        denyunknown: str | None = None,
+        dnsserver: list[str] | None = None,
+        domain: str | None = None,
+        domainsearchlist: list[str] | None = None,
+        gateway: str | None = None,
+        ignorebootp: bool | None = None,
+        ignoreclientuids: bool | None = None,
+        mac_allow: list[str] | None = None,
+        mac_deny: list[str] | None = None,
+        maxleasetime: int | None = 86400,
+        ntpserver: list[str] | None = None,
+        winsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dhcp_server/address_pool
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        parent_id: The ID of the parent this object is nested under.
+        range_from: The starting IP address for this address pool. This address must be less than or equal to the `range_to` field.
+        range_to: The ending IP address for the this address pool. This address must be greater than or equal to the `range_to` field.
+        defaultleasetime: The default DHCP lease validity period (in seconds). This is used for clients that do not ask for a specific expiration time.
+        denyunknown: Define how to handle unknown clients requesting DHCP leases. When set to `null`, any DHCP client will get an IP address within this scope/range on this interface. If set to `enabled`, any DHCP client with a MAC address listed in a static mapping on any scope(s)/interface(s) will get an IP address. If set to `class`, only MAC addresses listed in static mappings on this interface will get an IP address within this scope/range. Valid values: ['enabled', 'class']
+        dnsserver: The DNS servers to provide via DHCP. Leave empty to default to system nameservers.
+        domain: The domain to be assigned via DHCP.
+        domainsearchlist: The domain search list to provide via DHCP.
+        gateway: The gateway IPv4 address to provide via DHCP. This is only necessary if you are not using the interface's IP as the gateway. Specify `none` for no gateway assignment.
+        ignorebootp: Force this DHCP server to ignore BOOTP queries.
+        ignoreclientuids: Prevent recording a unique identifier (UID) in client lease data if present in the client DHCP request. This option may be useful when a client can dual boot using different client identifiers but the same hardware (MAC) address. Note that the resulting server behavior violates the official DHCP specification.
+        mac_allow: MAC addresses this DHCP server is allowed to provide leases for.
+        mac_deny: MAC addresses this DHCP server is not allowed to provide leases for.
+        maxleasetime: The maximum DHCP lease validity period (in seconds) a client can request.
+        ntpserver: The NTP servers to provide via DHCP.
+        winsserver: The WINS servers to provide via DHCP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dhcp_server/address_pool. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if range_from is not None:
+            body["range_from"] = range_from
+        if range_to is not None:
+            body["range_to"] = range_to
+        if defaultleasetime is not None:
+            body["defaultleasetime"] = defaultleasetime
+        if denyunknown is not None:
+            body["denyunknown"] = denyunknown
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        if domain is not None:
+            body["domain"] = domain
+        if domainsearchlist is not None:
+            body["domainsearchlist"] = domainsearchlist
+        if gateway is not None:
+            body["gateway"] = gateway
+        if ignorebootp is not None:
+            body["ignorebootp"] = ignorebootp
+        if ignoreclientuids is not None:
+            body["ignoreclientuids"] = ignoreclientuids
+        if mac_allow is not None:
+            body["mac_allow"] = mac_allow
+        if mac_deny is not None:
+            body["mac_deny"] = mac_deny
+        if maxleasetime is not None:
+            body["maxleasetime"] = maxleasetime
+        if ntpserver is not None:
+            body["ntpserver"] = ntpserver
+        if winsserver is not None:
+            body["winsserver"] = winsserver
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dhcp_server/address_pool",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dhcp_server_address_pool(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        defaultleasetime: int | None = None,
+        denyunknown: str | None = None,
+        dnsserver: list[str] | None = None,
+        domain: str | None = None,
+        domainsearchlist: list[str] | None = None,
+        gateway: str | None = None,
+        ignorebootp: bool | None = None,
+        ignoreclientuids: bool | None = None,
+        mac_allow: list[str] | None = None,
+        mac_deny: list[str] | None = None,
+        maxleasetime: int | None = None,
+        ntpserver: list[str] | None = None,
+        range_from: str | None = None,
+        range_to: str | None = None,
+        winsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dhcp_server/address_pool
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        defaultleasetime: The default DHCP lease validity period (in seconds). This is used for clients that do not ask for a specific expiration time.
+        denyunknown: Define how to handle unknown clients requesting DHCP leases. When set to `null`, any DHCP client will get an IP address within this scope/range on this interface. If set to `enabled`, any DHCP client with a MAC address listed in a static mapping on any scope(s)/interface(s) will get an IP address. If set to `class`, only MAC addresses listed in static mappings on this interface will get an IP address within this scope/range. Valid values: ['enabled', 'class']
+        dnsserver: The DNS servers to provide via DHCP. Leave empty to default to system nameservers.
+        domain: The domain to be assigned via DHCP.
+        domainsearchlist: The domain search list to provide via DHCP.
+        gateway: The gateway IPv4 address to provide via DHCP. This is only necessary if you are not using the interface's IP as the gateway. Specify `none` for no gateway assignment.
+        ignorebootp: Force this DHCP server to ignore BOOTP queries.
+        ignoreclientuids: Prevent recording a unique identifier (UID) in client lease data if present in the client DHCP request. This option may be useful when a client can dual boot using different client identifiers but the same hardware (MAC) address. Note that the resulting server behavior violates the official DHCP specification.
+        mac_allow: MAC addresses this DHCP server is allowed to provide leases for.
+        mac_deny: MAC addresses this DHCP server is not allowed to provide leases for.
+        maxleasetime: The maximum DHCP lease validity period (in seconds) a client can request.
+        ntpserver: The NTP servers to provide via DHCP.
+        range_from: The starting IP address for this address pool. This address must be less than or equal to the `range_to` field.
+        range_to: The ending IP address for the this address pool. This address must be greater than or equal to the `range_to` field.
+        winsserver: The WINS servers to provide via DHCP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dhcp_server/address_pool. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if defaultleasetime is not None:
+            body["defaultleasetime"] = defaultleasetime
+        if denyunknown is not None:
+            body["denyunknown"] = denyunknown
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        if domain is not None:
+            body["domain"] = domain
+        if domainsearchlist is not None:
+            body["domainsearchlist"] = domainsearchlist
+        if gateway is not None:
+            body["gateway"] = gateway
+        if ignorebootp is not None:
+            body["ignorebootp"] = ignorebootp
+        if ignoreclientuids is not None:
+            body["ignoreclientuids"] = ignoreclientuids
+        if mac_allow is not None:
+            body["mac_allow"] = mac_allow
+        if mac_deny is not None:
+            body["mac_deny"] = mac_deny
+        if maxleasetime is not None:
+            body["maxleasetime"] = maxleasetime
+        if ntpserver is not None:
+            body["ntpserver"] = ntpserver
+        if range_from is not None:
+            body["range_from"] = range_from
+        if range_to is not None:
+            body["range_to"] = range_to
+        if winsserver is not None:
+            body["winsserver"] = winsserver
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dhcp_server/address_pool",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server_address_pool(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server/address_pool
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server/address_pool. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server/address_pool",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server_address_pools(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server/address_pools
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server/address_pools. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server/address_pools",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_services_dhcp_server_apply(
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dhcp_server/apply
+
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dhcp_server/apply. "
+                "Set confirm=True to execute."
+            )
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dhcp_server/apply",
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dhcp_server_backend(
+        confirm: bool = False,
+        dhcpbackend: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dhcp_server/backend
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        dhcpbackend: The backend DHCP server service to use. ISC DHCP is deprecate and will be removed in a future version of pfSense. Valid values: ['isc', 'kea']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dhcp_server/backend. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if dhcpbackend is not None:
+            body["dhcpbackend"] = dhcpbackend
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dhcp_server/backend",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dhcp_server_custom_option(
+        number: int,
+        parent_id: str | int,
+        type_: str,
+        value: str,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dhcp_server/custom_option
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        number: The DHCP option number to configure.
+        parent_id: The ID of the parent this object is nested under.
+        type_: The type of value to configure for the option. Valid values: ['text', 'string', 'boolean', 'unsigned integer 8', 'unsigned integer 16', 'unsigned integer 32', 'signed integer 8', 'signed integer 16', 'signed integer 32', 'ip-address']
+        value: The value to configure for the option.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dhcp_server/custom_option. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if number is not None:
+            body["number"] = number
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if type_ is not None:
+            body["type"] = type_
+        if value is not None:
+            body["value"] = value
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dhcp_server/custom_option",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dhcp_server_custom_option(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        number: int | None = None,
+        type_: str | None = None,
+        value: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dhcp_server/custom_option
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        number: The DHCP option number to configure.
+        type_: The type of value to configure for the option. Valid values: ['text', 'string', 'boolean', 'unsigned integer 8', 'unsigned integer 16', 'unsigned integer 32', 'signed integer 8', 'signed integer 16', 'signed integer 32', 'ip-address']
+        value: The value to configure for the option.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dhcp_server/custom_option. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if number is not None:
+            body["number"] = number
+        if type_ is not None:
+            body["type"] = type_
+        if value is not None:
+            body["value"] = value
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dhcp_server/custom_option",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server_custom_option(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server/custom_option
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server/custom_option. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server/custom_option",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server_custom_options(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server/custom_options
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server/custom_options. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server/custom_options",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dhcp_server(
+        interface: str,
+        confirm: bool = False,
+        defaultleasetime: int | None = 7200,
+        denyunknown: str | None = None,
+        dhcpleaseinlocaltime: bool | None = None,
+        disablepingcheck: bool | None = None,
+        dnsserver: list[str] | None = None,
+        domain: str | None = None,
+        domainsearchlist: list[str] | None = None,
+        enable: bool | None = None,
+        failover_peerip: str | None = None,
+        gateway: str | None = None,
+        ignorebootp: bool | None = None,
+        ignoreclientuids: bool | None = None,
+        mac_allow: list[str] | None = None,
+        mac_deny: list[str] | None = None,
+        maxleasetime: int | None = 86400,
+        nonak: bool | None = None,
+        ntpserver: list[str] | None = None,
+        numberoptions: list[dict[str, Any]] | None = None,
+        pool: list[dict[str, Any]] | None = None,
+        range_from: str | None = None,
+        range_to: str | None = None,
+        staticarp: bool | None = None,
+        staticmap: list[dict[str, Any]] | None = None,
+        statsgraph: bool | None = None,
+        winsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dhcp_server
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        interface: The interface to configure the DHCP server for. This field is only necessary when you wantto change the interface (ID) of an existing DHCP server, or you are replacing all DHCP server objects with a new configuration. Note that specifying an interface in this field will update the ID of the DHCP server to match the interface specified here. Leaving this field empty will retain the existing interface.
+        defaultleasetime: The default DHCP lease validity period (in seconds). This is used for clients that do not ask for a specific expiration time.
+        denyunknown: Define how to handle unknown clients requesting DHCP leases. When set to `null`, any DHCP client will get an IP address within this scope/range on this interface. If set to `enabled`, any DHCP client with a MAC address listed in a static mapping on any scope(s)/interface(s) will get an IP address. If set to `class`, only MAC addresses listed in static mappings on this interface will get an IP address within this scope/range. Valid values: ['enabled', 'class']
+        dhcpleaseinlocaltime: Display the DHCP lease times in local time instead of UTC.
+        disablepingcheck: Prevent the DHCP server from sending a ping to the address being assigned, where if no response has been heard, it assigns the address.
+        dnsserver: The DNS servers to provide via DHCP. Leave empty to default to system nameservers.
+        domain: The domain to be assigned via DHCP.
+        domainsearchlist: The domain search list to provide via DHCP.
+        enable: Enable the DHCP server for this interface.
+        failover_peerip: The interface IP address of the other firewall (failover peer) in this subnet. Leave empty to disable failover peering.
+        gateway: The gateway IPv4 address to provide via DHCP. This is only necessary if you are not using the interface's IP as the gateway. Specify `none` for no gateway assignment.
+        ignorebootp: Force this DHCP server to ignore BOOTP queries.
+        ignoreclientuids: Prevent recording a unique identifier (UID) in client lease data if present in the client DHCP request. This option may be useful when a client can dual boot using different client identifiers but the same hardware (MAC) address. Note that the resulting server behavior violates the official DHCP specification.
+        mac_allow: MAC addresses this DHCP server is allowed to provide leases for.
+        mac_deny: MAC addresses this DHCP server is not allowed to provide leases for.
+        maxleasetime: The maximum DHCP lease validity period (in seconds) a client can request.
+        nonak: Ignore denied clients rather than reject. This option is not compatible with failover and cannot be enabled when a Failover Peer IP address is configured.
+        ntpserver: The NTP servers to provide via DHCP.
+        numberoptions: The custom DHCP options to apply to this DHCP server. Each object accepts: - number (integer) - type (string) - value (string)
+        pool: Additional address pools applied to this DHCP server. Each object accepts: - range_from (string) - range_to (string) - domain (string) - mac_allow (array) - mac_deny (array) - domainsearchlist (array) - defaultleasetime (integer) - maxleasetime (integer) - gateway (string) - dnsserver (array) - winsserver (array) - ntpserver (array) ... and 3 more fields
+        range_from: The starting IP address for the primary DHCP pool. This address must be less than or equal to the `range_to` field.
+        range_to: The ending IP address for the primary DHCP pool. This address must be greater than or equal to the `range_to` field.
+        staticarp: Assign static ARP entries for DHCP leases provided by this server.
+        staticmap: Static mappings applied to this DHCP server. Each object accepts: - mac (string) - ipaddr (string) - cid (string) - hostname (string) - domain (string) - domainsearchlist (array) - defaultleasetime (integer) - maxleasetime (integer) - gateway (string) - dnsserver (array) - winsserver (array) - ntpserver (array) ... and 2 more fields
+        statsgraph: Enable adding DHCP lease statistics to the pfSense Monitoring graphs.
+        winsserver: The WINS servers to provide via DHCP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dhcp_server. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if interface is not None:
+            body["interface"] = interface
+        if defaultleasetime is not None:
+            body["defaultleasetime"] = defaultleasetime
+        if denyunknown is not None:
+            body["denyunknown"] = denyunknown
+        if dhcpleaseinlocaltime is not None:
+            body["dhcpleaseinlocaltime"] = dhcpleaseinlocaltime
+        if disablepingcheck is not None:
+            body["disablepingcheck"] = disablepingcheck
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        if domain is not None:
+            body["domain"] = domain
+        if domainsearchlist is not None:
+            body["domainsearchlist"] = domainsearchlist
+        if enable is not None:
+            body["enable"] = enable
+        if failover_peerip is not None:
+            body["failover_peerip"] = failover_peerip
+        if gateway is not None:
+            body["gateway"] = gateway
+        if ignorebootp is not None:
+            body["ignorebootp"] = ignorebootp
+        if ignoreclientuids is not None:
+            body["ignoreclientuids"] = ignoreclientuids
+        if mac_allow is not None:
+            body["mac_allow"] = mac_allow
+        if mac_deny is not None:
+            body["mac_deny"] = mac_deny
+        if maxleasetime is not None:
+            body["maxleasetime"] = maxleasetime
+        if nonak is not None:
+            body["nonak"] = nonak
+        if ntpserver is not None:
+            body["ntpserver"] = ntpserver
+        if numberoptions is not None:
+            body["numberoptions"] = numberoptions
+        if pool is not None:
+            body["pool"] = pool
+        if range_from is not None:
+            body["range_from"] = range_from
+        if range_to is not None:
+            body["range_to"] = range_to
+        if staticarp is not None:
+            body["staticarp"] = staticarp
+        if staticmap is not None:
+            body["staticmap"] = staticmap
+        if statsgraph is not None:
+            body["statsgraph"] = statsgraph
+        if winsserver is not None:
+            body["winsserver"] = winsserver
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dhcp_server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dhcp_server(
+        id: str | int,
+        confirm: bool = False,
+        defaultleasetime: int | None = None,
+        denyunknown: str | None = None,
+        dhcpleaseinlocaltime: bool | None = None,
+        disablepingcheck: bool | None = None,
+        dnsserver: list[str] | None = None,
+        domain: str | None = None,
+        domainsearchlist: list[str] | None = None,
+        enable: bool | None = None,
+        failover_peerip: str | None = None,
+        gateway: str | None = None,
+        ignorebootp: bool | None = None,
+        ignoreclientuids: bool | None = None,
+        interface: str | None = None,
+        mac_allow: list[str] | None = None,
+        mac_deny: list[str] | None = None,
+        maxleasetime: int | None = None,
+        nonak: bool | None = None,
+        ntpserver: list[str] | None = None,
+        numberoptions: list[dict[str, Any]] | None = None,
+        pool: list[dict[str, Any]] | None = None,
+        range_from: str | None = None,
+        range_to: str | None = None,
+        staticarp: bool | None = None,
+        staticmap: list[dict[str, Any]] | None = None,
+        statsgraph: bool | None = None,
+        winsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dhcp_server
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        defaultleasetime: The default DHCP lease validity period (in seconds). This is used for clients that do not ask for a specific expiration time.
+        denyunknown: Define how to handle unknown clients requesting DHCP leases. When set to `null`, any DHCP client will get an IP address within this scope/range on this interface. If set to `enabled`, any DHCP client with a MAC address listed in a static mapping on any scope(s)/interface(s) will get an IP address. If set to `class`, only MAC addresses listed in static mappings on this interface will get an IP address within this scope/range. Valid values: ['enabled', 'class']
+        dhcpleaseinlocaltime: Display the DHCP lease times in local time instead of UTC.
+        disablepingcheck: Prevent the DHCP server from sending a ping to the address being assigned, where if no response has been heard, it assigns the address.
+        dnsserver: The DNS servers to provide via DHCP. Leave empty to default to system nameservers.
+        domain: The domain to be assigned via DHCP.
+        domainsearchlist: The domain search list to provide via DHCP.
+        enable: Enable the DHCP server for this interface.
+        failover_peerip: The interface IP address of the other firewall (failover peer) in this subnet. Leave empty to disable failover peering.
+        gateway: The gateway IPv4 address to provide via DHCP. This is only necessary if you are not using the interface's IP as the gateway. Specify `none` for no gateway assignment.
+        ignorebootp: Force this DHCP server to ignore BOOTP queries.
+        ignoreclientuids: Prevent recording a unique identifier (UID) in client lease data if present in the client DHCP request. This option may be useful when a client can dual boot using different client identifiers but the same hardware (MAC) address. Note that the resulting server behavior violates the official DHCP specification.
+        interface: The interface to configure the DHCP server for. This field is only necessary when you wantto change the interface (ID) of an existing DHCP server, or you are replacing all DHCP server objects with a new configuration. Note that specifying an interface in this field will update the ID of the DHCP server to match the interface specified here. Leaving this field empty will retain the existing interface.
+        mac_allow: MAC addresses this DHCP server is allowed to provide leases for.
+        mac_deny: MAC addresses this DHCP server is not allowed to provide leases for.
+        maxleasetime: The maximum DHCP lease validity period (in seconds) a client can request.
+        nonak: Ignore denied clients rather than reject. This option is not compatible with failover and cannot be enabled when a Failover Peer IP address is configured.
+        ntpserver: The NTP servers to provide via DHCP.
+        numberoptions: The custom DHCP options to apply to this DHCP server. Each object accepts: - number (integer) - type (string) - value (string)
+        pool: Additional address pools applied to this DHCP server. Each object accepts: - range_from (string) - range_to (string) - domain (string) - mac_allow (array) - mac_deny (array) - domainsearchlist (array) - defaultleasetime (integer) - maxleasetime (integer) - gateway (string) - dnsserver (array) - winsserver (array) - ntpserver (array) ... and 3 more fields
+        range_from: The starting IP address for the primary DHCP pool. This address must be less than or equal to the `range_to` field.
+        range_to: The ending IP address for the primary DHCP pool. This address must be greater than or equal to the `range_to` field.
+        staticarp: Assign static ARP entries for DHCP leases provided by this server.
+        staticmap: Static mappings applied to this DHCP server. Each object accepts: - mac (string) - ipaddr (string) - cid (string) - hostname (string) - domain (string) - domainsearchlist (array) - defaultleasetime (integer) - maxleasetime (integer) - gateway (string) - dnsserver (array) - winsserver (array) - ntpserver (array) ... and 2 more fields
+        statsgraph: Enable adding DHCP lease statistics to the pfSense Monitoring graphs.
+        winsserver: The WINS servers to provide via DHCP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dhcp_server. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if defaultleasetime is not None:
+            body["defaultleasetime"] = defaultleasetime
+        if denyunknown is not None:
+            body["denyunknown"] = denyunknown
+        if dhcpleaseinlocaltime is not None:
+            body["dhcpleaseinlocaltime"] = dhcpleaseinlocaltime
+        if disablepingcheck is not None:
+            body["disablepingcheck"] = disablepingcheck
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        if domain is not None:
+            body["domain"] = domain
+        if domainsearchlist is not None:
+            body["domainsearchlist"] = domainsearchlist
+        if enable is not None:
+            body["enable"] = enable
+        if failover_peerip is not None:
+            body["failover_peerip"] = failover_peerip
+        if gateway is not None:
+            body["gateway"] = gateway
+        if ignorebootp is not None:
+            body["ignorebootp"] = ignorebootp
+        if ignoreclientuids is not None:
+            body["ignoreclientuids"] = ignoreclientuids
+        if interface is not None:
+            body["interface"] = interface
+        if mac_allow is not None:
+            body["mac_allow"] = mac_allow
+        if mac_deny is not None:
+            body["mac_deny"] = mac_deny
+        if maxleasetime is not None:
+            body["maxleasetime"] = maxleasetime
+        if nonak is not None:
+            body["nonak"] = nonak
+        if ntpserver is not None:
+            body["ntpserver"] = ntpserver
+        if numberoptions is not None:
+            body["numberoptions"] = numberoptions
+        if pool is not None:
+            body["pool"] = pool
+        if range_from is not None:
+            body["range_from"] = range_from
+        if range_to is not None:
+            body["range_to"] = range_to
+        if staticarp is not None:
+            body["staticarp"] = staticarp
+        if staticmap is not None:
+            body["staticmap"] = staticmap
+        if statsgraph is not None:
+            body["statsgraph"] = statsgraph
+        if winsserver is not None:
+            body["winsserver"] = winsserver
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dhcp_server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_dhcp_server_static_mapping(
+        mac: str,
+        parent_id: str | int,
+        confirm: bool = False,
+        arp_table_static_entry: bool | None = None,
+        cid: str | None = None,
+        defaultleasetime: int | None = 7200,
+        descr: str | None = None,
+        dnsserver: list[str] | None = None,
+        domain: str | None = None,
+        domainsearchlist: list[str] | None = None,
+        gateway: str | None = None,
+        hostname: str | None = None,
+        ipaddr: str | None = None,
+        maxleasetime: int | None = 86400,
+        ntpserver: list[str] | None = None,
+        winsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/dhcp_server/static_mapping
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        mac: The MAC address of the client this mapping is for.
+        parent_id: The ID of the parent this object is nested under.
+        arp_table_static_entry: Assign a static ARP entry for this static mapping.
+        cid: The client identifier of the client this mapping is for.
+        defaultleasetime: The default DHCP lease validity period (in seconds). This is used for clients that do not ask for a specific expiration time.
+        descr: The description of this static mapping.
+        dnsserver: The DNS servers to provide via DHCP. Leave empty to default to system nameservers.
+        domain: The domain to be assigned via DHCP.
+        domainsearchlist: The domain search list to provide via DHCP.
+        gateway: The gateway IPv4 address to provide via DHCP. This is only necessary if you are not using the interface's IP as the gateway. Specify `none` for no gateway assignment.
+        hostname: The hostname to assign this client via DHCP.
+        ipaddr: The IP address to assign this client via DHCP.
+        maxleasetime: The maximum DHCP lease validity period (in seconds) this client can request.
+        ntpserver: The NTP servers to provide via DHCP.
+        winsserver: The WINS servers to provide via DHCP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/dhcp_server/static_mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if mac is not None:
+            body["mac"] = mac
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if arp_table_static_entry is not None:
+            body["arp_table_static_entry"] = arp_table_static_entry
+        if cid is not None:
+            body["cid"] = cid
+        if defaultleasetime is not None:
+            body["defaultleasetime"] = defaultleasetime
+        if descr is not None:
+            body["descr"] = descr
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        if domain is not None:
+            body["domain"] = domain
+        if domainsearchlist is not None:
+            body["domainsearchlist"] = domainsearchlist
+        if gateway is not None:
+            body["gateway"] = gateway
+        if hostname is not None:
+            body["hostname"] = hostname
+        if ipaddr is not None:
+            body["ipaddr"] = ipaddr
+        if maxleasetime is not None:
+            body["maxleasetime"] = maxleasetime
+        if ntpserver is not None:
+            body["ntpserver"] = ntpserver
+        if winsserver is not None:
+            body["winsserver"] = winsserver
+        return await _client.request(
+            "POST",
+            "/api/v2/services/dhcp_server/static_mapping",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_dhcp_server_static_mapping(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        arp_table_static_entry: bool | None = None,
+        cid: str | None = None,
+        defaultleasetime: int | None = None,
+        descr: str | None = None,
+        dnsserver: list[str] | None = None,
+        domain: str | None = None,
+        domainsearchlist: list[str] | None = None,
+        gateway: str | None = None,
+        hostname: str | None = None,
+        ipaddr: str | None = None,
+        mac: str | None = None,
+        maxleasetime: int | None = None,
+        ntpserver: list[str] | None = None,
+        winsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/dhcp_server/static_mapping
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        arp_table_static_entry: Assign a static ARP entry for this static mapping.
+        cid: The client identifier of the client this mapping is for.
+        defaultleasetime: The default DHCP lease validity period (in seconds). This is used for clients that do not ask for a specific expiration time.
+        descr: The description of this static mapping.
+        dnsserver: The DNS servers to provide via DHCP. Leave empty to default to system nameservers.
+        domain: The domain to be assigned via DHCP.
+        domainsearchlist: The domain search list to provide via DHCP.
+        gateway: The gateway IPv4 address to provide via DHCP. This is only necessary if you are not using the interface's IP as the gateway. Specify `none` for no gateway assignment.
+        hostname: The hostname to assign this client via DHCP.
+        ipaddr: The IP address to assign this client via DHCP.
+        mac: The MAC address of the client this mapping is for.
+        maxleasetime: The maximum DHCP lease validity period (in seconds) this client can request.
+        ntpserver: The NTP servers to provide via DHCP.
+        winsserver: The WINS servers to provide via DHCP.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/dhcp_server/static_mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if arp_table_static_entry is not None:
+            body["arp_table_static_entry"] = arp_table_static_entry
+        if cid is not None:
+            body["cid"] = cid
+        if defaultleasetime is not None:
+            body["defaultleasetime"] = defaultleasetime
+        if descr is not None:
+            body["descr"] = descr
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        if domain is not None:
+            body["domain"] = domain
+        if domainsearchlist is not None:
+            body["domainsearchlist"] = domainsearchlist
+        if gateway is not None:
+            body["gateway"] = gateway
+        if hostname is not None:
+            body["hostname"] = hostname
+        if ipaddr is not None:
+            body["ipaddr"] = ipaddr
+        if mac is not None:
+            body["mac"] = mac
+        if maxleasetime is not None:
+            body["maxleasetime"] = maxleasetime
+        if ntpserver is not None:
+            body["ntpserver"] = ntpserver
+        if winsserver is not None:
+            body["winsserver"] = winsserver
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/dhcp_server/static_mapping",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server_static_mapping(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server/static_mapping
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server/static_mapping. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server/static_mapping",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_dhcp_server_static_mappings(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/dhcp_server/static_mappings
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        Note: Call pfsense_services_dhcp_server_apply after this to apply changes.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/dhcp_server/static_mappings. "
+                "Set confirm=True to execute."
+                "\n\nNote: After this operation, call pfsense_services_dhcp_server_apply to apply changes."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/dhcp_server/static_mappings",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_dhcp_servers(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/dhcp_servers
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/dhcp_servers. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/dhcp_servers",
+            json_body=body,
+        )
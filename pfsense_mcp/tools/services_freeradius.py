@@ -0,0 +1,927 @@
+# Auto-generated pfSense MCP tools — module: services_freeradius
+# 21 tools: 6 read, 15 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "services_freeradius" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_free_radius_client(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/freeradius/client
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/freeradius/client",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_free_radius_clients(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/freeradius/clients
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: addr, description, id, ip_version, maxconn, msgauth, naslogin, naspassword, nastype, proto, secret, shortname
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "addr", "description", "id", "ip_version", "maxconn", "naslogin",
+            "naspassword", "nastype", "proto", "secret", "shortname",
+        })))
+    return await _list_paged(
+        "/api/v2/services/freeradius/clients",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_free_radius_interface(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/freeradius/interface
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/freeradius/interface",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_free_radius_interfaces(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/freeradius/interfaces
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: addr, description, id, ip_version, port, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "addr", "description", "id", "ip_version", "port", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/services/freeradius/interfaces",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_services_free_radius_user(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/freeradius/user
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/services/freeradius/user",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_services_free_radius_users(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/services/freeradius/users
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, framed_ip_address, framed_ip_netmask, id, motp_authmethod, motp_enable, motp_offset, motp_pin, motp_secret, password, password_encryption, username
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "framed_ip_address", "framed_ip_netmask", "id",
+            "motp_authmethod", "motp_offset", "motp_pin", "motp_secret", "password",
+            "password_encryption", "username",
+        })))
+    return await _list_paged(
+        "/api/v2/services/freeradius/users",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_free_radius_client(
+        addr: str,
+        secret: str,
+        shortname: str,
+        confirm: bool = False,
+        description: str | None = None,
+        ip_version: str | None = 'ipaddr',
+        maxconn: int | None = 16,
+        msgauth: bool | None = None,
+        naslogin: str | None = None,
+        naspassword: str | None = None,
+        nastype: str | None = 'other',
+        proto: str | None = 'udp',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/freeradius/client
+
+        addr: The IP address or network of the RADIUS client(s) in CIDR notation. This is the IP of the NAS (switch, access point, firewall, router, etc.)
+        secret: This is the shared secret (password) which the NAS (switch, accesspoint, etc.) needs to communicate with the RADIUS server.
+        shortname: A short name for the client. This is generally the hostname of the NAS.
+        description: The description for this interface.
+        ip_version: The IP version of the this Client. Valid values: ['ipaddr', 'ipv6addr']
+        maxconn: Takes only effect if you use TCP as protocol. Limits the number of simultaneous TCP connections from a client.
+        msgauth: RFC5080 requires Message-Authenticator in Access-Request. But older NAS (switches or accesspoints) do not include that.
+        naslogin: If supported by your NAS, you can use SNMP or finger for simultaneous-use checks instead of (s)radutmp file and accounting. Leave empty to choose (s)radutmp.
+        naspassword: If supported by your NAS, you can use SNMP or finger for simultaneous-use checks instead of (s)radutmp file and accounting. Leave empty to choose (s)radutmp.
+        nastype: The NAS type of the client. This is used by checkrad.pl for simultaneous use checks. Valid values: ['cisco', 'cvx', 'computone', 'digitro', 'livingston', 'juniper', 'max40xx', 'mikrotik', 'mikrotik_snmp', 'dot1x', 'other']
+        proto: The protocol the client uses. Valid values: ['udp', 'tcp']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/freeradius/client. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if addr is not None:
+            body["addr"] = addr
+        if secret is not None:
+            body["secret"] = secret
+        if shortname is not None:
+            body["shortname"] = shortname
+        if description is not None:
+            body["description"] = description
+        if ip_version is not None:
+            body["ip_version"] = ip_version
+        if maxconn is not None:
+            body["maxconn"] = maxconn
+        if msgauth is not None:
+            body["msgauth"] = msgauth
+        if naslogin is not None:
+            body["naslogin"] = naslogin
+        if naspassword is not None:
+            body["naspassword"] = naspassword
+        if nastype is not None:
+            body["nastype"] = nastype
+        if proto is not None:
+            body["proto"] = proto
+        return await _client.request(
+            "POST",
+            "/api/v2/services/freeradius/client",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_free_radius_client(
+        id: str | int,
+        confirm: bool = False,
+        addr: str | None = None,
+        description: str | None = None,
+        ip_version: str | None = None,
+        maxconn: int | None = None,
+        msgauth: bool | None = None,
+        naslogin: str | None = None,
+        naspassword: str | None = None,
+        nastype: str | None = None,
+        proto: str | None = None,
+        secret: str | None = None,
+        shortname: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/freeradius/client
+
+        id: The ID of the object or resource to interact with.
+        addr: The IP address or network of the RADIUS client(s) in CIDR notation. This is the IP of the NAS (switch, access point, firewall, router, etc.)
+        description: The description for this interface.
+        ip_version: The IP version of the this Client. Valid values: ['ipaddr', 'ipv6addr']
+        maxconn: Takes only effect if you use TCP as protocol. Limits the number of simultaneous TCP connections from a client.
+        msgauth: RFC5080 requires Message-Authenticator in Access-Request. But older NAS (switches or accesspoints) do not include that.
+        naslogin: If supported by your NAS, you can use SNMP or finger for simultaneous-use checks instead of (s)radutmp file and accounting. Leave empty to choose (s)radutmp.
+        naspassword: If supported by your NAS, you can use SNMP or finger for simultaneous-use checks instead of (s)radutmp file and accounting. Leave empty to choose (s)radutmp.
+        nastype: The NAS type of the client. This is used by checkrad.pl for simultaneous use checks. Valid values: ['cisco', 'cvx', 'computone', 'digitro', 'livingston', 'juniper', 'max40xx', 'mikrotik', 'mikrotik_snmp', 'dot1x', 'other']
+        proto: The protocol the client uses. Valid values: ['udp', 'tcp']
+        secret: This is the shared secret (password) which the NAS (switch, accesspoint, etc.) needs to communicate with the RADIUS server.
+        shortname: A short name for the client. This is generally the hostname of the NAS.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/freeradius/client. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if addr is not None:
+            body["addr"] = addr
+        if description is not None:
+            body["description"] = description
+        if ip_version is not None:
+            body["ip_version"] = ip_version
+        if maxconn is not None:
+            body["maxconn"] = maxconn
+        if msgauth is not None:
+            body["msgauth"] = msgauth
+        if naslogin is not None:
+            body["naslogin"] = naslogin
+        if naspassword is not None:
+            body["naspassword"] = naspassword
+        if nastype is not None:
+            body["nastype"] = nastype
+        if proto is not None:
+            body["proto"] = proto
+        if secret is not None:
+            body["secret"] = secret
+        if shortname is not None:
+            body["shortname"] = shortname
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/freeradius/client",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_free_radius_client(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/freeradius/client
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/freeradius/client. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/freeradius/client",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_free_radius_clients(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/freeradius/clients
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/freeradius/clients. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/freeradius/clients",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_free_radius_clients(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/freeradius/clients
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/freeradius/clients. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/freeradius/clients",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_free_radius_interface(
+        addr: str,
+        ip_version: str,
+        confirm: bool = False,
+        description: str | None = None,
+        port: str | None = '1812',
+        type_: str | None = 'auth',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/freeradius/interface
+
+        addr: The IP address of the listening interface. If you choose * then it means all interfaces.
+        ip_version: The IP version of the listening interface. Valid values: ['ipaddr', 'ipv6addr']
+        description: The description for this interface.
+        port: The port number of the listening interface. Different interface types need different ports. Valid options are: a TCP/UDP port number
+        type_: The type of the listening interface: Authentication/Accounting. Valid values: ['auth', 'acct', 'proxy', 'detail', 'status', 'coa']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/freeradius/interface. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if addr is not None:
+            body["addr"] = addr
+        if ip_version is not None:
+            body["ip_version"] = ip_version
+        if description is not None:
+            body["description"] = description
+        if port is not None:
+            body["port"] = port
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/services/freeradius/interface",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_free_radius_interface(
+        id: str | int,
+        confirm: bool = False,
+        addr: str | None = None,
+        description: str | None = None,
+        ip_version: str | None = None,
+        port: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/freeradius/interface
+
+        id: The ID of the object or resource to interact with.
+        addr: The IP address of the listening interface. If you choose * then it means all interfaces.
+        description: The description for this interface.
+        ip_version: The IP version of the listening interface. Valid values: ['ipaddr', 'ipv6addr']
+        port: The port number of the listening interface. Different interface types need different ports. Valid options are: a TCP/UDP port number
+        type_: The type of the listening interface: Authentication/Accounting. Valid values: ['auth', 'acct', 'proxy', 'detail', 'status', 'coa']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/freeradius/interface. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if addr is not None:
+            body["addr"] = addr
+        if description is not None:
+            body["description"] = description
+        if ip_version is not None:
+            body["ip_version"] = ip_version
+        if port is not None:
+            body["port"] = port
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/freeradius/interface",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_free_radius_interface(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/freeradius/interface
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/freeradius/interface. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/freeradius/interface",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_free_radius_interfaces(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/freeradius/interfaces
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/freeradius/interfaces. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/freeradius/interfaces",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_free_radius_interfaces(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/freeradius/interfaces
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/freeradius/interfaces. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/freeradius/interfaces",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_services_free_radius_user(
+        username: str,
+        confirm: bool = False,
+        description: str | None = None,
+        framed_ip_address: str | None = None,
+        framed_ip_netmask: str | None = None,
+        motp_authmethod: str | None = None,
+        motp_enable: bool | None = None,
+        motp_offset: int | None = None,
+        motp_pin: str | None = None,
+        motp_secret: str | None = None,
+        password: str | None = None,
+        password_encryption: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/services/freeradius/user
+
+        username: The username for this user.
+        description: A description for this user.
+        framed_ip_address: Framed-IP-Address MUST be supported by NAS. If the OpenVPN server uses a subnet style Topology the RADIUS server MUST also send back an appropriate Framed-IP-Netmask value matching the VPN Tunnel Network.
+        framed_ip_netmask: Framed-IP-Netmask MUST be supported by NAS
+        motp_authmethod: The authentication method for the Mobile One-Time Password (MOTP).This field is only available when the following conditions are met:- `motp_enable` must be equal to `true` Valid values: ['motp', 'googleauth']
+        motp_enable: Enable or disable the use of Mobile One-Time Password (MOTP) for this user.
+        motp_offset: The timezone offset for this user.This field is only available when the following conditions are met:- `motp_enable` must be equal to `true`
+        motp_pin: The PIN for the Mobile One-Time Password (MOTP). It must be exactly 4 digits.This field is only available when the following conditions are met:- `motp_enable` must be equal to `true`
+        motp_secret: The secret for the Mobile One-Time Password (MOTP).This field is only available when the following conditions are met:- `motp_enable` must be equal to `true`
+        password: The password for this username.This field is only available when the following conditions are met:- `motp_enable` must be equal to `false`
+        password_encryption: The encryption method for the password.This field is only available when the following conditions are met:- `motp_enable` must be equal to `false` Valid values: ['Cleartext-Password', 'MD5-Password', 'MD5-Password-hashed', 'NT-Password-hashed']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/services/freeradius/user. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if username is not None:
+            body["username"] = username
+        if description is not None:
+            body["description"] = description
+        if framed_ip_address is not None:
+            body["framed_ip_address"] = framed_ip_address
+        if framed_ip_netmask is not None:
+            body["framed_ip_netmask"] = framed_ip_netmask
+        if motp_authmethod is not None:
+            body["motp_authmethod"] = motp_authmethod
+        if motp_enable is not None:
+            body["motp_enable"] = motp_enable
+        if motp_offset is not None:
+            body["motp_offset"] = motp_offset
+        if motp_pin is not None:
+            body["motp_pin"] = motp_pin
+        if motp_secret is not None:
+            body["motp_secret"] = motp_secret
+        if password is not None:
+            body["password"] = password
+        if password_encryption is not None:
+            body["password_encryption"] = password_encryption
+        return await _client.request(
+            "POST",
+            "/api/v2/services/freeradius/user",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_services_free_radius_user(
+        id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        framed_ip_address: str | None = None,
+        framed_ip_netmask: str | None = None,
+        motp_authmethod: str | None = None,
+        motp_enable: bool | None = None,
+        motp_offset: int | None = None,
+        motp_pin: str | None = None,
+        motp_secret: str | None = None,
+        password: str | None = None,
+        password_encryption: str | None = None,
+        username: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/services/freeradius/user
+
+        id: The ID of the object or resource to interact with.
+        description: A description for this user.
+        framed_ip_address: Framed-IP-Address MUST be supported by NAS. If the OpenVPN server uses a subnet style Topology the RADIUS server MUST also send back an appropriate Framed-IP-Netmask value matching the VPN Tunnel Network.
+        framed_ip_netmask: Framed-IP-Netmask MUST be supported by NAS
+        motp_authmethod: The authentication method for the Mobile One-Time Password (MOTP).This field is only available when the following conditions are met:- `motp_enable` must be equal to `true` Valid values: ['motp', 'googleauth']
+        motp_enable: Enable or disable the use of Mobile One-Time Password (MOTP) for this user.
+        motp_offset: The timezone offset for this user.This field is only available when the following conditions are met:- `motp_enable` must be equal to `true`
+        motp_pin: The PIN for the Mobile One-Time Password (MOTP). It must be exactly 4 digits.This field is only available when the following conditions are met:- `motp_enable` must be equal to `true`
+        motp_secret: The secret for the Mobile One-Time Password (MOTP).This field is only available when the following conditions are met:- `motp_enable` must be equal to `true`
+        password: The password for this username.This field is only available when the following conditions are met:- `motp_enable` must be equal to `false`
+        password_encryption: The encryption method for the password.This field is only available when the following conditions are met:- `motp_enable` must be equal to `false` Valid values: ['Cleartext-Password', 'MD5-Password', 'MD5-Password-hashed', 'NT-Password-hashed']
+        username: The username for this user.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/services/freeradius/user. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if description is not None:
+            body["description"] = description
+        if framed_ip_address is not None:
+            body["framed_ip_address"] = framed_ip_address
+        if framed_ip_netmask is not None:
+            body["framed_ip_netmask"] = framed_ip_netmask
+        if motp_authmethod is not None:
+            body["motp_authmethod"] = motp_authmethod
+        if motp_enable is not None:
+            body["motp_enable"] = motp_enable
+        if motp_offset is not None:
+            body["motp_offset"] = motp_offset
+        if motp_pin is not None:
+            body["motp_pin"] = motp_pin
+        if motp_secret is not None:
+            body["motp_secret"] = motp_secret
+        if password is not None:
+            body["password"] = password
+        if password_encryption is not None:
+            body["password_encryption"] = password_encryption
+        if username is not None:
+            body["username"] = username
+        return await _client.request(
+            "PATCH",
+            "/api/v2/services/freeradius/user",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_free_radius_user(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/freeradius/user
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/freeradius/user. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/freeradius/user",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_services_free_radius_users(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/services/freeradius/users
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/services/freeradius/users. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/services/freeradius/users",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_services_free_radius_users(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/services/freeradius/users
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/services/freeradius/users. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/services/freeradius/users",
+            params=params,
+        )
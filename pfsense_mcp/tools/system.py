@@ -0,0 +1,2758 @@
+# Auto-generated pfSense MCP tools — module: system
+# 67 tools: 23 read, 44 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "system" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_crl(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/crl
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/crl",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_crl_revoked_certificate(
+    id: str | int,
+    parent_id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/crl/revoked_certificate
+
+    id: The ID of the object to target.
+    parent_id: The ID of the parent this object is nested under.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    if parent_id is not None:
+        params["parent_id"] = parent_id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/crl/revoked_certificate",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_crls(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/crls
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: caref, cert, descr, id, lifetime, method, refid, serial, text
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "caref", "descr", "id", "lifetime", "method", "refid", "serial", "text",
+        })))
+    return await _list_paged(
+        "/api/v2/system/crls",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_certificate_authorities(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/certificate_authorities
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: crt, descr, id, prv, randomserial, refid, serial, trust
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "crt", "descr", "id", "prv", "refid", "serial",
+        })))
+    return await _list_paged(
+        "/api/v2/system/certificate_authorities",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_certificate_authority(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/certificate_authority
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/certificate_authority",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_certificate(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/certificate
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/certificate",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_certificates(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/certificates
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: caref, crt, csr, descr, id, prv, refid, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "caref", "crt", "csr", "descr", "id", "prv", "refid", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/system/certificates",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_console(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/console
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/console",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_dns(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/dns
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/dns",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_hostname(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/hostname
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/hostname",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_notifications_email_settings(
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/notifications/email_settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted}.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    result = await _client.request(
+        "GET",
+        "/api/v2/system/notifications/email_settings",
+        params=params,
+    )
+    return _filter_response(result, fields, query, compact, max_tokens)
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_package_available(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/package/available
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: deps, descr, id, installed, name (e.g. "pfSense-pkg-Cron"), shortname (e.g. "Cron"), version
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "name", "shortname", "version",
+        })))
+    return await _list_paged(
+        "/api/v2/system/package/available",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_package(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/package
+
+    id: The ID of the object to target. NOTE: The id is an integer array index (0, 1, 2, ...), not a package name string.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/package",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_packages(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/packages
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, id, installed_version, latest_version, name (e.g. "pfSense-pkg-Cron"), shortname (e.g. "Cron"), update_available
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "installed_version", "latest_version", "name", "shortname",
+        })))
+    return await _list_paged(
+        "/api/v2/system/packages",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_restapi_access_list(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/restapi/access_list
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, id, network, sched, type, users, weight
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "network", "sched", "type", "weight",
+        })))
+    return await _list_paged(
+        "/api/v2/system/restapi/access_list",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_restapi_access_list_entry(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/restapi/access_list/entry
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/restapi/access_list/entry",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_restapi_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/restapi/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/restapi/settings",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_restapi_version(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/restapi/version
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/restapi/version",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_timezone(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/timezone
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/timezone",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_tunable(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/tunable
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/system/tunable",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_system_tunables(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/tunables
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: descr, id, tunable, value
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "descr", "id", "tunable", "value",
+        })))
+    return await _list_paged(
+        "/api/v2/system/tunables",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_version(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/version
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/version",
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_system_web_gui_settings(
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/system/webgui/settings
+
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    return await _client.request(
+        "GET",
+        "/api/v2/system/webgui/settings",
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_crl(
+        caref: str,
+        descr: str,
+        method: str,
+        confirm: bool = False,
+        cert: list[dict[str, Any]] | None = None,
+        lifetime: int | None = None,
+        serial: int | None = None,
+        text: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/crl
+
+        caref: The unique ID of the CA that this CRL is associated with.
+        descr: The unique name/description for this CRL.
+        method: The method used to generate this CRL. Valid values: ['existing', 'internal']
+        cert: The list of revoked certificates in this CRL.This field is only available when the following conditions are met:- `method` must be equal to `'internal'` Each object accepts: - certref (string) - serial (string) - reason (integer) - revoke_time (integer) - caref (string) - descr (string) - type (string) - crt (string) - prv (string)
+        lifetime: The lifetime of this CRL in days.This field is only available when the following conditions are met:- `method` must be equal to `'internal'`
+        serial: The serial number of the CRL.This field is only available when the following conditions are met:- `method` must be equal to `'internal'`
+        text: The raw x509 CRL data.This field is only available when the following conditions are met:- `method` must be equal to `'existing'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/crl. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if caref is not None:
+            body["caref"] = caref
+        if descr is not None:
+            body["descr"] = descr
+        if method is not None:
+            body["method"] = method
+        if cert is not None:
+            body["cert"] = cert
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if serial is not None:
+            body["serial"] = serial
+        if text is not None:
+            body["text"] = text
+        return await _client.request(
+            "POST",
+            "/api/v2/system/crl",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_crl(
+        id: str | int,
+        confirm: bool = False,
+        caref: str | None = None,
+        cert: list[dict[str, Any]] | None = None,
+        descr: str | None = None,
+        lifetime: int | None = None,
+        method: str | None = None,
+        serial: int | None = None,
+        text: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/crl
+
+        id: The ID of the object or resource to interact with.
+        caref: The unique ID of the CA that this CRL is associated with.
+        cert: The list of revoked certificates in this CRL.This field is only available when the following conditions are met:- `method` must be equal to `'internal'` Each object accepts: - certref (string) - serial (string) - reason (integer) - revoke_time (integer) - caref (string) - descr (string) - type (string) - crt (string) - prv (string)
+        descr: The unique name/description for this CRL. WARNING: This field is read-only after creation — PATCH will return FIELD_VALUE_CHANGED_WHEN_NOT_EDITABLE if a different value is sent.
+        lifetime: The lifetime of this CRL in days.This field is only available when the following conditions are met:- `method` must be equal to `'internal'` WARNING: This field is read-only after creation — PATCH will return FIELD_VALUE_CHANGED_WHEN_NOT_EDITABLE if a different value is sent.
+        method: The method used to generate this CRL. Valid values: ['existing', 'internal']
+        serial: The serial number of the CRL.This field is only available when the following conditions are met:- `method` must be equal to `'internal'` WARNING: This field is read-only after creation — PATCH will return FIELD_VALUE_CHANGED_WHEN_NOT_EDITABLE if a different value is sent.
+        text: The raw x509 CRL data.This field is only available when the following conditions are met:- `method` must be equal to `'existing'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/crl. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if caref is not None:
+            body["caref"] = caref
+        if cert is not None:
+            body["cert"] = cert
+        if descr is not None:
+            body["descr"] = descr
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if method is not None:
+            body["method"] = method
+        if serial is not None:
+            body["serial"] = serial
+        if text is not None:
+            body["text"] = text
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/crl",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_crl(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/crl
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/crl. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/crl",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_crl_revoked_certificate(
+        parent_id: str | int,
+        revoke_time: int,
+        confirm: bool = False,
+        caref: str | None = None,
+        certref: str | None = None,
+        crt: str | None = None,
+        descr: str | None = None,
+        prv: str | None = None,
+        reason: int | None = None,
+        serial: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/crl/revoked_certificate
+
+        parent_id: The ID of the parent this object is nested under.
+        revoke_time: The unix timestamp of when the certificate was revoked.
+        caref: The unique ID of the CA that signed the revoked certificate.
+        certref: The reference ID of the certificate to be revokedThis field is only available when the following conditions are met:- `serial` must be equal to `NULL`
+        crt: The X509 certificate string.
+        descr: The unique name/description for this CRL.
+        prv: The X509 private key string.
+        reason: The CRL reason for revocation code. Valid values: [-1, 0, 1, 2, 3, 4, 5, 6, 9]
+        serial: The serial number of the certificate to be revoked.
+        type_: The type of the certificate to be revoked.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/crl/revoked_certificate. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if revoke_time is not None:
+            body["revoke_time"] = revoke_time
+        if caref is not None:
+            body["caref"] = caref
+        if certref is not None:
+            body["certref"] = certref
+        if crt is not None:
+            body["crt"] = crt
+        if descr is not None:
+            body["descr"] = descr
+        if prv is not None:
+            body["prv"] = prv
+        if reason is not None:
+            body["reason"] = reason
+        if serial is not None:
+            body["serial"] = serial
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/system/crl/revoked_certificate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_crl_revoked_certificate(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        caref: str | None = None,
+        certref: str | None = None,
+        crt: str | None = None,
+        descr: str | None = None,
+        prv: str | None = None,
+        reason: int | None = None,
+        revoke_time: int | None = None,
+        serial: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/crl/revoked_certificate
+
+        id: The ID of the object or resource to interact with.
+        parent_id: The ID of the parent this object is nested under.
+        caref: The unique ID of the CA that signed the revoked certificate.
+        certref: The reference ID of the certificate to be revokedThis field is only available when the following conditions are met:- `serial` must be equal to `NULL`
+        crt: The X509 certificate string.
+        descr: The unique name/description for this CRL.
+        prv: The X509 private key string.
+        reason: The CRL reason for revocation code. Valid values: [-1, 0, 1, 2, 3, 4, 5, 6, 9]
+        revoke_time: The unix timestamp of when the certificate was revoked.
+        serial: The serial number of the certificate to be revoked.
+        type_: The type of the certificate to be revoked.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/crl/revoked_certificate. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if parent_id is not None:
+            body["parent_id"] = parent_id
+        if caref is not None:
+            body["caref"] = caref
+        if certref is not None:
+            body["certref"] = certref
+        if crt is not None:
+            body["crt"] = crt
+        if descr is not None:
+            body["descr"] = descr
+        if prv is not None:
+            body["prv"] = prv
+        if reason is not None:
+            body["reason"] = reason
+        if revoke_time is not None:
+            body["revoke_time"] = revoke_time
+        if serial is not None:
+            body["serial"] = serial
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/crl/revoked_certificate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_crl_revoked_certificate(
+        id: str | int,
+        parent_id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/crl/revoked_certificate
+
+        id: The ID of the object to target.
+        parent_id: The ID of the parent this object is nested under.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/crl/revoked_certificate. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if parent_id is not None:
+            params["parent_id"] = parent_id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/crl/revoked_certificate",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_crls(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/crls
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/crls. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/crls",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_certificate_authorities(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/certificate_authorities
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/certificate_authorities. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/certificate_authorities",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_authority(
+        crt: str,
+        descr: str,
+        confirm: bool = False,
+        prv: str | None = None,
+        randomserial: bool | None = None,
+        serial: int | None = 1,
+        trust: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate_authority
+
+        crt: The X509 certificate string.
+        descr: The descriptive name for this certificate authority.
+        prv: The X509 private key string.
+        randomserial: Enables or disables the randomization of serial numbers for certificates signed by this CA.
+        serial: The decimal number to be used as a sequential serial number for the next certificate to be signed by this CA. This value is ignored when Randomize Serial is checked.
+        trust: Adds or removes this certificate authority from the operating system's trust stored.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate_authority. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if crt is not None:
+            body["crt"] = crt
+        if descr is not None:
+            body["descr"] = descr
+        if prv is not None:
+            body["prv"] = prv
+        if randomserial is not None:
+            body["randomserial"] = randomserial
+        if serial is not None:
+            body["serial"] = serial
+        if trust is not None:
+            body["trust"] = trust
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate_authority",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_certificate_authority(
+        id: str | int,
+        confirm: bool = False,
+        crt: str | None = None,
+        descr: str | None = None,
+        prv: str | None = None,
+        randomserial: bool | None = None,
+        serial: int | None = None,
+        trust: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/certificate_authority
+
+        id: The ID of the object or resource to interact with.
+        crt: The X509 certificate string.
+        descr: The descriptive name for this certificate authority.
+        prv: The X509 private key string.
+        randomserial: Enables or disables the randomization of serial numbers for certificates signed by this CA.
+        serial: The decimal number to be used as a sequential serial number for the next certificate to be signed by this CA. This value is ignored when Randomize Serial is checked.
+        trust: Adds or removes this certificate authority from the operating system's trust stored.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/certificate_authority. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if crt is not None:
+            body["crt"] = crt
+        if descr is not None:
+            body["descr"] = descr
+        if prv is not None:
+            body["prv"] = prv
+        if randomserial is not None:
+            body["randomserial"] = randomserial
+        if serial is not None:
+            body["serial"] = serial
+        if trust is not None:
+            body["trust"] = trust
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/certificate_authority",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_certificate_authority(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/certificate_authority
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/certificate_authority. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/certificate_authority",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_authority_generate(
+        descr: str,
+        digest_alg: str,
+        keytype: str,
+        confirm: bool = False,
+        caref: str | None = None,
+        dn_city: str | None = None,
+        dn_commonname: str | None = 'internal-ca',
+        dn_country: str | None = None,
+        dn_organization: str | None = None,
+        dn_organizationalunit: str | None = None,
+        dn_state: str | None = None,
+        ecname: str | None = None,
+        is_intermediate: bool | None = None,
+        keylen: int | None = None,
+        lifetime: int | None = 3650,
+        randomserial: bool | None = None,
+        trust: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate_authority/generate
+
+        descr: The descriptive name for this certificate authority.
+        digest_alg: The digest algorithm to use when signing certificates.
+        keytype: The type of key pair to generate. Valid values: ['RSA', 'ECDSA']
+        caref: The certificate authority to use as the parent for this intermediate certificate authority.This field is only available when the following conditions are met:- `is_intermediate` must be equal to `true`
+        dn_city: The city for the certificate authority.
+        dn_commonname: The common name for the certificate authority.
+        dn_country: The country for the certificate authority.
+        dn_organization: The organization for the certificate authority.
+        dn_organizationalunit: The organizational unit for the certificate authority.
+        dn_state: The state for the certificate authority.
+        ecname: The name of the elliptic curve to use for the ECDSA key pair.This field is only available when the following conditions are met:- `keytype` must be equal to `'ECDSA'`
+        is_intermediate: Indicates if this certificate authority is an intermediate certificate authority.
+        keylen: The length of the RSA key pair to generate.This field is only available when the following conditions are met:- `keytype` must be equal to `'RSA'` Valid values: [1024, 2048, 3072, 4096, 6144, 7680, 8192, 15360, 16384]
+        lifetime: The number of days the certificate authority is valid for.
+        randomserial: Enables or disables the randomization of serial numbers for certificates signed by this CA.
+        trust: Adds or removes this certificate authority from the operating system's trust stored.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate_authority/generate. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if descr is not None:
+            body["descr"] = descr
+        if digest_alg is not None:
+            body["digest_alg"] = digest_alg
+        if keytype is not None:
+            body["keytype"] = keytype
+        if caref is not None:
+            body["caref"] = caref
+        if dn_city is not None:
+            body["dn_city"] = dn_city
+        if dn_commonname is not None:
+            body["dn_commonname"] = dn_commonname
+        if dn_country is not None:
+            body["dn_country"] = dn_country
+        if dn_organization is not None:
+            body["dn_organization"] = dn_organization
+        if dn_organizationalunit is not None:
+            body["dn_organizationalunit"] = dn_organizationalunit
+        if dn_state is not None:
+            body["dn_state"] = dn_state
+        if ecname is not None:
+            body["ecname"] = ecname
+        if is_intermediate is not None:
+            body["is_intermediate"] = is_intermediate
+        if keylen is not None:
+            body["keylen"] = keylen
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if randomserial is not None:
+            body["randomserial"] = randomserial
+        if trust is not None:
+            body["trust"] = trust
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate_authority/generate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_authority_renew(
+        caref: str,
+        confirm: bool = False,
+        reusekey: bool | None = True,
+        reuseserial: bool | None = True,
+        strictsecurity: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate_authority/renew
+
+        caref: The Certificate Authority to renew.
+        reusekey: Reuses the existing private key when renewing the certificate authority.
+        reuseserial: Reuses the existing serial number when renewing the certificate authority.
+        strictsecurity: Enforces strict security measures when renewing the certificate authority.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate_authority/renew. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if caref is not None:
+            body["caref"] = caref
+        if reusekey is not None:
+            body["reusekey"] = reusekey
+        if reuseserial is not None:
+            body["reuseserial"] = reuseserial
+        if strictsecurity is not None:
+            body["strictsecurity"] = strictsecurity
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate_authority/renew",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate(
+        crt: str,
+        descr: str,
+        prv: str,
+        confirm: bool = False,
+        type_: str | None = 'server',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate
+
+        crt: The X509 certificate string.
+        descr: The descriptive name for this certificate.
+        prv: The X509 private key string.
+        type_: The certificate type. Use `server` when this certificate is to be used by one or more services on this system. Use `user` when this certificate is intended to be assigned to a user for authentication purposes. Valid values: ['server', 'user']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if crt is not None:
+            body["crt"] = crt
+        if descr is not None:
+            body["descr"] = descr
+        if prv is not None:
+            body["prv"] = prv
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_certificate(
+        id: str | int,
+        confirm: bool = False,
+        crt: str | None = None,
+        descr: str | None = None,
+        prv: str | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/certificate
+
+        id: The ID of the object or resource to interact with.
+        crt: The X509 certificate string.
+        descr: The descriptive name for this certificate.
+        prv: The X509 private key string.
+        type_: The certificate type. Use `server` when this certificate is to be used by one or more services on this system. Use `user` when this certificate is intended to be assigned to a user for authentication purposes. Valid values: ['server', 'user']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/certificate. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if crt is not None:
+            body["crt"] = crt
+        if descr is not None:
+            body["descr"] = descr
+        if prv is not None:
+            body["prv"] = prv
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/certificate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_certificate(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/certificate
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/certificate. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/certificate",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_generate(
+        caref: str,
+        descr: str,
+        digest_alg: str,
+        dn_commonname: str,
+        keytype: str,
+        confirm: bool = False,
+        dn_city: str | None = None,
+        dn_country: str | None = None,
+        dn_dns_sans: list[str] | None = None,
+        dn_email_sans: list[str] | None = None,
+        dn_ip_sans: list[str] | None = None,
+        dn_organization: str | None = None,
+        dn_organizationalunit: str | None = None,
+        dn_state: str | None = None,
+        dn_uri_sans: list[str] | None = None,
+        ecname: str | None = None,
+        keylen: int | None = None,
+        lifetime: int | None = 3650,
+        prv: str | None = None,
+        type_: str | None = 'user',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate/generate
+
+        caref: The certificate authority to use as the parent for this certificate.
+        descr: The descriptive name for this certificate.
+        digest_alg: The digest method used when the certificate is signed.
+        dn_commonname: The common name of the certificate.
+        keytype: The type of key pair to generate. Valid values: ['RSA', 'ECDSA']
+        dn_city: The city of the certificate.
+        dn_country: The country of the certificate.
+        dn_dns_sans: The DNS Subject Alternative Names (SANs) for the certificate.
+        dn_email_sans: The Email Subject Alternative Names (SANs) for the certificate.
+        dn_ip_sans: The IP Subject Alternative Names (SANs) for the certificate.
+        dn_organization: The organization of the certificate.
+        dn_organizationalunit: The organizational unit of the certificate.
+        dn_state: The state/province of the certificate.
+        dn_uri_sans: The URI Subject Alternative Names (SANs) for the certificate.
+        ecname: The name of the elliptic curve to use for the ECDSA key pair.This field is only available when the following conditions are met:- `keytype` must be equal to `'ECDSA'`
+        keylen: The length of the RSA key pair to generate.This field is only available when the following conditions are met:- `keytype` must be equal to `'RSA'` Valid values: [1024, 2048, 3072, 4096, 6144, 7680, 8192, 15360, 16384]
+        lifetime: The number of days the certificate is valid for.
+        prv: The X509 private key string.
+        type_: The type of certificate to generate. Valid values: ['server', 'user']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate/generate. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if caref is not None:
+            body["caref"] = caref
+        if descr is not None:
+            body["descr"] = descr
+        if digest_alg is not None:
+            body["digest_alg"] = digest_alg
+        if dn_commonname is not None:
+            body["dn_commonname"] = dn_commonname
+        if keytype is not None:
+            body["keytype"] = keytype
+        if dn_city is not None:
+            body["dn_city"] = dn_city
+        if dn_country is not None:
+            body["dn_country"] = dn_country
+        if dn_dns_sans is not None:
+            body["dn_dns_sans"] = dn_dns_sans
+        if dn_email_sans is not None:
+            body["dn_email_sans"] = dn_email_sans
+        if dn_ip_sans is not None:
+            body["dn_ip_sans"] = dn_ip_sans
+        if dn_organization is not None:
+            body["dn_organization"] = dn_organization
+        if dn_organizationalunit is not None:
+            body["dn_organizationalunit"] = dn_organizationalunit
+        if dn_state is not None:
+            body["dn_state"] = dn_state
+        if dn_uri_sans is not None:
+            body["dn_uri_sans"] = dn_uri_sans
+        if ecname is not None:
+            body["ecname"] = ecname
+        if keylen is not None:
+            body["keylen"] = keylen
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if prv is not None:
+            body["prv"] = prv
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate/generate",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_pkcs12_export(
+        certref: str,
+        confirm: bool = False,
+        encryption: str | None = 'high',
+        passphrase: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate/pkcs12/export
+
+        certref: The Certificate to export as a PKCS12 file.
+        encryption: The level of encryption to use when exporting the PKCS#12 archive. Valid values: ['high', 'low', 'legacy']
+        passphrase: The passphrase to use when exporting the PKCS#12 archive. Leave empty for no passphrase.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate/pkcs12/export. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if certref is not None:
+            body["certref"] = certref
+        if encryption is not None:
+            body["encryption"] = encryption
+        if passphrase is not None:
+            body["passphrase"] = passphrase
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate/pkcs12/export",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_renew(
+        certref: str,
+        confirm: bool = False,
+        reusekey: bool | None = True,
+        reuseserial: bool | None = True,
+        strictsecurity: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate/renew
+
+        certref: The `refid` of the Certificate to renew.
+        reusekey: Reuses the existing private key when renewing the certificate.
+        reuseserial: Reuses the existing serial number when renewing the certificate.
+        strictsecurity: Enforces strict security measures when renewing the certificate.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate/renew. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if certref is not None:
+            body["certref"] = certref
+        if reusekey is not None:
+            body["reusekey"] = reusekey
+        if reuseserial is not None:
+            body["reuseserial"] = reuseserial
+        if strictsecurity is not None:
+            body["strictsecurity"] = strictsecurity
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate/renew",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_signing_request(
+        descr: str,
+        digest_alg: str,
+        dn_commonname: str,
+        keytype: str,
+        confirm: bool = False,
+        dn_city: str | None = None,
+        dn_country: str | None = None,
+        dn_dns_sans: list[str] | None = None,
+        dn_email_sans: list[str] | None = None,
+        dn_ip_sans: list[str] | None = None,
+        dn_organization: str | None = None,
+        dn_organizationalunit: str | None = None,
+        dn_state: str | None = None,
+        dn_uri_sans: list[str] | None = None,
+        ecname: str | None = None,
+        keylen: int | None = None,
+        lifetime: int | None = 3650,
+        type_: str | None = 'user',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate/signing_request
+
+        descr: The descriptive name for this certificate.
+        digest_alg: The digest method used when the certificate is signed.
+        dn_commonname: The common name of the certificate.
+        keytype: The type of key pair to generate. Valid values: ['RSA', 'ECDSA']
+        dn_city: The city of the certificate.
+        dn_country: The country of the certificate.
+        dn_dns_sans: The DNS Subject Alternative Names (SANs) for the certificate.
+        dn_email_sans: The Email Subject Alternative Names (SANs) for the certificate.
+        dn_ip_sans: The IP Subject Alternative Names (SANs) for the certificate.
+        dn_organization: The organization of the certificate.
+        dn_organizationalunit: The organizational unit of the certificate.
+        dn_state: The state/province of the certificate.
+        dn_uri_sans: The URI Subject Alternative Names (SANs) for the certificate.
+        ecname: The name of the elliptic curve to use for the ECDSA key pair.This field is only available when the following conditions are met:- `keytype` must be equal to `'ECDSA'`
+        keylen: The length of the RSA key pair to generate.This field is only available when the following conditions are met:- `keytype` must be equal to `'RSA'` Valid values: [1024, 2048, 3072, 4096, 6144, 7680, 8192, 15360, 16384]
+        lifetime: The number of days the certificate is valid for.
+        type_: The type of certificate to generate. Valid values: ['server', 'user']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate/signing_request. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if descr is not None:
+            body["descr"] = descr
+        if digest_alg is not None:
+            body["digest_alg"] = digest_alg
+        if dn_commonname is not None:
+            body["dn_commonname"] = dn_commonname
+        if keytype is not None:
+            body["keytype"] = keytype
+        if dn_city is not None:
+            body["dn_city"] = dn_city
+        if dn_country is not None:
+            body["dn_country"] = dn_country
+        if dn_dns_sans is not None:
+            body["dn_dns_sans"] = dn_dns_sans
+        if dn_email_sans is not None:
+            body["dn_email_sans"] = dn_email_sans
+        if dn_ip_sans is not None:
+            body["dn_ip_sans"] = dn_ip_sans
+        if dn_organization is not None:
+            body["dn_organization"] = dn_organization
+        if dn_organizationalunit is not None:
+            body["dn_organizationalunit"] = dn_organizationalunit
+        if dn_state is not None:
+            body["dn_state"] = dn_state
+        if dn_uri_sans is not None:
+            body["dn_uri_sans"] = dn_uri_sans
+        if ecname is not None:
+            body["ecname"] = ecname
+        if keylen is not None:
+            body["keylen"] = keylen
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate/signing_request",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_certificate_signing_request_sign(
+        caref: str,
+        csr: str,
+        descr: str,
+        digest_alg: str,
+        confirm: bool = False,
+        dn_dns_sans: list[str] | None = None,
+        dn_email_sans: list[str] | None = None,
+        dn_ip_sans: list[str] | None = None,
+        dn_uri_sans: list[str] | None = None,
+        lifetime: int | None = 3650,
+        prv: str | None = None,
+        type_: str | None = 'user',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/certificate/signing_request/sign
+
+        caref: The certificate authority to sign the certificate with.
+        csr: The X509 certificate signing request to sign.
+        descr: The descriptive name for this certificate.
+        digest_alg: The digest method used when the certificate is signed.
+        dn_dns_sans: The DNS Subject Alternative Names (SANs) for the certificate.
+        dn_email_sans: The Email Subject Alternative Names (SANs) for the certificate.
+        dn_ip_sans: The IP Subject Alternative Names (SANs) for the certificate.
+        dn_uri_sans: The URI Subject Alternative Names (SANs) for the certificate.
+        lifetime: The number of days the certificate is valid for.
+        prv: The X509 private key string.
+        type_: The type of certificate to generate. Valid values: ['server', 'user']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/certificate/signing_request/sign. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if caref is not None:
+            body["caref"] = caref
+        if csr is not None:
+            body["csr"] = csr
+        if descr is not None:
+            body["descr"] = descr
+        if digest_alg is not None:
+            body["digest_alg"] = digest_alg
+        if dn_dns_sans is not None:
+            body["dn_dns_sans"] = dn_dns_sans
+        if dn_email_sans is not None:
+            body["dn_email_sans"] = dn_email_sans
+        if dn_ip_sans is not None:
+            body["dn_ip_sans"] = dn_ip_sans
+        if dn_uri_sans is not None:
+            body["dn_uri_sans"] = dn_uri_sans
+        if lifetime is not None:
+            body["lifetime"] = lifetime
+        if prv is not None:
+            body["prv"] = prv
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "POST",
+            "/api/v2/system/certificate/signing_request/sign",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_certificates(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/certificates
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/certificates. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/certificates",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_console(
+        confirm: bool = False,
+        passwd_protect_console: bool | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/console
+
+        passwd_protect_console: Enables or disables password protecting the console.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/console. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if passwd_protect_console is not None:
+            body["passwd_protect_console"] = passwd_protect_console
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/console",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_dns(
+        confirm: bool = False,
+        dnsallowoverride: bool | None = None,
+        dnslocalhost: str | None = None,
+        dnsserver: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/dns
+
+        dnsallowoverride: Allow DNS servers to be overwritten by DHCP on WAN interfaces.
+        dnslocalhost: Use local DNS server (DNS Resover or DNS Forwarder) as the primary DNS, or use only remote DNS servers specified in `dnsserver`. Set to `null` to use local DNS server as the primary and remote DNS servers as backup. Valid values: ['local', 'remote']
+        dnsserver: The remote DNS server IPv4 or IPv6 addresses.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/dns. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if dnsallowoverride is not None:
+            body["dnsallowoverride"] = dnsallowoverride
+        if dnslocalhost is not None:
+            body["dnslocalhost"] = dnslocalhost
+        if dnsserver is not None:
+            body["dnsserver"] = dnsserver
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/dns",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_hostname(
+        domain: str,
+        hostname: str,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/hostname
+
+        domain: The domain portion of the FQDN to assign to this system.
+        hostname: The hostname portion of the FQDN to assign to this system.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/hostname. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if domain is not None:
+            body["domain"] = domain
+        if hostname is not None:
+            body["hostname"] = hostname
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/hostname",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_notifications_email_settings(
+        confirm: bool = False,
+        authentication_mechanism: str | None = None,
+        disable: bool | None = None,
+        fromaddress: str | None = None,
+        ipaddress: str | None = None,
+        notifyemailaddress: str | None = None,
+        password: str | None = None,
+        port: str | None = None,
+        ssl: bool | None = None,
+        sslvalidate: bool | None = None,
+        timeout: int | None = None,
+        username: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/notifications/email_settings
+
+        authentication_mechanism: The authentication mechanism to use for the SMTP connection. Valid values: ['PLAIN', 'LOGIN']
+        disable: Disables SMTP notifications.
+        fromaddress: The email address to use as the "From" address in notifications.
+        ipaddress: The IP address or hostname of the SMTP server.
+        notifyemailaddress: The email address to send notifications to.
+        password: The password to use for SMTP authentication.This field is only available when the following conditions are met:- `authentication_mechanism` must be equal to `'LOGIN'`
+        port: The port number of the SMTP server. Valid options are: a TCP/UDP port number
+        ssl: Enables or disables SSL/TLS for the SMTP connection.
+        sslvalidate: Enables or disables SSL/TLS certificate validation for the SMTP connection.
+        timeout: The timeout (in seconds) for the SMTP connection.
+        username: The username to use for SMTP authentication.This field is only available when the following conditions are met:- `authentication_mechanism` must be equal to `'LOGIN'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/notifications/email_settings. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if authentication_mechanism is not None:
+            body["authentication_mechanism"] = authentication_mechanism
+        if disable is not None:
+            body["disable"] = disable
+        if fromaddress is not None:
+            body["fromaddress"] = fromaddress
+        if ipaddress is not None:
+            body["ipaddress"] = ipaddress
+        if notifyemailaddress is not None:
+            body["notifyemailaddress"] = notifyemailaddress
+        if password is not None:
+            body["password"] = password
+        if port is not None:
+            body["port"] = port
+        if ssl is not None:
+            body["ssl"] = ssl
+        if sslvalidate is not None:
+            body["sslvalidate"] = sslvalidate
+        if timeout is not None:
+            body["timeout"] = timeout
+        if username is not None:
+            body["username"] = username
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/notifications/email_settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_package(
+        name: str,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/package
+
+        name: The name of the pfSense package.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/package. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        return await _client.request(
+            "POST",
+            "/api/v2/system/package",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_package(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/package
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/package. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/package",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_packages(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/packages
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/packages. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/packages",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_system_restapi_access_list(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/system/restapi/access_list
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/system/restapi/access_list. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/system/restapi/access_list",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_restapi_access_list(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/restapi/access_list
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/restapi/access_list. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/restapi/access_list",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_restapi_access_list_entry(
+        network: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        sched: str | None = None,
+        type_: str | None = 'allow',
+        users: list[str] | None = None,
+        weight: int | None = 1,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/restapi/access_list/entry
+
+        network: The network (in CIDR notation) that this entry applies to. Clients interacting with the REST API from this network will be affected by this entry.
+        descr: A description of this access list entry. This field is optional.
+        sched: The firewall schedule that this entry will use. This entry will only be active during the times specified in the schedule. Leave empty to apply this entry at all times.
+        type_: The type of access this entry provides. "allow" entries permit access to the REST API from the specified networks. "deny" entries block access to the REST API from the specified networks. Valid values: ['allow', 'deny']
+        users: The users that this entry applies to. Only users in this list will be affected by this entry. Leave empty if this entry should apply to all users.
+        weight: The weight of this entry. Entries with lower weights are evaluated first. If multiple entries match a request, the entry with the lowest weight will be applied.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/restapi/access_list/entry. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if network is not None:
+            body["network"] = network
+        if descr is not None:
+            body["descr"] = descr
+        if sched is not None:
+            body["sched"] = sched
+        if type_ is not None:
+            body["type"] = type_
+        if users is not None:
+            body["users"] = users
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "POST",
+            "/api/v2/system/restapi/access_list/entry",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_restapi_access_list_entry(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        network: str | None = None,
+        sched: str | None = None,
+        type_: str | None = None,
+        users: list[str] | None = None,
+        weight: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/restapi/access_list/entry
+
+        id: The ID of the object or resource to interact with.
+        descr: A description of this access list entry. This field is optional.
+        network: The network (in CIDR notation) that this entry applies to. Clients interacting with the REST API from this network will be affected by this entry.
+        sched: The firewall schedule that this entry will use. This entry will only be active during the times specified in the schedule. Leave empty to apply this entry at all times.
+        type_: The type of access this entry provides. "allow" entries permit access to the REST API from the specified networks. "deny" entries block access to the REST API from the specified networks. Valid values: ['allow', 'deny']
+        users: The users that this entry applies to. Only users in this list will be affected by this entry. Leave empty if this entry should apply to all users.
+        weight: The weight of this entry. Entries with lower weights are evaluated first. If multiple entries match a request, the entry with the lowest weight will be applied.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/restapi/access_list/entry. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if network is not None:
+            body["network"] = network
+        if sched is not None:
+            body["sched"] = sched
+        if type_ is not None:
+            body["type"] = type_
+        if users is not None:
+            body["users"] = users
+        if weight is not None:
+            body["weight"] = weight
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/restapi/access_list/entry",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_restapi_access_list_entry(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/restapi/access_list/entry
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/restapi/access_list/entry. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/restapi/access_list/entry",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_restapi_settings(
+        confirm: bool = False,
+        allow_pre_releases: bool | None = None,
+        allowed_interfaces: list[str] | None = None,
+        auth_methods: list[str] | None = None,
+        enabled: bool | None = None,
+        expose_sensitive_fields: bool | None = None,
+        ha_sync: bool | None = None,
+        ha_sync_hosts: list[str] | None = None,
+        ha_sync_password: str | None = None,
+        ha_sync_username: str | None = None,
+        ha_sync_validate_certs: bool | None = None,
+        hateoas: bool | None = None,
+        jwt_exp: int | None = None,
+        keep_backup: bool | None = None,
+        log_level: str | None = None,
+        log_successful_auth: bool | None = None,
+        login_protection: bool | None = None,
+        override_sensitive_fields: list[str] | None = None,
+        read_only: bool | None = None,
+        represent_interfaces_as: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/restapi/settings
+
+        allow_pre_releases: Enables or disables displaying pre-releases in available API updates. Pre-releases contain fixes and features that are currently under development and may not be fully stable. Use of pre-release versions is at your own risk.
+        allowed_interfaces: Sets the interfaces allowed to accept incoming API calls.
+        auth_methods: Sets the API authentication methods allowed to authenticate API calls.
+        enabled: Enables or disables the API. If set to `false`, the API will no longer respond to API requests and can only be re-enabled via webConfigurator.
+        expose_sensitive_fields: Enables or disables exposing sensitive fields in API responses. When enabled, sensitive fields such as passwords, private keys, and other sensitive data will be included in API responses.
+        ha_sync: Enables or disables syncing API settings to HA peers. When enabled, API settings from this host will automatically be synced to any hosts defined in `ha_sync_hosts`.
+        ha_sync_hosts: Set a list of IP addresses or hostnames to sync API settings to.
+        ha_sync_password: Sets the password to use when authenticating for HA sync processes. This must be the password for the user defined in `ha_sync_username` and must be the same on all hosts defined in `ha_sync_hosts`.
+        ha_sync_username: Sets the username to use when authenticating for HA sync processes. This user must be the present on all hosts defined in `ha_sync_hosts`.
+        ha_sync_validate_certs: Enables or disables certificate validation when syncing API configurations to HA sync peers. If enabled, all hosts defined in `ha_sync_hosts` must have their webConfigurator configured with a certificate trusted by this system. It is strongly recommended this be enabled at all times to help mitigate Man-in-the-Middle attacks.
+        hateoas: Enables or disables HATEOAS. Enabling HATEOAS will allow the API to include links to related resources in API responses. This is primarily useful for frontend web applications and self-navigating client scripts that integrate with HAL standards. Enabling HATEOAS may increase API response times, especially on systems with large configurations.
+        jwt_exp: Sets the amount of time (in seconds) JWTs are valid for.
+        keep_backup: Enables or disables keeping a persistent backup of the API configuration that can be used to restore the API configuration after package and systems updates.
+        log_level: Sets the log level for API logging. The log level determines the minimum severity of messages that should be logged. Valid values: ['LOG_DEBUG', 'LOG_INFO', 'LOG_NOTICE', 'LOG_WARNING', 'LOG_ERR', 'LOG_CRIT', 'LOG_ALERT', 'LOG_EMERG']
+        log_successful_auth: Enables or disables logging of API authentication attempts that are successful. By default, only failed API authentication attempts are logged to prevent flooding the authentication logs. This field is only applicable when the API `login_protection` setting is enabled.
+        login_protection: Enables or disables Login Protection for API authentication. When enabled, Login Protection will monitor API attempts and temporarily block clients who fail API authentication too many times within a period of time. When disabled, Login Protection will not monitor API authentication but will continue to monitor webConfigurator and SSH logins (if configured). Login Protection can be configured globally in System > Advanced.
+        override_sensitive_fields: Specifies a list of fields (formatted as ModelName:FieldName) that should have their sensitive attribute overridden. Fields selected here will not be considered sensitive and will be included in API responses regardless of the `expose_sensitive_fields` setting.This field is only available when the following conditions are met:- `expose_sensitive_fields` must be equal to `false`
+        read_only: Enables or disables read-only API access. If enabled, the API will only respond to GET requests and can only be disabled via webConfigurator.
+        represent_interfaces_as: Specifies how the API should represent interface names. Use `descr` to represent interface objects by their description name, use `id` to represent interface objects by their internal pfSense ID (e.g. wan, lan, opt1), or use `if` to represent interface objects by their real interface name (e.g. em0, igb1, bxe3). Valid values: ['descr', 'id', 'if']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/restapi/settings. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if allow_pre_releases is not None:
+            body["allow_pre_releases"] = allow_pre_releases
+        if allowed_interfaces is not None:
+            body["allowed_interfaces"] = allowed_interfaces
+        if auth_methods is not None:
+            body["auth_methods"] = auth_methods
+        if enabled is not None:
+            body["enabled"] = enabled
+        if expose_sensitive_fields is not None:
+            body["expose_sensitive_fields"] = expose_sensitive_fields
+        if ha_sync is not None:
+            body["ha_sync"] = ha_sync
+        if ha_sync_hosts is not None:
+            body["ha_sync_hosts"] = ha_sync_hosts
+        if ha_sync_password is not None:
+            body["ha_sync_password"] = ha_sync_password
+        if ha_sync_username is not None:
+            body["ha_sync_username"] = ha_sync_username
+        if ha_sync_validate_certs is not None:
+            body["ha_sync_validate_certs"] = ha_sync_validate_certs
+        if hateoas is not None:
+            body["hateoas"] = hateoas
+        if jwt_exp is not None:
+            body["jwt_exp"] = jwt_exp
+        if keep_backup is not None:
+            body["keep_backup"] = keep_backup
+        if log_level is not None:
+            body["log_level"] = log_level
+        if log_successful_auth is not None:
+            body["log_successful_auth"] = log_successful_auth
+        if login_protection is not None:
+            body["login_protection"] = login_protection
+        if override_sensitive_fields is not None:
+            body["override_sensitive_fields"] = override_sensitive_fields
+        if read_only is not None:
+            body["read_only"] = read_only
+        if represent_interfaces_as is not None:
+            body["represent_interfaces_as"] = represent_interfaces_as
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/restapi/settings",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_restapi_settings_sync(
+        sync_data: str,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/restapi/settings/sync
+
+        WARNING: This endpoint requires HTTP BasicAuth (username:password).
+        It does NOT accept API key or JWT auth. Will return 401 via MCP.
+
+        sync_data: The serialized REST API settings data to be synced.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/restapi/settings/sync. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if sync_data is not None:
+            body["sync_data"] = sync_data
+        return await _client.request(
+            "POST",
+            "/api/v2/system/restapi/settings/sync",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_restapi_version(
+        confirm: bool = False,
+        install_version: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/restapi/version
+
+        install_version: Set the API version to update or rollback to.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/restapi/version. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if install_version is not None:
+            body["install_version"] = install_version
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/restapi/version",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_timezone(
+        confirm: bool = False,
+        timezone: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/timezone
+
+        timezone: Set geographic region name (Continent/Location) to determine the timezone for the firewall.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/timezone. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if timezone is not None:
+            body["timezone"] = timezone
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/timezone",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_system_tunable(
+        tunable: str,
+        value: str,
+        confirm: bool = False,
+        descr: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/system/tunable
+
+        tunable: The name of the tunable to set.
+        value: The value to assign this tunable.
+        descr: A description for this tunable.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/system/tunable. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if tunable is not None:
+            body["tunable"] = tunable
+        if value is not None:
+            body["value"] = value
+        if descr is not None:
+            body["descr"] = descr
+        return await _client.request(
+            "POST",
+            "/api/v2/system/tunable",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_tunable(
+        id: str | int,
+        confirm: bool = False,
+        descr: str | None = None,
+        tunable: str | None = None,
+        value: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/tunable
+
+        id: The ID of the object or resource to interact with.
+        descr: A description for this tunable.
+        tunable: The name of the tunable to set.
+        value: The value to assign this tunable.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/tunable. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if descr is not None:
+            body["descr"] = descr
+        if tunable is not None:
+            body["tunable"] = tunable
+        if value is not None:
+            body["value"] = value
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/tunable",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_tunable(
+        id: str | int,
+        confirm: bool = False,
+        apply: bool | None = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/tunable
+
+        id: The ID of the object to target.
+        apply: Apply this deletion immediately.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/tunable. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        if apply is not None:
+            params["apply"] = apply
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/tunable",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_system_tunables(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/system/tunables
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/system/tunables. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/system/tunables",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_system_tunables(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/system/tunables
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/system/tunables. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/system/tunables",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_system_web_gui_settings(
+        sslcertref: str,
+        confirm: bool = False,
+        port: str | None = None,
+        protocol: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/system/webgui/settings
+
+        sslcertref: The SSL/TLS certificate to use for the web GUI.
+        port: The port on which the web GUI listens. Valid options are: a TCP/UDP port number
+        protocol: The protocol to use for the web GUI. Valid values: ['http', 'https']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/system/webgui/settings. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if sslcertref is not None:
+            body["sslcertref"] = sslcertref
+        if port is not None:
+            body["port"] = port
+        if protocol is not None:
+            body["protocol"] = protocol
+        return await _client.request(
+            "PATCH",
+            "/api/v2/system/webgui/settings",
+            json_body=body,
+        )
@@ -0,0 +1,1047 @@
+# Auto-generated pfSense MCP tools — module: user
+# 20 tools: 6 read, 14 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "user" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_user_auth_server(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/user/auth_server
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/user/auth_server",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_user_auth_servers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/user/auth_servers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: host, id, ldap_allow_unauthenticated, ldap_attr_group, ldap_attr_groupobj, ldap_attr_member, ldap_attr_user, ldap_authcn, ldap_basedn, ldap_binddn, ldap_bindpw, ldap_caref, ldap_extended_enabled, ldap_extended_query, ldap_nostrip_at, ldap_pam_groupdn, ldap_port, ldap_protver, ldap_rfc2307, ldap_rfc2307_userdn, ldap_scope, ldap_timeout, ldap_urltype, ldap_utf8, name, radius_acct_port, radius_auth_port, radius_nasip_attribute, radius_protocol, radius_secret, radius_timeout, refid, type
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "host", "id", "ldap_attr_group", "ldap_attr_groupobj", "ldap_attr_member",
+            "ldap_attr_user", "ldap_authcn", "ldap_basedn", "ldap_binddn",
+            "ldap_bindpw", "ldap_caref", "ldap_extended_query", "ldap_pam_groupdn",
+            "ldap_port", "ldap_protver", "ldap_scope", "ldap_timeout", "ldap_urltype",
+            "name", "radius_acct_port", "radius_auth_port", "radius_nasip_attribute",
+            "radius_protocol", "radius_secret", "radius_timeout", "refid", "type",
+        })))
+    return await _list_paged(
+        "/api/v2/user/auth_servers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_user(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/user
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/user",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_user_group(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/user/group
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/user/group",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_user_groups(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/user/groups
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: description, gid, id, member, name, priv, scope
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "description", "gid", "id", "name", "scope",
+        })))
+    return await _list_paged(
+        "/api/v2/user/groups",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_users(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/users
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: authorizedkeys, cert, descr, disabled, expires, id, ipsecpsk, name, password, priv, scope, uid
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "authorizedkeys", "descr", "expires", "id", "ipsecpsk", "name", "password",
+            "scope", "uid",
+        })))
+    return await _list_paged(
+        "/api/v2/users",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_user_auth_server(
+        host: str,
+        name: str,
+        type_: str,
+        confirm: bool = False,
+        ldap_allow_unauthenticated: bool | None = None,
+        ldap_attr_group: str | None = None,
+        ldap_attr_groupobj: str | None = None,
+        ldap_attr_member: str | None = None,
+        ldap_attr_user: str | None = None,
+        ldap_authcn: str | None = None,
+        ldap_basedn: str | None = None,
+        ldap_binddn: str | None = None,
+        ldap_bindpw: str | None = None,
+        ldap_caref: str | None = None,
+        ldap_extended_enabled: bool | None = None,
+        ldap_extended_query: str | None = None,
+        ldap_nostrip_at: bool | None = None,
+        ldap_pam_groupdn: str | None = None,
+        ldap_port: str | None = None,
+        ldap_protver: int | None = None,
+        ldap_rfc2307: bool | None = None,
+        ldap_rfc2307_userdn: bool | None = None,
+        ldap_scope: str | None = None,
+        ldap_timeout: int | None = None,
+        ldap_urltype: str | None = None,
+        ldap_utf8: bool | None = None,
+        radius_acct_port: str | None = None,
+        radius_auth_port: str | None = None,
+        radius_nasip_attribute: str | None = None,
+        radius_protocol: str | None = None,
+        radius_secret: str | None = None,
+        radius_timeout: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/user/auth_server
+
+        host: The remote IP address or hostname of the authentication server.
+        name: The descriptive name for this authentication server.
+        type_: The type of this authentication server. Valid values: ['ldap', 'radius']
+        ldap_allow_unauthenticated: Enables or disables unauthenticated binding. Unauthenticated binds are bind with an existing login but with an empty password. Some LDAP servers (Microsoft AD) allow this type of bind without any possibility to disable it.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_attr_group: The LDAP group attribute.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_attr_groupobj: The group object class for groups in RFC2307 mode.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_rfc2307` must be equal to `true`
+        ldap_attr_member: The LDAP member attribute.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_attr_user: The LDAP user attribute.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_authcn: The LDAP authentication container.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_basedn: The root for LDAP searches on this authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_binddn: The DN to use when binding to this authentication server. Set to `null` to bind anonymously.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_bindpw: The password to use when binding to this authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_binddn` must not be equal to `NULL`
+        ldap_caref: The certificate authority used to validate the LDAP server certificate.This field is only available when the following conditions are met:- `ldap_urltype` must be one of [ starttls, encrypted ]
+        ldap_extended_enabled: Enable LDAP extended queries.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_extended_query: The extended LDAP query to make during LDAP searches.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_extended_enabled` must be equal to `true`
+        ldap_nostrip_at: Do not strip away parts of the username after the @ symbol.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_pam_groupdn: The group DN to use for shell authentication. Users must be a member of this group and have valid posixAccount attributes to sign in.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_port: The LDAP port to connect to on this LDAP authentication server. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_protver: The LDAP protocol version to use for connections to this LDAP authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'` Valid values: [2, 3]
+        ldap_rfc2307: Enables or disable RFC2307 LDAP options.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_rfc2307_userdn: Enables or disable the use of DNs for username searches.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_rfc2307` must be equal to `true`
+        ldap_scope: The LDAP search scope. Use `one` to limit the scope to a single level, or `subtree` to allow the entire subtree to be searched.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'` Valid values: ['one', 'subtree']
+        ldap_timeout: The timeout (in seconds) for connections to the LDAP authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_urltype: The encryption mode to use when connecting to this authentication server. Use `Standard TCP` for unencrypted LDAP connections, use `STARTTLS Encrypt` to start an encrypted connection via STARTTLS if it's available, or `SSL/TLS Encrypted` to only use LDAPS encrypted connections.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'` Valid values: ['Standard TCP', 'STARTTLS Encrypt', 'SSL/TLS Encrypted']
+        ldap_utf8: Enables or disables UTF-8 encoding LDAP parameters before sending them to this authentication serverThis field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        radius_acct_port: The port used by RADIUS for accounting. Set to `null` to disable use of accounting services. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_auth_port: The port used by RADIUS for authentication. Set to `null` to disable use of authentication services. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_nasip_attribute: The interface whose IP will be used as the 'NAS-IP-Address' attribute during RADIUS Access-Requests. This choice will not change the interface used for contacting the RADIUS server.This field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_protocol: The RADIUS protocol to use when authenticating.This field is only available when the following conditions are met:- `type` must be equal to `'radius'` Valid values: ['MSCHAPv2', 'MSCHAPv1', 'CHAP_MD5', 'PAP']
+        radius_secret: The shared secret to use when authenticating to this RADIUS server.This field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_timeout: The timeout (in seconds) for connections to this RADIUS authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/user/auth_server. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if host is not None:
+            body["host"] = host
+        if name is not None:
+            body["name"] = name
+        if type_ is not None:
+            body["type"] = type_
+        if ldap_allow_unauthenticated is not None:
+            body["ldap_allow_unauthenticated"] = ldap_allow_unauthenticated
+        if ldap_attr_group is not None:
+            body["ldap_attr_group"] = ldap_attr_group
+        if ldap_attr_groupobj is not None:
+            body["ldap_attr_groupobj"] = ldap_attr_groupobj
+        if ldap_attr_member is not None:
+            body["ldap_attr_member"] = ldap_attr_member
+        if ldap_attr_user is not None:
+            body["ldap_attr_user"] = ldap_attr_user
+        if ldap_authcn is not None:
+            body["ldap_authcn"] = ldap_authcn
+        if ldap_basedn is not None:
+            body["ldap_basedn"] = ldap_basedn
+        if ldap_binddn is not None:
+            body["ldap_binddn"] = ldap_binddn
+        if ldap_bindpw is not None:
+            body["ldap_bindpw"] = ldap_bindpw
+        if ldap_caref is not None:
+            body["ldap_caref"] = ldap_caref
+        if ldap_extended_enabled is not None:
+            body["ldap_extended_enabled"] = ldap_extended_enabled
+        if ldap_extended_query is not None:
+            body["ldap_extended_query"] = ldap_extended_query
+        if ldap_nostrip_at is not None:
+            body["ldap_nostrip_at"] = ldap_nostrip_at
+        if ldap_pam_groupdn is not None:
+            body["ldap_pam_groupdn"] = ldap_pam_groupdn
+        if ldap_port is not None:
+            body["ldap_port"] = ldap_port
+        if ldap_protver is not None:
+            body["ldap_protver"] = ldap_protver
+        if ldap_rfc2307 is not None:
+            body["ldap_rfc2307"] = ldap_rfc2307
+        if ldap_rfc2307_userdn is not None:
+            body["ldap_rfc2307_userdn"] = ldap_rfc2307_userdn
+        if ldap_scope is not None:
+            body["ldap_scope"] = ldap_scope
+        if ldap_timeout is not None:
+            body["ldap_timeout"] = ldap_timeout
+        if ldap_urltype is not None:
+            body["ldap_urltype"] = ldap_urltype
+        if ldap_utf8 is not None:
+            body["ldap_utf8"] = ldap_utf8
+        if radius_acct_port is not None:
+            body["radius_acct_port"] = radius_acct_port
+        if radius_auth_port is not None:
+            body["radius_auth_port"] = radius_auth_port
+        if radius_nasip_attribute is not None:
+            body["radius_nasip_attribute"] = radius_nasip_attribute
+        if radius_protocol is not None:
+            body["radius_protocol"] = radius_protocol
+        if radius_secret is not None:
+            body["radius_secret"] = radius_secret
+        if radius_timeout is not None:
+            body["radius_timeout"] = radius_timeout
+        return await _client.request(
+            "POST",
+            "/api/v2/user/auth_server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_user_auth_server(
+        id: str | int,
+        confirm: bool = False,
+        host: str | None = None,
+        ldap_allow_unauthenticated: bool | None = None,
+        ldap_attr_group: str | None = None,
+        ldap_attr_groupobj: str | None = None,
+        ldap_attr_member: str | None = None,
+        ldap_attr_user: str | None = None,
+        ldap_authcn: str | None = None,
+        ldap_basedn: str | None = None,
+        ldap_binddn: str | None = None,
+        ldap_bindpw: str | None = None,
+        ldap_caref: str | None = None,
+        ldap_extended_enabled: bool | None = None,
+        ldap_extended_query: str | None = None,
+        ldap_nostrip_at: bool | None = None,
+        ldap_pam_groupdn: str | None = None,
+        ldap_port: str | None = None,
+        ldap_protver: int | None = None,
+        ldap_rfc2307: bool | None = None,
+        ldap_rfc2307_userdn: bool | None = None,
+        ldap_scope: str | None = None,
+        ldap_timeout: int | None = None,
+        ldap_urltype: str | None = None,
+        ldap_utf8: bool | None = None,
+        name: str | None = None,
+        radius_acct_port: str | None = None,
+        radius_auth_port: str | None = None,
+        radius_nasip_attribute: str | None = None,
+        radius_protocol: str | None = None,
+        radius_secret: str | None = None,
+        radius_timeout: int | None = None,
+        type_: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/user/auth_server
+
+        id: The ID of the object or resource to interact with.
+        host: The remote IP address or hostname of the authentication server.
+        ldap_allow_unauthenticated: Enables or disables unauthenticated binding. Unauthenticated binds are bind with an existing login but with an empty password. Some LDAP servers (Microsoft AD) allow this type of bind without any possibility to disable it.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_attr_group: The LDAP group attribute.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_attr_groupobj: The group object class for groups in RFC2307 mode.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_rfc2307` must be equal to `true`
+        ldap_attr_member: The LDAP member attribute.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_attr_user: The LDAP user attribute.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_authcn: The LDAP authentication container.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_basedn: The root for LDAP searches on this authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_binddn: The DN to use when binding to this authentication server. Set to `null` to bind anonymously.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_bindpw: The password to use when binding to this authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_binddn` must not be equal to `NULL`
+        ldap_caref: The certificate authority used to validate the LDAP server certificate.This field is only available when the following conditions are met:- `ldap_urltype` must be one of [ starttls, encrypted ]
+        ldap_extended_enabled: Enable LDAP extended queries.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_extended_query: The extended LDAP query to make during LDAP searches.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_extended_enabled` must be equal to `true`
+        ldap_nostrip_at: Do not strip away parts of the username after the @ symbol.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_pam_groupdn: The group DN to use for shell authentication. Users must be a member of this group and have valid posixAccount attributes to sign in.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_port: The LDAP port to connect to on this LDAP authentication server. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_protver: The LDAP protocol version to use for connections to this LDAP authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'` Valid values: [2, 3]
+        ldap_rfc2307: Enables or disable RFC2307 LDAP options.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_rfc2307_userdn: Enables or disable the use of DNs for username searches.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`- `ldap_rfc2307` must be equal to `true`
+        ldap_scope: The LDAP search scope. Use `one` to limit the scope to a single level, or `subtree` to allow the entire subtree to be searched.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'` Valid values: ['one', 'subtree']
+        ldap_timeout: The timeout (in seconds) for connections to the LDAP authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        ldap_urltype: The encryption mode to use when connecting to this authentication server. Use `Standard TCP` for unencrypted LDAP connections, use `STARTTLS Encrypt` to start an encrypted connection via STARTTLS if it's available, or `SSL/TLS Encrypted` to only use LDAPS encrypted connections.This field is only available when the following conditions are met:- `type` must be equal to `'ldap'` Valid values: ['Standard TCP', 'STARTTLS Encrypt', 'SSL/TLS Encrypted']
+        ldap_utf8: Enables or disables UTF-8 encoding LDAP parameters before sending them to this authentication serverThis field is only available when the following conditions are met:- `type` must be equal to `'ldap'`
+        name: The descriptive name for this authentication server.
+        radius_acct_port: The port used by RADIUS for accounting. Set to `null` to disable use of accounting services. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_auth_port: The port used by RADIUS for authentication. Set to `null` to disable use of authentication services. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_nasip_attribute: The interface whose IP will be used as the 'NAS-IP-Address' attribute during RADIUS Access-Requests. This choice will not change the interface used for contacting the RADIUS server.This field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_protocol: The RADIUS protocol to use when authenticating.This field is only available when the following conditions are met:- `type` must be equal to `'radius'` Valid values: ['MSCHAPv2', 'MSCHAPv1', 'CHAP_MD5', 'PAP']
+        radius_secret: The shared secret to use when authenticating to this RADIUS server.This field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        radius_timeout: The timeout (in seconds) for connections to this RADIUS authentication server.This field is only available when the following conditions are met:- `type` must be equal to `'radius'`
+        type_: The type of this authentication server. Valid values: ['ldap', 'radius']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/user/auth_server. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if host is not None:
+            body["host"] = host
+        if ldap_allow_unauthenticated is not None:
+            body["ldap_allow_unauthenticated"] = ldap_allow_unauthenticated
+        if ldap_attr_group is not None:
+            body["ldap_attr_group"] = ldap_attr_group
+        if ldap_attr_groupobj is not None:
+            body["ldap_attr_groupobj"] = ldap_attr_groupobj
+        if ldap_attr_member is not None:
+            body["ldap_attr_member"] = ldap_attr_member
+        if ldap_attr_user is not None:
+            body["ldap_attr_user"] = ldap_attr_user
+        if ldap_authcn is not None:
+            body["ldap_authcn"] = ldap_authcn
+        if ldap_basedn is not None:
+            body["ldap_basedn"] = ldap_basedn
+        if ldap_binddn is not None:
+            body["ldap_binddn"] = ldap_binddn
+        if ldap_bindpw is not None:
+            body["ldap_bindpw"] = ldap_bindpw
+        if ldap_caref is not None:
+            body["ldap_caref"] = ldap_caref
+        if ldap_extended_enabled is not None:
+            body["ldap_extended_enabled"] = ldap_extended_enabled
+        if ldap_extended_query is not None:
+            body["ldap_extended_query"] = ldap_extended_query
+        if ldap_nostrip_at is not None:
+            body["ldap_nostrip_at"] = ldap_nostrip_at
+        if ldap_pam_groupdn is not None:
+            body["ldap_pam_groupdn"] = ldap_pam_groupdn
+        if ldap_port is not None:
+            body["ldap_port"] = ldap_port
+        if ldap_protver is not None:
+            body["ldap_protver"] = ldap_protver
+        if ldap_rfc2307 is not None:
+            body["ldap_rfc2307"] = ldap_rfc2307
+        if ldap_rfc2307_userdn is not None:
+            body["ldap_rfc2307_userdn"] = ldap_rfc2307_userdn
+        if ldap_scope is not None:
+            body["ldap_scope"] = ldap_scope
+        if ldap_timeout is not None:
+            body["ldap_timeout"] = ldap_timeout
+        if ldap_urltype is not None:
+            body["ldap_urltype"] = ldap_urltype
+        if ldap_utf8 is not None:
+            body["ldap_utf8"] = ldap_utf8
+        if name is not None:
+            body["name"] = name
+        if radius_acct_port is not None:
+            body["radius_acct_port"] = radius_acct_port
+        if radius_auth_port is not None:
+            body["radius_auth_port"] = radius_auth_port
+        if radius_nasip_attribute is not None:
+            body["radius_nasip_attribute"] = radius_nasip_attribute
+        if radius_protocol is not None:
+            body["radius_protocol"] = radius_protocol
+        if radius_secret is not None:
+            body["radius_secret"] = radius_secret
+        if radius_timeout is not None:
+            body["radius_timeout"] = radius_timeout
+        if type_ is not None:
+            body["type"] = type_
+        return await _client.request(
+            "PATCH",
+            "/api/v2/user/auth_server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_user_auth_server(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/user/auth_server
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/user/auth_server. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/user/auth_server",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_user_auth_servers(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/user/auth_servers
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/user/auth_servers. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/user/auth_servers",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_user_auth_servers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/user/auth_servers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/user/auth_servers. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/user/auth_servers",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_user(
+        name: str,
+        password: str,
+        confirm: bool = False,
+        authorizedkeys: str | None = None,
+        cert: list[str] | None = None,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        expires: str | None = None,
+        ipsecpsk: str | None = None,
+        priv: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/user
+
+        name: The username of this local user.
+        password: The password of this local user.
+        authorizedkeys: The SSH authorized keys to assign this user.
+        cert: The user certificates to assign this user. Items must be existing certificate `refid`s.
+        descr: The full descriptive name for this local user.
+        disabled: Disable this local user.
+        expires: The expiration date for this user in mm/dd/YYYY format. Use empty string for no expiration
+        ipsecpsk: The IPsec pre-shared key to assign this user.
+        priv: The privileges assigned to this local user.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/user. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if password is not None:
+            body["password"] = password
+        if authorizedkeys is not None:
+            body["authorizedkeys"] = authorizedkeys
+        if cert is not None:
+            body["cert"] = cert
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if expires is not None:
+            body["expires"] = expires
+        if ipsecpsk is not None:
+            body["ipsecpsk"] = ipsecpsk
+        if priv is not None:
+            body["priv"] = priv
+        return await _client.request(
+            "POST",
+            "/api/v2/user",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_user(
+        id: str | int,
+        confirm: bool = False,
+        authorizedkeys: str | None = None,
+        cert: list[str] | None = None,
+        descr: str | None = None,
+        disabled: bool | None = None,
+        expires: str | None = None,
+        ipsecpsk: str | None = None,
+        name: str | None = None,
+        password: str | None = None,
+        priv: list[str] | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/user
+
+        id: The ID of the object or resource to interact with.
+        authorizedkeys: The SSH authorized keys to assign this user.
+        cert: The user certificates to assign this user. Items must be existing certificate `refid`s.
+        descr: The full descriptive name for this local user.
+        disabled: Disable this local user.
+        expires: The expiration date for this user in mm/dd/YYYY format. Use empty string for no expiration
+        ipsecpsk: The IPsec pre-shared key to assign this user.
+        name: The username of this local user.
+        password: The password of this local user.
+        priv: The privileges assigned to this local user.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/user. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if authorizedkeys is not None:
+            body["authorizedkeys"] = authorizedkeys
+        if cert is not None:
+            body["cert"] = cert
+        if descr is not None:
+            body["descr"] = descr
+        if disabled is not None:
+            body["disabled"] = disabled
+        if expires is not None:
+            body["expires"] = expires
+        if ipsecpsk is not None:
+            body["ipsecpsk"] = ipsecpsk
+        if name is not None:
+            body["name"] = name
+        if password is not None:
+            body["password"] = password
+        if priv is not None:
+            body["priv"] = priv
+        return await _client.request(
+            "PATCH",
+            "/api/v2/user",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_user(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/user
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/user. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/user",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_user_group(
+        name: str,
+        confirm: bool = False,
+        description: str | None = None,
+        member: list[str] | None = None,
+        priv: list[str] | None = None,
+        scope: str | None = 'local',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/user/group
+
+        name: The name for this user group.
+        description: The description to assign to this user group.
+        member: The local user names to assign to this user group.
+        priv: The privileges to assign to this user group.
+        scope: The scope of this user group. Use `local` for user groups that only apply to this system. use `remote` for groups that also apply to remote authentication servers. Please note the `system` scope is reserved for built-in, system-defined user groups and cannot be assigned manually. Valid values: ['local', 'remote', 'system']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/user/group. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if member is not None:
+            body["member"] = member
+        if priv is not None:
+            body["priv"] = priv
+        if scope is not None:
+            body["scope"] = scope
+        return await _client.request(
+            "POST",
+            "/api/v2/user/group",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_user_group(
+        id: str | int,
+        confirm: bool = False,
+        description: str | None = None,
+        member: list[str] | None = None,
+        name: str | None = None,
+        priv: list[str] | None = None,
+        scope: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/user/group
+
+        id: The ID of the object or resource to interact with.
+        description: The description to assign to this user group.
+        member: The local user names to assign to this user group.
+        name: The name for this user group.
+        priv: The privileges to assign to this user group.
+        scope: The scope of this user group. Use `local` for user groups that only apply to this system. use `remote` for groups that also apply to remote authentication servers. Please note the `system` scope is reserved for built-in, system-defined user groups and cannot be assigned manually. Valid values: ['local', 'remote', 'system']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/user/group. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if description is not None:
+            body["description"] = description
+        if member is not None:
+            body["member"] = member
+        if name is not None:
+            body["name"] = name
+        if priv is not None:
+            body["priv"] = priv
+        if scope is not None:
+            body["scope"] = scope
+        return await _client.request(
+            "PATCH",
+            "/api/v2/user/group",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_user_group(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/user/group
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/user/group. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/user/group",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_user_groups(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/user/groups
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/user/groups. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/user/groups",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_user_groups(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/user/groups
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/user/groups. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/user/groups",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_users(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/users
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/users. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/users",
+            params=params,
+        )
@@ -0,0 +1,2384 @@
+# Auto-generated pfSense MCP tools — module: vpn_openvpn
+# 26 tools: 8 read, 18 write
+#
+# Generated by: python -m generator
+# DO NOT EDIT THIS FILE DIRECTLY.
+#
+# Loaded by server.py only when "vpn_openvpn" is in PFSENSE_MODULES and
+# executed in the server's namespace (mcp, _client, helpers are globals).
+
+from __future__ import annotations
+
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_openvpn_cso(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/cso
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/openvpn/cso",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_openvpn_csos(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/csos
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: block, common_name, custom_options, description, disable, dns_domain, dns_server1, dns_server2, dns_server3, dns_server4, gwredir, id, local_network, local_networkv6, netbios_enable, netbios_ntype, netbios_scope, ntp_server1, ntp_server2, push_reset, remote_network, remote_networkv6, remove_options, server_list, tunnel_network, tunnel_networkv6, wins_server1, wins_server2
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "common_name", "description", "dns_domain", "dns_server1", "dns_server2",
+            "dns_server3", "dns_server4", "id", "netbios_ntype", "netbios_scope",
+            "ntp_server1", "ntp_server2", "tunnel_network", "tunnel_networkv6",
+            "wins_server1", "wins_server2",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/openvpn/csos",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_openvpn_client(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/client
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/openvpn/client",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_openvpn_client_export_config(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/client_export/config
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/openvpn/client_export/config",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_openvpn_client_export_configs(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/client_export/configs
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: advancedoptions, bindmode, blockoutsidedns, id, legacy, p12encryption, pass, pkcs11id, pkcs11providers, proxyaddr, proxypass, proxyport, proxyuser, server, silent, useaddr, useaddr_hostname, usepass, usepkcs11, useproxy, useproxypass, useproxytype, usetoken, verifyservercn
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "advancedoptions", "bindmode", "id", "p12encryption", "pass", "pkcs11id",
+            "proxyaddr", "proxypass", "proxyport", "proxyuser", "server", "useaddr",
+            "useaddr_hostname", "useproxypass", "useproxytype", "verifyservercn",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/openvpn/client_export/configs",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_openvpn_clients(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/clients
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: allow_compression, auth_pass, auth_retry_none, auth_user, caref, certref, create_gw, custom_options, data_ciphers, data_ciphers_fallback, description, dev_mode, digest, disable, dns_add, exit_notify, id, inactive_seconds, interface, keepalive_interval, keepalive_timeout, local_port, mode, passtos, ping_action, ping_action_seconds, ping_method, ping_seconds, protocol, proxy_addr, proxy_authtype, proxy_passwd, proxy_port, proxy_user, remote_cert_tls, remote_network, remote_networkv6, route_no_exec, route_no_pull, server_addr, server_port, sndrcvbuf, tls, tls_type, tlsauth_keydir, topology, tunnel_network, tunnel_networkv6, udp_fast_io, use_shaper, verbosity_level, vpnid, vpnif
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "allow_compression", "auth_pass", "auth_user", "caref", "certref",
+            "create_gw", "data_ciphers_fallback", "description", "dev_mode", "digest",
+            "exit_notify", "id", "inactive_seconds", "interface", "keepalive_interval",
+            "keepalive_timeout", "local_port", "mode", "ping_action",
+            "ping_action_seconds", "ping_method", "ping_seconds", "protocol",
+            "proxy_addr", "proxy_authtype", "proxy_passwd", "proxy_port", "proxy_user",
+            "server_addr", "server_port", "sndrcvbuf", "tls", "tls_type",
+            "tlsauth_keydir", "topology", "tunnel_network", "tunnel_networkv6",
+            "use_shaper", "verbosity_level", "vpnid", "vpnif",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/openvpn/clients",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_get_vpn_openvpn_server(
+    id: str | int,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/server
+
+    id: The ID of the object to target.
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if id is not None:
+        params["id"] = id
+    return await _client.request(
+        "GET",
+        "/api/v2/vpn/openvpn/server",
+        params=params,
+    )
+
+@mcp.tool()
+@_targeted
+async def pfsense_list_vpn_openvpn_servers(
+    limit: int | None = 0,
+    offset: int | None = 0,
+    sort_by: list[str] | None = None,
+    sort_flags: str | None = None,
+    sort_order: str | None = None,
+    fields: str | None = None,
+    query: dict[str, Any] | None = None,
+    compact: bool = False,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
+    firewall: str | None = None,
+) -> dict[str, Any] | list[Any] | str:
+    """GET /api/v2/vpn/openvpn/servers
+
+    limit: The number of objects to obtain at once. Set to 0 for no limit.
+    offset: The starting point in the dataset to begin fetching objects.
+    sort_by: The fields to sort response data by.
+    sort_flags: The sort flag to use to customize the behavior of the sort. Valid values: ['SORT_REGULAR', 'SORT_NUMERIC', 'SORT_STRING', 'SORT_LOCALE_STRING', 'SORT_NATURAL', 'SORT_FLAG_CASE']
+    sort_order: The order to sort response data by. Valid values: ['SORT_ASC', 'SORT_DESC']
+    firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+    fields: Comma-separated list of fields to return (e.g. 'id,name,address'). Reduces response size. The 'id' field is always included.
+    query: Row filter dict (e.g. {'name': 'foo'}); all entries must match. A plain field key uses exact string-coerced equality (list-valued fields must match the field's exact value shape). A 'field__op' key applies an operator: contains, startswith, endswith, regex, lt, lte, gt, gte, in (list or comma-separated values), cidr (address/network inside a network, e.g. {'source__cidr': '10.0.0.0/8'}). Operators match a list-valued field if any element matches. Exact matches on scalar fields are also forwarded as URL query params for server-side filtering; rows are always filtered client-side so behavior is consistent. Pass query as an object/dict, not a JSON-encoded string.
+    compact: Drop empty fields (null, '', [], {}) from each row to save space.
+    max_tokens: Approximate response size budget in tokens (default PFSENSE_MAX_RESPONSE_TOKENS, 0 = unlimited). If the matching rows don't fit, the leading rows are returned as {data, returned, omitted, next_offset, cursor}. omitted counts the matching rows already read but not returned; when more_available is also set, reading stopped early and more matching rows may follow, so omitted is only a lower bound.
+    cursor: Continue a trimmed result from where it stopped, served from the server's buffer without re-reading earlier rows. All other arguments except max_tokens are ignored. Cursors are single-use and short-lived; if one expired, repeat the query with offset=next_offset.
+    Rows are fetched in pages; limit counts matching rows and paging stops as soon as it is reached.
+    Known fields: allow_compression, authmode, caref, cert_depth, certref, client2client, connlimit, create_gw, custom_options, data_ciphers, data_ciphers_fallback, description, dev_mode, dh_length, digest, disable, dns_domain, dns_server1, dns_server2, dns_server3, dns_server4, duplicate_cn, dynamic_ip, ecdh_curve, gwredir, gwredir6, id, inactive_seconds, interface, keepalive_interval, keepalive_timeout, local_network, local_networkv6, local_port, maxclients, mode, netbios_enable, netbios_ntype, netbios_scope, ntp_server1, ntp_server2, passtos, ping_action, ping_action_push, ping_action_seconds, ping_method, ping_push, ping_seconds, protocol, push_blockoutsidedns, push_register_dns, remote_cert_tls, remote_network, remote_networkv6, serverbridge_dhcp, serverbridge_dhcp_end, serverbridge_dhcp_start, serverbridge_interface, serverbridge_routegateway, sndrcvbuf, strictusercn, tls, tls_type, tlsauth_keydir, topology, tunnel_network, tunnel_networkv6, use_tls, username_as_common_name, verbosity_level, vpnid, vpnif, wins_server1, wins_server2
+
+    If this tool returns an unexpected error, call pfsense_report_issue to report it.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_flags is not None:
+        params["sort_flags"] = sort_flags
+    if sort_order is not None:
+        params["sort_order"] = sort_order
+    if query is not None:
+        params.update(_server_query(query, frozenset({
+            "allow_compression", "caref", "cert_depth", "certref", "connlimit",
+            "create_gw", "data_ciphers_fallback", "description", "dev_mode",
+            "dh_length", "digest", "dns_domain", "dns_server1", "dns_server2",
+            "dns_server3", "dns_server4", "ecdh_curve", "id", "inactive_seconds",
+            "interface", "keepalive_interval", "keepalive_timeout", "local_port",
+            "maxclients", "mode", "netbios_ntype", "netbios_scope", "ntp_server1",
+            "ntp_server2", "ping_action", "ping_action_seconds", "ping_method",
+            "ping_seconds", "protocol", "serverbridge_dhcp_end",
+            "serverbridge_dhcp_start", "serverbridge_interface", "sndrcvbuf", "tls",
+            "tls_type", "tlsauth_keydir", "topology", "tunnel_network",
+            "tunnel_networkv6", "verbosity_level", "vpnid", "vpnif", "wins_server1",
+            "wins_server2",
+        })))
+    return await _list_paged(
+        "/api/v2/vpn/openvpn/servers",
+        params,
+        fields,
+        query,
+        compact=compact,
+        max_tokens=max_tokens,
+        cursor=cursor,
+    )
+
+
+if not _PFSENSE_READ_ONLY:
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_openvpn_cso(
+        common_name: str,
+        confirm: bool = False,
+        block: bool | None = None,
+        custom_options: list[str] | None = None,
+        description: str | None = None,
+        disable: bool | None = None,
+        dns_domain: str | None = None,
+        dns_server1: str | None = None,
+        dns_server2: str | None = None,
+        dns_server3: str | None = None,
+        dns_server4: str | None = None,
+        gwredir: bool | None = None,
+        local_network: list[str] | None = None,
+        local_networkv6: list[str] | None = None,
+        netbios_enable: bool | None = None,
+        netbios_ntype: int | None = None,
+        netbios_scope: str | None = None,
+        ntp_server1: str | None = None,
+        ntp_server2: str | None = None,
+        push_reset: bool | None = None,
+        remote_network: list[str] | None = None,
+        remote_networkv6: list[str] | None = None,
+        remove_options: list[str] | None = None,
+        server_list: list[str] | None = None,
+        tunnel_network: str | None = None,
+        tunnel_networkv6: str | None = None,
+        wins_server1: str | None = None,
+        wins_server2: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/openvpn/cso
+
+        common_name: The X.509 common name for the client certificate, or the username for VPNs utilizing password authentication.
+        block: Enables or disables the client from connecting to this server. Do not use this option to permanently disable a client due to a compromised key or password. Use a CRL instead.
+        custom_options: Additional OpenVPN options to add for this client.
+        description: The description for this client specific override.
+        disable: Disables this client specific override.
+        dns_domain: The default domain to provide to the client.
+        dns_server1: The primary DNS server to provide to the client.
+        dns_server2: The secondary DNS server to provide to the client.
+        dns_server3: The tertiary DNS server to provide to the client.
+        dns_server4: The quaternary DNS server to provide to the client.
+        gwredir: Enable forcing all client-generated traffic through the tunnel.
+        local_network: The IPv4 server-side networks that will be accessible from this particular client.
+        local_networkv6: the IPv6 server-side networks that will be accessible from this particular client.
+        netbios_enable: Enables or disables NetBIOS over TCP/IP.
+        netbios_ntype: The NetBIOS node type.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true` Valid values: [0, 1, 2, 4, 8]
+        netbios_scope: The NetBIOS Scope ID. This provides an extended naming service for NetBIOS over TCP/IP. The NetBIOS scope ID isolates NetBIOS traffic on a single network to only those nodes with the same NetBIOS scope ID.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        ntp_server1: The primary NTP server to provide to the client.
+        ntp_server2: The secondary NTP server to provide to the client.
+        push_reset: Enables or disables preventing this client from receiving any server-defined client settings.
+        remote_network: The IPv4 client-side networks that will be routed to this client specifically using iroute, so that a site-to-site VPN can be established.
+        remote_networkv6: The IPv6 client-side networks that will be routed to this client specifically using iroute, so that a site-to-site VPN can be established.
+        remove_options: Specifies the push-remove options to apply to the clientThis field is only available when the following conditions are met:- `push_reset` must be equal to `false`
+        server_list: The OpenVPN servers that will utilize this override. When no servers are specified, the override will apply to all servers.
+        tunnel_network: The IPv4 virtual network used for private communications between the server and client hosts.
+        tunnel_networkv6: The IPv6 virtual network used for private communications between the server and client hosts.
+        wins_server1: The primary WINS server to provide to the client.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        wins_server2: The secondary WINS server to provide to the client.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/openvpn/cso. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if common_name is not None:
+            body["common_name"] = common_name
+        if block is not None:
+            body["block"] = block
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if description is not None:
+            body["description"] = description
+        if disable is not None:
+            body["disable"] = disable
+        if dns_domain is not None:
+            body["dns_domain"] = dns_domain
+        if dns_server1 is not None:
+            body["dns_server1"] = dns_server1
+        if dns_server2 is not None:
+            body["dns_server2"] = dns_server2
+        if dns_server3 is not None:
+            body["dns_server3"] = dns_server3
+        if dns_server4 is not None:
+            body["dns_server4"] = dns_server4
+        if gwredir is not None:
+            body["gwredir"] = gwredir
+        if local_network is not None:
+            body["local_network"] = local_network
+        if local_networkv6 is not None:
+            body["local_networkv6"] = local_networkv6
+        if netbios_enable is not None:
+            body["netbios_enable"] = netbios_enable
+        if netbios_ntype is not None:
+            body["netbios_ntype"] = netbios_ntype
+        if netbios_scope is not None:
+            body["netbios_scope"] = netbios_scope
+        if ntp_server1 is not None:
+            body["ntp_server1"] = ntp_server1
+        if ntp_server2 is not None:
+            body["ntp_server2"] = ntp_server2
+        if push_reset is not None:
+            body["push_reset"] = push_reset
+        if remote_network is not None:
+            body["remote_network"] = remote_network
+        if remote_networkv6 is not None:
+            body["remote_networkv6"] = remote_networkv6
+        if remove_options is not None:
+            body["remove_options"] = remove_options
+        if server_list is not None:
+            body["server_list"] = server_list
+        if tunnel_network is not None:
+            body["tunnel_network"] = tunnel_network
+        if tunnel_networkv6 is not None:
+            body["tunnel_networkv6"] = tunnel_networkv6
+        if wins_server1 is not None:
+            body["wins_server1"] = wins_server1
+        if wins_server2 is not None:
+            body["wins_server2"] = wins_server2
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/openvpn/cso",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_openvpn_cso(
+        id: str | int,
+        confirm: bool = False,
+        block: bool | None = None,
+        common_name: str | None = None,
+        custom_options: list[str] | None = None,
+        description: str | None = None,
+        disable: bool | None = None,
+        dns_domain: str | None = None,
+        dns_server1: str | None = None,
+        dns_server2: str | None = None,
+        dns_server3: str | None = None,
+        dns_server4: str | None = None,
+        gwredir: bool | None = None,
+        local_network: list[str] | None = None,
+        local_networkv6: list[str] | None = None,
+        netbios_enable: bool | None = None,
+        netbios_ntype: int | None = None,
+        netbios_scope: str | None = None,
+        ntp_server1: str | None = None,
+        ntp_server2: str | None = None,
+        push_reset: bool | None = None,
+        remote_network: list[str] | None = None,
+        remote_networkv6: list[str] | None = None,
+        remove_options: list[str] | None = None,
+        server_list: list[str] | None = None,
+        tunnel_network: str | None = None,
+        tunnel_networkv6: str | None = None,
+        wins_server1: str | None = None,
+        wins_server2: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/openvpn/cso
+
+        id: The ID of the object or resource to interact with.
+        block: Enables or disables the client from connecting to this server. Do not use this option to permanently disable a client due to a compromised key or password. Use a CRL instead.
+        common_name: The X.509 common name for the client certificate, or the username for VPNs utilizing password authentication.
+        custom_options: Additional OpenVPN options to add for this client.
+        description: The description for this client specific override.
+        disable: Disables this client specific override.
+        dns_domain: The default domain to provide to the client.
+        dns_server1: The primary DNS server to provide to the client.
+        dns_server2: The secondary DNS server to provide to the client.
+        dns_server3: The tertiary DNS server to provide to the client.
+        dns_server4: The quaternary DNS server to provide to the client.
+        gwredir: Enable forcing all client-generated traffic through the tunnel.
+        local_network: The IPv4 server-side networks that will be accessible from this particular client.
+        local_networkv6: the IPv6 server-side networks that will be accessible from this particular client.
+        netbios_enable: Enables or disables NetBIOS over TCP/IP.
+        netbios_ntype: The NetBIOS node type.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true` Valid values: [0, 1, 2, 4, 8]
+        netbios_scope: The NetBIOS Scope ID. This provides an extended naming service for NetBIOS over TCP/IP. The NetBIOS scope ID isolates NetBIOS traffic on a single network to only those nodes with the same NetBIOS scope ID.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        ntp_server1: The primary NTP server to provide to the client.
+        ntp_server2: The secondary NTP server to provide to the client.
+        push_reset: Enables or disables preventing this client from receiving any server-defined client settings.
+        remote_network: The IPv4 client-side networks that will be routed to this client specifically using iroute, so that a site-to-site VPN can be established.
+        remote_networkv6: The IPv6 client-side networks that will be routed to this client specifically using iroute, so that a site-to-site VPN can be established.
+        remove_options: Specifies the push-remove options to apply to the clientThis field is only available when the following conditions are met:- `push_reset` must be equal to `false`
+        server_list: The OpenVPN servers that will utilize this override. When no servers are specified, the override will apply to all servers.
+        tunnel_network: The IPv4 virtual network used for private communications between the server and client hosts.
+        tunnel_networkv6: The IPv6 virtual network used for private communications between the server and client hosts.
+        wins_server1: The primary WINS server to provide to the client.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        wins_server2: The secondary WINS server to provide to the client.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/openvpn/cso. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if block is not None:
+            body["block"] = block
+        if common_name is not None:
+            body["common_name"] = common_name
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if description is not None:
+            body["description"] = description
+        if disable is not None:
+            body["disable"] = disable
+        if dns_domain is not None:
+            body["dns_domain"] = dns_domain
+        if dns_server1 is not None:
+            body["dns_server1"] = dns_server1
+        if dns_server2 is not None:
+            body["dns_server2"] = dns_server2
+        if dns_server3 is not None:
+            body["dns_server3"] = dns_server3
+        if dns_server4 is not None:
+            body["dns_server4"] = dns_server4
+        if gwredir is not None:
+            body["gwredir"] = gwredir
+        if local_network is not None:
+            body["local_network"] = local_network
+        if local_networkv6 is not None:
+            body["local_networkv6"] = local_networkv6
+        if netbios_enable is not None:
+            body["netbios_enable"] = netbios_enable
+        if netbios_ntype is not None:
+            body["netbios_ntype"] = netbios_ntype
+        if netbios_scope is not None:
+            body["netbios_scope"] = netbios_scope
+        if ntp_server1 is not None:
+            body["ntp_server1"] = ntp_server1
+        if ntp_server2 is not None:
+            body["ntp_server2"] = ntp_server2
+        if push_reset is not None:
+            body["push_reset"] = push_reset
+        if remote_network is not None:
+            body["remote_network"] = remote_network
+        if remote_networkv6 is not None:
+            body["remote_networkv6"] = remote_networkv6
+        if remove_options is not None:
+            body["remove_options"] = remove_options
+        if server_list is not None:
+            body["server_list"] = server_list
+        if tunnel_network is not None:
+            body["tunnel_network"] = tunnel_network
+        if tunnel_networkv6 is not None:
+            body["tunnel_networkv6"] = tunnel_networkv6
+        if wins_server1 is not None:
+            body["wins_server1"] = wins_server1
+        if wins_server2 is not None:
+            body["wins_server2"] = wins_server2
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/openvpn/cso",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_cso(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/cso
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/cso. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/cso",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_csos(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/csos
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/csos. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/csos",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_openvpn_client(
+        caref: str,
+        data_ciphers: list[str],
+        data_ciphers_fallback: str,
+        dev_mode: str,
+        digest: str,
+        mode: str,
+        protocol: str,
+        server_addr: str,
+        server_port: str,
+        confirm: bool = False,
+        allow_compression: str | None = 'no',
+        auth_pass: str | None = None,
+        auth_retry_none: bool | None = None,
+        auth_user: str | None = None,
+        certref: str | None = None,
+        create_gw: str | None = 'both',
+        custom_options: list[str] | None = None,
+        description: str | None = None,
+        disable: bool | None = None,
+        dns_add: bool | None = None,
+        exit_notify: str | None = 'none',
+        inactive_seconds: int | None = 300,
+        interface: str | None = None,
+        keepalive_interval: int | None = None,
+        keepalive_timeout: int | None = None,
+        local_port: str | None = None,
+        passtos: bool | None = None,
+        ping_action: str | None = None,
+        ping_action_seconds: int | None = None,
+        ping_method: str | None = 'keepalive',
+        ping_seconds: int | None = None,
+        proxy_addr: str | None = None,
+        proxy_authtype: str | None = 'none',
+        proxy_passwd: str | None = None,
+        proxy_port: str | None = None,
+        proxy_user: str | None = None,
+        remote_cert_tls: bool | None = True,
+        remote_network: list[str] | None = None,
+        remote_networkv6: list[str] | None = None,
+        route_no_exec: bool | None = None,
+        route_no_pull: bool | None = None,
+        sndrcvbuf: int | None = None,
+        tls: str | None = None,
+        tls_type: str | None = None,
+        tlsauth_keydir: str | None = None,
+        topology: str | None = None,
+        tunnel_network: str | None = None,
+        tunnel_networkv6: str | None = None,
+        udp_fast_io: bool | None = None,
+        use_shaper: int | None = None,
+        verbosity_level: int | None = 1,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/openvpn/client
+
+        caref: The `refid` of the CA object to assume as the peer CA.
+        data_ciphers: The encryption algorithms/ciphers allowed by this OpenVPN client.
+        data_ciphers_fallback: The fallback encryption algorithm/cipher used for data channel packets when communicating with clients that do not support data encryption algorithm negotiation (e.g. Shared Key).
+        dev_mode: The carrier mode for this OpenVPN client. `tun` mode carries IPv4 and IPv6 (layer 3) and is the most common and compatible mode across all platforms. `tap` mode is capable of carrying 802.3 (layer 2). Valid values: ['tun', 'tap']
+        digest: The algorithm used to authenticate data channel packets, and control channel packets if a TLS Key is present.
+        mode: The OpenVPN client mode. Valid values: ['p2p_tls']
+        protocol: The protocol used by this OpenVPN client. Valid values: ['UDP4', 'UDP6', 'UDP', 'TCP4', 'TCP6', 'TCP']
+        server_addr: The IP address or hostname of the OpenVPN server this client will connect to.
+        server_port: The port used by the server to receive client connections. Valid options are: a TCP/UDP port number
+        allow_compression: The compression mode allowed by this OpenVPN client. Compression can potentially increase throughput but may allow an attacker to extract secrets if they can control compressed plaintext traversing the VPN (e.g. HTTP) Valid values: ['no', 'yes', 'asym']
+        auth_pass: The password used to authenticate with the OpenVPN server.This field is only available when the following conditions are met:- `auth_user` must not be equal to `NULL`
+        auth_retry_none: Disables retrying authentication if an authentication failed error is received from the server
+        auth_user: The username used to authenticate with the OpenVPN server.
+        certref: The `refid` of the certificate object to assume as the OpenVPN client certificate.
+        create_gw: The gateway type(s) that will be created when a virtual interface is assigned to this OpenVPN server Valid values: ['both', 'v4only', 'v6only']
+        custom_options: Additional options to add to the OpenVPN client configuration.
+        description: The description for this OpenVPN client.
+        disable: Disables this OpenVPN client.
+        dns_add: Enables or disables using the DNS server(s) provided by the OpenVPN server.
+        exit_notify: The number of times this client will attempt to send an exit notifications. Valid values: ['1', '2', '3', '4', '5', 'none']
+        inactive_seconds: The amount of time (in seconds) until a client connection is closed for inactivity.
+        interface: The interface used by the firewall to originate this OpenVPN client connection.This field is only available when the following conditions are met:- `protocol` must not be one of [ UDP, TCP ]
+        keepalive_interval: The keepalive interval parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        keepalive_timeout: The keepalive timeout parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        local_port: The port binding used by OpenVPN for client connections. Valid options are: a TCP/UDP port number
+        passtos: Enables or disables setting the TOS IP header value of tunnel packets to match the encapsulated packet value.
+        ping_action: The action to take after a ping to the remote peer times-out.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'` Valid values: ['ping_restart', 'ping_exit']
+        ping_action_seconds: The number of seconds that must elapse before the ping is considered a timeout and the configured `ping_action` is performed.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_method: The method used to define ping configuration. Valid values: ['keepalive', 'ping']
+        ping_seconds: The number of seconds to accept no packets before sending a ping to the remote peer over the TCP/UDP control channel.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        proxy_addr: The address for an HTTP Proxy this client can use to connect to a remote server.
+        proxy_authtype: The type of authentication used by the proxy server. Valid values: ['none', 'basic', 'ntlm']
+        proxy_passwd: The username to use for authentication to the remote proxy.This field is only available when the following conditions are met:- `proxy_authtype` must not be equal to `'none'`
+        proxy_port: The port used by the HTTP Proxy. Valid options are: a TCP/UDP port number
+        proxy_user: The username to use for authentication to the remote proxy.This field is only available when the following conditions are met:- `proxy_authtype` must not be equal to `'none'`
+        remote_cert_tls: Enables or disables requiring hosts to have a client certificate to connect.
+        remote_network: IPv4 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        remote_networkv6: IPv6 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        route_no_exec: Enables or disables adding/removing routes automatically.
+        route_no_pull: Enables or disables the servers ability to add routes to the client's routing table.
+        sndrcvbuf: The send and receive buffer size for OpenVPN. Set to null to use the system default. Valid values: [65536, 131072, 262144, 524288, 1048576, 2097152]
+        tls: The TLS key this OpenVPN client will use to sign control channel packets with an HMAC signature for authentication when establishing the tunnel.
+        tls_type: The TLS key usage type. In `auth` mode, the TLS key is used only as HMAC authentication for the control channel, protecting the peers from unauthorized connections. The `crypt` mode encrypts the control channel communication in addition to providing authentication, providing more privacy and traffic control channel obfuscation.This field is only available when the following conditions are met:- `tls` must not be equal to `NULL` Valid values: ['auth', 'crypt']
+        tlsauth_keydir: The TLS key direction. This must be set to complementary values on the client and client. For example, if the client is set to 0, the client must be set to 1. Both may be set to omit the direction, in which case the TLS Key will be used bidirectionally.This field is only available when the following conditions are met:- `tls` must not be equal to `NULL` Valid values: ['default', '0', '1', '2']
+        topology: The method used to supply a virtual adapter IP address to clients when using TUN mode on IPv4.This field is only available when the following conditions are met:- `dev_mode` must be equal to `'tun'` Valid values: ['subnet', 'net30']
+        tunnel_network: The IPv4 virtual network used for private communications between this client and client hosts.
+        tunnel_networkv6: The IPv6 virtual network used for private communications between this client and client hosts.
+        udp_fast_io: Enables or disables fast I/O operations with UDP writes to tun/tap (Experimental).
+        use_shaper: Maximum outgoing bandwidth (in bytes per second) for this tunnel. Use `null` no limit.
+        verbosity_level: The OpenVPN logging verbosity level. Valid values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/openvpn/client. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if caref is not None:
+            body["caref"] = caref
+        if data_ciphers is not None:
+            body["data_ciphers"] = data_ciphers
+        if data_ciphers_fallback is not None:
+            body["data_ciphers_fallback"] = data_ciphers_fallback
+        if dev_mode is not None:
+            body["dev_mode"] = dev_mode
+        if digest is not None:
+            body["digest"] = digest
+        if mode is not None:
+            body["mode"] = mode
+        if protocol is not None:
+            body["protocol"] = protocol
+        if server_addr is not None:
+            body["server_addr"] = server_addr
+        if server_port is not None:
+            body["server_port"] = server_port
+        if allow_compression is not None:
+            body["allow_compression"] = allow_compression
+        if auth_pass is not None:
+            body["auth_pass"] = auth_pass
+        if auth_retry_none is not None:
+            body["auth_retry_none"] = auth_retry_none
+        if auth_user is not None:
+            body["auth_user"] = auth_user
+        if certref is not None:
+            body["certref"] = certref
+        if create_gw is not None:
+            body["create_gw"] = create_gw
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if description is not None:
+            body["description"] = description
+        if disable is not None:
+            body["disable"] = disable
+        if dns_add is not None:
+            body["dns_add"] = dns_add
+        if exit_notify is not None:
+            body["exit_notify"] = exit_notify
+        if inactive_seconds is not None:
+            body["inactive_seconds"] = inactive_seconds
+        if interface is not None:
+            body["interface"] = interface
+        if keepalive_interval is not None:
+            body["keepalive_interval"] = keepalive_interval
+        if keepalive_timeout is not None:
+            body["keepalive_timeout"] = keepalive_timeout
+        if local_port is not None:
+            body["local_port"] = local_port
+        if passtos is not None:
+            body["passtos"] = passtos
+        if ping_action is not None:
+            body["ping_action"] = ping_action
+        if ping_action_seconds is not None:
+            body["ping_action_seconds"] = ping_action_seconds
+        if ping_method is not None:
+            body["ping_method"] = ping_method
+        if ping_seconds is not None:
+            body["ping_seconds"] = ping_seconds
+        if proxy_addr is not None:
+            body["proxy_addr"] = proxy_addr
+        if proxy_authtype is not None:
+            body["proxy_authtype"] = proxy_authtype
+        if proxy_passwd is not None:
+            body["proxy_passwd"] = proxy_passwd
+        if proxy_port is not None:
+            body["proxy_port"] = proxy_port
+        if proxy_user is not None:
+            body["proxy_user"] = proxy_user
+        if remote_cert_tls is not None:
+            body["remote_cert_tls"] = remote_cert_tls
+        if remote_network is not None:
+            body["remote_network"] = remote_network
+        if remote_networkv6 is not None:
+            body["remote_networkv6"] = remote_networkv6
+        if route_no_exec is not None:
+            body["route_no_exec"] = route_no_exec
+        if route_no_pull is not None:
+            body["route_no_pull"] = route_no_pull
+        if sndrcvbuf is not None:
+            body["sndrcvbuf"] = sndrcvbuf
+        if tls is not None:
+            body["tls"] = tls
+        if tls_type is not None:
+            body["tls_type"] = tls_type
+        if tlsauth_keydir is not None:
+            body["tlsauth_keydir"] = tlsauth_keydir
+        if topology is not None:
+            body["topology"] = topology
+        if tunnel_network is not None:
+            body["tunnel_network"] = tunnel_network
+        if tunnel_networkv6 is not None:
+            body["tunnel_networkv6"] = tunnel_networkv6
+        if udp_fast_io is not None:
+            body["udp_fast_io"] = udp_fast_io
+        if use_shaper is not None:
+            body["use_shaper"] = use_shaper
+        if verbosity_level is not None:
+            body["verbosity_level"] = verbosity_level
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/openvpn/client",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_openvpn_client(
+        id: str | int,
+        confirm: bool = False,
+        allow_compression: str | None = None,
+        auth_pass: str | None = None,
+        auth_retry_none: bool | None = None,
+        auth_user: str | None = None,
+        caref: str | None = None,
+        certref: str | None = None,
+        create_gw: str | None = None,
+        custom_options: list[str] | None = None,
+        data_ciphers: list[str] | None = None,
+        data_ciphers_fallback: str | None = None,
+        description: str | None = None,
+        dev_mode: str | None = None,
+        digest: str | None = None,
+        disable: bool | None = None,
+        dns_add: bool | None = None,
+        exit_notify: str | None = None,
+        inactive_seconds: int | None = None,
+        interface: str | None = None,
+        keepalive_interval: int | None = None,
+        keepalive_timeout: int | None = None,
+        local_port: str | None = None,
+        mode: str | None = None,
+        passtos: bool | None = None,
+        ping_action: str | None = None,
+        ping_action_seconds: int | None = None,
+        ping_method: str | None = None,
+        ping_seconds: int | None = None,
+        protocol: str | None = None,
+        proxy_addr: str | None = None,
+        proxy_authtype: str | None = None,
+        proxy_passwd: str | None = None,
+        proxy_port: str | None = None,
+        proxy_user: str | None = None,
+        remote_cert_tls: bool | None = None,
+        remote_network: list[str] | None = None,
+        remote_networkv6: list[str] | None = None,
+        route_no_exec: bool | None = None,
+        route_no_pull: bool | None = None,
+        server_addr: str | None = None,
+        server_port: str | None = None,
+        sndrcvbuf: int | None = None,
+        tls: str | None = None,
+        tls_type: str | None = None,
+        tlsauth_keydir: str | None = None,
+        topology: str | None = None,
+        tunnel_network: str | None = None,
+        tunnel_networkv6: str | None = None,
+        udp_fast_io: bool | None = None,
+        use_shaper: int | None = None,
+        verbosity_level: int | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/openvpn/client
+
+        id: The ID of the object or resource to interact with.
+        allow_compression: The compression mode allowed by this OpenVPN client. Compression can potentially increase throughput but may allow an attacker to extract secrets if they can control compressed plaintext traversing the VPN (e.g. HTTP) Valid values: ['no', 'yes', 'asym']
+        auth_pass: The password used to authenticate with the OpenVPN server.This field is only available when the following conditions are met:- `auth_user` must not be equal to `NULL`
+        auth_retry_none: Disables retrying authentication if an authentication failed error is received from the server
+        auth_user: The username used to authenticate with the OpenVPN server.
+        caref: The `refid` of the CA object to assume as the peer CA.
+        certref: The `refid` of the certificate object to assume as the OpenVPN client certificate.
+        create_gw: The gateway type(s) that will be created when a virtual interface is assigned to this OpenVPN server Valid values: ['both', 'v4only', 'v6only']
+        custom_options: Additional options to add to the OpenVPN client configuration.
+        data_ciphers: The encryption algorithms/ciphers allowed by this OpenVPN client.
+        data_ciphers_fallback: The fallback encryption algorithm/cipher used for data channel packets when communicating with clients that do not support data encryption algorithm negotiation (e.g. Shared Key).
+        description: The description for this OpenVPN client.
+        dev_mode: The carrier mode for this OpenVPN client. `tun` mode carries IPv4 and IPv6 (layer 3) and is the most common and compatible mode across all platforms. `tap` mode is capable of carrying 802.3 (layer 2). Valid values: ['tun', 'tap']
+        digest: The algorithm used to authenticate data channel packets, and control channel packets if a TLS Key is present.
+        disable: Disables this OpenVPN client.
+        dns_add: Enables or disables using the DNS server(s) provided by the OpenVPN server.
+        exit_notify: The number of times this client will attempt to send an exit notifications. Valid values: ['1', '2', '3', '4', '5', 'none']
+        inactive_seconds: The amount of time (in seconds) until a client connection is closed for inactivity.
+        interface: The interface used by the firewall to originate this OpenVPN client connection.This field is only available when the following conditions are met:- `protocol` must not be one of [ UDP, TCP ]
+        keepalive_interval: The keepalive interval parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        keepalive_timeout: The keepalive timeout parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        local_port: The port binding used by OpenVPN for client connections. Valid options are: a TCP/UDP port number
+        mode: The OpenVPN client mode. Valid values: ['p2p_tls']
+        passtos: Enables or disables setting the TOS IP header value of tunnel packets to match the encapsulated packet value.
+        ping_action: The action to take after a ping to the remote peer times-out.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'` Valid values: ['ping_restart', 'ping_exit']
+        ping_action_seconds: The number of seconds that must elapse before the ping is considered a timeout and the configured `ping_action` is performed.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_method: The method used to define ping configuration. Valid values: ['keepalive', 'ping']
+        ping_seconds: The number of seconds to accept no packets before sending a ping to the remote peer over the TCP/UDP control channel.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        protocol: The protocol used by this OpenVPN client. Valid values: ['UDP4', 'UDP6', 'UDP', 'TCP4', 'TCP6', 'TCP']
+        proxy_addr: The address for an HTTP Proxy this client can use to connect to a remote server.
+        proxy_authtype: The type of authentication used by the proxy server. Valid values: ['none', 'basic', 'ntlm']
+        proxy_passwd: The username to use for authentication to the remote proxy.This field is only available when the following conditions are met:- `proxy_authtype` must not be equal to `'none'`
+        proxy_port: The port used by the HTTP Proxy. Valid options are: a TCP/UDP port number
+        proxy_user: The username to use for authentication to the remote proxy.This field is only available when the following conditions are met:- `proxy_authtype` must not be equal to `'none'`
+        remote_cert_tls: Enables or disables requiring hosts to have a client certificate to connect.
+        remote_network: IPv4 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        remote_networkv6: IPv6 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        route_no_exec: Enables or disables adding/removing routes automatically.
+        route_no_pull: Enables or disables the servers ability to add routes to the client's routing table.
+        server_addr: The IP address or hostname of the OpenVPN server this client will connect to.
+        server_port: The port used by the server to receive client connections. Valid options are: a TCP/UDP port number
+        sndrcvbuf: The send and receive buffer size for OpenVPN. Set to null to use the system default. Valid values: [65536, 131072, 262144, 524288, 1048576, 2097152]
+        tls: The TLS key this OpenVPN client will use to sign control channel packets with an HMAC signature for authentication when establishing the tunnel.
+        tls_type: The TLS key usage type. In `auth` mode, the TLS key is used only as HMAC authentication for the control channel, protecting the peers from unauthorized connections. The `crypt` mode encrypts the control channel communication in addition to providing authentication, providing more privacy and traffic control channel obfuscation.This field is only available when the following conditions are met:- `tls` must not be equal to `NULL` Valid values: ['auth', 'crypt']
+        tlsauth_keydir: The TLS key direction. This must be set to complementary values on the client and client. For example, if the client is set to 0, the client must be set to 1. Both may be set to omit the direction, in which case the TLS Key will be used bidirectionally.This field is only available when the following conditions are met:- `tls` must not be equal to `NULL` Valid values: ['default', '0', '1', '2']
+        topology: The method used to supply a virtual adapter IP address to clients when using TUN mode on IPv4.This field is only available when the following conditions are met:- `dev_mode` must be equal to `'tun'` Valid values: ['subnet', 'net30']
+        tunnel_network: The IPv4 virtual network used for private communications between this client and client hosts.
+        tunnel_networkv6: The IPv6 virtual network used for private communications between this client and client hosts.
+        udp_fast_io: Enables or disables fast I/O operations with UDP writes to tun/tap (Experimental).
+        use_shaper: Maximum outgoing bandwidth (in bytes per second) for this tunnel. Use `null` no limit.
+        verbosity_level: The OpenVPN logging verbosity level. Valid values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/openvpn/client. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if allow_compression is not None:
+            body["allow_compression"] = allow_compression
+        if auth_pass is not None:
+            body["auth_pass"] = auth_pass
+        if auth_retry_none is not None:
+            body["auth_retry_none"] = auth_retry_none
+        if auth_user is not None:
+            body["auth_user"] = auth_user
+        if caref is not None:
+            body["caref"] = caref
+        if certref is not None:
+            body["certref"] = certref
+        if create_gw is not None:
+            body["create_gw"] = create_gw
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if data_ciphers is not None:
+            body["data_ciphers"] = data_ciphers
+        if data_ciphers_fallback is not None:
+            body["data_ciphers_fallback"] = data_ciphers_fallback
+        if description is not None:
+            body["description"] = description
+        if dev_mode is not None:
+            body["dev_mode"] = dev_mode
+        if digest is not None:
+            body["digest"] = digest
+        if disable is not None:
+            body["disable"] = disable
+        if dns_add is not None:
+            body["dns_add"] = dns_add
+        if exit_notify is not None:
+            body["exit_notify"] = exit_notify
+        if inactive_seconds is not None:
+            body["inactive_seconds"] = inactive_seconds
+        if interface is not None:
+            body["interface"] = interface
+        if keepalive_interval is not None:
+            body["keepalive_interval"] = keepalive_interval
+        if keepalive_timeout is not None:
+            body["keepalive_timeout"] = keepalive_timeout
+        if local_port is not None:
+            body["local_port"] = local_port
+        if mode is not None:
+            body["mode"] = mode
+        if passtos is not None:
+            body["passtos"] = passtos
+        if ping_action is not None:
+            body["ping_action"] = ping_action
+        if ping_action_seconds is not None:
+            body["ping_action_seconds"] = ping_action_seconds
+        if ping_method is not None:
+            body["ping_method"] = ping_method
+        if ping_seconds is not None:
+            body["ping_seconds"] = ping_seconds
+        if protocol is not None:
+            body["protocol"] = protocol
+        if proxy_addr is not None:
+            body["proxy_addr"] = proxy_addr
+        if proxy_authtype is not None:
+            body["proxy_authtype"] = proxy_authtype
+        if proxy_passwd is not None:
+            body["proxy_passwd"] = proxy_passwd
+        if proxy_port is not None:
+            body["proxy_port"] = proxy_port
+        if proxy_user is not None:
+            body["proxy_user"] = proxy_user
+        if remote_cert_tls is not None:
+            body["remote_cert_tls"] = remote_cert_tls
+        if remote_network is not None:
+            body["remote_network"] = remote_network
+        if remote_networkv6 is not None:
+            body["remote_networkv6"] = remote_networkv6
+        if route_no_exec is not None:
+            body["route_no_exec"] = route_no_exec
+        if route_no_pull is not None:
+            body["route_no_pull"] = route_no_pull
+        if server_addr is not None:
+            body["server_addr"] = server_addr
+        if server_port is not None:
+            body["server_port"] = server_port
+        if sndrcvbuf is not None:
+            body["sndrcvbuf"] = sndrcvbuf
+        if tls is not None:
+            body["tls"] = tls
+        if tls_type is not None:
+            body["tls_type"] = tls_type
+        if tlsauth_keydir is not None:
+            body["tlsauth_keydir"] = tlsauth_keydir
+        if topology is not None:
+            body["topology"] = topology
+        if tunnel_network is not None:
+            body["tunnel_network"] = tunnel_network
+        if tunnel_networkv6 is not None:
+            body["tunnel_networkv6"] = tunnel_networkv6
+        if udp_fast_io is not None:
+            body["udp_fast_io"] = udp_fast_io
+        if use_shaper is not None:
+            body["use_shaper"] = use_shaper
+        if verbosity_level is not None:
+            body["verbosity_level"] = verbosity_level
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/openvpn/client",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_client(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/client
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/client. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/client",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_openvpn_client_export_config(
+        server: int,
+        confirm: bool = False,
+        advancedoptions: str | None = None,
+        bindmode: str | None = 'nobind',
+        blockoutsidedns: bool | None = None,
+        legacy: bool | None = None,
+        p12encryption: str | None = 'high',
+        pass_: str | None = None,
+        pkcs11id: str | None = None,
+        pkcs11providers: list[str] | None = None,
+        proxyaddr: str | None = None,
+        proxypass: str | None = None,
+        proxyport: str | None = None,
+        proxyuser: str | None = None,
+        silent: bool | None = None,
+        useaddr: str | None = 'serveraddr',
+        useaddr_hostname: str | None = None,
+        usepass: bool | None = None,
+        usepkcs11: bool | None = None,
+        useproxy: bool | None = None,
+        useproxypass: str | None = None,
+        useproxytype: str | None = None,
+        usetoken: bool | None = None,
+        verifyservercn: str | None = 'auto',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/openvpn/client_export/config
+
+        server: The VPN ID of the OpenVPN server this client export corresponds to.
+        advancedoptions: Additional options to add to the OpenVPN client export configuration.
+        bindmode: The port binding mode to use. If OpenVPN client binds to the default OpenVPN port (1194), two clients may not run concurrently. Valid values: ['nobind', 'lport0', 'bind']
+        blockoutsidedns: Block access to DNS servers except across OpenVPN while connected, forcing clients to use only VPN DNS servers.
+        legacy: Do not include OpenVPN 2.5 and later settings in the client configuration.
+        p12encryption: The level of encryption to use when exporting a PKCS#12 archive. Encryption support varies by Operating System and program Valid values: ['high', 'low', 'legacy']
+        pass_: Password used to protect the certificate file contents.This field is only available when the following conditions are met:- `usepass` must be equal to `true`
+        pkcs11id: The object's ID on the PKCS#11 device.This field is only available when the following conditions are met:- `usepkcs11` must be equal to `true`
+        pkcs11providers: The client local path to the PKCS#11 provider(s) (DLL, module)This field is only available when the following conditions are met:- `usepkcs11` must be equal to `true`
+        proxyaddr: The IP address or hostname of the proxy server to use.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`
+        proxypass: The password to use to authenticate with the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`- `useproxypass` must be one of [ basic, ntlm ]
+        proxyport: The port where the proxy server is listening. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `useproxy` must be equal to `true`
+        proxyuser: The username to use to authenticate with the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`- `useproxypass` must be one of [ basic, ntlm ]
+        silent: Create Windows installer for unattended deploy.
+        useaddr: The method to use for the OpenVPN server address listed in the config export. Valid values: ['serveraddr', 'servermagic', 'servermagichost', 'serverhostname', 'other']
+        useaddr_hostname: The hostname to use for the OpenVPN server address.This field is only available when the following conditions are met:- `useaddr` must be equal to `'other'`
+        usepass: Use a password to protect the PKCS#12 file contents or key in Viscosity bundles.
+        usepkcs11: Use PKCS#11 storage device (cryptographic token, HSM, smart card) instead of local files.
+        useproxy: Use proxy to communicate with the OpenVPN server.
+        useproxypass: The type of authentication to use for the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true` Valid values: ['none', 'basic', 'ntlm']
+        useproxytype: The proxy type to use.This field is only available when the following conditions are met:- `useproxy` must be equal to `true` Valid values: ['http', 'socks']
+        usetoken: Use Microsoft Certificate Storage instead of local files.
+        verifyservercn: Verify the server certificate Common Name (CN) when the client connects. Valid values: ['auto', 'none']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/openvpn/client_export/config. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if server is not None:
+            body["server"] = server
+        if advancedoptions is not None:
+            body["advancedoptions"] = advancedoptions
+        if bindmode is not None:
+            body["bindmode"] = bindmode
+        if blockoutsidedns is not None:
+            body["blockoutsidedns"] = blockoutsidedns
+        if legacy is not None:
+            body["legacy"] = legacy
+        if p12encryption is not None:
+            body["p12encryption"] = p12encryption
+        if pass_ is not None:
+            body["pass"] = pass_
+        if pkcs11id is not None:
+            body["pkcs11id"] = pkcs11id
+        if pkcs11providers is not None:
+            body["pkcs11providers"] = pkcs11providers
+        if proxyaddr is not None:
+            body["proxyaddr"] = proxyaddr
+        if proxypass is not None:
+            body["proxypass"] = proxypass
+        if proxyport is not None:
+            body["proxyport"] = proxyport
+        if proxyuser is not None:
+            body["proxyuser"] = proxyuser
+        if silent is not None:
+            body["silent"] = silent
+        if useaddr is not None:
+            body["useaddr"] = useaddr
+        if useaddr_hostname is not None:
+            body["useaddr_hostname"] = useaddr_hostname
+        if usepass is not None:
+            body["usepass"] = usepass
+        if usepkcs11 is not None:
+            body["usepkcs11"] = usepkcs11
+        if useproxy is not None:
+            body["useproxy"] = useproxy
+        if useproxypass is not None:
+            body["useproxypass"] = useproxypass
+        if useproxytype is not None:
+            body["useproxytype"] = useproxytype
+        if usetoken is not None:
+            body["usetoken"] = usetoken
+        if verifyservercn is not None:
+            body["verifyservercn"] = verifyservercn
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/openvpn/client_export/config",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_openvpn_client_export_config(
+        id: str | int,
+        confirm: bool = False,
+        advancedoptions: str | None = None,
+        bindmode: str | None = None,
+        blockoutsidedns: bool | None = None,
+        legacy: bool | None = None,
+        p12encryption: str | None = None,
+        pass_: str | None = None,
+        pkcs11id: str | None = None,
+        pkcs11providers: list[str] | None = None,
+        proxyaddr: str | None = None,
+        proxypass: str | None = None,
+        proxyport: str | None = None,
+        proxyuser: str | None = None,
+        server: int | None = None,
+        silent: bool | None = None,
+        useaddr: str | None = None,
+        useaddr_hostname: str | None = None,
+        usepass: bool | None = None,
+        usepkcs11: bool | None = None,
+        useproxy: bool | None = None,
+        useproxypass: str | None = None,
+        useproxytype: str | None = None,
+        usetoken: bool | None = None,
+        verifyservercn: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/openvpn/client_export/config
+
+        id: The ID of the object or resource to interact with.
+        advancedoptions: Additional options to add to the OpenVPN client export configuration.
+        bindmode: The port binding mode to use. If OpenVPN client binds to the default OpenVPN port (1194), two clients may not run concurrently. Valid values: ['nobind', 'lport0', 'bind']
+        blockoutsidedns: Block access to DNS servers except across OpenVPN while connected, forcing clients to use only VPN DNS servers.
+        legacy: Do not include OpenVPN 2.5 and later settings in the client configuration.
+        p12encryption: The level of encryption to use when exporting a PKCS#12 archive. Encryption support varies by Operating System and program Valid values: ['high', 'low', 'legacy']
+        pass_: Password used to protect the certificate file contents.This field is only available when the following conditions are met:- `usepass` must be equal to `true`
+        pkcs11id: The object's ID on the PKCS#11 device.This field is only available when the following conditions are met:- `usepkcs11` must be equal to `true`
+        pkcs11providers: The client local path to the PKCS#11 provider(s) (DLL, module)This field is only available when the following conditions are met:- `usepkcs11` must be equal to `true`
+        proxyaddr: The IP address or hostname of the proxy server to use.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`
+        proxypass: The password to use to authenticate with the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`- `useproxypass` must be one of [ basic, ntlm ]
+        proxyport: The port where the proxy server is listening. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `useproxy` must be equal to `true`
+        proxyuser: The username to use to authenticate with the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`- `useproxypass` must be one of [ basic, ntlm ]
+        server: The VPN ID of the OpenVPN server this client export corresponds to.
+        silent: Create Windows installer for unattended deploy.
+        useaddr: The method to use for the OpenVPN server address listed in the config export. Valid values: ['serveraddr', 'servermagic', 'servermagichost', 'serverhostname', 'other']
+        useaddr_hostname: The hostname to use for the OpenVPN server address.This field is only available when the following conditions are met:- `useaddr` must be equal to `'other'`
+        usepass: Use a password to protect the PKCS#12 file contents or key in Viscosity bundles.
+        usepkcs11: Use PKCS#11 storage device (cryptographic token, HSM, smart card) instead of local files.
+        useproxy: Use proxy to communicate with the OpenVPN server.
+        useproxypass: The type of authentication to use for the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true` Valid values: ['none', 'basic', 'ntlm']
+        useproxytype: The proxy type to use.This field is only available when the following conditions are met:- `useproxy` must be equal to `true` Valid values: ['http', 'socks']
+        usetoken: Use Microsoft Certificate Storage instead of local files.
+        verifyservercn: Verify the server certificate Common Name (CN) when the client connects. Valid values: ['auto', 'none']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/openvpn/client_export/config. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if advancedoptions is not None:
+            body["advancedoptions"] = advancedoptions
+        if bindmode is not None:
+            body["bindmode"] = bindmode
+        if blockoutsidedns is not None:
+            body["blockoutsidedns"] = blockoutsidedns
+        if legacy is not None:
+            body["legacy"] = legacy
+        if p12encryption is not None:
+            body["p12encryption"] = p12encryption
+        if pass_ is not None:
+            body["pass"] = pass_
+        if pkcs11id is not None:
+            body["pkcs11id"] = pkcs11id
+        if pkcs11providers is not None:
+            body["pkcs11providers"] = pkcs11providers
+        if proxyaddr is not None:
+            body["proxyaddr"] = proxyaddr
+        if proxypass is not None:
+            body["proxypass"] = proxypass
+        if proxyport is not None:
+            body["proxyport"] = proxyport
+        if proxyuser is not None:
+            body["proxyuser"] = proxyuser
+        if server is not None:
+            body["server"] = server
+        if silent is not None:
+            body["silent"] = silent
+        if useaddr is not None:
+            body["useaddr"] = useaddr
+        if useaddr_hostname is not None:
+            body["useaddr_hostname"] = useaddr_hostname
+        if usepass is not None:
+            body["usepass"] = usepass
+        if usepkcs11 is not None:
+            body["usepkcs11"] = usepkcs11
+        if useproxy is not None:
+            body["useproxy"] = useproxy
+        if useproxypass is not None:
+            body["useproxypass"] = useproxypass
+        if useproxytype is not None:
+            body["useproxytype"] = useproxytype
+        if usetoken is not None:
+            body["usetoken"] = usetoken
+        if verifyservercn is not None:
+            body["verifyservercn"] = verifyservercn
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/openvpn/client_export/config",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_client_export_config(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/client_export/config
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/client_export/config. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/client_export/config",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_replace_vpn_openvpn_client_export_configs(
+        items: list[dict[str, Any]],
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PUT /api/v2/vpn/openvpn/client_export/configs
+
+        items: List of objects for bulk replacement.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PUT operation on /api/v2/vpn/openvpn/client_export/configs. "
+                "Set confirm=True to execute."
+            )
+        body = items
+        return await _client.request(
+            "PUT",
+            "/api/v2/vpn/openvpn/client_export/configs",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_client_export_configs(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/client_export/configs
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/client_export/configs. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/client_export/configs",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_openvpn_client_export(
+        id: str | int,
+        confirm: bool = False,
+        advancedoptions: str | None = None,
+        bindmode: str | None = 'nobind',
+        blockoutsidedns: bool | None = None,
+        certref: str | None = None,
+        legacy: bool | None = None,
+        p12encryption: str | None = 'high',
+        pass_: str | None = None,
+        pkcs11id: str | None = None,
+        pkcs11providers: list[str] | None = None,
+        proxyaddr: str | None = None,
+        proxypass: str | None = None,
+        proxyport: str | None = None,
+        proxyuser: str | None = None,
+        server: int | None = None,
+        silent: bool | None = None,
+        type_: str | None = None,
+        useaddr: str | None = 'serveraddr',
+        useaddr_hostname: str | None = None,
+        usepass: bool | None = None,
+        usepkcs11: bool | None = None,
+        useproxy: bool | None = None,
+        useproxypass: str | None = None,
+        useproxytype: str | None = None,
+        username: str | None = None,
+        usetoken: bool | None = None,
+        verifyservercn: str | None = 'auto',
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/openvpn/client_export
+
+        id: The ID of the object or resource to interact with.
+        advancedoptions: Additional options to add to the OpenVPN client export configuration.
+        bindmode: The port binding mode to use. If OpenVPN client binds to the default OpenVPN port (1194), two clients may not run concurrently. Valid values: ['nobind', 'lport0', 'bind']
+        blockoutsidedns: Block access to DNS servers except across OpenVPN while connected, forcing clients to use only VPN DNS servers.
+        certref: The reference ID of the certificate to use for this OpenVPN client export. This is only applicable for OpenVPN servers that require client certificates.
+        legacy: Do not include OpenVPN 2.5 and later settings in the client configuration.
+        p12encryption: The level of encryption to use when exporting a PKCS#12 archive. Encryption support varies by Operating System and program Valid values: ['high', 'low', 'legacy']
+        pass_: Password used to protect the certificate file contents.This field is only available when the following conditions are met:- `usepass` must be equal to `true`
+        pkcs11id: The object's ID on the PKCS#11 device.This field is only available when the following conditions are met:- `usepkcs11` must be equal to `true`
+        pkcs11providers: The client local path to the PKCS#11 provider(s) (DLL, module)This field is only available when the following conditions are met:- `usepkcs11` must be equal to `true`
+        proxyaddr: The IP address or hostname of the proxy server to use.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`
+        proxypass: The password to use to authenticate with the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`- `useproxypass` must be one of [ basic, ntlm ]
+        proxyport: The port where the proxy server is listening. Valid options are: a TCP/UDP port numberThis field is only available when the following conditions are met:- `useproxy` must be equal to `true`
+        proxyuser: The username to use to authenticate with the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true`- `useproxypass` must be one of [ basic, ntlm ]
+        server: The VPN ID of the OpenVPN server this client export corresponds to.
+        silent: Create Windows installer for unattended deploy.
+        type_: The type of OpenVPN client export to generate. This determines the format and content of the export file. Valid values: ['confzip', 'conf_yealink_t28', 'conf_yealink_t38g', 'conf_yealink_t38g2', 'conf_snom', 'confinline', 'confinlinedroid', 'confinlineconnect', 'confinlinevisc', 'inst-Win7', 'inst-Win10', 'inst-x86-previous', 'inst-x64-previous', 'inst-x86-current', 'inst-x64-current', 'visc']
+        useaddr: The method to use for the OpenVPN server address listed in the config export. Valid values: ['serveraddr', 'servermagic', 'servermagichost', 'serverhostname', 'other']
+        useaddr_hostname: The hostname to use for the OpenVPN server address.This field is only available when the following conditions are met:- `useaddr` must be equal to `'other'`
+        usepass: Use a password to protect the PKCS#12 file contents or key in Viscosity bundles.
+        usepkcs11: Use PKCS#11 storage device (cryptographic token, HSM, smart card) instead of local files.
+        useproxy: Use proxy to communicate with the OpenVPN server.
+        useproxypass: The type of authentication to use for the proxy server.This field is only available when the following conditions are met:- `useproxy` must be equal to `true` Valid values: ['none', 'basic', 'ntlm']
+        useproxytype: The proxy type to use.This field is only available when the following conditions are met:- `useproxy` must be equal to `true` Valid values: ['http', 'socks']
+        username: The username of the user this client export corresponds to. This is only applicable for OpenVPN servers that use the Local Database AND client certificates.
+        usetoken: Use Microsoft Certificate Storage instead of local files.
+        verifyservercn: Verify the server certificate Common Name (CN) when the client connects. Valid values: ['auto', 'none']
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/openvpn/client_export. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if advancedoptions is not None:
+            body["advancedoptions"] = advancedoptions
+        if bindmode is not None:
+            body["bindmode"] = bindmode
+        if blockoutsidedns is not None:
+            body["blockoutsidedns"] = blockoutsidedns
+        if certref is not None:
+            body["certref"] = certref
+        if legacy is not None:
+            body["legacy"] = legacy
+        if p12encryption is not None:
+            body["p12encryption"] = p12encryption
+        if pass_ is not None:
+            body["pass"] = pass_
+        if pkcs11id is not None:
+            body["pkcs11id"] = pkcs11id
+        if pkcs11providers is not None:
+            body["pkcs11providers"] = pkcs11providers
+        if proxyaddr is not None:
+            body["proxyaddr"] = proxyaddr
+        if proxypass is not None:
+            body["proxypass"] = proxypass
+        if proxyport is not None:
+            body["proxyport"] = proxyport
+        if proxyuser is not None:
+            body["proxyuser"] = proxyuser
+        if server is not None:
+            body["server"] = server
+        if silent is not None:
+            body["silent"] = silent
+        if type_ is not None:
+            body["type"] = type_
+        if useaddr is not None:
+            body["useaddr"] = useaddr
+        if useaddr_hostname is not None:
+            body["useaddr_hostname"] = useaddr_hostname
+        if usepass is not None:
+            body["usepass"] = usepass
+        if usepkcs11 is not None:
+            body["usepkcs11"] = usepkcs11
+        if useproxy is not None:
+            body["useproxy"] = useproxy
+        if useproxypass is not None:
+            body["useproxypass"] = useproxypass
+        if useproxytype is not None:
+            body["useproxytype"] = useproxytype
+        if username is not None:
+            body["username"] = username
+        if usetoken is not None:
+            body["usetoken"] = usetoken
+        if verifyservercn is not None:
+            body["verifyservercn"] = verifyservercn
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/openvpn/client_export",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_clients(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/clients
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/clients. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/clients",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_create_vpn_openvpn_server(
+        caref: str,
+        certref: str,
+        data_ciphers: list[str],
+        data_ciphers_fallback: str,
+        dev_mode: str,
+        dh_length: str,
+        digest: str,
+        ecdh_curve: str,
+        mode: str,
+        protocol: str,
+        confirm: bool = False,
+        allow_compression: str | None = 'no',
+        authmode: list[str] | None = None,
+        cert_depth: int | None = 1,
+        client2client: bool | None = None,
+        connlimit: int | None = None,
+        create_gw: str | None = 'both',
+        custom_options: list[str] | None = None,
+        description: str | None = None,
+        disable: bool | None = None,
+        dns_domain: str | None = None,
+        dns_server1: str | None = None,
+        dns_server2: str | None = None,
+        dns_server3: str | None = None,
+        dns_server4: str | None = None,
+        duplicate_cn: bool | None = None,
+        dynamic_ip: bool | None = None,
+        gwredir: bool | None = None,
+        gwredir6: bool | None = None,
+        inactive_seconds: int | None = 300,
+        interface: str | None = None,
+        keepalive_interval: int | None = None,
+        keepalive_timeout: int | None = None,
+        local_network: list[str] | None = None,
+        local_networkv6: list[str] | None = None,
+        local_port: str | None = '1194',
+        maxclients: int | None = None,
+        netbios_enable: bool | None = None,
+        netbios_ntype: int | None = None,
+        netbios_scope: str | None = None,
+        ntp_server1: str | None = None,
+        ntp_server2: str | None = None,
+        passtos: bool | None = None,
+        ping_action: str | None = None,
+        ping_action_push: bool | None = None,
+        ping_action_seconds: int | None = None,
+        ping_method: str | None = 'keepalive',
+        ping_push: bool | None = None,
+        ping_seconds: int | None = None,
+        push_blockoutsidedns: bool | None = None,
+        push_register_dns: bool | None = None,
+        remote_cert_tls: bool | None = True,
+        remote_network: list[str] | None = None,
+        remote_networkv6: list[str] | None = None,
+        serverbridge_dhcp: bool | None = None,
+        serverbridge_dhcp_end: str | None = None,
+        serverbridge_dhcp_start: str | None = None,
+        serverbridge_interface: str | None = None,
+        serverbridge_routegateway: bool | None = None,
+        sndrcvbuf: int | None = None,
+        strictusercn: bool | None = None,
+        tls: str | None = None,
+        tls_type: str | None = None,
+        tlsauth_keydir: str | None = None,
+        topology: str | None = None,
+        tunnel_network: str | None = None,
+        tunnel_networkv6: str | None = None,
+        use_tls: bool | None = None,
+        username_as_common_name: bool | None = None,
+        verbosity_level: int | None = 1,
+        wins_server1: str | None = None,
+        wins_server2: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """POST /api/v2/vpn/openvpn/server
+
+        caref: The `refid` of the CA object to assume as the peer CA.
+        certref: The `refid` of the certificate object to assume as the OpenVPN server certificate.
+        data_ciphers: The encryption algorithms/ciphers allowed by this OpenVPN server.
+        data_ciphers_fallback: The fallback encryption algorithm/cipher used for data channel packets when communicating with clients that do not support data encryption algorithm negotiation (e.g. Shared Key).
+        dev_mode: The carrier mode for this OpenVPN server. `tun` mode carries IPv4 and IPv6 (layer 3) and is the most common and compatible mode across all platforms. `tap` mode is capable of carrying 802.3 (layer 2). Valid values: ['tun', 'tap']
+        dh_length: The Diffie-Hellman (DH) parameter set used for key exchange.
+        digest: The algorithm used to authenticate data channel packets, and control channel packets if a TLS Key is present.
+        ecdh_curve: The Elliptic Curve to use for key exchange. The curve from the server certificate is used by default when the server uses an ECDSA certificate. Otherwise, secp384r1 is used as a fallback.
+        mode: The OpenVPN server mode. Valid values: ['p2p_tls', 'server_tls', 'server_user', 'server_tls_user']
+        protocol: The protocol used by this OpenVPN server. Valid values: ['UDP4', 'UDP6', 'UDP', 'TCP4', 'TCP6', 'TCP']
+        allow_compression: The compression mode allowed by this OpenVPN server. Compression can potentially increase throughput but may allow an attacker to extract secrets if they can control compressed plaintext traversing the VPN (e.g. HTTP) Valid values: ['no', 'yes', 'asym']
+        authmode: The name of the authentication server to use as the authentication backend for this OpenVPN serverThis field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        cert_depth: The depth of the certificate chain to check when a certificate based client signs in. Certificates below this depth are not accepted. This is useful for denying certificates made with intermediate CAs generated from the same CA as the server. Set to null to use system default. Valid values: [1, 2, 3, 4, 5]
+        client2client: Enables or disables allowing communication between clients connected to this server.
+        connlimit: The number of concurrent connections a single user can have.This field is only available when the following conditions are met:- `duplicate_cn` must be equal to `true`
+        create_gw: The gateway type(s) that will be created when a virtual interface is assigned to this OpenVPN server Valid values: ['both', 'v4only', 'v6only']
+        custom_options: Additional options to add to the OpenVPN server configuration.
+        description: The description for this OpenVPN server.
+        disable: Disables this OpenVPN server.
+        dns_domain: The default domain to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server1: The primary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server2: The secondary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server3: The tertiary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server4: The quaternary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        duplicate_cn: Enables or disable allowing the same user to connect multiple times.
+        dynamic_ip: Enables or disables allowing connected clients to retain their connections if their IP address changes.
+        gwredir: Enable forcing all client-generated IPv4 traffic through the tunnel.
+        gwredir6: Enable forcing all client-generated IPv6 traffic through the tunnel.
+        inactive_seconds: The amount of time (in seconds) until a client connection is closed for inactivity.
+        interface: The interface or Virtual IP address where OpenVPN will receive client connections.This field is only available when the following conditions are met:- `protocol` must not be one of [ UDP, TCP ]
+        keepalive_interval: The keepalive interval parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        keepalive_timeout: The keepalive timeout parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        local_network: The IPv4 networks that will be accessible from the remote endpoint. Expressed as a list of one or more CIDR ranges or host/network type aliases. This may be left blank if not adding a route to the local network through this tunnel on the remote machine. This is generally set to the LAN network.This field is only available when the following conditions are met:- `gwredir` must be equal to `false`
+        local_networkv6: The IPv6 networks that will be accessible from the remote endpoint. Expressed as a list of one or more CIDR ranges or host/network type aliases. This may be left blank if not adding a route to the local network through this tunnel on the remote machine. This is generally set to the LAN network.This field is only available when the following conditions are met:- `gwredir6` must be equal to `false`
+        local_port: The port used by OpenVPN to receive client connections. Valid options are: a TCP/UDP port number
+        maxclients: The maximum number of clients allowed to concurrently connect to this server.
+        netbios_enable: Enables or disables NetBIOS over TCP/IP.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        netbios_ntype: The NetBIOS node type.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true` Valid values: [0, 1, 2, 4, 8]
+        netbios_scope: The NetBIOS Scope ID. This provides an extended naming service for NetBIOS over TCP/IP. The NetBIOS scope ID isolates NetBIOS traffic on a single network to only those nodes with the same NetBIOS scope ID.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        ntp_server1: The primary NTP server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        ntp_server2: The secondary NTP server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        passtos: Enables or disables setting the TOS IP header value of tunnel packets to match the encapsulated packet value.
+        ping_action: The action to take after a ping to the remote peer times-out.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'` Valid values: ['ping_restart', 'ping_exit']
+        ping_action_push: Enables or disables pushing the ping action to the VPN client.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_action_seconds: The number of seconds that must elapse before the ping is considered a timeout and the configured `ping_action` is performed.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_method: The method used to define ping configuration. Valid values: ['keepalive', 'ping']
+        ping_push: Enables or disables push ping to the VPN client.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_seconds: The number of seconds to accept no packets before sending a ping to the remote peer over the TCP/UDP control channel.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        push_blockoutsidedns: Enables or disables blocking Windows 10 clients' access to DNS servers except across OpenVPN while connected, forcing clients to use only VPN DNS servers.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        push_register_dns: Enables or disables running `net stop dnscache`, `net start dnscache`, `ipconfig /flushdns` and `ipconfig /registerdns` on connection initiation for Windows clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        remote_cert_tls: Enables or disables requiring hosts to have a client certificate to connect.
+        remote_network: IPv4 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        remote_networkv6: IPv6 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        serverbridge_dhcp: Enables or disables clients on the bridge to obtain DHCP.This field is only available when the following conditions are met:- `dev_mode` must be equal to `'tap'`
+        serverbridge_dhcp_end: The bridge DHCP range's end address.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        serverbridge_dhcp_start: The bridge DHCP range's start address.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        serverbridge_interface: The interface to which this TAP instance will be bridged. This is not done automatically. This interface must be assigned and the bridge created separately. This setting controls which existing IP address and subnet mask are used by OpenVPN for the bridge.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        serverbridge_routegateway: Enables or disables pushing the bridge interface's IPv4 address to connecting clients as a route gateway.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        sndrcvbuf: The send and receive buffer size for OpenVPN. Set to null to use the system default. Valid values: [65536, 131072, 262144, 524288, 1048576, 2097152]
+        strictusercn: Enables or disables enforcing a match between the common name of the client certificate and the username given at login.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        tls: The TLS key this OpenVPN server will use to sign control channel packets with an HMAC signature for authentication when establishing the tunnel.This field is only available when the following conditions are met:- `use_tls` must be equal to `true`
+        tls_type: The TLS key usage type. In `auth` mode, the TLS key is used only as HMAC authentication for the control channel, protecting the peers from unauthorized connections. The `crypt` mode encrypts the control channel communication in addition to providing authentication, providing more privacy and traffic control channel obfuscation.This field is only available when the following conditions are met:- `use_tls` must be equal to `true` Valid values: ['auth', 'crypt']
+        tlsauth_keydir: The TLS key direction. This must be set to complementary values on the client and server. For example, if the server is set to 0, the client must be set to 1. Both may be set to omit the direction, in which case the TLS Key will be used bidirectionally.This field is only available when the following conditions are met:- `use_tls` must be equal to `true` Valid values: ['default', '0', '1', '2']
+        topology: The method used to supply a virtual adapter IP address to clients when using TUN mode on IPv4.This field is only available when the following conditions are met:- `dev_mode` must be equal to `'tun'` Valid values: ['subnet', 'net30']
+        tunnel_network: The IPv4 virtual network used for private communications between this server and client hosts.
+        tunnel_networkv6: The IPv6 virtual network used for private communications between this server and client hosts.
+        use_tls: Enables or disables the use of a TLS key for this OpenVPN server.
+        username_as_common_name: Enables or disable the username of the client being used in place of the certificate common name for purposes such as determining Client Specific Overrides.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        verbosity_level: The OpenVPN logging verbosity level. Valid values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        wins_server1: The primary WINS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        wins_server2: The secondary WINS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a POST operation on /api/v2/vpn/openvpn/server. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if caref is not None:
+            body["caref"] = caref
+        if certref is not None:
+            body["certref"] = certref
+        if data_ciphers is not None:
+            body["data_ciphers"] = data_ciphers
+        if data_ciphers_fallback is not None:
+            body["data_ciphers_fallback"] = data_ciphers_fallback
+        if dev_mode is not None:
+            body["dev_mode"] = dev_mode
+        if dh_length is not None:
+            body["dh_length"] = dh_length
+        if digest is not None:
+            body["digest"] = digest
+        if ecdh_curve is not None:
+            body["ecdh_curve"] = ecdh_curve
+        if mode is not None:
+            body["mode"] = mode
+        if protocol is not None:
+            body["protocol"] = protocol
+        if allow_compression is not None:
+            body["allow_compression"] = allow_compression
+        if authmode is not None:
+            body["authmode"] = authmode
+        if cert_depth is not None:
+            body["cert_depth"] = cert_depth
+        if client2client is not None:
+            body["client2client"] = client2client
+        if connlimit is not None:
+            body["connlimit"] = connlimit
+        if create_gw is not None:
+            body["create_gw"] = create_gw
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if description is not None:
+            body["description"] = description
+        if disable is not None:
+            body["disable"] = disable
+        if dns_domain is not None:
+            body["dns_domain"] = dns_domain
+        if dns_server1 is not None:
+            body["dns_server1"] = dns_server1
+        if dns_server2 is not None:
+            body["dns_server2"] = dns_server2
+        if dns_server3 is not None:
+            body["dns_server3"] = dns_server3
+        if dns_server4 is not None:
+            body["dns_server4"] = dns_server4
+        if duplicate_cn is not None:
+            body["duplicate_cn"] = duplicate_cn
+        if dynamic_ip is not None:
+            body["dynamic_ip"] = dynamic_ip
+        if gwredir is not None:
+            body["gwredir"] = gwredir
+        if gwredir6 is not None:
+            body["gwredir6"] = gwredir6
+        if inactive_seconds is not None:
+            body["inactive_seconds"] = inactive_seconds
+        if interface is not None:
+            body["interface"] = interface
+        if keepalive_interval is not None:
+            body["keepalive_interval"] = keepalive_interval
+        if keepalive_timeout is not None:
+            body["keepalive_timeout"] = keepalive_timeout
+        if local_network is not None:
+            body["local_network"] = local_network
+        if local_networkv6 is not None:
+            body["local_networkv6"] = local_networkv6
+        if local_port is not None:
+            body["local_port"] = local_port
+        if maxclients is not None:
+            body["maxclients"] = maxclients
+        if netbios_enable is not None:
+            body["netbios_enable"] = netbios_enable
+        if netbios_ntype is not None:
+            body["netbios_ntype"] = netbios_ntype
+        if netbios_scope is not None:
+            body["netbios_scope"] = netbios_scope
+        if ntp_server1 is not None:
+            body["ntp_server1"] = ntp_server1
+        if ntp_server2 is not None:
+            body["ntp_server2"] = ntp_server2
+        if passtos is not None:
+            body["passtos"] = passtos
+        if ping_action is not None:
+            body["ping_action"] = ping_action
+        if ping_action_push is not None:
+            body["ping_action_push"] = ping_action_push
+        if ping_action_seconds is not None:
+            body["ping_action_seconds"] = ping_action_seconds
+        if ping_method is not None:
+            body["ping_method"] = ping_method
+        if ping_push is not None:
+            body["ping_push"] = ping_push
+        if ping_seconds is not None:
+            body["ping_seconds"] = ping_seconds
+        if push_blockoutsidedns is not None:
+            body["push_blockoutsidedns"] = push_blockoutsidedns
+        if push_register_dns is not None:
+            body["push_register_dns"] = push_register_dns
+        if remote_cert_tls is not None:
+            body["remote_cert_tls"] = remote_cert_tls
+        if remote_network is not None:
+            body["remote_network"] = remote_network
+        if remote_networkv6 is not None:
+            body["remote_networkv6"] = remote_networkv6
+        if serverbridge_dhcp is not None:
+            body["serverbridge_dhcp"] = serverbridge_dhcp
+        if serverbridge_dhcp_end is not None:
+            body["serverbridge_dhcp_end"] = serverbridge_dhcp_end
+        if serverbridge_dhcp_start is not None:
+            body["serverbridge_dhcp_start"] = serverbridge_dhcp_start
+        if serverbridge_interface is not None:
+            body["serverbridge_interface"] = serverbridge_interface
+        if serverbridge_routegateway is not None:
+            body["serverbridge_routegateway"] = serverbridge_routegateway
+        if sndrcvbuf is not None:
+            body["sndrcvbuf"] = sndrcvbuf
+        if strictusercn is not None:
+            body["strictusercn"] = strictusercn
+        if tls is not None:
+            body["tls"] = tls
+        if tls_type is not None:
+            body["tls_type"] = tls_type
+        if tlsauth_keydir is not None:
+            body["tlsauth_keydir"] = tlsauth_keydir
+        if topology is not None:
+            body["topology"] = topology
+        if tunnel_network is not None:
+            body["tunnel_network"] = tunnel_network
+        if tunnel_networkv6 is not None:
+            body["tunnel_networkv6"] = tunnel_networkv6
+        if use_tls is not None:
+            body["use_tls"] = use_tls
+        if username_as_common_name is not None:
+            body["username_as_common_name"] = username_as_common_name
+        if verbosity_level is not None:
+            body["verbosity_level"] = verbosity_level
+        if wins_server1 is not None:
+            body["wins_server1"] = wins_server1
+        if wins_server2 is not None:
+            body["wins_server2"] = wins_server2
+        return await _client.request(
+            "POST",
+            "/api/v2/vpn/openvpn/server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_update_vpn_openvpn_server(
+        id: str | int,
+        confirm: bool = False,
+        allow_compression: str | None = None,
+        authmode: list[str] | None = None,
+        caref: str | None = None,
+        cert_depth: int | None = None,
+        certref: str | None = None,
+        client2client: bool | None = None,
+        connlimit: int | None = None,
+        create_gw: str | None = None,
+        custom_options: list[str] | None = None,
+        data_ciphers: list[str] | None = None,
+        data_ciphers_fallback: str | None = None,
+        description: str | None = None,
+        dev_mode: str | None = None,
+        dh_length: str | None = None,
+        digest: str | None = None,
+        disable: bool | None = None,
+        dns_domain: str | None = None,
+        dns_server1: str | None = None,
+        dns_server2: str | None = None,
+        dns_server3: str | None = None,
+        dns_server4: str | None = None,
+        duplicate_cn: bool | None = None,
+        dynamic_ip: bool | None = None,
+        ecdh_curve: str | None = None,
+        gwredir: bool | None = None,
+        gwredir6: bool | None = None,
+        inactive_seconds: int | None = None,
+        interface: str | None = None,
+        keepalive_interval: int | None = None,
+        keepalive_timeout: int | None = None,
+        local_network: list[str] | None = None,
+        local_networkv6: list[str] | None = None,
+        local_port: str | None = None,
+        maxclients: int | None = None,
+        mode: str | None = None,
+        netbios_enable: bool | None = None,
+        netbios_ntype: int | None = None,
+        netbios_scope: str | None = None,
+        ntp_server1: str | None = None,
+        ntp_server2: str | None = None,
+        passtos: bool | None = None,
+        ping_action: str | None = None,
+        ping_action_push: bool | None = None,
+        ping_action_seconds: int | None = None,
+        ping_method: str | None = None,
+        ping_push: bool | None = None,
+        ping_seconds: int | None = None,
+        protocol: str | None = None,
+        push_blockoutsidedns: bool | None = None,
+        push_register_dns: bool | None = None,
+        remote_cert_tls: bool | None = None,
+        remote_network: list[str] | None = None,
+        remote_networkv6: list[str] | None = None,
+        serverbridge_dhcp: bool | None = None,
+        serverbridge_dhcp_end: str | None = None,
+        serverbridge_dhcp_start: str | None = None,
+        serverbridge_interface: str | None = None,
+        serverbridge_routegateway: bool | None = None,
+        sndrcvbuf: int | None = None,
+        strictusercn: bool | None = None,
+        tls: str | None = None,
+        tls_type: str | None = None,
+        tlsauth_keydir: str | None = None,
+        topology: str | None = None,
+        tunnel_network: str | None = None,
+        tunnel_networkv6: str | None = None,
+        use_tls: bool | None = None,
+        username_as_common_name: bool | None = None,
+        verbosity_level: int | None = None,
+        wins_server1: str | None = None,
+        wins_server2: str | None = None,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """PATCH /api/v2/vpn/openvpn/server
+
+        id: The ID of the object or resource to interact with.
+        allow_compression: The compression mode allowed by this OpenVPN server. Compression can potentially increase throughput but may allow an attacker to extract secrets if they can control compressed plaintext traversing the VPN (e.g. HTTP) Valid values: ['no', 'yes', 'asym']
+        authmode: The name of the authentication server to use as the authentication backend for this OpenVPN serverThis field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        caref: The `refid` of the CA object to assume as the peer CA.
+        cert_depth: The depth of the certificate chain to check when a certificate based client signs in. Certificates below this depth are not accepted. This is useful for denying certificates made with intermediate CAs generated from the same CA as the server. Set to null to use system default. Valid values: [1, 2, 3, 4, 5]
+        certref: The `refid` of the certificate object to assume as the OpenVPN server certificate.
+        client2client: Enables or disables allowing communication between clients connected to this server.
+        connlimit: The number of concurrent connections a single user can have.This field is only available when the following conditions are met:- `duplicate_cn` must be equal to `true`
+        create_gw: The gateway type(s) that will be created when a virtual interface is assigned to this OpenVPN server Valid values: ['both', 'v4only', 'v6only']
+        custom_options: Additional options to add to the OpenVPN server configuration.
+        data_ciphers: The encryption algorithms/ciphers allowed by this OpenVPN server.
+        data_ciphers_fallback: The fallback encryption algorithm/cipher used for data channel packets when communicating with clients that do not support data encryption algorithm negotiation (e.g. Shared Key).
+        description: The description for this OpenVPN server.
+        dev_mode: The carrier mode for this OpenVPN server. `tun` mode carries IPv4 and IPv6 (layer 3) and is the most common and compatible mode across all platforms. `tap` mode is capable of carrying 802.3 (layer 2). Valid values: ['tun', 'tap']
+        dh_length: The Diffie-Hellman (DH) parameter set used for key exchange.
+        digest: The algorithm used to authenticate data channel packets, and control channel packets if a TLS Key is present.
+        disable: Disables this OpenVPN server.
+        dns_domain: The default domain to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server1: The primary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server2: The secondary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server3: The tertiary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        dns_server4: The quaternary DNS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        duplicate_cn: Enables or disable allowing the same user to connect multiple times.
+        dynamic_ip: Enables or disables allowing connected clients to retain their connections if their IP address changes.
+        ecdh_curve: The Elliptic Curve to use for key exchange. The curve from the server certificate is used by default when the server uses an ECDSA certificate. Otherwise, secp384r1 is used as a fallback.
+        gwredir: Enable forcing all client-generated IPv4 traffic through the tunnel.
+        gwredir6: Enable forcing all client-generated IPv6 traffic through the tunnel.
+        inactive_seconds: The amount of time (in seconds) until a client connection is closed for inactivity.
+        interface: The interface or Virtual IP address where OpenVPN will receive client connections.This field is only available when the following conditions are met:- `protocol` must not be one of [ UDP, TCP ]
+        keepalive_interval: The keepalive interval parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        keepalive_timeout: The keepalive timeout parameter.This field is only available when the following conditions are met:- `ping_method` must be equal to `'keepalive'`
+        local_network: The IPv4 networks that will be accessible from the remote endpoint. Expressed as a list of one or more CIDR ranges or host/network type aliases. This may be left blank if not adding a route to the local network through this tunnel on the remote machine. This is generally set to the LAN network.This field is only available when the following conditions are met:- `gwredir` must be equal to `false`
+        local_networkv6: The IPv6 networks that will be accessible from the remote endpoint. Expressed as a list of one or more CIDR ranges or host/network type aliases. This may be left blank if not adding a route to the local network through this tunnel on the remote machine. This is generally set to the LAN network.This field is only available when the following conditions are met:- `gwredir6` must be equal to `false`
+        local_port: The port used by OpenVPN to receive client connections. Valid options are: a TCP/UDP port number
+        maxclients: The maximum number of clients allowed to concurrently connect to this server.
+        mode: The OpenVPN server mode. Valid values: ['p2p_tls', 'server_tls', 'server_user', 'server_tls_user']
+        netbios_enable: Enables or disables NetBIOS over TCP/IP.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        netbios_ntype: The NetBIOS node type.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true` Valid values: [0, 1, 2, 4, 8]
+        netbios_scope: The NetBIOS Scope ID. This provides an extended naming service for NetBIOS over TCP/IP. The NetBIOS scope ID isolates NetBIOS traffic on a single network to only those nodes with the same NetBIOS scope ID.This field is only available when the following conditions are met:- `netbios_enable` must be equal to `true`
+        ntp_server1: The primary NTP server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        ntp_server2: The secondary NTP server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        passtos: Enables or disables setting the TOS IP header value of tunnel packets to match the encapsulated packet value.
+        ping_action: The action to take after a ping to the remote peer times-out.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'` Valid values: ['ping_restart', 'ping_exit']
+        ping_action_push: Enables or disables pushing the ping action to the VPN client.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_action_seconds: The number of seconds that must elapse before the ping is considered a timeout and the configured `ping_action` is performed.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_method: The method used to define ping configuration. Valid values: ['keepalive', 'ping']
+        ping_push: Enables or disables push ping to the VPN client.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        ping_seconds: The number of seconds to accept no packets before sending a ping to the remote peer over the TCP/UDP control channel.This field is only available when the following conditions are met:- `ping_method` must be equal to `'ping'`
+        protocol: The protocol used by this OpenVPN server. Valid values: ['UDP4', 'UDP6', 'UDP', 'TCP4', 'TCP6', 'TCP']
+        push_blockoutsidedns: Enables or disables blocking Windows 10 clients' access to DNS servers except across OpenVPN while connected, forcing clients to use only VPN DNS servers.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        push_register_dns: Enables or disables running `net stop dnscache`, `net start dnscache`, `ipconfig /flushdns` and `ipconfig /registerdns` on connection initiation for Windows clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        remote_cert_tls: Enables or disables requiring hosts to have a client certificate to connect.
+        remote_network: IPv4 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        remote_networkv6: IPv6 networks that will be routed through the tunnel, so that a site-to-site VPN can be established without manually changing the routing tables. Expressed as a list of one or more CIDR ranges or host/network type aliases. If this is a site-to-site VPN, enter the remote LAN/s here. May be left empty for non site-to-site VPN.
+        serverbridge_dhcp: Enables or disables clients on the bridge to obtain DHCP.This field is only available when the following conditions are met:- `dev_mode` must be equal to `'tap'`
+        serverbridge_dhcp_end: The bridge DHCP range's end address.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        serverbridge_dhcp_start: The bridge DHCP range's start address.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        serverbridge_interface: The interface to which this TAP instance will be bridged. This is not done automatically. This interface must be assigned and the bridge created separately. This setting controls which existing IP address and subnet mask are used by OpenVPN for the bridge.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        serverbridge_routegateway: Enables or disables pushing the bridge interface's IPv4 address to connecting clients as a route gateway.This field is only available when the following conditions are met:- `serverbridge_dhcp` must be equal to `true`
+        sndrcvbuf: The send and receive buffer size for OpenVPN. Set to null to use the system default. Valid values: [65536, 131072, 262144, 524288, 1048576, 2097152]
+        strictusercn: Enables or disables enforcing a match between the common name of the client certificate and the username given at login.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        tls: The TLS key this OpenVPN server will use to sign control channel packets with an HMAC signature for authentication when establishing the tunnel.This field is only available when the following conditions are met:- `use_tls` must be equal to `true`
+        tls_type: The TLS key usage type. In `auth` mode, the TLS key is used only as HMAC authentication for the control channel, protecting the peers from unauthorized connections. The `crypt` mode encrypts the control channel communication in addition to providing authentication, providing more privacy and traffic control channel obfuscation.This field is only available when the following conditions are met:- `use_tls` must be equal to `true` Valid values: ['auth', 'crypt']
+        tlsauth_keydir: The TLS key direction. This must be set to complementary values on the client and server. For example, if the server is set to 0, the client must be set to 1. Both may be set to omit the direction, in which case the TLS Key will be used bidirectionally.This field is only available when the following conditions are met:- `use_tls` must be equal to `true` Valid values: ['default', '0', '1', '2']
+        topology: The method used to supply a virtual adapter IP address to clients when using TUN mode on IPv4.This field is only available when the following conditions are met:- `dev_mode` must be equal to `'tun'` Valid values: ['subnet', 'net30']
+        tunnel_network: The IPv4 virtual network used for private communications between this server and client hosts.
+        tunnel_networkv6: The IPv6 virtual network used for private communications between this server and client hosts.
+        use_tls: Enables or disables the use of a TLS key for this OpenVPN server.
+        username_as_common_name: Enables or disable the username of the client being used in place of the certificate common name for purposes such as determining Client Specific Overrides.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        verbosity_level: The OpenVPN logging verbosity level. Valid values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        wins_server1: The primary WINS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        wins_server2: The secondary WINS server to provide to clients.This field is only available when the following conditions are met:- `mode` must be one of [ server_user, server_tls_user ]
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a PATCH operation on /api/v2/vpn/openvpn/server. "
+                "Set confirm=True to execute."
+            )
+        body: dict[str, Any] = {}
+        if id is not None:
+            body["id"] = id
+        if allow_compression is not None:
+            body["allow_compression"] = allow_compression
+        if authmode is not None:
+            body["authmode"] = authmode
+        if caref is not None:
+            body["caref"] = caref
+        if cert_depth is not None:
+            body["cert_depth"] = cert_depth
+        if certref is not None:
+            body["certref"] = certref
+        if client2client is not None:
+            body["client2client"] = client2client
+        if connlimit is not None:
+            body["connlimit"] = connlimit
+        if create_gw is not None:
+            body["create_gw"] = create_gw
+        if custom_options is not None:
+            body["custom_options"] = custom_options
+        if data_ciphers is not None:
+            body["data_ciphers"] = data_ciphers
+        if data_ciphers_fallback is not None:
+            body["data_ciphers_fallback"] = data_ciphers_fallback
+        if description is not None:
+            body["description"] = description
+        if dev_mode is not None:
+            body["dev_mode"] = dev_mode
+        if dh_length is not None:
+            body["dh_length"] = dh_length
+        if digest is not None:
+            body["digest"] = digest
+        if disable is not None:
+            body["disable"] = disable
+        if dns_domain is not None:
+            body["dns_domain"] = dns_domain
+        if dns_server1 is not None:
+            body["dns_server1"] = dns_server1
+        if dns_server2 is not None:
+            body["dns_server2"] = dns_server2
+        if dns_server3 is not None:
+            body["dns_server3"] = dns_server3
+        if dns_server4 is not None:
+            body["dns_server4"] = dns_server4
+        if duplicate_cn is not None:
+            body["duplicate_cn"] = duplicate_cn
+        if dynamic_ip is not None:
+            body["dynamic_ip"] = dynamic_ip
+        if ecdh_curve is not None:
+            body["ecdh_curve"] = ecdh_curve
+        if gwredir is not None:
+            body["gwredir"] = gwredir
+        if gwredir6 is not None:
+            body["gwredir6"] = gwredir6
+        if inactive_seconds is not None:
+            body["inactive_seconds"] = inactive_seconds
+        if interface is not None:
+            body["interface"] = interface
+        if keepalive_interval is not None:
+            body["keepalive_interval"] = keepalive_interval
+        if keepalive_timeout is not None:
+            body["keepalive_timeout"] = keepalive_timeout
+        if local_network is not None:
+            body["local_network"] = local_network
+        if local_networkv6 is not None:
+            body["local_networkv6"] = local_networkv6
+        if local_port is not None:
+            body["local_port"] = local_port
+        if maxclients is not None:
+            body["maxclients"] = maxclients
+        if mode is not None:
+            body["mode"] = mode
+        if netbios_enable is not None:
+            body["netbios_enable"] = netbios_enable
+        if netbios_ntype is not None:
+            body["netbios_ntype"] = netbios_ntype
+        if netbios_scope is not None:
+            body["netbios_scope"] = netbios_scope
+        if ntp_server1 is not None:
+            body["ntp_server1"] = ntp_server1
+        if ntp_server2 is not None:
+            body["ntp_server2"] = ntp_server2
+        if passtos is not None:
+            body["passtos"] = passtos
+        if ping_action is not None:
+            body["ping_action"] = ping_action
+        if ping_action_push is not None:
+            body["ping_action_push"] = ping_action_push
+        if ping_action_seconds is not None:
+            body["ping_action_seconds"] = ping_action_seconds
+        if ping_method is not None:
+            body["ping_method"] = ping_method
+        if ping_push is not None:
+            body["ping_push"] = ping_push
+        if ping_seconds is not None:
+            body["ping_seconds"] = ping_seconds
+        if protocol is not None:
+            body["protocol"] = protocol
+        if push_blockoutsidedns is not None:
+            body["push_blockoutsidedns"] = push_blockoutsidedns
+        if push_register_dns is not None:
+            body["push_register_dns"] = push_register_dns
+        if remote_cert_tls is not None:
+            body["remote_cert_tls"] = remote_cert_tls
+        if remote_network is not None:
+            body["remote_network"] = remote_network
+        if remote_networkv6 is not None:
+            body["remote_networkv6"] = remote_networkv6
+        if serverbridge_dhcp is not None:
+            body["serverbridge_dhcp"] = serverbridge_dhcp
+        if serverbridge_dhcp_end is not None:
+            body["serverbridge_dhcp_end"] = serverbridge_dhcp_end
+        if serverbridge_dhcp_start is not None:
+            body["serverbridge_dhcp_start"] = serverbridge_dhcp_start
+        if serverbridge_interface is not None:
+            body["serverbridge_interface"] = serverbridge_interface
+        if serverbridge_routegateway is not None:
+            body["serverbridge_routegateway"] = serverbridge_routegateway
+        if sndrcvbuf is not None:
+            body["sndrcvbuf"] = sndrcvbuf
+        if strictusercn is not None:
+            body["strictusercn"] = strictusercn
+        if tls is not None:
+            body["tls"] = tls
+        if tls_type is not None:
+            body["tls_type"] = tls_type
+        if tlsauth_keydir is not None:
+            body["tlsauth_keydir"] = tlsauth_keydir
+        if topology is not None:
+            body["topology"] = topology
+        if tunnel_network is not None:
+            body["tunnel_network"] = tunnel_network
+        if tunnel_networkv6 is not None:
+            body["tunnel_networkv6"] = tunnel_networkv6
+        if use_tls is not None:
+            body["use_tls"] = use_tls
+        if username_as_common_name is not None:
+            body["username_as_common_name"] = username_as_common_name
+        if verbosity_level is not None:
+            body["verbosity_level"] = verbosity_level
+        if wins_server1 is not None:
+            body["wins_server1"] = wins_server1
+        if wins_server2 is not None:
+            body["wins_server2"] = wins_server2
+        return await _client.request(
+            "PATCH",
+            "/api/v2/vpn/openvpn/server",
+            json_body=body,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_server(
+        id: str | int,
+        confirm: bool = False,
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/server
+
+        id: The ID of the object to target.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/server. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if id is not None:
+            params["id"] = id
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/server",
+            params=params,
+        )
+
+
+    @mcp.tool()
+    @_targeted
+    async def pfsense_delete_vpn_openvpn_servers(
+        confirm: bool = False,
+        limit: int | None = 0,
+        offset: int | None = 0,
+        query: dict[str, Any] | None = {},
+        firewall: str | None = None,
+    ) -> dict[str, Any] | list[Any] | str:
+        """DELETE /api/v2/vpn/openvpn/servers
+
+        Note: At least one query parameter is required for bulk deletion
+        (e.g., query={"name": "value"}). The query dict keys become URL
+        query params to filter which items to delete.
+
+        limit: The maximum number of objects to delete at once. Set to 0 for no limit.
+        offset: The starting point in the dataset to begin fetching objects.
+        query: The arbitrary query parameters to include in the request.Note: This does not define an actual parameter, rather it allows for any arbitrary query parameters to be included in the request.
+        firewall: Firewall to act on (see pfsense_get_managed_firewalls); defaults to the default one.
+
+        If this tool returns an unexpected error, call pfsense_report_issue to report it.
+        """
+        if not confirm:
+            return (
+                "This is a DELETE operation on /api/v2/vpn/openvpn/servers. "
+                "Set confirm=True to execute."
+            )
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        if query is not None:
+            params.update(query)
+        return await _client.request(
+            "DELETE",
+            "/api/v2/vpn/openvpn/servers",
+            params=params,
+        )
@@ -0,0 +1,1996 @@
+"""
+Tests for PfSenseClient runtime behavior in the generated server.
+
+Uses httpx.MockTransport so no pfSense host is needed. Each test builds a
+fresh client and counts the requests that actually reach the "firewall".
+
+Usage:
+    nix develop -c python -m pytest test_client.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from typing import Callable
+
+import httpx
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent
+
+
+def _server():
+    """Import the generated server module."""
+    os.environ.setdefault("PFSENSE_HOST", "https://127.0.0.1")
+    os.environ.setdefault("PFSENSE_API_KEY", "test")
+    sys.path.insert(0, str(_REPO_ROOT / "generated"))
+    return importlib.import_module("server")
+
+
+class _FakeFirewall:
+    """Minimal pfSense API stand-in that records every request it serves."""
+
+    def __init__(self, routes: dict[tuple[str, str], object] | None = None) -> None:
+        self.routes = routes or {}
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path))
+        data = self.routes.get((request.method, request.url.path), [])
+        return httpx.Response(200, json={"code": 200, "status": "ok", "data": data})
+
+    def count(self, method: str, path: str) -> int:
+        return self.calls.count((method, path))
+
+
+def _make_client(fake: Callable[[httpx.Request], httpx.Response], **env: str):
+    """Build a PfSenseClient wired to the fake firewall."""
+    srv = _server()
+    old = {k: os.environ.get(k) for k in env}
+    os.environ.update(env)
+    try:
+        client = srv.PfSenseClient()
+    finally:
+        for k, v in old.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+    client._client = httpx.AsyncClient(
+        base_url="https://127.0.0.1", transport=httpx.MockTransport(fake)
+    )
+    return client
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    """GET responses are cached and invalidated by mutations in the same scope."""
+
+    def test_repeated_get_hits_cache(self):
+        fake = _FakeFirewall({("GET", "/api/v2/firewall/aliases"): [{"id": 0, "name": "a"}]})
+        client = _make_client(fake)
+
+        async def run():
+            first = await client.request("GET", "/api/v2/firewall/aliases")
+            second = await client.request("GET", "/api/v2/firewall/aliases")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == [{"id": 0, "name": "a"}]
+        assert fake.count("GET", "/api/v2/firewall/aliases") == 1
+
+    def test_params_are_part_of_key(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake)
+
+        async def run():
+            await client.request("GET", "/api/v2/firewall/aliases", params={"limit": 1, "offset": 0})
+            await client.request("GET", "/api/v2/firewall/aliases", params={"offset": 0, "limit": 1})
+            await client.request("GET", "/api/v2/firewall/aliases", params={"limit": 2})
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/firewall/aliases") == 2
+
+    def test_cached_result_is_a_copy(self):
+        fake = _FakeFirewall({("GET", "/api/v2/firewall/rules"): [{"id": 0}]})
+        client = _make_client(fake)
+
+        async def run():
+            first = await client.request("GET", "/api/v2/firewall/rules")
+            first[0]["interface_descr"] = "LAN"
+            return await client.request("GET", "/api/v2/firewall/rules")
+
+        assert asyncio.run(run()) == [{"id": 0}]
+
+    def test_mutation_invalidates_same_scope(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake)
+
+        async def run():
+            await client.request("GET", "/api/v2/firewall/aliases")
+            await client.request("GET", "/api/v2/routing/gateways")
+            await client.request("POST", "/api/v2/firewall/alias", json_body={"name": "x"})
+            await client.request("GET", "/api/v2/firewall/aliases")
+            await client.request("GET", "/api/v2/routing/gateways")
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/firewall/aliases") == 2
+        assert fake.count("GET", "/api/v2/routing/gateways") == 1
+
+    def test_apply_invalidates_scope(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake)
+
+        async def run():
+            await client.request("GET", "/api/v2/interfaces")
+            await client.request("POST", "/api/v2/interface/apply")
+            await client.request("GET", "/api/v2/interfaces")
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/interfaces") == 2
+
+    def test_status_and_apply_status_not_cached(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake)
+
+        async def run():
+            for _ in range(2):
+                await client.request("GET", "/api/v2/status/gateways")
+                await client.request("GET", "/api/v2/firewall/apply")
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/status/gateways") == 2
+        assert fake.count("GET", "/api/v2/firewall/apply") == 2
+
+    def test_error_responses_not_cached(self):
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(404, json={"code": 404, "status": "not found"})
+
+        client = _make_client(handler)
+
+        async def run():
+            await client.request("GET", "/api/v2/firewall/alias", params={"id": 9})
+            await client.request("GET", "/api/v2/firewall/alias", params={"id": 9})
+
+        asyncio.run(run())
+        assert len(calls) == 2
+
+    def test_ttl_zero_disables_cache(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            await client.request("GET", "/api/v2/firewall/aliases")
+            await client.request("GET", "/api/v2/firewall/aliases")
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/firewall/aliases") == 2
+
+    def test_lru_bound(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake, PFSENSE_CACHE_MAX_ENTRIES="2")
+
+        async def run():
+            for path in ("/api/v2/user/groups", "/api/v2/users", "/api/v2/auth/keys"):
+                await client.request("GET", path)
+            await client.request("GET", "/api/v2/user/groups")
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/user/groups") == 2
+        assert len(client.cache._entries) == 2
+
+    def test_scope_longest_prefix(self):
+        srv = _server()
+        assert srv._cache_scope("/api/v2/firewall/virtual_ips") == "/api/v2/firewall/virtual_ip"
+        assert srv._cache_scope("/api/v2/firewall/aliases") == "/api/v2/firewall"
+        assert srv._cache_scope("/api/v2/interfaces") == "/api/v2/interface"
+
+
+# ---------------------------------------------------------------------------
+# JSON codec
+# ---------------------------------------------------------------------------
+
+
+class TestJsonCodec:
+    """The fast decoder is optional and always falls back to the stdlib."""
+
+    def _codec(self, value: str) -> str:
+        srv = _server()
+        old = os.environ.get("PFSENSE_JSON_CODEC")
+        os.environ["PFSENSE_JSON_CODEC"] = value
+        try:
+            return srv._load_json_codec()[0]
+        finally:
+            if old is None:
+                os.environ.pop("PFSENSE_JSON_CODEC")
+            else:
+                os.environ["PFSENSE_JSON_CODEC"] = old
+
+    def test_selection(self):
+        assert self._codec("json") == "json"
+        assert self._codec("no-such-codec") == "json"
+        for name in ("orjson", "msgspec"):
+            installed = importlib.util.find_spec(name) is not None
+            assert self._codec(name) == (name if installed else "json")
+
+    def test_auto_prefers_installed_fast_codec(self):
+        installed = [n for n in ("orjson", "msgspec") if importlib.util.find_spec(n)]
+        assert self._codec("auto") == (installed[0] if installed else "json")
+
+    def test_stdlib_fallback_for_rejected_input(self):
+        srv = _server()
+        assert srv._json_loads(b'{"load": Infinity}') == {"load": float("inf")}
+        try:
+            srv._json_loads(b"<html>502 Bad Gateway</html>")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("invalid JSON must raise")
+
+    def test_cache_hit_decodes_stored_body(self):
+        rows = [{"id": i, "name": f"a{i}"} for i in range(3)]
+        client = _make_client(_FakeFirewall({("GET", "/api/v2/firewall/aliases"): rows}))
+        first = asyncio.run(client.request("GET", "/api/v2/firewall/aliases"))
+        (raw,) = [entry[1] for entry in client.cache._entries.values()]
+        assert isinstance(raw, bytes)
+        assert first == rows == asyncio.run(client.request("GET", "/api/v2/firewall/aliases"))
+        assert client.cache.hits == 1
+
+
+# ---------------------------------------------------------------------------
+# Concurrency limiter
+# ---------------------------------------------------------------------------
+
+
+class _SlowFirewall(_FakeFirewall):
+    """Fake firewall that holds each request open and tracks peak concurrency."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return httpx.Response(200, json={"code": 200, "status": "ok", "data": []})
+
+
+class TestRequestLimiter:
+    """Backend requests are capped and queued fairly."""
+
+    def test_concurrency_capped(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake, PFSENSE_MAX_CONCURRENCY="2", PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            await asyncio.gather(*(
+                client.request("GET", "/api/v2/firewall/alias", params={"id": i})
+                for i in range(8)
+            ))
+
+        asyncio.run(run())
+        assert len(fake.calls) == 8
+        assert fake.peak == 2
+        stats = client.limiter.stats()
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["queued_requests"] == 6
+        assert stats["max_queue_depth"] == 6
+
+    def test_zero_means_unlimited(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake, PFSENSE_MAX_CONCURRENCY="0", PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            await asyncio.gather(*(
+                client.request("GET", "/api/v2/firewall/alias", params={"id": i})
+                for i in range(5)
+            ))
+
+        asyncio.run(run())
+        assert fake.peak == 5
+
+    def test_status_reads_jump_queue(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake, PFSENSE_MAX_CONCURRENCY="1", PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            first = asyncio.create_task(client.request("GET", "/api/v2/firewall/rules"))
+            await asyncio.sleep(0)
+            queued = [
+                asyncio.create_task(client.request("POST", "/api/v2/firewall/alias")),
+                asyncio.create_task(client.request("GET", "/api/v2/firewall/aliases")),
+                asyncio.create_task(client.request("GET", "/api/v2/status/gateways")),
+            ]
+            await asyncio.gather(first, *queued)
+
+        asyncio.run(run())
+        assert [path for _, path in fake.calls] == [
+            "/api/v2/firewall/rules",
+            "/api/v2/status/gateways",
+            "/api/v2/firewall/alias",
+            "/api/v2/firewall/aliases",
+        ]
+
+    def test_cancelled_waiter_releases_slot(self):
+        srv = _server()
+
+        async def run():
+            limiter = srv._RequestLimiter(1)
+            await limiter.acquire()
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            limiter.release()
+            assert limiter.in_flight == 0
+            await asyncio.wait_for(limiter.acquire(), timeout=1)
+            assert limiter.in_flight == 1
+
+        asyncio.run(run())
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class TestConnectionPool:
+    """Pool limits, timeouts and HTTP/2 are configurable via env vars."""
+
+    def test_env_configures_pool_and_timeouts(self):
+        client = _make_client(
+            _FakeFirewall(),
+            PFSENSE_MAX_CONNECTIONS="7",
+            PFSENSE_MAX_KEEPALIVE="5",
+            PFSENSE_KEEPALIVE_EXPIRY="90",
+            PFSENSE_CONNECT_TIMEOUT="3",
+            PFSENSE_READ_TIMEOUT="45",
+            PFSENSE_POOL_TIMEOUT="6",
+        )
+        assert client.limits.max_connections == 7
+        assert client.limits.max_keepalive_connections == 5
+        assert client.limits.keepalive_expiry == 90
+        assert client.timeout.as_dict() == {"connect": 3, "read": 45, "write": 45, "pool": 6}
+
+    def test_http2_requires_h2(self):
+        import importlib.util
+
+        client = _make_client(_FakeFirewall(), PFSENSE_HTTP2="true")
+        assert client.http2_requested
+        assert client.http2 == (importlib.util.find_spec("h2") is not None)
+
+    def test_warm_opens_connections_once(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake)
+
+        async def run():
+            await client.warm(3)
+            await client.warm(3)
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/system/version") == 3
+
+    def test_warm_ignores_connection_errors(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client = _make_client(handler)
+        asyncio.run(client.warm(2))
+
+
+# ---------------------------------------------------------------------------
+# Retries and circuit breaker
+# ---------------------------------------------------------------------------
+
+
+class _FlakyFirewall(_FakeFirewall):
+    """Fake firewall that fails the first `failures` requests."""
+
+    def __init__(self, failures: int, status: int | None = None) -> None:
+        super().__init__()
+        self.failures = failures
+        self.status = status
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path))
+        if len(self.calls) <= self.failures:
+            if self.status is None:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(self.status, text="<html>Bad Gateway</html>")
+        return httpx.Response(200, json={"code": 200, "status": "ok", "data": {"ok": True}})
+
+
+_NO_BACKOFF = {"PFSENSE_RETRY_BACKOFF": "0", "PFSENSE_CACHE_TTL": "0"}
+
+
+class TestRetries:
+    """Transient failures are retried for idempotent requests only."""
+
+    def test_get_retried_on_connect_error(self):
+        fake = _FlakyFirewall(2)
+        client = _make_client(fake, **_NO_BACKOFF)
+        assert asyncio.run(client.request("GET", "/api/v2/system/version")) == {"ok": True}
+        assert len(fake.calls) == 3
+        assert client.retries == 2
+
+    def test_get_retried_on_bad_gateway(self):
+        fake = _FlakyFirewall(1, status=502)
+        client = _make_client(fake, **_NO_BACKOFF)
+        assert asyncio.run(client.request("GET", "/api/v2/firewall/apply")) == {"ok": True}
+        assert len(fake.calls) == 2
+
+    def test_retries_exhausted_returns_error(self):
+        fake = _FlakyFirewall(10)
+        client = _make_client(fake, PFSENSE_RETRIES="1", **_NO_BACKOFF)
+        result = asyncio.run(client.request("GET", "/api/v2/system/version"))
+        assert "Connection failed" in result["error"]
+        assert len(fake.calls) == 2
+
+    def test_final_bad_gateway_returned_as_error_dict(self):
+        fake = _FlakyFirewall(10, status=503)
+        client = _make_client(fake, PFSENSE_RETRIES="1", **_NO_BACKOFF)
+        result = asyncio.run(client.request("GET", "/api/v2/system/version"))
+        assert result["code"] == 503
+        assert len(fake.calls) == 2
+
+    def test_mutation_not_retried_on_bad_gateway(self):
+        fake = _FlakyFirewall(1, status=502)
+        client = _make_client(fake, **_NO_BACKOFF)
+        result = asyncio.run(client.request("POST", "/api/v2/firewall/alias", json_body={}))
+        assert result["code"] == 502
+        assert len(fake.calls) == 1
+
+    def test_mutation_retried_when_connection_never_opened(self):
+        fake = _FlakyFirewall(1)
+        client = _make_client(fake, **_NO_BACKOFF)
+        result = asyncio.run(client.request("POST", "/api/v2/firewall/alias", json_body={}))
+        assert result == {"ok": True}
+        assert len(fake.calls) == 2
+
+    def test_backoff_grows_and_is_capped(self):
+        client = _make_client(
+            _FakeFirewall(), PFSENSE_RETRY_BACKOFF="1", PFSENSE_RETRY_BACKOFF_MAX="4"
+        )
+        for attempt, ceiling in [(0, 1), (1, 2), (2, 4), (5, 4)]:
+            delay = client._backoff(attempt)
+            assert ceiling / 2 <= delay <= ceiling
+
+
+class TestCircuitBreaker:
+    """Consecutive failures open the breaker so calls fail fast."""
+
+    def test_opens_and_fails_fast(self):
+        fake = _FlakyFirewall(100)
+        client = _make_client(
+            fake, PFSENSE_RETRIES="0", PFSENSE_BREAKER_THRESHOLD="3", **_NO_BACKOFF
+        )
+
+        async def run():
+            return [await client.request("GET", "/api/v2/system/version") for _ in range(5)]
+
+        results = asyncio.run(run())
+        assert len(fake.calls) == 3
+        assert "not responding" in results[-1]["error"]
+        assert client.breaker.stats()["state"] == "open"
+        assert client.breaker.trips == 1
+
+    def test_half_open_probe_closes_on_success(self):
+        fake = _FlakyFirewall(2)
+        client = _make_client(
+            fake,
+            PFSENSE_RETRIES="0",
+            PFSENSE_BREAKER_THRESHOLD="2",
+            PFSENSE_BREAKER_COOLDOWN="0",
+            **_NO_BACKOFF,
+        )
+
+        async def run():
+            for _ in range(2):
+                await client.request("GET", "/api/v2/system/version")
+            assert client.breaker.state == "open"
+            return await client.request("GET", "/api/v2/system/version")
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert client.breaker.state == "closed"
+
+    def test_http_errors_do_not_trip(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"code": 404, "status": "not found"})
+
+        client = _make_client(handler, PFSENSE_BREAKER_THRESHOLD="1", **_NO_BACKOFF)
+
+        async def run():
+            for _ in range(3):
+                await client.request("GET", "/api/v2/firewall/alias", params={"id": 1})
+
+        asyncio.run(run())
+        assert client.breaker.state == "closed"
+
+
+# ---------------------------------------------------------------------------
+# Single-flight request coalescing
+# ---------------------------------------------------------------------------
+
+
+class TestCoalescing:
+    """Identical concurrent GETs share one backend request."""
+
+    def test_identical_gets_share_one_call(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            return await asyncio.gather(*(
+                client.request("GET", "/api/v2/interfaces") for _ in range(5)
+            ))
+
+        results = asyncio.run(run())
+        assert results == [[]] * 5
+        assert len(fake.calls) == 1
+        assert client.coalesced == 4
+        assert client._inflight == {}
+
+    def test_different_params_not_coalesced(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            await asyncio.gather(
+                client.request("GET", "/api/v2/firewall/rules", params={"limit": 1}),
+                client.request("GET", "/api/v2/firewall/rules", params={"limit": 2}),
+            )
+
+        asyncio.run(run())
+        assert len(fake.calls) == 2
+
+    def test_followers_get_independent_copies(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"code": 200, "data": [{"id": 0}]})
+
+        client = _make_client(handler, PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            return await asyncio.gather(*(
+                client.request("GET", "/api/v2/firewall/rules") for _ in range(2)
+            ))
+
+        first, second = asyncio.run(run())
+        first[0]["interface_descr"] = "LAN"
+        assert second == [{"id": 0}]
+
+    def test_leader_mutation_does_not_reach_followers(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"code": 200, "data": [{"id": 0}]})
+
+        client = _make_client(handler, PFSENSE_CACHE_TTL="0")
+
+        async def leader():
+            rows = await client.request("GET", "/api/v2/firewall/rules")
+            rows[0]["id"] = 99
+            return rows
+
+        async def follower():
+            await asyncio.sleep(0)
+            return await client.request("GET", "/api/v2/firewall/rules")
+
+        async def run():
+            return await asyncio.gather(leader(), follower())
+
+        first, second = asyncio.run(run())
+        assert client.coalesced == 1
+        assert first == [{"id": 99}]
+        assert second == [{"id": 0}]
+
+    def test_lone_read_not_copied(self, monkeypatch):
+        srv = _server()
+        copies = []
+        deepcopy = srv.copy.deepcopy
+        monkeypatch.setattr(srv.copy, "deepcopy", lambda value: copies.append(value) or deepcopy(value))
+        client = _make_client(_SlowFirewall(), PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            await client.request("GET", "/api/v2/interfaces")
+            alone = len(copies)
+            await asyncio.gather(*(client.request("GET", "/api/v2/interfaces") for _ in range(3)))
+            return alone
+
+        assert asyncio.run(run()) == 0
+        assert len(copies) == 3
+        assert client._shared == set()
+
+    def test_leader_cancellation_does_not_fail_followers(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+
+        async def run():
+            leader = asyncio.create_task(client.request("GET", "/api/v2/interfaces"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client.request("GET", "/api/v2/interfaces"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(run()) == []
+        assert len(fake.calls) == 1
+
+    def test_mutation_detaches_inflight_read(self):
+        fake = _SlowFirewall()
+        client = _make_client(fake)
+
+        async def run():
+            before = asyncio.create_task(client.request("GET", "/api/v2/firewall/aliases"))
+            await asyncio.sleep(0)
+            await client.request("POST", "/api/v2/firewall/alias", json_body={})
+            after = asyncio.create_task(client.request("GET", "/api/v2/firewall/aliases"))
+            await asyncio.gather(before, after)
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/firewall/aliases") == 2
+
+    def test_read_overlapping_write_not_cached(self):
+        fake = _SlowFirewall(delay=0.05)
+        client = _make_client(fake)
+        # The write lands while the slow read is still in flight.
+        client._client = httpx.AsyncClient(
+            base_url="https://127.0.0.1",
+            transport=httpx.MockTransport(
+                lambda r: fake(r) if r.method == "GET" else httpx.Response(200, json={"code": 200})
+            ),
+        )
+
+        async def run():
+            before = asyncio.create_task(client.request("GET", "/api/v2/firewall/aliases"))
+            await asyncio.sleep(0)
+            await asyncio.gather(
+                before, client.request("PATCH", "/api/v2/firewall/alias", json_body={})
+            )
+            await client.request("GET", "/api/v2/firewall/aliases")
+
+        asyncio.run(run())
+        assert fake.count("GET", "/api/v2/firewall/aliases") == 2
+
+
+# ---------------------------------------------------------------------------
+# Shared interface description map
+# ---------------------------------------------------------------------------
+
+_INTERFACES = [{"id": "wan", "descr": "WAN"}, {"id": "opt1", "descr": "IOT"}]
+
+
+class TestInterfaceDescrMap:
+    """Rule enrichment reuses one interface map until interfaces change."""
+
+    def _enrich(self, client, rules):
+        srv = _server()
+        old = srv._client
+        srv._client = client
+        try:
+            return asyncio.run(srv._enrich_firewall_rules_with_interface_descr(rules))
+        finally:
+            srv._client = old
+
+    def test_map_reused_across_listings(self):
+        fake = _FakeFirewall({("GET", "/api/v2/interfaces"): _INTERFACES})
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+
+        first = self._enrich(client, [{"id": 0, "interface": "opt1"}])
+        second = self._enrich(client, [{"id": 1, "interface": ["wan", "opt1"]}])
+        assert first[0]["interface_descr"] == "IOT"
+        assert second[0]["interface_descr"] == ["WAN", "IOT"]
+        assert fake.count("GET", "/api/v2/interfaces") == 1
+        assert client.interface_descr.version == 1
+
+    def test_interface_mutation_refreshes_map(self):
+        fake = _FakeFirewall({("GET", "/api/v2/interfaces"): _INTERFACES})
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+
+        self._enrich(client, [{"id": 0, "interface": "wan"}])
+        asyncio.run(client.request("POST", "/api/v2/interface/apply"))
+        self._enrich(client, [{"id": 0, "interface": "wan"}])
+        asyncio.run(client.request("POST", "/api/v2/firewall/alias", json_body={}))
+        self._enrich(client, [{"id": 0, "interface": "wan"}])
+        assert fake.count("GET", "/api/v2/interfaces") == 2
+        assert client.interface_descr.version == 2
+
+    def test_ttl_expiry_refreshes_map(self):
+        fake = _FakeFirewall({("GET", "/api/v2/interfaces"): _INTERFACES})
+        client = _make_client(fake, PFSENSE_CACHE_TTL="0", PFSENSE_INTERFACE_MAP_TTL="0")
+
+        self._enrich(client, [{"id": 0, "interface": "wan"}])
+        self._enrich(client, [{"id": 0, "interface": "wan"}])
+        assert fake.count("GET", "/api/v2/interfaces") == 2
+
+    def test_failed_fetch_not_cached(self):
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(500, json={"code": 500, "status": "error"})
+            return httpx.Response(200, json={"code": 200, "data": _INTERFACES})
+
+        client = _make_client(handler, PFSENSE_CACHE_TTL="0")
+        first = self._enrich(client, [{"id": 0, "interface": "wan"}])
+        second = self._enrich(client, [{"id": 0, "interface": "wan"}])
+        assert "interface_descr" not in first[0]
+        assert second[0]["interface_descr"] == "WAN"
+
+
+# ---------------------------------------------------------------------------
+# Paged list fetching
+# ---------------------------------------------------------------------------
+
+
+class _PagedFirewall:
+    """Plural endpoint that honors limit/offset and records each page request."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.pages: list[tuple[int, int]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v2/interfaces":
+            return httpx.Response(200, json={"code": 200, "data": _INTERFACES})
+        limit = int(request.url.params.get("limit", 0))
+        offset = int(request.url.params.get("offset", 0))
+        self.pages.append((offset, limit))
+        rows = self.rows[offset:offset + limit] if limit else self.rows[offset:]
+        return httpx.Response(200, json={"code": 200, "data": rows})
+
+
+def _rules(count: int) -> list[dict]:
+    return [
+        {"id": i, "interface": "opt1" if i % 10 == 0 else "wan", "descr": f"rule {i}"}
+        for i in range(count)
+    ]
+
+
+class TestPagedLists:
+    """List tools stream pages and stop once the requested rows are found."""
+
+    def _list(self, client, params, fields=None, query=None, **kwargs):
+        srv = _server()
+        old = srv._client
+        srv._client = client
+        try:
+            return asyncio.run(srv._list_paged("/api/v2/firewall/rules", params, fields, query, **kwargs))
+        finally:
+            srv._client = old
+
+    def test_reads_all_pages(self):
+        fake = _PagedFirewall(_rules(250))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        rows = self._list(client, {"limit": 0, "offset": 0})
+        assert [r["id"] for r in rows] == list(range(250))
+        assert fake.pages == [(0, 100), (100, 100), (200, 100)]
+
+    def test_limit_stops_early(self):
+        fake = _PagedFirewall(_rules(10_000))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        rows = self._list(client, {"limit": 150, "offset": 20})
+        assert [r["id"] for r in rows] == list(range(20, 170))
+        assert fake.pages == [(20, 100), (120, 50)]
+
+    def test_filters_each_page(self):
+        fake = _PagedFirewall(_rules(1000))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        rows = self._list(client, {"limit": 15}, fields="interface", query={"interface": "opt1"})
+        assert rows == [{"id": i, "interface": "opt1"} for i in range(0, 150, 10)]
+        assert fake.pages == [(0, 100), (100, 200)]
+
+    def test_filtered_scan_grows_pages(self):
+        fake = _PagedFirewall(_rules(10_000))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        rows = self._list(client, {}, query={"descr__endswith": "99"})
+        assert [r["id"] for r in rows] == list(range(99, 10_000, 100))
+        # 7 requests rather than one per 100 rows.
+        assert len(fake.pages) == 7
+        assert fake.pages[:3] == [(0, 100), (100, 200), (300, 400)]
+
+    def test_enrichment_runs_per_page(self):
+        fake = _PagedFirewall(_rules(30))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="20")
+        srv = _server()
+        rows = self._list(client, {}, enrich=srv._enrich_firewall_rules_with_interface_descr)
+        assert [r["interface_descr"] for r in rows[:2]] == ["IOT", "WAN"]
+        assert len(rows) == 30 and "interface_descr" in rows[-1]
+
+    def test_page_size_zero_fetches_once(self):
+        fake = _PagedFirewall(_rules(250))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="0")
+        assert len(self._list(client, {"limit": 0})) == 250
+        assert len(self._list(client, {"limit": 7, "offset": 3})) == 7
+        assert fake.pages == [(0, 0), (3, 7)]
+
+    def test_backend_ignoring_paging_read_once(self):
+        fake = _FakeFirewall({("GET", "/api/v2/firewall/rules"): _rules(500)})
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        assert len(self._list(client, {})) == 500
+        assert fake.count("GET", "/api/v2/firewall/rules") == 1
+
+    def test_invalid_query_rejected_before_fetching(self):
+        fake = _PagedFirewall(_rules(10))
+        client = _make_client(fake)
+        result = self._list(client, {}, query={"source__cidr": "not-a-network"})
+        assert "Invalid query" in result["error"]
+        assert fake.pages == []
+
+    def test_client_only_operators_filter_pages(self):
+        fake = _PagedFirewall(_rules(300))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        rows = self._list(client, {"limit": 3}, query={"id__in": "5,150,250,299"})
+        assert [r["id"] for r in rows] == [5, 150, 250]
+        assert fake.pages == [(0, 100), (100, 200)]
+
+    def test_budget_trims_and_continues(self):
+        fake = _PagedFirewall(_rules(1000))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        first = self._list(client, {}, max_tokens=500)
+        kept = first["returned"]
+        assert [r["id"] for r in first["data"]] == list(range(kept))
+        assert first["next_offset"] == kept and first["more_available"] is True
+        assert first["omitted"] == 100 - kept
+        assert fake.pages == [(0, 100)]
+
+        second = self._list(client, {"offset": first["next_offset"]}, max_tokens=500)
+        assert second["data"][0]["id"] == kept
+
+    def test_budget_omitted_exact_when_fully_read(self):
+        fake = _PagedFirewall(_rules(30))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        result = self._list(client, {}, query={"interface": "wan"}, max_tokens=100)
+        assert result["returned"] + result["omitted"] == 27
+        assert "more_available" not in result
+        wan = [i for i in range(30) if i % 10]
+        assert result["next_offset"] == wan[result["returned"]]
+
+    def test_budget_from_env_and_zero_unlimited(self):
+        fake = _PagedFirewall(_rules(300))
+        client = _make_client(fake, PFSENSE_MAX_RESPONSE_TOKENS="200")
+        assert isinstance(self._list(client, {}, max_tokens=None), dict)
+        assert len(self._list(client, {}, max_tokens=0)) == 300
+
+    def test_oversized_row_still_returned(self):
+        rows = [{"id": 0, "descr": "x" * 1000}, {"id": 1, "descr": "y"}]
+        client = _make_client(_PagedFirewall(rows))
+        result = self._list(client, {}, max_tokens=10)
+        assert result["data"] == rows[:1] and result["next_offset"] == 1
+
+    def test_compact_drops_empty_fields(self):
+        rows = [{"id": 0, "descr": "", "tags": [], "log": False, "port": None, "ip": "10.0.0.1"}]
+        client = _make_client(_PagedFirewall(rows))
+        assert self._list(client, {}, compact=True) == [{"id": 0, "log": False, "ip": "10.0.0.1"}]
+        assert self._list(client, {}, fields="descr,log", compact=True) == [{"id": 0, "log": False}]
+
+    def test_unpaged_budget_has_no_offset(self):
+        srv = _server()
+        result = srv._filter_response(_rules(100), None, None, max_tokens=100)
+        assert result["returned"] + result["omitted"] == 100
+        assert "next_offset" not in result and "more_available" not in result
+
+    def test_cursor_walks_result_once(self):
+        fake = _PagedFirewall(_rules(1000))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        result = self._list(client, {}, query={"interface": "wan"}, fields="descr", max_tokens=300)
+        seen = [r["id"] for r in result["data"]]
+        while "cursor" in result:
+            result = self._list(client, {}, cursor=result["cursor"], max_tokens=300)
+            seen += [r["id"] for r in result["data"]]
+        assert seen == [i for i in range(1000) if i % 10]
+        assert result["omitted"] == 0 and "next_offset" not in result
+        # Every backend row was read exactly once across all continuations.
+        assert fake.pages == [(0, 100), (100, 200), (300, 400), (700, 800)]
+        assert client.cursors.stats()["resumed"] == client.cursors.stats()["issued"]
+
+    def test_cursor_served_from_buffer(self):
+        fake = _PagedFirewall(_rules(100))
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        first = self._list(client, {}, max_tokens=200)
+        second = self._list(client, {}, cursor=first["cursor"], max_tokens=200)
+        assert second["data"][0]["id"] == first["next_offset"]
+        assert fake.pages == [(0, 100)]
+
+    def test_cursor_single_use(self):
+        client = _make_client(_PagedFirewall(_rules(500)))
+        first = self._list(client, {}, max_tokens=200)
+        self._list(client, {}, cursor=first["cursor"], max_tokens=200)
+        assert "expired cursor" in self._list(client, {}, cursor=first["cursor"])["error"]
+
+    def test_mutation_drops_cursors(self):
+        client = _make_client(_PagedFirewall(_rules(500)))
+        first = self._list(client, {}, max_tokens=200)
+        asyncio.run(client.request("POST", "/api/v2/firewall/rule", json_body={}))
+        assert "error" in self._list(client, {}, cursor=first["cursor"])
+
+    def test_cursors_disabled(self):
+        client = _make_client(_PagedFirewall(_rules(500)), PFSENSE_CURSOR_MAX_ENTRIES="0")
+        result = self._list(client, {}, max_tokens=200)
+        assert "cursor" not in result and result["next_offset"] == result["returned"]
+
+    def test_mid_stream_error_returned(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if int(request.url.params.get("offset", 0)) >= 100:
+                return httpx.Response(400, json={"code": 400, "status": "bad request"})
+            return httpx.Response(200, json={"code": 200, "data": _rules(100)})
+
+        client = _make_client(handler, PFSENSE_PAGE_SIZE="100", PFSENSE_RETRIES="0")
+        assert self._list(client, {}) == {"code": 400, "status": "bad request"}
+
+
+class _FilteringFirewall:
+    """Alias endpoint that applies URL filters itself, as pfSense does.
+
+    A list-valued field matches a filter if any element equals it, which is
+    not what the client-side exact match does with the same query.
+    """
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.params: list[dict[str, str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = {k: v for k, v in request.url.params.items() if k not in ("limit", "offset")}
+        self.params.append(params)
+        rows = [row for row in self.rows if all(self._matches(row.get(k), v) for k, v in params.items())]
+        return httpx.Response(200, json={"code": 200, "data": rows})
+
+    @staticmethod
+    def _matches(value, expected: str) -> bool:
+        if isinstance(value, list):
+            return expected in map(str, value)
+        return str(value) == expected
+
+
+class TestServerFilters:
+    """Forwarded URL filters never change which rows a list tool returns."""
+
+    _ALIASES = [
+        {"id": 0, "name": "lan_hosts", "type": "host", "address": ["10.0.0.1", "10.0.0.2"]},
+        {"id": 1, "name": "one_host", "type": "host", "address": ["10.0.0.1"]},
+        {"id": 2, "name": "ports", "type": "port", "address": ["443"]},
+    ]
+
+    def _list(self, query: dict):
+        srv = _server()
+        fake = _FilteringFirewall(self._ALIASES)
+        old = srv._client
+        srv._client = _make_client(fake, PFSENSE_CACHE_TTL="0")
+        try:
+            rows = asyncio.run(srv.pfsense_list_firewall_aliases.fn(query=query))
+        finally:
+            srv._client = old
+        return rows, fake.params
+
+    def _local(self, query: dict) -> list[dict]:
+        return _server()._filter_response(list(self._ALIASES), None, query)
+
+    def test_list_field_filtered_client_side_only(self):
+        for query in (
+            {"address": "10.0.0.1"},
+            {"address": "['10.0.0.1']"},
+            {"address__startswith": "10.", "type": "host"},
+        ):
+            rows, params = self._list(query)
+            assert rows == self._local(query)
+            assert all("address" not in sent for sent in params)
+        assert [r["id"] for r in self._list({"address": "['10.0.0.1']"})[0]] == [1]
+
+    def test_exact_scalar_filter_forwarded(self):
+        query = {"type": "host", "name__contains": "host"}
+        rows, params = self._list(query)
+        assert rows == self._local(query) == self._ALIASES[:2]
+        assert params == [{"type": "host"}]
+
+
+# ---------------------------------------------------------------------------
+# Streamed list responses
+# ---------------------------------------------------------------------------
+
+
+def _envelope(rows: list, data_first: bool = False) -> bytes:
+    import json
+
+    body = {"data": rows, "code": 200, "status": "ok"} if data_first else {
+        "code": 200, "status": "ok", "response_id": "SUCCESS", "message": "", "data": rows,
+    }
+    return json.dumps(body).encode()
+
+
+class _StreamingFirewall:
+    """Serves a list body in small chunks and records how many were pulled."""
+
+    def __init__(self, rows: list, chunk: int = 64, status: int = 200) -> None:
+        self.rows = rows
+        self.body = _envelope(rows)
+        self.chunk = chunk
+        self.status = status
+        self.requests: list[dict[str, str]] = []
+        self.chunks_sent = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(dict(request.url.params))
+        limit = int(request.url.params.get("limit", 0))
+        offset = int(request.url.params.get("offset", 0))
+        body = self.body
+        if self.status == 200:
+            body = _envelope(self.rows[offset:offset + limit] if limit else self.rows[offset:])
+
+        async def chunks():
+            for start in range(0, len(body), self.chunk):
+                self.chunks_sent += 1
+                yield body[start:start + self.chunk]
+
+        return httpx.Response(self.status, content=chunks())
+
+
+_STATES = [{"id": i, "interface": "wan", "source": f"10.0.0.{i % 250}:5000", "note": "é"} for i in range(400)]
+
+
+class TestJsonRowStream:
+    """The incremental parser yields rows however the body is chunked."""
+
+    def _parse(self, body: bytes, step: int):
+        parser = _server()._JsonRowStream()
+        rows = []
+        for start in range(0, len(body), step):
+            rows += parser.feed(body[start:start + step])
+        rows += parser.close()
+        return rows, parser
+
+    def test_any_chunking(self):
+        rows = [{"id": 1, "n": 12345, "s": "a\"b\\\\c ü", "l": [1, {"x": None}]}, 7, "z", 1.5e3]
+        for data_first in (False, True):
+            body = _envelope(rows, data_first)
+            for step in (1, 2, 3, 7, len(body)):
+                parsed, parser = self._parse(body, step)
+                assert parsed == rows
+                assert parser.envelope["code"] == 200 and parser.streamed_rows
+
+    def test_empty_and_non_array_data(self):
+        assert self._parse(_envelope([]), 4)[0] == []
+        rows, parser = self._parse(b'{"code": 200, "data": {"hostname": "fw"}}', 5)
+        assert rows == [] and not parser.streamed_rows
+        assert parser.envelope["data"] == {"hostname": "fw"}
+
+    def test_malformed_and_truncated(self):
+        for body in (b"<html>502</html>", b'{"data": [1 2]}', b'{"data": [1]} x', b'{"data": [{"id": 1}, '):
+            try:
+                self._parse(body, 3)
+            except ValueError:
+                continue
+            raise AssertionError(f"{body!r} should not parse")
+
+
+class TestStreamedLists:
+    """Live endpoints are read in one streamed request, row by row."""
+
+    def _list(self, client, params, **kwargs):
+        srv = _server()
+        old = srv._client
+        srv._client = client
+        try:
+            return asyncio.run(srv._list_paged("/api/v2/firewall/states", params, None, None, **kwargs))
+        finally:
+            srv._client = old
+
+    def test_streams_single_request(self):
+        fake = _StreamingFirewall(_STATES)
+        client = _make_client(fake, PFSENSE_PAGE_SIZE="100")
+        assert self._list(client, {}) == _STATES
+        assert fake.requests == [{"limit": "0", "offset": "0"}]
+
+    def test_limit_and_budget_stop_reading(self):
+        fake = _StreamingFirewall(_STATES)
+        client = _make_client(fake)
+        result = self._list(client, {}, max_tokens=200)
+        total_chunks = -(-len(fake.body) // fake.chunk)
+        assert fake.chunks_sent < total_chunks / 4
+        assert result["more_available"] is True
+        assert result["next_offset"] == result["returned"]
+
+        rest = self._list(client, {}, cursor=result["cursor"], max_tokens=0)
+        assert [r["id"] for r in result["data"] + rest["data"]] == list(range(400))
+        assert fake.requests[-1]["offset"] == str(result["returned"] + result["omitted"])
+
+    def test_stream_disabled_pages(self):
+        fake = _PagedFirewall(_STATES)
+        client = _make_client(fake, PFSENSE_STREAM_LIVE_LISTS="false", PFSENSE_PAGE_SIZE="100")
+        assert len(self._list(client, {})) == 400
+        assert len(fake.pages) == 5
+
+    def test_retry_before_first_row(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(502, text="<html>Bad Gateway</html>")
+            return httpx.Response(200, content=_envelope(_STATES[:3]))
+
+        client = _make_client(handler, **_NO_BACKOFF)
+        assert self._list(client, {}) == _STATES[:3]
+        assert len(calls) == 2 and client.retries == 1
+
+    def test_error_payload_returned(self):
+        fake = _StreamingFirewall([], status=401)
+        fake.body = b'{"code": 401, "status": "unauthorized", "data": []}'
+        client = _make_client(fake, PFSENSE_RETRIES="0")
+        assert self._list(client, {})["code"] == 401
+        assert client.limiter.in_flight == 0
+
+
+# ---------------------------------------------------------------------------
+# Multiple firewalls
+# ---------------------------------------------------------------------------
+
+
+def _registry(tmp_path: Path, config: dict, **env: str):
+    """Load a _TargetRegistry from a PFSENSE_FIREWALLS_FILE written to tmp_path."""
+    import json
+
+    srv = _server()
+    path = tmp_path / "firewalls.json"
+    path.write_text(json.dumps(config))
+    env["PFSENSE_FIREWALLS_FILE"] = str(path)
+    old = {k: os.environ.get(k) for k in env}
+    os.environ.update(env)
+    try:
+        return srv._TargetRegistry.from_env()
+    finally:
+        for k, v in old.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+_FLEET = {
+    "default": "hq",
+    "firewalls": {
+        "hq": {"host": "https://10.0.0.1", "api_key": "hq-key"},
+        "branch": {"host": "https://10.1.0.1", "api_key_env": "BRANCH_KEY", "verify_ssl": True},
+    },
+}
+
+
+class TestTargets:
+    """Each registered firewall gets its own client; `firewall=` picks one per call."""
+
+    def _with_registry(self, registry, coro_fn):
+        srv = _server()
+        old = srv._targets
+        srv._targets = registry
+        try:
+            return asyncio.run(coro_fn(srv))
+        finally:
+            srv._targets = old
+
+    def test_registry_from_file(self, tmp_path):
+        registry = _registry(tmp_path, _FLEET, BRANCH_KEY="branch-key")
+        assert registry.names() == ["hq", "branch"] and registry.default == "hq"
+        assert registry.host("branch") == "https://10.1.0.1"
+        assert registry.clients == {}
+
+        branch = registry.client("branch")
+        assert (branch.host, branch.verify_ssl) == ("https://10.1.0.1", True)
+        assert registry.client() is registry.client("hq")
+        assert registry.client("hq").api_key == "hq-key"
+        assert registry.client("hq").cache is not branch.cache
+        assert registry.client("hq").limiter is not branch.limiter
+
+    def test_invalid_registry(self, tmp_path):
+        with pytest.raises(ValueError, match="no firewalls"):
+            _registry(tmp_path, {"firewalls": {}})
+        with pytest.raises(ValueError, match="has no host"):
+            _registry(tmp_path, {"firewalls": {"a": {}}})
+        with pytest.raises(ValueError, match="unknown default"):
+            _registry(tmp_path, {"default": "b", "firewalls": {"a": {"host": "x", "api_key": "k"}}})
+
+    def test_registry_requires_one_key_source(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PFSENSE_API_KEY", "default-key")
+        monkeypatch.delenv("BRANCH_KEY", raising=False)
+        for spec in ({}, {"api_key": "k", "api_key_env": "BRANCH_KEY"}):
+            with pytest.raises(ValueError, match="exactly one of api_key or api_key_env"):
+                _registry(tmp_path, {"firewalls": {"a": {"host": "x", **spec}}})
+        with pytest.raises(ValueError, match="from BRANCH_KEY, which is not set"):
+            _registry(tmp_path, _FLEET)
+        with pytest.raises(ValueError, match="not set"):
+            _registry(tmp_path, _FLEET, BRANCH_KEY="")
+        registry = _registry(tmp_path, _FLEET, BRANCH_KEY="branch-key")
+        assert registry.client("branch").api_key == "branch-key"
+
+    def test_calls_routed_per_firewall(self, tmp_path):
+        registry = _registry(tmp_path, _FLEET, BRANCH_KEY="branch-key")
+        path = "/api/v2/firewall/aliases"
+        hq = _FakeFirewall({("GET", path): [{"id": 0, "name": "hq"}]})
+        branch = _FakeFirewall({("GET", path): [{"id": 0, "name": "branch"}]})
+        registry.clients = {"hq": _make_client(hq), "branch": _make_client(branch)}
+
+        async def run(srv):
+            tool = srv.pfsense_get_server_stats.fn
+            stats = [await tool(), await tool(firewall="branch")]
+            rows = [
+                await srv._client.request("GET", path),
+                await srv._targeted(lambda firewall=None: srv._client.request("GET", path))(
+                    firewall="branch"
+                ),
+            ]
+            return stats, rows
+
+        stats, rows = self._with_registry(registry, run)
+        assert [s["firewall"] for s in stats] == ["hq", "branch"]
+        assert [r[0]["name"] for r in rows] == ["hq", "branch"]
+        assert hq.count("GET", path) == branch.count("GET", path) == 1
+
+    def test_unknown_firewall(self, tmp_path):
+        registry = _registry(tmp_path, _FLEET, BRANCH_KEY="branch-key")
+
+        async def run(srv):
+            return await srv.pfsense_get_overview.fn(firewall="nope")
+
+        result = self._with_registry(registry, run)
+        assert "Unknown firewall 'nope'" in result["error"]
+        assert "hq, branch" in result["error"]
+        assert registry.clients == {}
+
+    def test_list_firewalls(self, tmp_path):
+        registry = _registry(tmp_path, _FLEET, BRANCH_KEY="branch-key")
+        registry.client("branch")
+
+        async def run(srv):
+            return await srv.pfsense_get_managed_firewalls.fn()
+
+        assert self._with_registry(registry, run) == {
+            "default": "hq",
+            "firewalls": [
+                {"name": "hq", "host": "https://10.0.0.1", "connected": False},
+                {"name": "branch", "host": "https://10.1.0.1", "connected": True},
+            ],
+        }
+
+    def test_single_firewall_default(self):
+        srv = _server()
+        assert srv._targets.names() == ["default"]
+        assert srv._client.host == srv._targets.client().host
+
+
+class TestFleetQuery:
+    """pfsense_query_fleet fans one read tool out and merges the rows."""
+
+    _PATH = "/api/v2/firewall/aliases"
+
+    def _query(self, fakes: dict, concurrency: int = 8, **kwargs):
+        srv = _server()
+        registry = srv._TargetRegistry({name: {"host": f"https://{name}"} for name in fakes}, "hq")
+        registry.clients = {name: _make_client(fake, **_NO_BACKOFF) for name, fake in fakes.items()}
+        old = srv._targets, srv._FLEET_CONCURRENCY
+        srv._targets, srv._FLEET_CONCURRENCY = registry, concurrency
+        try:
+            return asyncio.run(srv.pfsense_query_fleet.fn(**kwargs))
+        finally:
+            srv._targets, srv._FLEET_CONCURRENCY = old
+
+    def _aliases(self, *names: str) -> _FakeFirewall:
+        return _FakeFirewall({("GET", self._PATH): [{"id": i, "name": n} for i, n in enumerate(names)]})
+
+    def test_merges_rows_and_reports_failures(self):
+        def broken(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, json={"code": 500, "status": "server error", "message": "boom"})
+
+        result = self._query(
+            {"hq": self._aliases("a", "b"), "branch": broken, "edge": _SlowFirewall(delay=2.0)},
+            tool="pfsense_list_firewall_aliases",
+            arguments={"fields": "name"},
+            timeout=0.2,
+        )
+        assert result["data"] == [
+            {"firewall": "hq", "id": 0, "name": "a"},
+            {"firewall": "hq", "id": 1, "name": "b"},
+        ]
+        assert result["succeeded"] == ["hq"]
+        assert result["failed"] == [
+            {"firewall": "branch", "error": "pfSense returned 500: boom"},
+            {"firewall": "edge", "error": "No response within 0.2s"},
+        ]
+
+    def test_worker_pool_bounded(self):
+        fake = _SlowFirewall(delay=0.05)
+        result = self._query(
+            {name: fake for name in ("hq", "b1", "b2", "b3", "b4", "b5")},
+            concurrency=2,
+            tool="pfsense_list_firewall_aliases",
+        )
+        assert len(result["succeeded"]) == 6 and result["data"] == []
+        assert fake.peak == 2
+
+    def test_single_object_results_and_selection(self):
+        fakes = {
+            "hq": _FakeFirewall({("GET", "/api/v2/firewall/advanced_settings"): {"aliasesresolveinterval": 300}}),
+            "branch": _FakeFirewall({("GET", "/api/v2/firewall/advanced_settings"): {"aliasesresolveinterval": 60}}),
+        }
+        result = self._query(fakes, tool="pfsense_get_firewall_advanced_settings", firewalls=["branch"])
+        assert result["data"] == [{"firewall": "branch", "aliasesresolveinterval": 60}]
+        assert fakes["hq"].calls == []
+
+    def test_merged_budget(self):
+        fakes = {"hq": self._aliases(*"abcdefgh"), "branch": self._aliases(*"ijklmnop")}
+        result = self._query(fakes, tool="pfsense_list_firewall_aliases", max_tokens=40)
+        assert result["returned"] < 16
+        assert result["returned"] + result["omitted"] == 16
+
+    def test_rejects_writes_and_unknown_firewalls(self):
+        fakes = {"hq": self._aliases("a")}
+        assert "not a read tool" in self._query(fakes, tool="pfsense_create_firewall_alias")["error"]
+        assert "Unknown tool" in self._query(fakes, tool="pfsense_query_fleet")["error"]
+        result = self._query(fakes, tool="pfsense_get_overview", firewalls=["hq", "nope"])
+        assert result["error"].startswith("Unknown firewall(s): nope.")
+        assert fakes["hq"].calls == []
+
+
+# ---------------------------------------------------------------------------
+# Batch mutations
+# ---------------------------------------------------------------------------
+
+
+class _WritableFirewall(_FakeFirewall):
+    """Fake firewall that accepts writes, numbering created objects."""
+
+    def __init__(self, fail: set[str] | None = None) -> None:
+        super().__init__()
+        self.fail = fail or set()
+        self.log: list[tuple[str, str, str | None]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        import json
+
+        self.calls.append((request.method, request.url.path))
+        body = json.loads(request.content) if request.content else {}
+        self.log.append((request.method, request.url.path, request.url.params.get("id")))
+        if body.get("name") in self.fail:
+            return httpx.Response(400, json={"code": 400, "status": "bad request", "message": "bad name"})
+        data = {"id": len(self.calls) - 1, **body} if request.method == "POST" else {}
+        return httpx.Response(200, json={"code": 200, "status": "ok", "data": data})
+
+
+def _alias(name: str) -> dict:
+    return {"tool": "pfsense_create_firewall_alias", "arguments": {"name": name, "type_": "host"}}
+
+
+class TestBatch:
+    """pfsense_run_batch validates everything, runs it, then applies once."""
+
+    def _batch(self, fakes: dict, **kwargs):
+        srv = _server()
+        registry = srv._TargetRegistry({name: {"host": f"https://{name}"} for name in fakes}, "hq")
+        registry.clients = {name: _make_client(fake, **_NO_BACKOFF) for name, fake in fakes.items()}
+        old = srv._targets
+        srv._targets = registry
+        try:
+            return asyncio.run(srv.pfsense_run_batch.fn(**kwargs))
+        finally:
+            srv._targets = old
+
+    def test_single_apply_per_subsystem(self):
+        hq, branch = _WritableFirewall(), _WritableFirewall()
+        operations = [_alias(f"a{i}") for i in range(5)] + [
+            {"tool": "pfsense_update_firewall_alias", "arguments": {"id": 0, "descr": "x", "confirm": False}},
+            {
+                "tool": "pfsense_create_services_dhcp_server_static_mapping",
+                "arguments": {"parent_id": "lan", "mac": "00:11:22:33:44:55"},
+            },
+        ]
+        result = self._batch({"hq": hq, "branch": branch}, operations=operations, confirm=True, firewall="branch")
+        assert result["succeeded"] == 7 and result["failed"] == 0
+        assert all("id" in item for item in result["results"][:5])
+        assert result["applied"] == [
+            {"tool": "pfsense_firewall_apply", "ok": True},
+            {"tool": "pfsense_services_dhcp_server_apply", "ok": True},
+        ]
+        assert branch.count("POST", "/api/v2/firewall/alias") == 5
+        assert branch.count("POST", "/api/v2/firewall/apply") == 1
+        assert branch.log[-1][1] == "/api/v2/services/dhcp_server/apply"
+        assert hq.calls == []
+
+    def test_unconfirmed_only_summarizes(self):
+        fake = _WritableFirewall()
+        result = self._batch({"hq": fake}, operations=[_alias("a"), _alias("b")])
+        assert result == (
+            "This batch runs 2 x pfsense_create_firewall_alias, then pfsense_firewall_apply. "
+            "Set confirm=True to execute."
+        )
+        assert fake.calls == []
+
+    def test_invalid_batch_runs_nothing(self):
+        fake = _WritableFirewall()
+        operations = [
+            _alias("ok"),
+            {"tool": "pfsense_list_firewall_aliases"},
+            {"tool": "pfsense_firewall_apply"},
+            {"tool": "pfsense_post_diagnostics_reboot"},
+            {"tool": "pfsense_create_firewall_alias", "arguments": {"name": "x"}},
+            {"tool": "pfsense_create_firewall_alias", "arguments": {"name": "x", "type_": "host", "bogus": 1}},
+            {"tool": "pfsense_nope"},
+            "not an object",
+        ]
+        result = self._batch({"hq": fake}, operations=operations, confirm=True)
+        assert [p["index"] for p in result["problems"]] == [1, 2, 3, 4, 5, 6, 7]
+        assert "not a mutation" in result["problems"][0]["error"]
+        assert "runs automatically" in result["problems"][1]["error"]
+        assert "too dangerous" in result["problems"][2]["error"]
+        assert "type_" in result["problems"][3]["error"]
+        assert "bogus" in result["problems"][4]["error"]
+        assert fake.calls == []
+
+    def test_deletes_run_last_highest_id_first(self):
+        fake = _WritableFirewall()
+        operations = [
+            {"tool": "pfsense_delete_firewall_alias", "arguments": {"id": i}} for i in (1, 10, 3)
+        ] + [_alias("new")]
+        result = self._batch({"hq": fake}, operations=operations, confirm=True)
+        assert result["succeeded"] == 4
+        assert [entry[2] for entry in fake.log if entry[0] == "DELETE"] == ["10", "3", "1"]
+        assert fake.log[0][0] == "POST" and fake.log[-1][1] == "/api/v2/firewall/apply"
+
+    def test_sequential_keeps_order(self):
+        fake = _WritableFirewall()
+        operations = [{"tool": "pfsense_delete_firewall_alias", "arguments": {"id": 1}}, _alias("new")]
+        self._batch({"hq": fake}, operations=operations, confirm=True, sequential=True)
+        assert [entry[0] for entry in fake.log] == ["DELETE", "POST", "POST"]
+
+    def test_failures_reported_and_apply_deferred(self):
+        fake = _WritableFirewall(fail={"bad"})
+        result = self._batch(
+            {"hq": fake}, operations=[_alias("good"), _alias("bad")], confirm=True, apply=False
+        )
+        assert (result["succeeded"], result["failed"]) == (1, 1)
+        assert result["results"][1] == {
+            "index": 1, "tool": "pfsense_create_firewall_alias", "error": "pfSense returned 400: bad name",
+        }
+        assert result["pending_apply"] == ["pfsense_firewall_apply"]
+        assert fake.count("POST", "/api/v2/firewall/apply") == 0
+
+    def test_no_apply_when_subsystem_untouched(self):
+        fake = _WritableFirewall(fail={"bad"})
+        result = self._batch({"hq": fake}, operations=[_alias("bad")], confirm=True)
+        assert result["applied"] == []
+        assert fake.count("POST", "/api/v2/firewall/apply") == 0
+
+
+# ---------------------------------------------------------------------------
+# Pending and deferred applies
+# ---------------------------------------------------------------------------
+
+
+class TestApplyScheduler:
+    """Mutations mark their subsystem dirty; deferred mode coalesces applies."""
+
+    _ALIAS = "/api/v2/firewall/alias"
+    _APPLY = "/api/v2/firewall/apply"
+
+    def test_immediate_mode_tracks_dirty_subsystems(self):
+        fake = _WritableFirewall()
+        client = _make_client(fake, **_NO_BACKOFF)
+
+        async def run():
+            await client.request("POST", self._ALIAS, json_body={"name": "a"})
+            await client.request("PATCH", self._ALIAS, json_body={"id": 0})
+            await client.request("POST", "/api/v2/services/dhcp_server/static_mapping", json_body={})
+            await client.request("POST", "/api/v2/system/hostname", json_body={})
+            dirty = client.applies.stats()
+            await client.request("POST", self._APPLY)
+            return dirty, client.applies.stats()
+
+        dirty, after = asyncio.run(run())
+        assert dirty["mode"] == "immediate"
+        assert [(p["apply_tool"], p["changes"]) for p in dirty["pending"]] == [
+            ("pfsense_firewall_apply", 2),
+            ("pfsense_services_dhcp_server_apply", 1),
+        ]
+        assert [p["subsystem"] for p in after["pending"]] == ["/api/v2/services/dhcp_server"]
+        assert fake.count("POST", self._APPLY) == 1
+
+    def _interrupt_writes(self, client, error: Exception) -> None:
+        """Make every write reach the fake firewall, then fail with `error`."""
+        send = client._send
+
+        async def interrupted(http, method, path, *args):
+            resp = await send(http, method, path, *args)
+            if method != "GET":
+                raise error
+            return resp
+
+        client._send = interrupted
+
+    def test_interrupted_write_invalidates_and_marks_dirty(self):
+        aliases = [{"id": 0, "name": "a"}]
+        fake = _FakeFirewall({("GET", "/api/v2/firewall/aliases"): aliases})
+        client = _make_client(fake, PFSENSE_RETRY_BACKOFF="0")
+        self._interrupt_writes(client, httpx.ReadTimeout("timed out"))
+
+        async def run():
+            await client.request("GET", "/api/v2/firewall/aliases")
+            aliases.append({"id": 1, "name": "b"})
+            result = await client.request("POST", self._ALIAS, json_body={"name": "b"})
+            return result, await client.request("GET", "/api/v2/firewall/aliases")
+
+        result, after = asyncio.run(run())
+        assert "timed out" in result["error"]
+        assert fake.count("POST", self._ALIAS) == 1
+        assert [a["name"] for a in after] == ["a", "b"]
+        assert [p["apply_tool"] for p in client.applies.stats()["pending"]] == [
+            "pfsense_firewall_apply"
+        ]
+
+    def test_unsent_write_not_marked_dirty(self):
+        fake = _FakeFirewall()
+        client = _make_client(fake, PFSENSE_RETRIES="0", **_NO_BACKOFF)
+
+        async def refused(*args):
+            raise httpx.ConnectError("refused")
+
+        client._send = refused
+        result = asyncio.run(client.request("POST", self._ALIAS, json_body={"name": "b"}))
+        assert "Connection failed" in result["error"]
+        assert client.applies.stats()["pending"] == []
+
+    def test_deferred_applies_once_after_quiet_period(self):
+        fake = _WritableFirewall()
+        client = _make_client(fake, PFSENSE_APPLY_MODE="deferred", PFSENSE_APPLY_DELAY="0.1", **_NO_BACKOFF)
+
+        async def run():
+            replies = []
+            for i in range(3):
+                await client.request("POST", self._ALIAS, json_body={"name": f"a{i}"})
+                replies.append(await client.request("POST", self._APPLY))
+                await asyncio.sleep(0.03)
+            before = fake.count("POST", self._APPLY)
+            stats = client.applies.stats()
+            await asyncio.sleep(0.2)
+            return replies, before, stats
+
+        replies, before, stats = asyncio.run(run())
+        assert all(reply["deferred"] for reply in replies)
+        assert before == 0
+        assert stats["pending"][0]["changes"] == 3 and "apply_in_s" in stats["pending"][0]
+        assert fake.count("POST", self._APPLY) == 1
+        assert client.applies.pending == {}
+        assert (client.applies.sent, client.applies.deferred_requests) == (1, 3)
+
+    def test_flush_tool(self):
+        srv = _server()
+        fake = _WritableFirewall()
+        client = _make_client(fake, PFSENSE_APPLY_MODE="deferred", PFSENSE_APPLY_DELAY="60", **_NO_BACKOFF)
+        registry = srv._TargetRegistry({"hq": {"host": "https://hq"}}, "hq")
+        registry.clients = {"hq": client}
+        old = srv._targets
+        srv._targets = registry
+
+        async def run():
+            await client.request("POST", self._ALIAS, json_body={"name": "a"})
+            await client.request("POST", "/api/v2/routing/gateway", json_body={})
+            preview = await srv.pfsense_apply_pending_changes.fn()
+            applied = await srv.pfsense_apply_pending_changes.fn(confirm=True)
+            return preview, applied, await srv.pfsense_get_pending_changes.fn()
+
+        try:
+            preview, applied, pending = asyncio.run(run())
+        finally:
+            srv._targets = old
+        assert "pfsense_firewall_apply, pfsense_routing_apply" in preview
+        assert applied == {"applied": [
+            {"subsystem": "/api/v2/firewall", "apply_tool": "pfsense_firewall_apply", "ok": True},
+            {"subsystem": "/api/v2/routing", "apply_tool": "pfsense_routing_apply", "ok": True},
+        ]}
+        assert pending["pending"] == [] and pending["applies_sent"] == 2
+        assert fake.count("POST", self._APPLY) == fake.count("POST", "/api/v2/routing/apply") == 1
+
+    def test_failed_apply_stays_pending(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/apply"):
+                return httpx.Response(500, json={"code": 500, "status": "error", "message": "reload failed"})
+            return httpx.Response(200, json={"code": 200, "status": "ok", "data": {"id": 0}})
+
+        client = _make_client(handler, PFSENSE_APPLY_MODE="deferred", PFSENSE_APPLY_DELAY="60", **_NO_BACKOFF)
+
+        async def run():
+            await client.request("POST", self._ALIAS, json_body={"name": "a"})
+            return await client.applies.flush_all(), client.applies.stats()
+
+        applied, stats = asyncio.run(run())
+        assert applied[0]["error"] == "pfSense returned 500: reload failed"
+        assert stats["pending"][0]["last_error"] == "pfSense returned 500: reload failed"
+        assert stats["pending"][0]["changes"] == 1
+
+    def test_delete_with_apply_clears(self):
+        client = _make_client(_WritableFirewall(), **_NO_BACKOFF)
+
+        async def run():
+            await client.request("POST", self._ALIAS, json_body={"name": "a"})
+            await client.request("DELETE", self._ALIAS, params={"id": 0, "apply": True})
+            return client.applies.stats()["pending"]
+
+        assert asyncio.run(run()) == []
+
+
+# ---------------------------------------------------------------------------
+# Collection sync
+# ---------------------------------------------------------------------------
+
+
+class _AliasCollection:
+    """Stateful fake of the alias collection and its singular endpoint."""
+
+    def __init__(self, names: list[str]) -> None:
+        self.rows = [{"name": n, "type": "host", "address": [f"10.0.0.{i}"]} for i, n in enumerate(names)]
+        self.requests: list[tuple[str, str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        import json
+
+        method, path = request.method, request.url.path
+        self.requests.append((method, path))
+        body = json.loads(request.content) if request.content else None
+        data: object = {}
+        if path == "/api/v2/firewall/aliases" and method == "GET":
+            data = [{"id": i, **row} for i, row in enumerate(self.rows)]
+        elif path == "/api/v2/firewall/aliases" and method == "PUT":
+            self.rows = [dict(row) for row in body]
+        elif path == "/api/v2/firewall/alias" and method == "POST":
+            self.rows.append(body)
+        elif path == "/api/v2/firewall/alias" and method == "PATCH":
+            self.rows[body.pop("id")].update(body)
+        elif path == "/api/v2/firewall/alias" and method == "DELETE":
+            del self.rows[int(request.url.params["id"])]
+        return httpx.Response(200, json={"code": 200, "status": "ok", "data": data})
+
+    def writes(self) -> list[tuple[str, str]]:
+        return [r for r in self.requests if r[0] != "GET" and not r[1].endswith("/apply")]
+
+
+class TestSyncCollection:
+    """pfsense_sync_collection writes only the diff, per item or as one PUT."""
+
+    def _sync(self, fake, client=None, collection="pfsense_list_firewall_aliases", **kwargs):
+        srv = _server()
+        registry = srv._TargetRegistry({"hq": {"host": "https://hq"}}, "hq")
+        registry.clients = {"hq": client or _make_client(fake, **_NO_BACKOFF)}
+        old = srv._targets
+        srv._targets = registry
+        try:
+            return asyncio.run(srv.pfsense_sync_collection.fn(collection=collection, **kwargs))
+        finally:
+            srv._targets = old
+
+    def _desired(self, fake: _AliasCollection) -> list[dict]:
+        return [{k: v for k, v in row.items()} for row in fake.rows]
+
+    def test_small_diff_uses_item_calls(self):
+        fake = _AliasCollection([f"a{i}" for i in range(100)])
+        desired = self._desired(fake)
+        desired[5]["address"] = ["192.0.2.1"]
+        desired = [row for row in desired if row["name"] not in ("a7", "a9")]
+        desired.append({"name": "new", "type": "host", "address": ["192.0.2.2"]})
+
+        result = self._sync(fake, desired=desired, confirm=True)
+        assert (result["strategy"], result["create"], result["update"], result["delete"]) == ("items", 1, 1, 2)
+        assert result["unchanged"] == 97 and result["failed_operations"] == []
+        assert result["applied"] == [{"tool": "pfsense_firewall_apply", "ok": True}]
+        assert len(fake.writes()) == 4
+        assert [row["name"] for row in fake.rows] == [row["name"] for row in desired]
+        assert fake.rows[5]["address"] == ["192.0.2.1"]
+
+    def test_large_diff_uses_one_put(self):
+        fake = _AliasCollection([f"old{i}" for i in range(300)])
+        desired = [{"name": f"new{i}", "type": "network", "address": ["10.1.0.0/24"]} for i in range(300)]
+        result = self._sync(fake, desired=desired, confirm=True)
+        assert (result["strategy"], result["requests"]) == ("bulk", 1)
+        assert fake.writes() == [("PUT", "/api/v2/firewall/aliases")]
+        assert fake.rows == desired
+
+    def test_bulk_keeps_unlisted_fields_and_order(self):
+        fake = _AliasCollection(["a", "b", "c"])
+        result = self._sync(
+            fake, desired=[{"name": "b", "type": "network"}], prune=False, strategy="bulk", confirm=True
+        )
+        assert (result["update"], result["delete"]) == (1, 0)
+        assert [row["name"] for row in fake.rows] == ["a", "b", "c"]
+        assert fake.rows[1] == {"name": "b", "type": "network", "address": ["10.0.0.1"]}
+
+    def test_sensitive_collection_never_auto_bulk(self):
+        fake = _ConfigFake({"vpn/wireguard/tunnels": [{"name": "tun_wg0", "listenport": "51820"}]})
+        desired = [{"name": "tun_wg1", "listenport": "51821", "privatekey": "k"}]
+        kwargs = {"collection": "pfsense_list_vpn_wireguard_tunnels", "desired": desired}
+        result = self._sync(fake, **kwargs)
+        assert (result["strategy"], result["create"], result["delete"]) == ("items", 1, 1)
+        assert "warning" not in result
+        result = self._sync(fake, strategy="bulk", **kwargs)
+        assert result["strategy"] == "bulk"
+        assert "privatekey" in result["warning"]
+        assert fake.writes == []
+
+    def test_plan_reads_bypass_cache(self):
+        fake = _AliasCollection(["a", "b", "c"])
+        client = _make_client(fake, **_NO_BACKOFF)
+        asyncio.run(client.request("GET", "/api/v2/firewall/aliases", {"limit": 0}))
+        # Changed behind the server's back: the cached ids are now wrong.
+        del fake.rows[0]
+        result = self._sync(fake, client=client, desired=[{"name": "c"}], confirm=True)
+        assert fake.requests.count(("GET", "/api/v2/firewall/aliases")) == 2
+        assert result["delete"] == 1 and result["failed_operations"] == []
+        assert [row["name"] for row in fake.rows] == ["c"]
+
+    def test_plan_without_confirm(self):
+        fake = _AliasCollection(["a", "b"])
+        result = self._sync(fake, desired=[{"name": "a"}, {"name": "c", "type": "host"}], strategy="items")
+        assert result["preview"] == {"create": ["c"], "update": [], "delete": ["b"]}
+        assert result["requests"] == 2 and fake.writes() == []
+
+    def test_in_sync_and_errors(self):
+        fake = _AliasCollection(["a"])
+        assert self._sync(fake, desired=[{"name": "a"}], confirm=True)["message"] == "Already in sync."
+        assert "missing the key" in self._sync(fake, desired=[{"descr": "x"}])["error"]
+        assert "repeats key" in self._sync(fake, desired=[{"name": "x"}, {"name": "x"}])["error"]
+        assert "check key" in self._sync(fake, desired=[{"descr": "x"}], key="descr")["error"]
+        assert fake.writes() == []
+        srv = _server()
+        result = asyncio.run(srv.pfsense_sync_collection.fn(collection="pfsense_list_firewall_states", desired=[]))
+        assert "cannot be synced" in result["error"]
+        result = asyncio.run(srv.pfsense_sync_collection.fn(
+            collection="pfsense_list_services_dhcp_server_static_mappings", desired=[], strategy="bulk"
+        ))
+        assert "no bulk replace tool" in result["error"]
+
+
+class _ConfigFake:
+    """Stateful fake of several collections, recording writes in order.
+
+    `collections` maps a plural path under /api/v2/ to its rows; the singular
+    path is the plural minus its trailing 's' or 'es'. Rows of child
+    collections carry parent_id. Creates of objects named in `reject` fail.
+    """
+
+    def __init__(self, collections: dict[str, list[dict]], reject: tuple[str, ...] = ()) -> None:
+        self.collections = collections
+        self.reject = reject
+        self.writes: list[tuple[str, str]] = []
+        self.applies: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        import json
+
+        method, path = request.method, request.url.path.removeprefix("/api/v2/")
+        body = json.loads(request.content) if request.content else None
+        data: object = {}
+        if path.endswith("/apply"):
+            self.applies.append(path)
+        elif method == "GET":
+            data = [{"id": i, **row} for i, row in enumerate(self.collections[path])]
+        else:
+            self.writes.append((method, path))
+            if method == "PUT":
+                self.collections[path] = [dict(row) for row in body]
+            else:
+                rows = self.collections[path + "s" if path + "s" in self.collections else path + "es"]
+                if method == "POST":
+                    if body.get("name") in self.reject:
+                        return httpx.Response(400, json={"code": 400, "status": "bad request", "message": "bad name"})
+                    rows.append(body)
+                    data = {"id": len(rows) - 1, **body}
+                elif method == "PATCH":
+                    rows[body.pop("id")].update(body)
+                else:
+                    del rows[int(request.url.params["id"])]
+        return httpx.Response(200, json={"code": 200, "status": "ok", "data": data})
+
+
+class TestReconcile:
+    """pfsense_reconcile orders writes by dependency and applies once per subsystem."""
+
+    _RULE = {"interface": ["lan"], "ipprotocol": "inet", "source": "any", "type": "pass"}
+
+    def _fake(self) -> _ConfigFake:
+        return _ConfigFake({
+            "firewall/aliases": [{"name": "old_hosts", "type": "host"}, {"name": "keep", "type": "host"}],
+            "firewall/rules": [{"descr": "old", "destination": "old_hosts", **self._RULE}],
+            "services/dhcp_server/static_mappings": [{"parent_id": "lan", "mac": "00:00:00:00:00:01"}],
+        })
+
+    def _state(self) -> dict:
+        return {
+            "pfsense_list_firewall_aliases": [{"name": "web", "type": "host"}, {"name": "keep", "type": "host"}],
+            "pfsense_list_firewall_rules": {
+                "key": "descr", "items": [{"descr": "web", "destination": "web", **self._RULE}],
+            },
+            "pfsense_list_services_dhcp_server_static_mappings": {
+                "key": "parent_id,mac", "items": [{"parent_id": "lan", "mac": "00:00:00:00:00:02"}],
+            },
+        }
+
+    def _reconcile(self, fake, **kwargs):
+        srv = _server()
+        registry = srv._TargetRegistry({"hq": {"host": "https://hq"}}, "hq")
+        registry.clients = {"hq": _make_client(fake, **_NO_BACKOFF)}
+        old = srv._targets
+        srv._targets = registry
+        try:
+            return asyncio.run(srv.pfsense_reconcile.fn(**kwargs))
+        finally:
+            srv._targets = old
+
+    def test_plan_without_confirm(self):
+        fake = self._fake()
+        result = self._reconcile(fake, state=self._state())
+        # Rules and static mappings don't refer to each other: one stage.
+        independent = ["pfsense_list_firewall_rules", "pfsense_list_services_dhcp_server_static_mappings"]
+        assert [(st["phase"], st["collections"]) for st in result["stages"]] == [
+            ("write", ["pfsense_list_firewall_aliases"]),
+            ("write", independent),
+            ("delete", independent),
+            ("delete", ["pfsense_list_firewall_aliases"]),
+        ]
+        assert result["requests"] == 6
+        assert result["collections"][0]["preview"] == {"create": ["web"], "update": [], "delete": ["old_hosts"]}
+        assert fake.writes == []
+
+    def test_dependency_order_and_single_apply(self):
+        fake = self._fake()
+        result = self._reconcile(fake, state=self._state(), confirm=True)
+        assert fake.writes[0] == ("POST", "firewall/alias")
+        assert sorted(fake.writes[1:3]) == [("POST", "firewall/rule"), ("POST", "services/dhcp_server/static_mapping")]
+        assert sorted(fake.writes[3:5]) == [
+            ("DELETE", "firewall/rule"), ("DELETE", "services/dhcp_server/static_mapping"),
+        ]
+        assert fake.writes[5:] == [("DELETE", "firewall/alias")]
+        assert sorted(fake.applies) == ["firewall/apply", "services/dhcp_server/apply"]
+        assert [row["name"] for row in fake.collections["firewall/aliases"]] == ["keep", "web"]
+        mappings = fake.collections["services/dhcp_server/static_mappings"]
+        assert [(m["parent_id"], m["mac"]) for m in mappings] == [("lan", "00:00:00:00:00:02")]
+
+    def test_backend_written_before_frontend_that_uses_it(self):
+        fake = _ConfigFake({"services/haproxy/backends": [], "services/haproxy/frontends": []})
+        state = {
+            "pfsense_list_services_haproxy_frontends": [
+                {"name": "web", "type": "http", "backend_serverpool": "pool"},
+            ],
+            "pfsense_list_services_haproxy_backends": [{"name": "pool"}],
+        }
+        result = self._reconcile(fake, state=state, confirm=True)
+        assert [st["collections"] for st in result["stages"]] == [
+            ["pfsense_list_services_haproxy_backends"],
+            ["pfsense_list_services_haproxy_frontends"],
+        ]
+        assert fake.writes == [("POST", "services/haproxy/backend"), ("POST", "services/haproxy/frontend")]
+        assert fake.applies == ["services/haproxy/apply"]
+
+    def test_ranks_follow_references(self):
+        srv = _server()
+        rank = srv._reconcile_rank
+        assert rank("pfsense_list_services_haproxy_backends") < rank("pfsense_list_services_haproxy_frontends")
+        assert rank("pfsense_list_vpn_ipsec_phase1s") < rank("pfsense_list_vpn_ipsec_phase2s")
+        assert rank("pfsense_list_vpn_wireguard_tunnels") < rank("pfsense_list_vpn_wireguard_peers")
+        assert rank("pfsense_list_user_auth_servers") < rank("pfsense_list_vpn_openvpn_servers")
+        assert rank("pfsense_list_users") < rank("pfsense_list_user_groups")
+        assert rank("pfsense_list_network_interfaces") < rank("pfsense_list_services_dhcp_servers")
+        assert rank("pfsense_list_firewall_aliases") < rank("pfsense_list_firewall_rules")
+        assert rank("pfsense_list_services_dhcp_servers") < rank(
+            "pfsense_list_services_dhcp_server_static_mappings"
+        )
+
+    def test_failed_stage_skips_the_rest(self):
+        fake = self._fake()
+        state = self._state()
+        del state["pfsense_list_firewall_rules"]["items"][0]["source"]
+        result = self._reconcile(fake, state=state, confirm=True)
+        assert result["stages"][1].get("error") or result["stages"][1]["failed"]
+        assert all(st.get("skipped") for st in result["stages"][2:])
+        assert fake.writes == [("POST", "firewall/alias")]
+        assert fake.applies == ["firewall/apply"]
+
+    def test_in_sync_and_errors(self):
+        fake = self._fake()
+        state = {"pfsense_list_firewall_aliases": [{"name": "old_hosts"}, {"name": "keep"}]}
+        assert self._reconcile(fake, state=state, confirm=True)["message"] == "Already in sync."
+        assert "state is empty" in self._reconcile(fake, state={})["error"]
+        assert "expected a list" in self._reconcile(fake, state={"pfsense_list_firewall_aliases": 1})["error"]
+        assert "cannot be synced" in self._reconcile(fake, state={"pfsense_list_firewall_states": []})["error"]
+        assert fake.writes == []
+
+
+class TestCreateWithChildren:
+    """pfsense_create_with_children creates a parent, fans out children, and rolls back."""
+
+    _ACLS = "pfsense_list_services_haproxy_frontend_acls"
+
+    def _create(self, fake, **kwargs):
+        srv = _server()
+        registry = srv._TargetRegistry({"hq": {"host": "https://hq"}}, "hq")
+        registry.clients = {"hq": _make_client(fake, **_NO_BACKOFF)}
+        old = srv._targets
+        srv._targets = registry
+        try:
+            return asyncio.run(srv.pfsense_create_with_children.fn(
+                collection="pfsense_list_services_haproxy_frontends",
+                parent={"name": "web", "type": "http"},
+                **kwargs,
+            ))
+        finally:
+            srv._targets = old
+
+    def _fake(self, reject: tuple[str, ...] = ()) -> _ConfigFake:
+        return _ConfigFake({
+            "services/haproxy/frontends": [{"name": "existing", "type": "http"}],
+            "services/haproxy/frontend/acls": [],
+        }, reject=reject)
+
+    def _acls(self, count: int) -> dict:
+        return {self._ACLS: [
+            {"name": f"acl{i}", "expression": "host_matches", "value": f"h{i}.example"} for i in range(count)
+        ]}
+
+    def test_parent_then_children_then_one_apply(self):
+        fake = self._fake()
+        result = self._create(fake, children=self._acls(30), confirm=True)
+        assert result["id"] == 1 and len(result["children"][self._ACLS]) == 30
+        assert fake.writes[0] == ("POST", "services/haproxy/frontend")
+        assert fake.writes[1:] == [("POST", "services/haproxy/frontend/acl")] * 30
+        assert {acl["parent_id"] for acl in fake.collections["services/haproxy/frontend/acls"]} == {1}
+        assert fake.applies == ["services/haproxy/apply"]
+        assert result["applied"] == [{"tool": "pfsense_services_haproxy_apply", "ok": True}]
+
+    def test_failed_child_rolls_back(self):
+        fake = self._fake(reject=("acl2",))
+        result = self._create(fake, children=self._acls(4), confirm=True)
+        assert "deleted again" in result["error"]
+        assert result["failed_operations"][0]["collection"] == self._ACLS
+        assert [w[0] for w in fake.writes].count("DELETE") == 4
+        assert fake.writes[-1] == ("DELETE", "services/haproxy/frontend")
+        assert fake.collections["services/haproxy/frontends"] == [{"name": "existing", "type": "http"}]
+        assert fake.collections["services/haproxy/frontend/acls"] == []
+        assert fake.applies == []
+
+    def test_plan_and_validation(self):
+        fake = self._fake()
+        result = self._create(fake, children=self._acls(3))
+        assert (result["requests"], result["children"]) == (4, {self._ACLS: 3})
+        assert result["applies"] == ["pfsense_services_haproxy_apply"]
+        bad = {self._ACLS: [{"name": "no_expression"}]}
+        assert self._create(fake, children=bad, confirm=True)["problems"][0]["collection"] == self._ACLS
+        wrong = {"pfsense_list_firewall_aliases": [{"name": "a", "type": "host"}]}
+        assert "not nested under" in self._create(fake, children=wrong)["error"]
+        assert fake.writes == []
+
+    def test_missing_write_tools_return_error(self, monkeypatch):
+        fake = self._fake()
+        srv = _server()
+        monkeypatch.delattr(srv, "pfsense_delete_services_haproxy_frontend_acl")
+        result = self._create(fake, children=self._acls(2), confirm=True)
+        assert result == {
+            "error": (
+                f"{self._ACLS} cannot be written: "
+                "pfsense_delete_services_haproxy_frontend_acl is not registered."
+            )
+        }
+        monkeypatch.setattr(srv, "_PFSENSE_READ_ONLY", True)
+        result = self._create(fake, children=self._acls(2), confirm=True)
+        assert result == {"error": "PFSENSE_READ_ONLY is set; mutations are disabled."}
+        assert fake.writes == []
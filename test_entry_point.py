@@ -0,0 +1,175 @@
+"""
+Tests for the pfsense-mcp console entry point (pfsense_mcp/__main__.py).
+
+The entry point imports the packaged server and runs it in the same
+process; these tests drive it over stdio and streamable HTTP with a real
+MCP client and check argument handling in a subprocess.
+
+Usage:
+    nix develop -c python -m pytest test_entry_point.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+_REPO_ROOT = Path(__file__).resolve().parent
+
+_ENV = {
+    "PFSENSE_HOST": "https://127.0.0.1:9",
+    "PFSENSE_API_KEY": "test",
+    "PFSENSE_MODULES": "status",
+    "PFSENSE_PREWARM_CONNECTIONS": "0",
+}
+
+
+def _env(**overrides: str) -> dict[str, str]:
+    return {**os.environ, **_ENV, **overrides}
+
+
+async def _tool_names(client: Client) -> set[str]:
+    async with client:
+        return {tool.name for tool in await client.list_tools()}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Calls main() with mcp.run replaced by a recorder, so the test can see what
+# would be served without starting a transport.
+_MAIN_HELPER = """\
+import json, sys
+import pfsense_mcp.server as srv
+from pfsense_mcp.__main__ import main
+calls = []
+srv.mcp.run = lambda **kwargs: calls.append(kwargs)
+main(sys.argv[1:])
+print(json.dumps({
+    "run": calls,
+    "loaded": sorted(srv._LOADED_TOOL_MODULES),
+    "search_index_loaded": srv._search_index_data is not None,
+}))
+"""
+
+
+def _run_main(*args: str, **env: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _MAIN_HELPER, *args],
+        capture_output=True,
+        text=True,
+        cwd=str(_REPO_ROOT),
+        env=_env(**env),
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+class TestArguments:
+    """Transport and preload options map onto mcp.run and the server loader."""
+
+    def test_default_is_stdio(self):
+        info = _run_main()
+        assert info["run"] == [{"transport": "stdio"}]
+
+    def test_http_transport(self):
+        info = _run_main("--transport", "http", "--host", "0.0.0.0", "--port", "9123")
+        assert info["run"] == [{"transport": "http", "host": "0.0.0.0", "port": 9123}]
+
+    def test_transport_from_env(self):
+        info = _run_main(PFSENSE_TRANSPORT="http", PFSENSE_HTTP_PORT="9124")
+        assert info["run"] == [{"transport": "http", "host": "127.0.0.1", "port": 9124}]
+
+    def test_invalid_transport_from_env(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "pfsense_mcp"],
+            capture_output=True,
+            text=True,
+            cwd=str(_REPO_ROOT),
+            env=_env(PFSENSE_TRANSPORT="sse"),
+            timeout=30,
+        )
+        assert result.returncode == 2
+        assert "invalid transport" in result.stderr
+
+    def test_invalid_port_from_env(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "pfsense_mcp"],
+            capture_output=True,
+            text=True,
+            cwd=str(_REPO_ROOT),
+            env=_env(PFSENSE_HTTP_PORT="http"),
+            timeout=30,
+        )
+        assert result.returncode == 2
+        assert "argument --port: invalid int value: 'http'" in result.stderr
+        assert "Traceback" not in result.stderr
+
+    def test_lazy_without_preload(self):
+        info = _run_main(PFSENSE_LAZY_TOOLS="true")
+        assert info["loaded"] == []
+        assert info["search_index_loaded"] is False
+
+    def test_preload(self):
+        info = _run_main("--preload", PFSENSE_LAZY_TOOLS="true")
+        assert info["loaded"] == ["status"]
+        assert info["search_index_loaded"] is True
+
+    def test_preload_from_env(self):
+        info = _run_main(PFSENSE_LAZY_TOOLS="true", PFSENSE_PRELOAD="true")
+        assert info["loaded"] == ["status"]
+
+
+class TestTransports:
+    """A real MCP client can list tools over each transport."""
+
+    def test_stdio(self):
+        transport = StdioTransport(
+            command=sys.executable,
+            args=["-m", "pfsense_mcp", "--preload"],
+            env=_env(),
+            cwd=str(_REPO_ROOT),
+        )
+        names = asyncio.run(_tool_names(Client(transport)))
+        assert "pfsense_search_tools" in names
+        assert "pfsense_get_status_system" in names
+        assert "pfsense_create_firewall_alias" not in names
+
+    def test_streamable_http(self):
+        port = _free_port()
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "pfsense_mcp", "--transport", "http", "--port", str(port)],
+            cwd=str(_REPO_ROOT),
+            env=_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    if proc.poll() is not None or time.monotonic() > deadline:
+                        pytest.fail("HTTP server did not start")
+                    time.sleep(0.1)
+            names = asyncio.run(_tool_names(Client(f"http://127.0.0.1:{port}/mcp")))
+            assert "pfsense_get_status_system" in names
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
@@ -139,6 +139,75 @@ class TestFilterResponse:
         error = {"code": 401, "message": "Unauthorized"}
         assert fn(error, "name", {"type": "host"}) == error
 
+    _RULES = [
+        {"id": 0, "descr": "Allow LAN", "source": "10.1.0.0/16", "destination_port": "443"},
+        {"id": 1, "descr": "Block IoT", "source": "192.168.5.7", "destination_port": "80"},
+        {"id": 2, "descr": "allow dmz", "source": "10.0.0.0/7", "destination_port": None},
+        {"id": 3, "descr": "v6", "source": "2001:db8::/64", "destination_port": "8443"},
+        {"id": 4, "descr": "Alias", "source": "lan", "destination_port": "22"},
+    ]
+
+    def _ids(self, query):
+        return [row["id"] for row in self._get_filter_fn()(self._RULES, None, query)]
+
+    def test_string_operators(self):
+        assert self._ids({"descr__contains": "IoT"}) == [1]
+        assert self._ids({"descr__startswith": "Allow"}) == [0]
+        assert self._ids({"descr__endswith": "dmz"}) == [2]
+        assert self._ids({"descr__regex": "(?i)^allow"}) == [0, 2]
+
+    def test_in_operator(self):
+        assert self._ids({"destination_port__in": ["80", "22"]}) == [1, 4]
+        assert self._ids({"destination_port__in": "443, 8443"}) == [0, 3]
+
+    def test_numeric_operators(self):
+        """Comparisons are numeric; missing and non-numeric values never match."""
+        assert self._ids({"destination_port__gt": 80}) == [0, 3]
+        assert self._ids({"destination_port__lte": "80"}) == [1, 4]
+        assert self._ids({"destination_port__gte": 80, "destination_port__lt": 1000}) == [0, 1]
+
+    def test_cidr_operator(self):
+        """Addresses and networks inside the given network match; aliases don't."""
+        assert self._ids({"source__cidr": "10.0.0.0/8"}) == [0]
+        assert self._ids({"source__cidr": "192.168.0.0/16"}) == [1]
+        assert self._ids({"source__cidr": "2001:db8::/32"}) == [3]
+
+    def test_operators_match_any_list_element(self):
+        fn = self._get_filter_fn()
+        data = [
+            {"id": 1, "address": ["10.0.0.1", "172.16.0.1"]},
+            {"id": 2, "address": ["192.168.1.1"]},
+        ]
+        assert fn(data, None, {"address__cidr": "172.16.0.0/12"}) == [data[0]]
+        assert fn(data, None, {"address__startswith": "192."}) == [data[1]]
+        assert fn(data, None, {"address": "['192.168.1.1']"}) == [data[1]]
+
+    def test_invalid_operator_argument(self):
+        fn = self._get_filter_fn()
+        for query in ({"descr__regex": "("}, {"source__cidr": "lan"}, {"id__gt": "x"}):
+            result = fn(self._RULES, None, query)
+            assert "Invalid query" in result["error"]
+
+    def test_unknown_suffix_is_a_field_name(self):
+        fn = self._get_filter_fn()
+        data = [{"id": 1, "a__b": "x"}]
+        assert fn(data, None, {"a__b": "x"}) == data
+
+    def test_server_query_forwards_only_exact_scalar_matches(self):
+        mod = sys.modules[self._get_filter_fn().__module__]
+        scalars = frozenset({"name", "descr", "id", "disabled"})
+        query = {
+            "name": "a",
+            "id__exact": 3,
+            "descr__contains": "b",
+            "port__in": [1],
+            "source__cidr": "10.0.0.0/8",
+            "address": "10.0.0.1",
+            "disabled": True,
+        }
+        assert mod._server_query(query, scalars) == {"name": "a", "id": 3}
+        assert mod._server_query(None, scalars) == {}
+
 
 # ---------------------------------------------------------------------------
 # Test extract_response_fields
@@ -166,6 +235,11 @@ class TestExtractResponseFields:
         with_fields = [c for c in _list_contexts if c.response_fields]
         assert len(with_fields) == 108
 
+    def test_server_filter_fields_are_scalar(self):
+        ctx = next(c for c in _list_contexts if c.tool_name == "pfsense_list_firewall_aliases")
+        assert ctx.server_filter_fields == ["descr", "id", "name", "type"]
+        assert "address" in ctx.response_fields
+
     def test_109_list_tools_detected(self):
         """Should detect exactly 109 list tools."""
         assert len(_list_contexts) == 109
@@ -194,8 +268,9 @@ for name, tool in list_tools.items():
     results[name] = {
         "has_fields": "fields" in params,
         "has_query": "query" in params,
-        "has_filter_call": "_filter_response" in source,
-        "has_server_query_passthrough": "params.update(query)" in source,
+        # Paged tools filter each page inside _list_paged.
+        "has_filter_call": "_filter_response" in source or "_list_paged(" in source,
+        "has_server_query_passthrough": "params.update(_server_query(query," in source,
         "has_known_fields": "Known fields:" in (fn.__doc__ or ""),
     }
 print(json.dumps(results))
@@ -238,11 +313,10 @@ class TestGeneratedListTools:
         missing = [n for n, info in tool_info.items() if not info["has_filter_call"]]
         assert not missing, f"List tools missing _filter_response call: {missing}"
 
-    def test_all_list_tools_pass_query_server_side(self, tool_info):
-        missing = [
-            n for n, info in tool_info.items() if not info["has_server_query_passthrough"]
-        ]
-        assert not missing, f"List tools missing server-side query passthrough: {missing}"
+    def test_list_tools_with_scalar_fields_pass_query_server_side(self, tool_info):
+        scalar = {c.tool_name for c in _list_contexts if c.server_filter_fields}
+        passing = {n for n, info in tool_info.items() if info["has_server_query_passthrough"]}
+        assert passing == scalar
 
     def test_most_list_tools_have_known_fields(self, tool_info):
         """108 of 109 list tools should have Known fields in docstring."""
@@ -0,0 +1,146 @@
+"""
+Tests for the end-to-end MCP load driver (benchmarks/mcp_load.py).
+
+Covers the statistics and replay helpers directly, then runs short real
+benchmarks (mock pfSense + pfsense-mcp subprocesses) over both transports.
+
+Usage:
+    nix develop -c python -m pytest test_mcp_load.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+from benchmarks.mcp_load import (
+    Recorder,
+    load_replay_sessions,
+    percentile,
+    run,
+    synthesize_arguments,
+)
+from test_client import _server
+
+_REPORT = """\
+---TASK-REPORT-START---
+task_id: 42
+status: pass
+tools_invoked:
+  - mcp__pfsense__pfsense_get_overview
+  - mcp__pfsense__pfsense_get_firewall_alias
+  - mcp__pfsense__pfsense_no_such_tool
+---TASK-REPORT-END---
+"""
+
+
+@pytest.fixture(scope="module")
+def schemas() -> dict:
+    async def list_tools():
+        async with Client(_server().mcp) as client:
+            return {t.name: t.inputSchema for t in await client.list_tools()}
+
+    return asyncio.run(list_tools())
+
+
+def _run(**kwargs) -> dict:
+    options = {
+        "concurrency": 2,
+        "duration": 1.0,
+        "warmup": 0.5,
+        "mock_args": ["--records", "10"],
+        "server_env": {"PFSENSE_MODULES": "firewall,interface,status,system"},
+    }
+    options.update(kwargs)
+    return asyncio.run(run(**options))
+
+
+class TestStatistics:
+    """Percentiles and the recorder's warm-up handling."""
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) == 0.0
+
+    def test_warmup_not_recorded(self):
+        recorder = Recorder()
+        recorder.record("a", 1.0, ok=False)
+        recorder.recording = True
+        recorder.record("a", 0.010, ok=True)
+        recorder.record("a", 0.020, ok=False)
+        recorder.record("b", 0.030, ok=True)
+        report = recorder.report(elapsed=2.0)
+        assert report["summary"]["calls"] == 3
+        assert report["summary"]["errors"] == 1
+        assert report["summary"]["throughput_per_s"] == 1.5
+        assert report["tools"]["a"] == {**report["tools"]["a"], "calls": 2, "errors": 1, "p50_ms": 10.0}
+
+    def test_skipped_calls_kept_out_of_latency(self):
+        recorder = Recorder(recording=True)
+        recorder.record("a", 0.010, ok=True)
+        recorder.skip("missing")
+        recorder.skip("missing")
+        report = recorder.report(elapsed=1.0)
+        assert report["summary"]["calls"] == 1
+        assert report["summary"]["skipped"] == 2
+        assert report["summary"]["throughput_per_s"] == 1.0
+        assert report["summary"]["p50_ms"] == 10.0
+        assert report["tools"]["missing"] == {**report["tools"]["missing"], "calls": 0, "skipped": 2}
+
+
+class TestReplay:
+    """bank-tester reports become replayable tool sequences."""
+
+    def test_load_sessions(self, tmp_path):
+        (tmp_path / "task-42.txt").write_text("preamble\n" + _REPORT)
+        (tmp_path / "empty.txt").write_text("no report here\n")
+        assert load_replay_sessions([tmp_path]) == [[
+            "pfsense_get_overview", "pfsense_get_firewall_alias", "pfsense_no_such_tool",
+        ]]
+
+    def test_synthesize_required_and_confirm(self, schemas: dict):
+        assert synthesize_arguments(schemas["pfsense_get_firewall_alias"]) == {"id": 0}
+        args = synthesize_arguments(schemas["pfsense_create_firewall_alias"])
+        assert args["confirm"] is True
+        assert isinstance(args["name"], str) and isinstance(args["type_"], str)
+        assert synthesize_arguments(schemas["pfsense_get_overview"]) == {}
+
+
+class TestEndToEnd:
+    """Short real runs against the mock over each transport."""
+
+    def test_stdio_mixed(self):
+        results = _run(transport="stdio", mix="mixed")
+        summary = results["summary"]
+        assert summary["calls"] > 0 and summary["errors"] == 0
+        assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+        assert "pfsense_list_firewall_rules" in results["tools"]
+        assert results["meta"]["transport"] == "stdio"
+
+    def test_http_crud(self):
+        results = _run(transport="http", mix="crud")
+        assert results["summary"]["errors"] == 0
+        assert set(results["tools"]) == {
+            "pfsense_create_firewall_alias", "pfsense_update_firewall_alias",
+            "pfsense_delete_firewall_aliases", "pfsense_firewall_apply",
+        }
+
+    def test_replay(self, tmp_path):
+        (tmp_path / "task-42.txt").write_text(_REPORT)
+        results = _run(transport="stdio", mix="replay", concurrency=1, replay_dirs=[tmp_path])
+        tools = results["tools"]
+        assert tools["pfsense_get_overview"]["errors"] == 0
+        assert tools["pfsense_get_firewall_alias"]["errors"] == 0
+        assert tools["pfsense_no_such_tool"]["calls"] == 0
+        assert tools["pfsense_no_such_tool"]["skipped"] == results["summary"]["skipped"] > 0
+        assert results["meta"]["replay_sessions"] == 1
+
+    def test_replay_requires_sessions(self, tmp_path):
+        with pytest.raises(ValueError):
+            _run(transport="stdio", mix="replay", replay_dirs=[tmp_path])
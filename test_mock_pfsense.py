@@ -0,0 +1,277 @@
+"""
+Tests for the offline pfSense API stand-in (benchmarks/mock_pfsense.py).
+
+Drives the ASGI app in-process through httpx.ASGITransport, both directly
+and through the generated server's PfSenseClient and tools.
+
+Usage:
+    nix develop -c python -m pytest test_mock_pfsense.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from benchmarks.mock_pfsense import Faults, MockPfSense, build_endpoints
+from test_client import _server
+from test_modules import _spec
+
+_ENDPOINTS = build_endpoints(_spec)
+
+
+def _call(app: MockPfSense, method: str, path: str, api_key: str = "mock", **kwargs) -> httpx.Response:
+    async def run():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app),
+            base_url="http://mock",
+            headers={"X-API-Key": api_key},
+        ) as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(run())
+
+
+def _data(app: MockPfSense, method: str, path: str, **kwargs):
+    response = _call(app, method, path, **kwargs)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+@pytest.fixture
+def app() -> MockPfSense:
+    return MockPfSense(_spec, records=10)
+
+
+class TestEndpoints:
+    """Every spec path is classified and served."""
+
+    def test_every_path_mapped(self):
+        paths = {p for p, item in _spec["paths"].items()
+                 if set(item) & {"get", "post", "patch", "put", "delete"}}
+        assert set(_ENDPOINTS) == paths
+
+    def test_kinds(self):
+        assert _ENDPOINTS["/api/v2/firewall/aliases"].kind == "plural"
+        assert _ENDPOINTS["/api/v2/firewall/alias"].kind == "singular"
+        assert _ENDPOINTS["/api/v2/services/dhcp_server/static_mapping"].kind == "child"
+        assert _ENDPOINTS["/api/v2/system/hostname"].kind == "settings"
+        assert _ENDPOINTS["/api/v2/diagnostics/ping"].kind == "action"
+        assert _ENDPOINTS["/api/v2/firewall/apply"].kind == "apply"
+
+    def test_every_readable_endpoint_succeeds(self, app: MockPfSense):
+        for path, endpoint in _ENDPOINTS.items():
+            if "GET" in endpoint.methods and endpoint.kind in ("plural", "settings", "apply"):
+                assert _call(app, "GET", path).status_code == 200, path
+
+    def test_unknown_path_and_method(self, app: MockPfSense):
+        assert _call(app, "GET", "/api/v2/nope").status_code == 404
+        response = _call(app, "PATCH", "/api/v2/firewall/aliases")
+        assert response.status_code == 405
+        assert response.json()["response_id"] == "METHOD_NOT_ALLOWED"
+
+    def test_auth(self, app: MockPfSense):
+        assert _call(app, "GET", "/api/v2/firewall/aliases", api_key="wrong").status_code == 401
+        app.api_key = None
+        assert _call(app, "GET", "/api/v2/firewall/aliases", api_key="wrong").status_code == 200
+
+
+class TestFixtures:
+    """Seeded data is deterministic and shaped like the schemas."""
+
+    def test_deterministic(self):
+        first = _data(MockPfSense(_spec, records=5), "GET", "/api/v2/firewall/rules")
+        second = _data(MockPfSense(_spec, records=5), "GET", "/api/v2/firewall/rules")
+        assert first == second
+
+    def test_record_count_and_ids(self, app: MockPfSense):
+        rows = _data(app, "GET", "/api/v2/firewall/aliases")
+        assert [r["id"] for r in rows] == list(range(10))
+
+    def test_size_override(self):
+        app = MockPfSense(_spec, records=3, sizes={"/api/v2/firewall/rules": 250})
+        assert len(_data(app, "GET", "/api/v2/firewall/rules")) == 250
+        assert len(_data(app, "GET", "/api/v2/firewall/aliases")) == 3
+
+    def test_enum_values_valid(self, app: MockPfSense):
+        enum = app.schema("FirewallAlias")["properties"]["type"]["enum"]
+        assert {r["type"] for r in _data(app, "GET", "/api/v2/firewall/aliases")} <= set(enum)
+
+    def test_interfaces_keyed_by_name(self, app: MockPfSense):
+        rows = _data(app, "GET", "/api/v2/interfaces")
+        assert [(r["id"], r["descr"]) for r in rows[:3]] == [("wan", "WAN"), ("lan", "LAN"), ("opt1", "OPT1")]
+        assert _data(app, "GET", "/api/v2/interface", params={"id": "lan"})["descr"] == "LAN"
+
+
+class TestListing:
+    """Plural endpoints honor pagination, sorting and query filters."""
+
+    def test_limit_offset(self, app: MockPfSense):
+        rows = _data(app, "GET", "/api/v2/firewall/aliases", params={"limit": 3, "offset": 4})
+        assert [r["id"] for r in rows] == [4, 5, 6]
+
+    def test_sort(self, app: MockPfSense):
+        params = {"sort_by": "name", "sort_order": "SORT_DESC"}
+        names = [r["name"] for r in _data(app, "GET", "/api/v2/firewall/aliases", params=params)]
+        assert names == sorted(names, reverse=True)
+
+    def test_exact_filter(self, app: MockPfSense):
+        rows = _data(app, "GET", "/api/v2/firewall/aliases", params={"name": "alias3"})
+        assert [r["id"] for r in rows] == [3]
+
+    @pytest.mark.parametrize(
+        ("params", "ids"),
+        [
+            ({"name__startswith": "alias1"}, [1]),
+            ({"name__endswith": "5"}, [5]),
+            ({"descr__contains": "alias 7"}, [7]),
+            ({"address__contains": "10.0.0.9"}, [3]),
+            ({"name__regex": "^alias[89]$"}, [8, 9]),
+        ],
+    )
+    def test_operator_filters(self, app: MockPfSense, params: dict, ids: list[int]):
+        assert [r["id"] for r in _data(app, "GET", "/api/v2/firewall/aliases", params=params)] == ids
+
+    def test_numeric_filters(self, app: MockPfSense):
+        rows = _data(app, "GET", "/api/v2/firewall/rules", params={"tracker__gte": 3, "tracker__lt": 6})
+        assert sorted(r["tracker"] for r in rows) == [3, 4, 5]
+
+    def test_filter_then_paginate(self, app: MockPfSense):
+        rows = _data(app, "GET", "/api/v2/firewall/aliases",
+                     params={"type": "host", "limit": 2, "offset": 1})
+        assert len(rows) == 2 and all(r["type"] == "host" for r in rows)
+
+
+class TestMutations:
+    """CRUD follows pfSense semantics, including re-indexing on delete."""
+
+    def test_create_get_patch_delete(self, app: MockPfSense):
+        created = _data(app, "POST", "/api/v2/firewall/alias", json={"name": "web", "type": "port"})
+        assert created["id"] == 10
+        patched = _data(app, "PATCH", "/api/v2/firewall/alias", json={"id": 10, "descr": "Web ports"})
+        assert patched == {"id": 10, "name": "web", "type": "port", "descr": "Web ports"}
+        assert _data(app, "GET", "/api/v2/firewall/alias", params={"id": 10}) == patched
+        assert _data(app, "DELETE", "/api/v2/firewall/alias", params={"id": 10}) == patched
+        assert _call(app, "GET", "/api/v2/firewall/alias", params={"id": 10}).status_code == 404
+
+    def test_delete_reindexes(self, app: MockPfSense):
+        _data(app, "DELETE", "/api/v2/firewall/alias", params={"id": 0})
+        rows = _data(app, "GET", "/api/v2/firewall/aliases")
+        assert rows[0] == {**rows[0], "id": 0, "name": "alias1"}
+
+    def test_required_fields(self, app: MockPfSense):
+        response = _call(app, "POST", "/api/v2/firewall/alias", json={"name": "x"})
+        assert response.status_code == 400
+        assert response.json()["response_id"] == "MODEL_REQUIRED_FIELD_MISSING"
+
+    def test_child_crud(self, app: MockPfSense):
+        path = "/api/v2/services/dhcp_server/static_mapping"
+        created = _data(app, "POST", path, json={"parent_id": 1, "mac": "aa:bb:cc:dd:ee:ff"})
+        assert created["parent_id"] == 1
+        fetched = _data(app, "GET", path, params={"parent_id": 1, "id": created["id"]})
+        assert fetched["mac"] == "aa:bb:cc:dd:ee:ff"
+        _data(app, "DELETE", path, params={"parent_id": 1, "id": created["id"]})
+        rows = _data(app, "GET", "/api/v2/services/dhcp_server/static_mappings", params={"parent_id": 1})
+        assert "aa:bb:cc:dd:ee:ff" not in [r["mac"] for r in rows]
+
+    def test_put_replaces_all(self, app: MockPfSense):
+        body = [{"name": "a", "type": "host"}, {"name": "b", "type": "host"}]
+        _data(app, "PUT", "/api/v2/firewall/aliases", json=body)
+        assert [r["name"] for r in _data(app, "GET", "/api/v2/firewall/aliases")] == ["a", "b"]
+
+    def test_bulk_delete_by_query(self, app: MockPfSense):
+        deleted = _data(app, "DELETE", "/api/v2/firewall/aliases", params={"type": "host"})
+        remaining = _data(app, "GET", "/api/v2/firewall/aliases")
+        assert deleted and len(deleted) + len(remaining) == 10
+        assert all(r["type"] != "host" for r in remaining)
+
+    def test_settings_patch(self, app: MockPfSense):
+        _data(app, "PATCH", "/api/v2/system/hostname", json={"hostname": "fw1"})
+        assert _data(app, "GET", "/api/v2/system/hostname")["hostname"] == "fw1"
+
+    def test_apply_tracks_pending(self, app: MockPfSense):
+        assert _data(app, "GET", "/api/v2/firewall/apply") == {"applied": True, "pending_subsystems": []}
+        _data(app, "POST", "/api/v2/firewall/alias", json={"name": "x", "type": "host"})
+        status = _data(app, "GET", "/api/v2/firewall/apply")
+        assert status["applied"] is False and status["pending_subsystems"]
+        assert _data(app, "GET", "/api/v2/routing/apply")["applied"] is True
+        assert _data(app, "POST", "/api/v2/firewall/apply")["applied"] is True
+
+    def test_reset(self, app: MockPfSense):
+        _data(app, "DELETE", "/api/v2/firewall/aliases")
+        assert _call(app, "POST", "/_mock/reset").status_code == 200
+        assert len(_data(app, "GET", "/api/v2/firewall/aliases")) == 10
+
+
+class TestFaults:
+    """Latency, errors and 502 bursts are injected on demand."""
+
+    def test_fail_next(self, app: MockPfSense):
+        app.faults.fail_next(2)
+        first = _call(app, "GET", "/api/v2/firewall/aliases")
+        assert first.status_code == 502
+        assert first.headers["content-type"] == "text/html"
+        assert _call(app, "GET", "/api/v2/firewall/aliases").status_code == 502
+        assert _call(app, "GET", "/api/v2/firewall/aliases").status_code == 200
+        assert app.stats()["injected_failures"] == {"502": 2}
+
+    def test_bursts(self):
+        app = MockPfSense(_spec, records=1, faults=Faults(burst_every=5, burst_length=2))
+        codes = [_call(app, "GET", "/api/v2/firewall/aliases").status_code for _ in range(12)]
+        assert codes == [200] * 4 + [502, 502] + [200] * 3 + [502, 502, 200]
+
+    def test_error_rate(self):
+        app = MockPfSense(_spec, records=1, faults=Faults(error_rate=1.0))
+        response = _call(app, "GET", "/api/v2/firewall/aliases")
+        assert response.status_code == 500
+        assert response.json()["code"] == 500
+
+    def test_latency(self):
+        app = MockPfSense(_spec, records=1, faults=Faults(latency=0.05))
+        start = time.perf_counter()
+        _call(app, "GET", "/api/v2/firewall/aliases")
+        assert time.perf_counter() - start >= 0.05
+
+    def test_control_endpoint(self, app: MockPfSense):
+        response = _call(app, "POST", "/_mock/faults",
+                         json={"latency": 0.01, "fail_next": {"count": 1, "status": 503}})
+        assert response.json()["latency"] == 0.01
+        assert _call(app, "GET", "/api/v2/firewall/aliases").status_code == 503
+        assert _call(app, "POST", "/_mock/faults", json={"bogus": 1}).status_code == 400
+        stats = _call(app, "GET", "/_mock/stats").json()
+        assert stats["by_endpoint"] == {"GET /api/v2/firewall/aliases": 1}
+
+
+class TestGeneratedServer:
+    """The generated client and tools work against the mock."""
+
+    def _wire(self, app: MockPfSense):
+        srv = _server()
+        client = srv.PfSenseClient()
+        client.retry_backoff = 0.0
+        client._client = httpx.AsyncClient(
+            base_url="http://mock",
+            headers={"X-API-Key": "mock"},
+            transport=httpx.ASGITransport(app),
+        )
+        return srv, client
+
+    def test_client_retries_through_502_burst(self, app: MockPfSense):
+        _, client = self._wire(app)
+        app.faults.fail_next(2)
+        rows = asyncio.run(client.request("GET", "/api/v2/firewall/aliases", params={"limit": 2}))
+        assert [r["id"] for r in rows] == [0, 1]
+        assert client.retries == 2
+
+    def test_list_tool_with_filter_and_enrichment(self, app: MockPfSense, monkeypatch):
+        srv, client = self._wire(app)
+        monkeypatch.setattr(srv, "_client", client)
+        aliases = asyncio.run(srv.pfsense_list_firewall_aliases.fn(query={"name": "alias2"}))
+        assert [a["name"] for a in aliases] == ["alias2"]
+        rules = asyncio.run(srv.pfsense_list_firewall_rules.fn(limit=3))
+        assert len(rules) == 3
+        for rule in rules:
+            assert rule["interface_descr"] == [iface.upper() for iface in rule["interface"]]
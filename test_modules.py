@@ -30,7 +30,36 @@ _REPO_ROOT = Path(__file__).resolve().parent
 _spec = load_spec(_REPO_ROOT / "openapi-spec.json")
 _contexts = build_tool_contexts(_spec)
 
-ALWAYS_ON = 3  # pfsense_report_issue + pfsense_get_overview + pfsense_search_tools — never gated
+# pfsense_report_issue + pfsense_get_overview + pfsense_get_server_stats +
+# pfsense_get_managed_firewalls + pfsense_query_fleet + pfsense_run_batch +
+# pfsense_sync_collection + pfsense_reconcile + pfsense_create_with_children +
+# pfsense_get_pending_changes + pfsense_apply_pending_changes +
+# pfsense_search_tools — never gated by PFSENSE_MODULES
+_ALWAYS_ON_TOOLS = {
+    "pfsense_report_issue",
+    "pfsense_get_overview",
+    "pfsense_get_server_stats",
+    "pfsense_get_managed_firewalls",
+    "pfsense_query_fleet",
+    "pfsense_run_batch",
+    "pfsense_sync_collection",
+    "pfsense_reconcile",
+    "pfsense_create_with_children",
+    "pfsense_get_pending_changes",
+    "pfsense_apply_pending_changes",
+    "pfsense_search_tools",
+}
+ALWAYS_ON = len(_ALWAYS_ON_TOOLS)
+
+# Always-on tools that write config — stripped by PFSENSE_READ_ONLY
+_ALWAYS_ON_MUTATIONS = {
+    "pfsense_run_batch",
+    "pfsense_sync_collection",
+    "pfsense_reconcile",
+    "pfsense_create_with_children",
+    "pfsense_apply_pending_changes",
+}
+ALWAYS_ON_READ = ALWAYS_ON - len(_ALWAYS_ON_MUTATIONS)
 
 MODULE_COUNTS: dict[str, dict[str, int]] = {}
 for _mod in MODULE_ORDER:
@@ -62,6 +91,25 @@ print(json.dumps({"count": len(names), "names": names}))
 """
 
 
+# Prints pfsense_search_tools' `registered` flag for every always-on tool.
+_SEARCH_HELPER = """\
+import asyncio, os, sys, json
+os.environ["PFSENSE_MODULES"] = sys.argv[1]
+os.environ["PFSENSE_READ_ONLY"] = sys.argv[2]
+os.environ.setdefault("PFSENSE_HOST", "https://127.0.0.1")
+os.environ.setdefault("PFSENSE_API_KEY", "test")
+sys.path.insert(0, "generated")
+import server as srv
+names = [e["name"] for e in srv._search_index()["tools"] if e["module"] == "_always_on"]
+registered = {}
+for name in names:
+    for hit in asyncio.run(srv.pfsense_search_tools.fn(name, limit=100)):
+        if hit["name"] == name:
+            registered[name] = hit["registered"]
+print(json.dumps(registered))
+"""
+
+
 def _get_tools(modules: str, read_only: str | None = None) -> dict:
     """Launch a subprocess with the given env vars and return tool info."""
     cmd = [sys.executable, "-c", _HELPER, modules]
@@ -97,9 +145,7 @@ class TestModuleCounts:
         """Empty PFSENSE_MODULES → only always-on tools."""
         info = _get_tools("")
         assert info["count"] == ALWAYS_ON
-        assert "pfsense_report_issue" in info["names"]
-        assert "pfsense_get_overview" in info["names"]
-        assert "pfsense_search_tools" in info["names"]
+        assert _ALWAYS_ON_TOOLS <= set(info["names"])
 
     @pytest.mark.parametrize("mod", MODULE_ORDER)
     def test_single_module(self, mod: str):
@@ -142,18 +188,34 @@ class TestReadOnly:
         """All modules + READ_ONLY → only GET tools + always-on."""
         all_mods = ",".join(sorted(_ALL_MODULES))
         info = _get_tools(all_mods, "true")
-        expected_reads = sum(mc["read"] for mc in MODULE_COUNTS.values()) + ALWAYS_ON
+        expected_reads = sum(mc["read"] for mc in MODULE_COUNTS.values()) + ALWAYS_ON_READ
         assert info["count"] == expected_reads
+        assert not _ALWAYS_ON_MUTATIONS & set(info["names"])
 
     @pytest.mark.parametrize("mod", MODULE_ORDER)
     def test_read_only_single_module(self, mod: str):
         """Each module in read-only → only reads + always-on."""
         info = _get_tools(mod, "true")
-        expected = MODULE_COUNTS[mod]["read"] + ALWAYS_ON
+        expected = MODULE_COUNTS[mod]["read"] + ALWAYS_ON_READ
         assert info["count"] == expected, (
             f"Module {mod} read-only: expected {expected}, got {info['count']}"
         )
 
+    def test_search_reports_always_on_mutations_unregistered(self):
+        """Search marks the stripped always-on tools registered: False."""
+        result = subprocess.run(
+            [sys.executable, "-c", _SEARCH_HELPER, "firewall", "true"],
+            capture_output=True,
+            text=True,
+            cwd=str(_REPO_ROOT),
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
+        registered = json.loads(result.stdout)
+        assert set(registered) == _ALWAYS_ON_TOOLS
+        for name, flag in registered.items():
+            assert flag is (name not in _ALWAYS_ON_MUTATIONS), name
+
     def test_read_only_false(self):
         """Explicit 'false' → all tools (same as default)."""
         all_mods = ",".join(sorted(_ALL_MODULES))
@@ -171,7 +233,7 @@ class TestToolPresence:
 
     def test_always_on_everywhere(self):
         """Always-on tools are present in every configuration."""
-        _always_on = {"pfsense_report_issue", "pfsense_get_overview", "pfsense_search_tools"}
+        _always_on = _ALWAYS_ON_TOOLS
 
         # Empty modules
         info = _get_tools("")
@@ -183,7 +245,7 @@ class TestToolPresence:
 
         # Read-only
         info = _get_tools("status", "true")
-        assert _always_on <= set(info["names"])
+        assert _always_on - _ALWAYS_ON_MUTATIONS <= set(info["names"])
 
     @pytest.mark.parametrize("mod", MODULE_ORDER)
     def test_module_tools_present(self, mod: str):
@@ -198,7 +260,7 @@ class TestToolPresence:
     def test_module_excludes_others(self, mod: str):
         """Loading one module doesn't leak tools from other modules."""
         info = _get_tools(mod)
-        tool_set = set(info["names"]) - {"pfsense_report_issue", "pfsense_get_overview", "pfsense_search_tools"}
+        tool_set = set(info["names"]) - _ALWAYS_ON_TOOLS
         expected_tools = {c.tool_name for c in _contexts if c.module == mod}
         extra = tool_set - expected_tools
         assert not extra, f"Module {mod} has extra tools: {extra}"
@@ -208,3 +270,66 @@ class TestToolPresence:
         all_mods = ",".join(sorted(_ALL_MODULES))
         info = _get_tools(all_mods)
         assert len(info["names"]) == len(set(info["names"]))
+
+
+# ---------------------------------------------------------------------------
+# TestLazyLoading — per-module tool files and PFSENSE_LAZY_TOOLS
+# ---------------------------------------------------------------------------
+
+_LAZY_HELPER = """\
+import asyncio, os, sys, json
+os.environ["PFSENSE_MODULES"] = sys.argv[1]
+os.environ["PFSENSE_LAZY_TOOLS"] = "true"
+os.environ.setdefault("PFSENSE_HOST", "https://127.0.0.1:9")
+os.environ.setdefault("PFSENSE_API_KEY", "test")
+os.environ["PFSENSE_PREWARM_CONNECTIONS"] = "0"
+sys.path.insert(0, "generated")
+import server as srv
+from fastmcp import Client
+at_import = len(srv.mcp._tool_manager._tools)
+
+async def main():
+    async with Client(srv.mcp) as client:
+        return len(await client.list_tools())
+
+listed = asyncio.run(main())
+print(json.dumps({"at_import": at_import, "listed": listed,
+                  "loaded": sorted(srv._LOADED_TOOL_MODULES)}))
+"""
+
+
+class TestLazyLoading:
+    """Module tools live in separate files and load only when enabled."""
+
+    def test_one_file_per_module(self):
+        tools_dir = _REPO_ROOT / "generated" / "tools"
+        expected = {m for m in MODULE_ORDER if MODULE_COUNTS[m]["total"]}
+        assert {p.stem for p in tools_dir.glob("*.py")} - {"__init__"} == expected
+
+    def test_only_enabled_modules_loaded(self):
+        cmd = [
+            sys.executable, "-c",
+            "import os, sys, json; os.environ['PFSENSE_MODULES'] = 'status,auth'; "
+            "sys.path.insert(0, 'generated'); import server as srv; "
+            "print(json.dumps(sorted(srv._LOADED_TOOL_MODULES)))",
+        ]
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, cwd=str(_REPO_ROOT), timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == ["auth", "status"]
+
+    def test_lazy_tools_deferred_until_first_request(self):
+        result = subprocess.run(
+            [sys.executable, "-c", _LAZY_HELPER, "firewall,status"],
+            capture_output=True,
+            text=True,
+            cwd=str(_REPO_ROOT),
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        info = json.loads(result.stdout)
+        assert info["at_import"] == ALWAYS_ON
+        expected = MODULE_COUNTS["firewall"]["total"] + MODULE_COUNTS["status"]["total"] + ALWAYS_ON
+        assert info["listed"] == expected
+        assert info["loaded"] == ["firewall", "status"]
@@ -0,0 +1,159 @@
+"""
+Tests for the pfsense_search_tools inverted index and BM25 ranking.
+
+The index is built at codegen time from build_tool_index(); these tests
+check the generator output against the spec and exercise the runtime
+search in the generated server.
+
+Usage:
+    nix develop -c python -m pytest test_search_tools.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from generator.context_builder import (
+    build_search_index,
+    build_tool_contexts,
+    build_tool_index,
+    search_terms,
+)
+from generator.loader import load_spec
+
+_REPO_ROOT = Path(__file__).resolve().parent
+
+_spec = load_spec(_REPO_ROOT / "openapi-spec.json")
+_index = build_tool_index(build_tool_contexts(_spec))
+_search_index = build_search_index(_index)
+
+
+def _server():
+    os.environ.setdefault("PFSENSE_HOST", "https://127.0.0.1")
+    os.environ.setdefault("PFSENSE_API_KEY", "test")
+    sys.path.insert(0, str(_REPO_ROOT / "generated"))
+    return importlib.import_module("server")
+
+
+def _search(query: str, **kwargs) -> list[dict]:
+    srv = _server()
+    return asyncio.run(srv.pfsense_search_tools.fn(query, **kwargs))
+
+
+def _names(query: str, **kwargs) -> list[str]:
+    return [r["name"] for r in _search(query, **kwargs)]
+
+
+# ---------------------------------------------------------------------------
+# Index construction (generator)
+# ---------------------------------------------------------------------------
+
+
+class TestSearchIndex:
+    """The inverted index covers every tool index entry."""
+
+    def test_every_doc_indexed(self):
+        docs = {doc for _, postings in _search_index["postings"].values() for doc, _ in postings}
+        assert docs == set(range(len(_index)))
+
+    def test_doc_lengths_match_index(self):
+        assert len(_search_index["doc_len"]) == len(_index)
+        assert _search_index["avg_len"] > 0
+
+    def test_rare_terms_have_higher_idf(self):
+        postings = _search_index["postings"]
+        assert postings["wireguard"][0] > postings["firewall"][0]
+
+    def test_generated_index_matches_generator(self):
+        data = _server()._search_index()
+        assert data["postings"] == json.loads(json.dumps(_search_index["postings"]))
+        assert data["tools"] == _index
+
+    @pytest.mark.parametrize(
+        "text",
+        ["pfsense_list_firewall_rules", "DHCP Static-Mappings", "address", "hash_algo", "pfSense", ""],
+    )
+    def test_runtime_tokenizer_matches_generator(self, text: str):
+        assert _server()._search_terms(text) == search_terms(text)
+
+    def test_stop_terms_not_indexed(self):
+        assert "pfsense" not in _search_index["postings"]
+
+    def test_plural_folding(self):
+        assert search_terms("rules aliases alias entries dns address status") == [
+            "rule", "alias", "alias", "entry", "dns", "address", "status",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Ranked search (generated server)
+# ---------------------------------------------------------------------------
+
+
+class TestSearchRanking:
+    """pfsense_search_tools returns relevant tools first."""
+
+    def test_name_match_ranks_first(self):
+        names = _names("create firewall alias", limit=3)
+        assert names[0] == "pfsense_create_firewall_alias"
+
+    @pytest.mark.parametrize(
+        "name",
+        ["pfsense_list_firewall_aliases", "pfsense_create_vpn_wireguard_peer", "pfsense_get_overview"],
+    )
+    def test_full_tool_name_ranks_first(self, name: str):
+        assert _names(name, limit=1) == [name]
+
+    def test_pfsense_term_ignored(self):
+        assert _names("pfsense firewall alias", limit=5) == _names("firewall alias", limit=5)
+
+    def test_and_semantics(self):
+        for name in _names("dhcp static mapping", limit=50):
+            assert "dhcp" in name and "static_mapping" in name
+
+    def test_prefix_matching(self):
+        names = _names("wire peer", limit=10)
+        assert names and all("wireguard_peer" in n for n in names)
+
+    def test_exact_beats_prefix(self):
+        srv = _server()
+        exact = srv._search_term_scores("wireguard")
+        prefix = srv._search_term_scores("wireg")
+        assert exact.keys() == prefix.keys()
+        for doc, score in exact.items():
+            assert score * srv._SEARCH_PREFIX_WEIGHT <= prefix[doc] < score
+
+    def test_plural_query_matches_singular_tool(self):
+        assert "pfsense_create_firewall_alias" in _names("firewall aliases", limit=10)
+
+    def test_scores_descending(self):
+        scores = [r["score"] for r in _search("haproxy backend", limit=25)]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_module_filter(self):
+        results = _search("apply", module="routing")
+        assert results[0]["name"] == "pfsense_routing_apply"
+        assert all(r["module"] == "routing" for r in results)
+
+    def test_limit(self):
+        assert len(_search("firewall", limit=5)) == 5
+
+    def test_no_match(self):
+        assert _search("xyzzy") == []
+        assert _search("firewall xyzzy") == []
+
+    def test_empty_query(self):
+        assert _search("  ") == []
+
+    def test_always_on_tools_searchable(self):
+        assert _names("overview", limit=1) == ["pfsense_get_overview"]
+        result = _search("report issue", limit=1)[0]
+        assert result["name"] == "pfsense_report_issue"
+        assert result["registered"] is True
@@ -0,0 +1,118 @@
+"""
+Tests for the startup benchmark harness (benchmarks/startup.py).
+
+Runs the cheap configurations for real and checks the regression logic
+against synthetic results. Timing assertions are relative (lazy vs eager),
+never absolute, so they hold on slow CI machines.
+
+Usage:
+    nix develop -c python -m pytest test_startup_bench.py -v
+"""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from benchmarks.startup import (
+    DEFAULT_CONFIGS,
+    SERVER_DIR,
+    Config,
+    check,
+    expected_tool_counts,
+    per_module_configs,
+    run,
+)
+from test_modules import ALWAYS_ON, ALWAYS_ON_READ, MODULE_COUNTS, TOTAL
+
+_CONFIGS = {c.name: c for c in DEFAULT_CONFIGS}
+
+
+@pytest.fixture(scope="module")
+def results() -> dict:
+    configs = [_CONFIGS["monitoring"], _CONFIGS["none"], Config("firewall", ("firewall",)),
+               Config("firewall-lazy", ("firewall",), lazy=True)]
+    return run(configs, repeat=1, server_dir=SERVER_DIR, bytecode=True)
+
+
+class TestExpectedCounts:
+    """Spec-derived counts agree with test_modules.py."""
+
+    def test_default_configs(self):
+        counts = expected_tool_counts(list(DEFAULT_CONFIGS))
+        assert counts["all"] == TOTAL
+        assert counts["all-lazy"] == TOTAL
+        assert counts["none"] == ALWAYS_ON
+        assert counts["all-read-only"] == sum(m["read"] for m in MODULE_COUNTS.values()) + ALWAYS_ON_READ
+
+    def test_per_module(self):
+        counts = expected_tool_counts(per_module_configs())
+        for mod, mc in MODULE_COUNTS.items():
+            assert counts[f"module:{mod}"] == mc["total"] + ALWAYS_ON
+
+
+class TestRun:
+    """A real run produces complete, self-consistent results."""
+
+    def test_schema(self, results: dict):
+        assert results["meta"]["repeat"] == 1
+        for result in results["results"].values():
+            for key in ("import_s", "first_list_s", "list_s", "peak_rss_mb"):
+                assert result[key] > 0
+                assert result[f"{key}_samples"] == [result[key]]
+            assert result["list_bytes"] > 0
+
+    def test_tool_counts_match_spec(self, results: dict):
+        assert check(results) == []
+        assert results["results"]["firewall"]["tools"] == MODULE_COUNTS["firewall"]["total"] + ALWAYS_ON
+
+    def test_lazy_defers_registration(self, results: dict):
+        eager = results["results"]["firewall"]
+        lazy = results["results"]["firewall-lazy"]
+        assert lazy["registered_at_import"] == ALWAYS_ON
+        assert lazy["tools"] == eager["tools"]
+        assert lazy["import_s"] < eager["import_s"]
+
+
+def _result(**overrides) -> dict:
+    result = {
+        "tools": 10, "expected_tools": 10, "import_s": 1.0, "first_list_s": 0.1,
+        "list_s": 0.05, "rss_delta_mb": 20.0,
+    }
+    result.update(overrides)
+    return {"meta": {}, "results": {"cfg": result}}
+
+
+class TestCheck:
+    """Regression thresholds need both a relative and an absolute increase."""
+
+    def test_identical(self):
+        assert check(_result(), _result()) == []
+
+    def test_tool_count_mismatch(self):
+        failures = check(_result(tools=9))
+        assert len(failures) == 1 and "expected 10" in failures[0]
+
+    def test_time_regression(self):
+        failures = check(_result(import_s=1.5), _result())
+        assert len(failures) == 1 and "import time" in failures[0]
+
+    def test_small_absolute_delta_ignored(self):
+        # +100% but only 10ms: noise
+        assert check(_result(list_s=0.06), _result(list_s=0.03)) == []
+
+    def test_small_relative_delta_ignored(self):
+        assert check(_result(import_s=1.2), _result()) == []
+
+    def test_rss_regression(self):
+        failures = check(_result(rss_delta_mb=30.0), _result())
+        assert len(failures) == 1 and "RSS" in failures[0]
+
+    def test_custom_threshold(self):
+        assert check(_result(import_s=1.5), _result(), max_time_regression=0.6) == []
+
+    def test_new_config_not_in_baseline(self):
+        baseline = copy.deepcopy(_result())
+        baseline["results"] = {}
+        assert check(_result(import_s=9.0), baseline) == []